@@ -1,8 +1,19 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import datetime, time
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from rest_framework.exceptions import NotFound, APIException
-from rest_framework.status import HTTP_400_BAD_REQUEST
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
+from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+from baserow.core.db import filter_after_keyset, get_keyset_columns
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -39,3 +50,114 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class KeysetCursorJSONEncoder(DjangoJSONEncoder):
+    """
+    The `DjangoJSONEncoder` truncates datetimes and times to milliseconds. The values
+    in a cursor must be exact because otherwise seeking past the last row of a page
+    can match rows of that page again, so they're encoded with full precision.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime, time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination:
+    """
+    Paginates an ordered queryset by seeking past the last row of the previous page
+    instead of using an OFFSET. The values that the last row is ordered by are
+    encoded in an opaque cursor that must be provided to fetch the next page. This
+    keeps fetching pages deep into large tables fast. The total count is expensive to
+    compute for large tables, so it is only included if explicitly requested.
+    """
+
+    page_size = PageNumberPagination.page_size
+    page_size_query_param = PageNumberPagination.page_size_query_param
+    cursor_query_param = "cursor"
+
+    def __init__(self, limit_page_size=None, include_count=False):
+        self.limit_page_size = limit_page_size
+        self.include_count = include_count
+
+    def get_page_size(self, request):
+        return PageNumberPagination(limit_page_size=self.limit_page_size).get_page_size(
+            request
+        )
+
+    def encode_cursor(self, values):
+        data = json.dumps(values, cls=KeysetCursorJSONEncoder).encode("utf-8")
+        return urlsafe_b64encode(data).decode("ascii")
+
+    def decode_cursor(self, cursor, columns):
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, TypeError, UnicodeError):
+            values = None
+
+        if not isinstance(values, list) or len(values) != len(columns):
+            self.raise_invalid_cursor()
+
+        return values
+
+    def raise_invalid_cursor(self):
+        exception = APIException(
+            {
+                "error": "ERROR_INVALID_CURSOR",
+                "detail": "The provided cursor is invalid or does not match the "
+                "ordering of the rows.",
+            }
+        )
+        exception.status_code = HTTP_400_BAD_REQUEST
+        raise exception
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.count = queryset.count() if self.include_count else None
+
+        queryset, columns = get_keyset_columns(queryset)
+        cursor = request.GET.get(self.cursor_query_param)
+
+        if cursor:
+            try:
+                queryset = filter_after_keyset(
+                    queryset, columns, self.decode_cursor(cursor, columns)
+                )
+            except (ValidationError, ValueError):
+                self.raise_invalid_cursor()
+
+        # One extra row is fetched to figure out if there is a next page.
+        rows = list(queryset[: self.page_size + 1])
+        page = rows[: self.page_size]
+        self.next_cursor = None
+
+        if len(rows) > self.page_size:
+            self.next_cursor = self.encode_cursor(
+                [column.get_value(page[-1]) for column in columns]
+            )
+
+        return page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+
+        if self.count is not None:
+            response["count"] = self.count
+
+        response["next"] = self.get_next_link()
+        response["previous"] = None
+        response["results"] = data
+        return Response(response)
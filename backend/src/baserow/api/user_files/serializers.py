@@ -64,6 +64,7 @@ class UserFileSerializer(
             "uploaded_at",
             "url",
             "thumbnails",
+            "thumbnails_status",
             "name",
             "original_name",
         )
@@ -47,6 +47,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "baserow.core.middleware.RequestCacheMiddleware",
 ]
 
 ROOT_URLCONF = "baserow.config.urls"
@@ -84,10 +85,28 @@ CELERY_BROKER_URL = REDIS_URL
 CELERY_TASK_ROUTES = {
     "baserow.contrib.database.export.tasks.run_export_job": {"queue": "export"},
     "baserow.contrib.database.export.tasks.clean_up_old_jobs": {"queue": "export"},
+    "baserow.contrib.database.fields.tasks.run_field_conversion_job": {
+        "queue": "export"
+    },
+    "baserow.contrib.database.fields.tasks.clean_up_stale_field_conversion_jobs": {
+        "queue": "export"
+    },
+    "baserow.contrib.database.formula.tasks.recalculate_field_values": {
+        "queue": "export"
+    },
+    "baserow.contrib.database.table.tasks.update_search_data_task": {"queue": "export"},
+    "baserow.contrib.database.table.tasks.update_primary_values_task": {
+        "queue": "export"
+    },
+    "baserow.contrib.database.table.tasks.update_field_indexes_task": {
+        "queue": "export"
+    },
+    "baserow.contrib.database.rows.tasks.rebalance_row_orders": {"queue": "export"},
     "baserow.core.trash.tasks.mark_old_trash_for_permanent_deletion": {
         "queue": "export"
     },
     "baserow.core.trash.tasks.permanently_delete_marked_trash": {"queue": "export"},
+    "baserow.core.user_files.tasks.generate_user_file_thumbnails": {"queue": "export"},
 }
 CELERY_SOFT_TIME_LIMIT = 60 * 5
 CELERY_TIME_LIMIT = CELERY_SOFT_TIME_LIMIT + 60
@@ -124,6 +143,29 @@ CHANNEL_LAYERS = {
     },
 }
 
+# The number of seconds that the real time row updated events of a table are buffered
+# before they are broadcasted as a single message. Setting this to 0 broadcasts every
+# update immediately.
+WS_ROWS_UPDATED_BUFFER_SECONDS = float(os.getenv("WS_ROWS_UPDATED_BUFFER_SECONDS", 0.5))
+
+# The cache is stored in Redis, so that it's shared between all the backend processes.
+# The keys are prefixed, so the same Redis database as Celery can safely be used.
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": os.getenv("CACHE_REDIS_URL", REDIS_URL),
+        "KEY_PREFIX": "baserow-default-cache",
+        "TIMEOUT": int(os.getenv("CACHE_DEFAULT_TIMEOUT_SECONDS", 300)),
+        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+    },
+}
+
+# The number of seconds that the hit, miss and latency counters of the cache are
+# accumulated in memory before they are added to the counters in the shared cache.
+CACHE_STATS_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("CACHE_STATS_FLUSH_INTERVAL_SECONDS", 10)
+)
+
 
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
@@ -284,6 +326,7 @@ if PRIVATE_BACKEND_HOSTNAME:
 FROM_EMAIL = os.getenv("FROM_EMAIL", "no-reply@localhost")
 RESET_PASSWORD_TOKEN_MAX_AGE = 60 * 60 * 48  # 48 hours
 ROW_PAGE_SIZE_LIMIT = 200  # How many rows can be requested at once.
+BATCH_ROWS_SIZE_LIMIT = 200  # How many rows can be changed at once.
 TRASH_PAGE_SIZE_LIMIT = 200  # How many trash entries can be requested at once.
 ROW_COMMENT_PAGE_SIZE_LIMIT = 200  # How many row comments can be requested at once.
 
@@ -305,6 +348,8 @@ EXPORT_FILES_DIRECTORY = "export_files"
 EXPORT_CLEANUP_INTERVAL_MINUTES = 5
 EXPORT_FILE_EXPIRE_MINUTES = 60
 
+FIELD_CONVERSION_CLEANUP_INTERVAL_MINUTES = 5
+
 EMAIL_BACKEND = "djcelery_email.backends.CeleryEmailBackend"
 
 if os.getenv("EMAIL_SMTP", ""):
@@ -335,12 +380,87 @@ DEFAULT_APPLICATION_TEMPLATE = "project-tracker"
 
 MAX_FIELD_LIMIT = 1500
 
+# The maximum amount of generated table models that are cached per process. Setting
+# this to 0 disables the cache.
+GENERATED_MODEL_CACHE_SIZE = int(os.getenv("GENERATED_MODEL_CACHE_SIZE", 256))
+# The maximum amount of typed tables, containing the parsed and typed formulas of a
+# table, that are cached per process. Setting this to 0 disables the cache.
+TYPED_TABLE_CACHE_SIZE = int(os.getenv("TYPED_TABLE_CACHE_SIZE", 256))
+# When a field changes, the values of the formula fields depending on it are
+# recalculated right away for tables having at most this amount of rows. The values of
+# larger tables are recalculated in chunks by a background task. Setting this to -1
+# always recalculates the values right away.
+FORMULA_BACKGROUND_RECALCULATION_THRESHOLD = int(
+    os.getenv("FORMULA_BACKGROUND_RECALCULATION_THRESHOLD", 100000)
+)
+# The maximum amount of rows of which the formula values are recalculated per query
+# by the background task.
+FORMULA_RECALCULATION_CHUNK_SIZE = int(
+    os.getenv("FORMULA_RECALCULATION_CHUNK_SIZE", 10000)
+)
+# When a field of a table using the full text search mode changes, the search data of
+# all its rows is rebuilt right away for tables having at most this amount of rows.
+# The search data of larger tables is rebuilt in chunks by a background task. Setting
+# this to -1 always rebuilds the search data right away.
+SEARCH_DATA_BACKGROUND_THRESHOLD = int(
+    os.getenv("SEARCH_DATA_BACKGROUND_THRESHOLD", 100000)
+)
+# The maximum amount of rows of which the search data is rebuilt per query by the
+# background task.
+SEARCH_DATA_UPDATE_CHUNK_SIZE = int(os.getenv("SEARCH_DATA_UPDATE_CHUNK_SIZE", 10000))
+# The maximum amount of indexes that are created per table on the columns of the
+# fields that are filtered or sorted on by the views of the table. Setting this to 0
+# drops the existing indexes and doesn't create new ones.
+TABLE_INDEX_BUDGET = int(os.getenv("TABLE_INDEX_BUDGET", 5))
+
 # If you change this default please also update the default for the web-frontend found
 # in web-frontend/modules/core/module.js:55
 HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = os.getenv(
     "HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The maximum number of seconds that a single run of the periodic task spends on
+# permanently deleting trash. The remaining trash is deleted by the next run.
+TRASH_PERMANENT_DELETION_TIME_BUDGET_SECONDS = int(
+    os.getenv("TRASH_PERMANENT_DELETION_TIME_BUDGET_SECONDS", 60)
+)
+
+# The number of seconds after the first queued submission of a form with asynchronous
+# submissions that the queued submissions are created as rows. All the submissions
+# that are queued in the meantime are processed together.
+FORM_VIEW_SUBMISSIONS_BATCH_DELAY_SECONDS = float(
+    os.getenv("FORM_VIEW_SUBMISSIONS_BATCH_DELAY_SECONDS", 1)
+)
+# The maximum number of queued form submissions that are created as rows in a single
+# transaction.
+FORM_VIEW_SUBMISSIONS_BATCH_SIZE = int(
+    os.getenv("FORM_VIEW_SUBMISSIONS_BATCH_SIZE", 500)
+)
+
+# The number of seconds after the gap between two rows has become too small that the
+# orders of the rows around it are rebalanced. All the rows that are inserted in the
+# meantime are rebalanced together.
+ROW_ORDER_REBALANCE_DELAY_SECONDS = float(
+    os.getenv("ROW_ORDER_REBALANCE_DELAY_SECONDS", 10)
+)
+# The maximum number of rows before the row at which the gap has become too small of
+# which the order is updated when rebalancing the row orders.
+ROW_ORDER_REBALANCE_WINDOW_SIZE = int(
+    os.getenv("ROW_ORDER_REBALANCE_WINDOW_SIZE", 1000)
+)
+
+# The number of seconds that the usage of API tokens is buffered in memory before it
+# is written to the database. Setting this to 0 writes the usage on every request.
+API_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("API_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS", 5)
+)
+
+# The number of seconds that the permissions of a user in a group are cached in the
+# shared cache. They are always cached for the duration of a request. Setting this to
+# 0 only caches them per request.
+GROUP_USER_PERMISSIONS_CACHE_SECONDS = int(
+    os.getenv("GROUP_USER_PERMISSIONS_CACHE_SECONDS", 10)
+)
 
 MAX_ROW_COMMENT_LENGTH = 10000
 
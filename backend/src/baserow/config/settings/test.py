@@ -7,6 +7,11 @@ CELERY_TASK_EAGER_PROPAGATES = True
 
 CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
 
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Broadcast the real time row updates immediately instead of from a background task.
+WS_ROWS_UPDATED_BUFFER_SECONDS = 0
+
 USER_FILES_DIRECTORY = "user_files"
 USER_THUMBNAILS_DIRECTORY = "thumbnails"
 USER_THUMBNAILS = {"tiny": [21, 21]}
@@ -74,3 +74,13 @@ ERROR_TOO_DEEPLY_NESTED_FORMULA = (
     HTTP_400_BAD_REQUEST,
     "The formula is too deeply nested.",
 )
+ERROR_FIELD_CONVERSION_JOB_DOES_NOT_EXIST = (
+    "ERROR_FIELD_CONVERSION_JOB_DOES_NOT_EXIST",
+    HTTP_404_NOT_FOUND,
+    "The requested field conversion job does not exist.",
+)
+ERROR_FIELD_CONVERSION_JOB_ALREADY_RUNNING = (
+    "ERROR_FIELD_CONVERSION_JOB_ALREADY_RUNNING",
+    HTTP_400_BAD_REQUEST,
+    "The field is already being converted.",
+)
@@ -7,8 +7,9 @@ from baserow.api.user_files.serializers import (
     UserFileURLAndThumbnailsSerializerMixin,
 )
 from baserow.api.user_files.validators import user_file_name_validator
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, FieldConversionJob
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.table.primary_values import get_related_primary_values
 
 
 class FieldSerializer(serializers.ModelSerializer):
@@ -85,6 +86,20 @@ class UpdateFieldSerializer(serializers.ModelSerializer):
         }
 
 
+class FieldConversionJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = FieldConversionJob
+        fields = (
+            "id",
+            "field",
+            "new_type_name",
+            "status",
+            "error",
+            "created_at",
+            "progress_percentage",
+        )
+
+
 class LinkRowValueSerializer(serializers.Serializer):
     id = serializers.IntegerField(
         read_only=True,
@@ -101,6 +116,20 @@ class LinkRowValueSerializer(serializers.Serializer):
         )
 
 
+class LinkRowValueListSerializer(serializers.ListSerializer):
+    """
+    Serializes the cached primary values of the related rows if they have been
+    annotated by the link row field type and the related rows otherwise.
+    """
+
+    def get_attribute(self, instance):
+        related_primary_values = get_related_primary_values(instance, self.source)
+        if related_primary_values is not None:
+            return related_primary_values
+
+        return super().get_attribute(instance)
+
+
 class FileFieldRequestSerializer(serializers.Serializer):
     visible_name = serializers.CharField(
         required=False, help_text="A visually editable name for the field."
@@ -20,6 +20,8 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_RESERVED_BASEROW_FIELD_NAME,
     ERROR_FIELD_WITH_SAME_NAME_ALREADY_EXISTS,
     ERROR_INVALID_BASEROW_FIELD_NAME,
+    ERROR_FIELD_CONVERSION_JOB_DOES_NOT_EXIST,
+    ERROR_FIELD_CONVERSION_JOB_ALREADY_RUNNING,
 )
 from baserow.contrib.database.api.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
 from baserow.contrib.database.api.tokens.authentications import TokenAuthentication
@@ -32,14 +34,17 @@ from baserow.contrib.database.fields.exceptions import (
     ReservedBaserowFieldNameException,
     FieldWithSameNameAlreadyExists,
     InvalidBaserowFieldName,
+    FieldConversionJobDoesNotExist,
+    FieldConversionJobAlreadyRunning,
 )
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, FieldConversionJob
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.tokens.exceptions import NoPermissionToTable
 from baserow.contrib.database.tokens.handler import TokenHandler
+from baserow.core.db import specific_iterator
 from baserow.core.exceptions import UserNotInGroup
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 from .serializers import (
@@ -48,6 +53,7 @@ from .serializers import (
     UpdateFieldSerializer,
     FieldSerializerWithRelatedFields,
     RelatedFieldsSerializer,
+    FieldConversionJobSerializer,
 )
 
 
@@ -117,7 +123,7 @@ class FieldsView(APIView):
 
         data = [
             field_type_registry.get_serializer(field, FieldSerializer).data
-            for field in fields
+            for field in specific_iterator(fields)
         ]
         return Response(data)
 
@@ -379,3 +385,126 @@ class FieldView(APIView):
             updated_fields = FieldHandler().delete_field(request.user, field)
 
         return Response(RelatedFieldsSerializer({}, related_fields=updated_fields).data)
+
+
+class FieldConversionView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="field_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Converts the field related to the provided value.",
+            )
+        ],
+        tags=["Database table fields"],
+        operation_id="convert_database_table_field",
+        description=(
+            "Creates and starts a job that updates the existing field in the "
+            "background if the authorized user has access to the related database's "
+            "group. It accepts the same properties as the update field endpoint, but "
+            "instead of converting all the values of the field while the table is "
+            "locked, they are converted in batches to a new column which replaces "
+            "the existing column at the end. This makes it possible to change the "
+            "type of a field of a large table without blocking the table. The "
+            "progress can be followed using the get field conversion job endpoint."
+        ),
+        request=DiscriminatorCustomFieldsMappingSerializer(
+            field_type_registry, UpdateFieldSerializer
+        ),
+        responses={
+            200: FieldConversionJobSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_RESERVED_BASEROW_FIELD_NAME",
+                    "ERROR_FIELD_WITH_SAME_NAME_ALREADY_EXISTS",
+                    "ERROR_INVALID_BASEROW_FIELD_NAME",
+                    "ERROR_FIELD_CONVERSION_JOB_ALREADY_RUNNING",
+                ]
+            ),
+            404: get_error_schema(["ERROR_FIELD_DOES_NOT_EXIST"]),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            FieldWithSameNameAlreadyExists: ERROR_FIELD_WITH_SAME_NAME_ALREADY_EXISTS,
+            ReservedBaserowFieldNameException: ERROR_RESERVED_BASEROW_FIELD_NAME,
+            InvalidBaserowFieldName: ERROR_INVALID_BASEROW_FIELD_NAME,
+            FieldConversionJobAlreadyRunning: (
+                ERROR_FIELD_CONVERSION_JOB_ALREADY_RUNNING
+            ),
+        }
+    )
+    def post(self, request, field_id):
+        """
+        Starts a new conversion job for the field if the user belongs to the group.
+        """
+
+        field = (
+            FieldHandler()
+            .get_field(field_id, base_queryset=Field.objects.select_for_update())
+            .specific
+        )
+        type_name = type_from_data_or_registry(request.data, field_type_registry, field)
+        field_type = field_type_registry.get(type_name)
+        data = validate_data_custom_fields(
+            type_name,
+            field_type_registry,
+            request.data,
+            base_serializer_class=UpdateFieldSerializer,
+        )
+
+        with field_type.map_api_exceptions():
+            job = FieldHandler().create_conversion_job(
+                request.user, field, type_name, **data
+            )
+
+        return Response(FieldConversionJobSerializer(job).data)
+
+
+class FieldConversionJobView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="job_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The job id to lookup information about.",
+            )
+        ],
+        tags=["Database table fields"],
+        operation_id="get_database_table_field_conversion_job",
+        description=(
+            "Returns information such as the conversion progress and status of the "
+            "specified field conversion job, only if the requesting user has access."
+        ),
+        responses={
+            200: FieldConversionJobSerializer,
+            404: get_error_schema(["ERROR_FIELD_CONVERSION_JOB_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            FieldConversionJobDoesNotExist: ERROR_FIELD_CONVERSION_JOB_DOES_NOT_EXIST,
+        }
+    )
+    def get(self, request, job_id):
+        """Retrieves the specified field conversion job."""
+
+        try:
+            job = FieldConversionJob.objects.get(id=job_id, user_id=request.user.id)
+        except FieldConversionJob.DoesNotExist:
+            raise FieldConversionJobDoesNotExist(
+                f"The field conversion job with id {job_id} does not exist."
+            )
+
+        return Response(FieldConversionJobSerializer(job).data)
@@ -1,7 +1,12 @@
-from rest_framework.status import HTTP_404_NOT_FOUND
+from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 
 ERROR_ROW_DOES_NOT_EXIST = (
     "ERROR_ROW_DOES_NOT_EXIST",
     HTTP_404_NOT_FOUND,
     "The requested row does not exist.",
 )
+ERROR_ROW_IDS_NOT_UNIQUE = (
+    "ERROR_ROW_IDS_NOT_UNIQUE",
+    HTTP_400_BAD_REQUEST,
+    "The provided row ids {e.ids} are not unique.",
+)
@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from rest_framework import serializers
 
 from baserow.api.serializers import get_example_pagination_serializer_class
@@ -100,6 +101,41 @@ def get_row_serializer_class(
     return get_serializer_class(model, field_names, field_overrides, base_class)
 
 
+class BatchUpdateRowSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(
+        min_value=1, help_text="The id of the row that must be updated."
+    )
+
+    class Meta:
+        fields = ("id",)
+
+
+def get_batch_row_serializer_class(row_serializer_class):
+    """
+    Generates a serializer that validates a list of rows, provided as `items`, with
+    the provided row serializer class. The number of rows is limited to the
+    `BATCH_ROWS_SIZE_LIMIT` setting.
+
+    :param row_serializer_class: The serializer that must be used to validate every
+        row.
+    :type row_serializer_class: Serializer
+    :return: The generated batch serializer.
+    :rtype: Serializer
+    """
+
+    fields = {
+        "items": serializers.ListField(
+            child=row_serializer_class(),
+            min_length=1,
+            max_length=settings.BATCH_ROWS_SIZE_LIMIT,
+        )
+    }
+
+    return type(
+        f"Batch{row_serializer_class.__name__}", (serializers.Serializer,), fields
+    )
+
+
 def get_example_row_serializer_class(add_id=False, user_field_names=False):
     """
     Generates a serializer containing a field for each field type. It is only used for
@@ -183,6 +219,34 @@ def get_example_row_serializer_class(add_id=False, user_field_names=False):
     return class_object
 
 
+def get_example_batch_update_row_serializer_class(user_field_names=False):
+    """
+    Generates a serializer containing a field for each field type and the id of the
+    row. It is only used for example purposes in the openapi documentation of the
+    batch update endpoint.
+
+    :param user_field_names: Whether this example serializer help text should indicate
+        the fields names can be switched using the `user_field_names` GET parameter.
+    :type user_field_names: bool
+    :return: Generated serializer containing the id and a field for each field type.
+    :rtype: Serializer
+    """
+
+    row_serializer_class = get_example_row_serializer_class(
+        False, user_field_names=user_field_names
+    )
+
+    return type(
+        row_serializer_class.__name__.replace("Request", "UpdateRequest"),
+        (row_serializer_class,),
+        {
+            "id": serializers.IntegerField(
+                help_text="The id of the row that must be updated."
+            )
+        },
+    )
+
+
 def get_example_row_metadata_field_serializer():
     """
     Generates a serializer containing a field for each row metadata type which
@@ -234,3 +298,14 @@ class ListRowsQueryParamsSerializer(serializers.Serializer):
     include = serializers.CharField(required=False)
     exclude = serializers.CharField(required=False)
     filter_type = serializers.CharField(required=False, default="")
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    include_count = serializers.BooleanField(required=False, default=False)
+
+
+class BatchDeleteRowsSerializer(serializers.Serializer):
+    items = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=settings.BATCH_ROWS_SIZE_LIMIT,
+        help_text="The ids of the rows that must be deleted.",
+    )
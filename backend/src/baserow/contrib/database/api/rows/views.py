@@ -7,10 +7,14 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from baserow.api.decorators import map_exceptions, validate_query_parameters
+from baserow.api.decorators import (
+    map_exceptions,
+    validate_body,
+    validate_query_parameters,
+)
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.api.exceptions import RequestBodyValidationException
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import PageNumberPagination, KeysetPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
 from baserow.api.user_files.errors import ERROR_USER_FILE_DOES_NOT_EXIST
@@ -20,7 +24,10 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_ORDER_BY_FIELD_NOT_FOUND,
     ERROR_FILTER_FIELD_NOT_FOUND,
 )
-from baserow.contrib.database.api.rows.errors import ERROR_ROW_DOES_NOT_EXIST
+from baserow.contrib.database.api.rows.errors import (
+    ERROR_ROW_DOES_NOT_EXIST,
+    ERROR_ROW_IDS_NOT_UNIQUE,
+)
 from baserow.contrib.database.api.rows.serializers import (
     example_pagination_row_serializer_class,
 )
@@ -36,7 +43,7 @@ from baserow.contrib.database.fields.exceptions import (
     OrderByFieldNotPossible,
     FilterFieldNotFound,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.rows.exceptions import RowDoesNotExist, RowIdsNotUnique
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
@@ -55,7 +62,11 @@ from .serializers import (
     MoveRowQueryParamsSerializer,
     CreateRowQueryParamsSerializer,
     RowSerializer,
+    BatchUpdateRowSerializer,
+    BatchDeleteRowsSerializer,
     get_example_row_serializer_class,
+    get_example_batch_update_row_serializer_class,
+    get_batch_row_serializer_class,
     get_row_serializer_class,
 )
 from baserow.contrib.database.fields.field_filters import (
@@ -89,6 +100,24 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Defines how many rows should be returned per page.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided the rows are paginated by a cursor instead "
+                "of a page, which stays fast deep into large tables. An empty value "
+                "returns the first page and the `next` URL in the response contains "
+                "the cursor of the next page. Can be combined with the `size` "
+                "parameter.",
+            ),
+            OpenApiParameter(
+                name="include_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description="Can only be used in combination with the `cursor` "
+                "parameter. If true the total count of the rows is included in the "
+                "response.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -194,9 +223,9 @@ class RowsView(APIView):
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's group. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
-            "optional search query, only rows where the data matches the search query "
-            "are going to be returned then. The properties of the returned rows "
+            "paginated by a page/size or cursor style. It is also possible to provide "
+            "an optional search query, only rows where the data matches the search "
+            "query are going to be returned then. The properties of the returned rows "
             "depends on which fields the table has. For a complete overview of fields "
             "use the **list_database_table_fields** endpoint to list them all. In the "
             "example all field types are listed, but normally the number in "
@@ -213,6 +242,7 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -277,7 +307,16 @@ class RowsView(APIView):
         filter_object = {key: request.GET.getlist(key) for key in request.GET.keys()}
         queryset = queryset.filter_by_fields_object(filter_object, filter_type)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if "cursor" in query_params:
+            paginator = KeysetPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT,
+                include_count=query_params["include_count"],
+            )
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
+
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True, user_field_names=user_field_names
@@ -727,3 +766,278 @@ class RowMoveView(APIView):
         )
         serializer = serializer_class(row)
         return Response(serializer.data)
+
+
+class BatchRowsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Creates the rows in the table.",
+            ),
+            OpenApiParameter(
+                name="before",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="If provided then the newly created rows will be "
+                "positioned before the row with the provided id.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.NONE,
+                description=(
+                    "A flag query parameter which if provided this endpoint will "
+                    "expect and return the user specified field names instead of "
+                    "internal Baserow field names (field_123 etc)."
+                ),
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="batch_create_database_table_rows",
+        description=(
+            "Creates multiple new rows in the table if the user has access to the "
+            "related table's group. The rows must be provided as a list in `items` "
+            "and every item accepts the same body fields as the "
+            "**create_database_table_row** endpoint. At most "
+            f"{settings.BATCH_ROWS_SIZE_LIMIT} rows can be created at once. The rows "
+            "are created in the provided order."
+        ),
+        request=get_batch_row_serializer_class(
+            get_example_row_serializer_class(False, user_field_names=True)
+        ),
+        responses={
+            200: get_batch_row_serializer_class(
+                get_example_row_serializer_class(True, user_field_names=True)
+            ),
+            400: get_error_schema(
+                ["ERROR_USER_NOT_IN_GROUP", "ERROR_REQUEST_BODY_VALIDATION"]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_ROW_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            UserFileDoesNotExist: ERROR_USER_FILE_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+        }
+    )
+    @validate_query_parameters(CreateRowQueryParamsSerializer)
+    def post(self, request, table_id, query_params):
+        """
+        Creates multiple new rows for the given table_id. Also the post data of every
+        row is validated according to the tables field types.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "create", table, False)
+        user_field_names = "user_field_names" in request.GET
+        model = table.get_model()
+
+        validation_serializer = get_batch_row_serializer_class(
+            get_row_serializer_class(model, user_field_names=user_field_names)
+        )
+        data = validate_data(validation_serializer, request.data)
+
+        before_id = query_params.get("before")
+        before = (
+            RowHandler().get_row(request.user, table, before_id, model)
+            if before_id
+            else None
+        )
+
+        try:
+            rows = RowHandler().create_rows(
+                request.user,
+                table,
+                data["items"],
+                model,
+                before=before,
+                user_field_names=user_field_names,
+            )
+        except ValidationError as e:
+            raise RequestBodyValidationException(detail=e.message)
+
+        serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+        serializer = serializer_class(rows, many=True)
+
+        return Response({"items": serializer.data})
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Updates the rows in the table.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.NONE,
+                description=(
+                    "A flag query parameter which if provided this endpoint will "
+                    "expect and return the user specified field names instead of "
+                    "internal Baserow field names (field_123 etc)."
+                ),
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="batch_update_database_table_rows",
+        description=(
+            "Updates multiple existing rows in the table if the user has access to "
+            "the related table's group. The rows must be provided as a list in "
+            "`items` and every item must contain the `id` of the row that must be "
+            "updated. Just like the **update_database_table_row** endpoint, only the "
+            "provided fields of every row are updated. At most "
+            f"{settings.BATCH_ROWS_SIZE_LIMIT} rows can be updated at once."
+        ),
+        request=get_batch_row_serializer_class(
+            get_example_batch_update_row_serializer_class(user_field_names=True)
+        ),
+        responses={
+            200: get_batch_row_serializer_class(
+                get_example_row_serializer_class(True, user_field_names=True)
+            ),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_ROW_IDS_NOT_UNIQUE",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_ROW_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            UserFileDoesNotExist: ERROR_USER_FILE_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+            RowIdsNotUnique: ERROR_ROW_IDS_NOT_UNIQUE,
+        }
+    )
+    def patch(self, request, table_id):
+        """
+        Updates multiple rows for the given table_id. Also the patch data of every
+        row is validated according to the tables field types.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "update", table, False)
+        user_field_names = "user_field_names" in request.GET
+        model = table.get_model()
+
+        validation_serializer = get_batch_row_serializer_class(
+            get_row_serializer_class(
+                model, BatchUpdateRowSerializer, user_field_names=user_field_names
+            )
+        )
+        data = validate_data(validation_serializer, request.data)
+
+        # The serialized data contains all the fields of the table, but only the
+        # fields that have been provided for a row must be updated.
+        rows_values = [
+            {key: value for key, value in values.items() if key in provided_values}
+            for values, provided_values in zip(data["items"], request.data["items"])
+        ]
+
+        try:
+            rows = RowHandler().update_rows(
+                request.user,
+                table,
+                rows_values,
+                model,
+                user_field_names=user_field_names,
+            )
+        except ValidationError as e:
+            raise RequestBodyValidationException(detail=e.message)
+
+        serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+        serializer = serializer_class(rows, many=True)
+
+        return Response({"items": serializer.data})
+
+
+class BatchDeleteRowsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Deletes the rows in the table related to the value.",
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="batch_delete_database_table_rows",
+        description=(
+            "Deletes multiple existing rows in the table if the user has access to "
+            "the table's group. The ids of the rows must be provided as a list in "
+            f"`items`. At most {settings.BATCH_ROWS_SIZE_LIMIT} rows can be deleted "
+            "at once."
+        ),
+        request=BatchDeleteRowsSerializer,
+        responses={
+            204: None,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_ROW_IDS_NOT_UNIQUE",
+                    "ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_ROW_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+            RowIdsNotUnique: ERROR_ROW_IDS_NOT_UNIQUE,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            CannotDeleteAlreadyDeletedItem: ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM,
+        }
+    )
+    @validate_body(BatchDeleteRowsSerializer)
+    def post(self, request, table_id, data):
+        """
+        Deletes the rows with the provided ids for the table with the given table_id.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "delete", table, False)
+        RowHandler().delete_rows(request.user, table, data["items"])
+
+        return Response(status=204)
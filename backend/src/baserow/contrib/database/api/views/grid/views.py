@@ -7,7 +7,7 @@ from rest_framework.views import APIView
 
 from baserow.api.decorators import map_exceptions, allowed_includes, validate_body
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import PageNumberPagination, KeysetPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.contrib.database.api.rows.serializers import (
@@ -97,6 +97,24 @@ class GridViewView(APIView):
                 description="Can only be used in combination with the `page` parameter "
                 "and defines how many rows should be returned.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided the rows are paginated by a cursor instead "
+                "of a page or offset, which stays fast deep into large tables. An "
+                "empty value returns the first page and the `next` URL in the "
+                "response contains the cursor of the next page. Can be combined with "
+                "the `size` parameter.",
+            ),
+            OpenApiParameter(
+                name="include_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.NONE,
+                description="Can only be used in combination with the `cursor` "
+                "parameter. If provided the total count of the rows is included in "
+                "the response.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -104,17 +122,27 @@ class GridViewView(APIView):
                 description="If provided only rows with data that matches the search "
                 "query are going to be returned.",
             ),
+            OpenApiParameter(
+                name="exclude_hidden_fields",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.NONE,
+                description="If provided the fields that are hidden in the view are "
+                "not fetched and not included in the rows of the response, unless "
+                "the rows are filtered or sorted on them. The hidden fields are not "
+                "searched.",
+            ),
         ],
         tags=["Database table grid view"],
         operation_id="list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's group. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
-            "overview of fields use the **list_database_table_fields** endpoint to "
-            "list them all. In the example all field types are listed, but normally "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a "
+            "complete overview of fields use the **list_database_table_fields** "
+            "endpoint to list them all. In the example all field types are listed, "
+            "but normally "
             "the number in field_{id} key is going to be the id of the field. "
             "The value is what the user has provided and the format of it depends on "
             "the fields type.\n"
@@ -135,7 +163,7 @@ class GridViewView(APIView):
                 },
                 serializer_name="PaginationSerializerWithGridViewFieldOptions",
             ),
-            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
+            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP", "ERROR_INVALID_CURSOR"]),
             404: get_error_schema(["ERROR_GRID_DOES_NOT_EXIST"]),
         },
     )
@@ -148,9 +176,10 @@ class GridViewView(APIView):
     @allowed_includes("field_options", "row_metadata")
     def get(self, request, view_id, field_options, row_metadata):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the cursor get parameter is provided the keyset pagination will be
+        used, if the limit get parameter is provided the limit/offset pagination will
+        be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the the
         `field_options` are provided in the include GET parameter.
@@ -165,27 +194,56 @@ class GridViewView(APIView):
         view.table.database.group.has_user(
             request.user, raise_error=True, allow_if_template=True
         )
-        model = view.table.get_model()
-        queryset = view_handler.get_queryset(view, search, model)
+        if "exclude_hidden_fields" in request.GET:
+            # Only the visible fields are fetched, searched and serialized, except for
+            # the fields that are filtered or sorted on. Those must be in the model to
+            # build the query and are serialized as well, so that the client can check
+            # whether a changed row still matches the filters and sortings.
+            visible_field_ids = view_type.get_visible_field_ids(view)
+            hidden_field_ids = list(
+                view_handler.get_filter_and_sort_field_ids(view)
+                - set(visible_field_ids)
+            )
+            field_ids = visible_field_ids + hidden_field_ids
+            model = view.table.get_model(field_ids=field_ids)
+        else:
+            visible_field_ids = None
+            field_ids = None
+            model = view.table.get_model()
+
+        queryset = view_handler.get_queryset(
+            view, search, model, only_field_ids=visible_field_ids
+        )
+        if visible_field_ids is not None:
+            queryset = queryset.enhance_by_fields(only_field_ids=hidden_field_ids)
 
         if "count" in request.GET:
             return Response({"count": queryset.count()})
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        if KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination(include_count="include_count" in request.GET)
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True
+            model, RowSerializer, is_response=True, field_ids=field_ids
         )
         serializer = serializer_class(page, many=True)
 
         response = paginator.get_paginated_response(serializer.data)
 
         if field_options:
-            context = {"fields": [o["field"] for o in model._field_objects.values()]}
+            # The field options of the hidden fields must also be included, so the
+            # fields are fetched by the serializer if the model doesn't contain all of
+            # them.
+            context = (
+                {"fields": [o["field"] for o in model._field_objects.values()]}
+                if visible_field_ids is None
+                else {}
+            )
             serializer_class = view_type.get_field_options_serializer_class()
             response.data.update(**serializer_class(view, context=context).data)
 
@@ -24,6 +24,7 @@ from baserow.api.utils import (
     CustomFieldRegistryMappingSerializer,
 )
 from baserow.api.schemas import get_error_schema
+from baserow.core.db import specific_iterator
 from baserow.core.exceptions import UserNotInGroup
 from baserow.contrib.database.api.fields.errors import ERROR_FIELD_NOT_IN_TABLE
 from baserow.contrib.database.api.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
@@ -162,7 +163,7 @@ class ViewsView(APIView):
             view_type_registry.get_serializer(
                 view, ViewSerializer, filters=filters, sortings=sortings
             ).data
-            for view in views
+            for view in specific_iterator(views)
         ]
         return Response(data)
 
@@ -1,9 +1,17 @@
+import json
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from types import SimpleNamespace
+from zipfile import ZIP_DEFLATED, ZipInfo
+
 from django.core.management.color import no_style
 from django.db import connection
 from django.urls import path, include
 
+from baserow.contrib.database.db.copy import copy_rows_into_table
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import specific_iterator
 from baserow.core.registries import ApplicationType
 from baserow.contrib.database.api.serializers import DatabaseSerializer
 from baserow.contrib.database.formula.types.typed_field_updater import (
@@ -17,6 +25,9 @@ class DatabaseApplicationType(ApplicationType):
     type = "database"
     model_class = Database
     instance_serializer_class = DatabaseSerializer
+    # The maximum number of rows that are fetched, or inserted, at once when
+    # exporting or importing the rows of a table.
+    ROWS_BATCH_SIZE = 2000
 
     def pre_delete(self, database):
         """
@@ -40,10 +51,12 @@ class DatabaseApplicationType(ApplicationType):
             path("database/", include(api_urls, namespace=self.type)),
         ]
 
-    def export_serialized(self, database, files_zip, storage):
+    def export_serialized(self, database, files_zip, storage, stream_rows=False):
         """
         Exports the database application type to a serialized format that can later be
-        be imported via the `import_serialized`.
+        be imported via the `import_serialized`. If `stream_rows` is true, the rows of
+        every table are written as JSON lines to a file in the `files_zip` instead of
+        being added to the serialized dict.
         """
 
         tables = database.table_set.all().prefetch_related(
@@ -54,49 +67,132 @@ class DatabaseApplicationType(ApplicationType):
         )
         serialized_tables = []
         for table in tables:
-            fields = table.field_set.all()
+            fields = list(specific_iterator(table.field_set.all()))
             serialized_fields = []
-            for f in fields:
-                field = f.specific
+            for field in fields:
                 field_type = field_type_registry.get_by_model(field)
                 serialized_fields.append(field_type.export_serialized(field))
 
             serialized_views = []
-            for v in table.view_set.all():
-                view = v.specific
+            for view in specific_iterator(table.view_set.all()):
                 view_type = view_type_registry.get_by_model(view)
                 serialized_views.append(
                     view_type.export_serialized(view, files_zip, storage)
                 )
 
+            serialized_table = {
+                "id": table.id,
+                "name": table.name,
+                "order": table.order,
+                "fields": serialized_fields,
+                "views": serialized_views,
+            }
+
             model = table.get_model(fields=fields)
-            serialized_rows = []
-            table_cache = {}
-            for row in model.objects.all():
-                serialized_row = {"id": row.id, "order": str(row.order)}
-                for field_object in model._field_objects.values():
-                    field_name = field_object["name"]
-                    field_type = field_object["type"]
-                    serialized_row[field_name] = field_type.get_export_serialized_value(
-                        row, field_name, table_cache, files_zip, storage
-                    )
-                serialized_rows.append(serialized_row)
-
-            serialized_tables.append(
-                {
-                    "id": table.id,
-                    "name": table.name,
-                    "order": table.order,
-                    "fields": serialized_fields,
-                    "views": serialized_views,
-                    "rows": serialized_rows,
-                }
-            )
+            serialized_rows = self._export_serialized_rows(model, files_zip, storage)
+
+            if stream_rows:
+                rows_file_name = f"database_table_{table.id}_rows.jsonl"
+                self._write_serialized_rows_to_zip(
+                    serialized_rows, files_zip, rows_file_name
+                )
+                serialized_table["rows_file_name"] = rows_file_name
+            else:
+                serialized_table["rows"] = list(serialized_rows)
+
+            serialized_tables.append(serialized_table)
 
         serialized = super().export_serialized(database, files_zip, storage)
         serialized["tables"] = serialized_tables
         return serialized
 
+    def _export_serialized_rows(self, model, files_zip, storage):
+        """
+        Generator that fetches the rows of the provided table model in batches and
+        yields them as serialized dicts.
+        """
+
+        table_cache = {}
+        for row in model.objects.all().iterator(chunk_size=self.ROWS_BATCH_SIZE):
+            serialized_row = {"id": row.id, "order": str(row.order)}
+            for field_object in model._field_objects.values():
+                field_name = field_object["name"]
+                field_type = field_object["type"]
+                serialized_row[field_name] = field_type.get_export_serialized_value(
+                    row, field_name, table_cache, files_zip, storage
+                )
+            yield serialized_row
+
+    def _write_serialized_rows_to_zip(self, serialized_rows, files_zip, file_name):
+        """
+        Writes the serialized rows as JSON lines to a new file in the zip. The rows are
+        first written to a temporary file because field types can add their own files
+        to the zip while serializing a row, which is not possible while another file
+        in the zip is open for writing.
+        """
+
+        with TemporaryFile() as rows_file:
+            for serialized_row in serialized_rows:
+                rows_file.write(json.dumps(serialized_row).encode("utf-8"))
+                rows_file.write(b"\n")
+
+            # Providing the size upfront allows the zip file to decide whether the
+            # ZIP64 extensions are needed.
+            zip_info = ZipInfo(file_name)
+            zip_info.compress_type = ZIP_DEFLATED
+            zip_info.file_size = rows_file.tell()
+            rows_file.seek(0)
+            with files_zip.open(zip_info, "w") as zip_file:
+                copyfileobj(rows_file, zip_file)
+
+    def _import_serialized_rows(self, table, files_zip):
+        """
+        Generator that yields the serialized rows of the provided table. If the rows
+        have been exported to a file in the zip, they are read line by line so that
+        they don't have to be loaded into memory at once.
+        """
+
+        if "rows_file_name" not in table:
+            yield from table["rows"]
+            return
+
+        with files_zip.open(table["rows_file_name"]) as rows_file:
+            for line in rows_file:
+                yield json.loads(line)
+
+    def _deserialize_rows(self, table, id_mapping, files_zip, storage):
+        """
+        Generator that yields the imported serialized rows of the provided table as
+        namespaces with the values set by the field types.
+        """
+
+        field_ids = [field_object.id for field_object in table["_field_objects"]]
+
+        for row in self._import_serialized_rows(table, files_zip):
+            row_object = SimpleNamespace(id=row["id"], order=row["order"])
+
+            for field in table["fields"]:
+                field_type = field_type_registry.get(field["type"])
+                new_field_id = id_mapping["database_fields"][field["id"]]
+
+                # If the new field id is not present in the field_ids then we don't
+                # want to set that value on the row. This is because upon creation
+                # of the field there could be a deliberate choice not to populate
+                # that field. This is for example the case with the related field
+                # of the `link_row` field which would result in duplicates if we
+                # would populate.
+                if new_field_id in field_ids:
+                    field_type.set_import_serialized_value(
+                        row_object,
+                        f'field_{id_mapping["database_fields"][field["id"]]}',
+                        row[f'field_{field["id"]}'],
+                        id_mapping,
+                        files_zip,
+                        storage,
+                    )
+
+            yield row_object
+
     def import_serialized(
         self, group, serialized_values, id_mapping, files_zip, storage
     ):
@@ -161,41 +257,15 @@ class DatabaseApplicationType(ApplicationType):
                 schema_editor.create_model(model)
 
         # Now that everything is in place we can start filling the table with the rows
-        # in an efficient matter by using the bulk_create functionality.
+        # in an efficient matter by using the PostgreSQL `COPY` command. The related
+        # ids of the many to many fields are inserted into the through tables in bulk
+        # after every batch of rows.
         for table in tables:
             model = table["_model"]
-            field_ids = [field_object.id for field_object in table["_field_objects"]]
-            rows_to_be_inserted = []
-
-            for row in table["rows"]:
-                row_object = model(id=row["id"], order=row["order"])
-
-                for field in table["fields"]:
-                    field_type = field_type_registry.get(field["type"])
-                    new_field_id = id_mapping["database_fields"][field["id"]]
-
-                    # If the new field id is not present in the field_ids then we don't
-                    # want to set that value on the row. This is because upon creation
-                    # of the field there could be a deliberate choice not to populate
-                    # that field. This is for example the case with the related field
-                    # of the `link_row` field which would result in duplicates if we
-                    # would populate.
-                    if new_field_id in field_ids:
-                        field_type.set_import_serialized_value(
-                            row_object,
-                            f'field_{id_mapping["database_fields"][field["id"]]}',
-                            row[f'field_{field["id"]}'],
-                            id_mapping,
-                            files_zip,
-                            storage,
-                        )
-
-                rows_to_be_inserted.append(row_object)
-
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            model.objects.bulk_create(rows_to_be_inserted)
+            rows = self._deserialize_rows(table, id_mapping, files_zip, storage)
+            copy_rows_into_table(
+                model, (vars(row) for row in rows), self.ROWS_BATCH_SIZE
+            )
 
             # When the rows are inserted we keep the provide the old ids and because of
             # that the auto increment is still set at `1`. This needs to be set to the
@@ -0,0 +1,167 @@
+from collections import defaultdict
+from io import StringIO
+from itertools import islice
+from typing import Any, Dict, Iterable
+
+from django.db import connections
+from django.utils import timezone
+from psycopg2.extras import Json
+
+from baserow.contrib.database.db.relations import set_many_to_many_relations
+from baserow.contrib.database.fields.fields import BaserowExpressionField
+from baserow.contrib.database.rows.order import row_order_allocator
+from baserow.contrib.database.formula.expression_generator.generator import (
+    baserow_expression_to_django_expression,
+)
+
+
+COPY_NULL = "\\N"
+COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"},
+)
+
+
+def to_copy_text(value: Any) -> str:
+    """
+    Converts a value that has been prepared for the database to its representation in
+    the text format of the PostgreSQL `COPY` command.
+
+    :param value: The value returned by the `get_db_prep_save` method of a field.
+    :return: The escaped text representation of the value.
+    """
+
+    if value is None:
+        return COPY_NULL
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, Json):
+        value = value.dumps(value.adapted)
+    elif not isinstance(value, str):
+        value = str(value)
+
+    return value.translate(COPY_ESCAPES)
+
+
+def copy_rows_into_table(
+    model, rows: Iterable[Dict[str, Any]], batch_size: int = 5000
+) -> int:
+    """
+    Inserts the provided rows into the table of the generated model using the
+    PostgreSQL `COPY ... FROM STDIN` command. This is a lot faster than `bulk_create`
+    when inserting lots of rows because no model instances have to be constructed and
+    PostgreSQL doesn't have to parse a huge insert statement. The rows are consumed
+    and copied in batches, so the memory usage doesn't grow with the number of rows.
+
+    Every row is a dict containing the values by the attribute name of the field, for
+    example `{"order": 1, "field_1": "Value", "field_2_id": 1}`. The values are
+    converted per column using the `get_db_prep_save` method of the model field.
+    Columns that are missing in a row get the default value of the field, the auto now
+    date fields get the current date and the id is generated by the sequence unless
+    the first row of the batch contains it. The values of many to many fields, like
+    the link row and multiple select fields, are lists of related ids by the name of
+    the field. They are written to the through tables after every batch, which
+    requires the rows containing them to have an id.
+
+    The values of the expression fields, like the formula fields, can't be provided
+    via the `COPY` command, so they are calculated afterwards for all the rows in the
+    table with a single update query. This loader is therefore meant to fill a newly
+    created table.
+
+    :param model: The generated table model of the table that must be filled.
+    :param rows: An iterable containing the rows that must be inserted.
+    :param batch_size: The maximum amount of rows that are copied at once.
+    :return: The number of inserted rows.
+    """
+
+    connection = connections[model.objects.db]
+    fields = []
+    expression_fields = []
+    for field in model._meta.concrete_fields:
+        if isinstance(field, BaserowExpressionField):
+            expression_fields.append(field)
+        else:
+            fields.append(field)
+
+    now = timezone.now()
+    defaults = {
+        field.attname: (
+            now
+            if getattr(field, "auto_now", False)
+            or getattr(field, "auto_now_add", False)
+            else field.get_default()
+        )
+        for field in fields
+    }
+
+    rows = iter(rows)
+    count = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+
+        if len(batch) == 0:
+            break
+
+        related_ids_by_field = defaultdict(dict)
+        for row in batch:
+            for field in model._meta.many_to_many:
+                related_ids = row.get(field.name)
+                if not related_ids:
+                    continue
+                if "id" not in row:
+                    raise ValueError(
+                        f"The row must have an id to set the values of {field.name}."
+                    )
+                related_ids_by_field[field.name][row["id"]] = list(
+                    dict.fromkeys(related_ids)
+                )
+
+        batch_fields = [
+            field
+            for field in fields
+            if not field.primary_key or field.attname in batch[0]
+        ]
+        columns = [
+            [
+                to_copy_text(
+                    field.get_db_prep_save(
+                        row.get(field.attname, defaults[field.attname]), connection
+                    )
+                )
+                for row in batch
+            ]
+            for field in batch_fields
+        ]
+        buffer = StringIO()
+        for values in zip(*columns):
+            buffer.write("\t".join(values))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        quote_name = connection.ops.quote_name
+        column_names = ", ".join(quote_name(field.column) for field in batch_fields)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {quote_name(model._meta.db_table)} ({column_names}) "
+                f"FROM STDIN",
+                buffer,
+            )
+
+        for name, related_ids_by_row in related_ids_by_field.items():
+            set_many_to_many_relations(model, name, related_ids_by_row, replace=False)
+
+        count += len(batch)
+
+    expressions = {
+        field.attname: baserow_expression_to_django_expression(field.expression, None)
+        for field in expression_fields
+        if field.expression is not None
+    }
+
+    if count > 0 and len(expressions) > 0:
+        model.objects.update(**expressions)
+
+    # The orders of the copied rows have been written without the allocator.
+    if count > 0:
+        row_order_allocator.reset(model._table_id)
+
+    return count
@@ -0,0 +1,69 @@
+from typing import Dict, List
+
+from django.db import connections
+
+
+def set_many_to_many_relations(
+    model, field_name: str, related_ids_by_row: Dict[int, List[int]], replace: bool
+):
+    """
+    Sets the related ids of a many to many field, like a link row or multiple select
+    field, of multiple rows at once using set based queries on the through table.
+    Instead of fetching the existing relations first like the `set` method of the
+    related manager does, the relations that must be removed are deleted with a
+    single `DELETE` query and the missing relations are inserted with a single
+    `INSERT ... ON CONFLICT DO NOTHING` query that relies on the unique constraint of
+    the through table. Existing relations are preserved so that the order of the
+    related rows doesn't change and new relations are added in the provided order.
+
+    :param model: The generated model containing the many to many field.
+    :param field_name: The name of the many to many field.
+    :param related_ids_by_row: The unique related ids by row id. Rows that are not
+        included are not changed.
+    :param replace: Indicates whether the rows could already have relations that must
+        be removed if they are not in the provided related ids.
+    """
+
+    if len(related_ids_by_row) == 0:
+        return
+
+    model_field = model._meta.get_field(field_name)
+    through_table = model_field.remote_field.through._meta.db_table
+    connection = connections[model.objects.db]
+    quote_name = connection.ops.quote_name
+    row_column = quote_name(model_field.m2m_column_name())
+    related_column = quote_name(model_field.m2m_reverse_name())
+
+    row_ids = []
+    related_ids = []
+    for row_id, row_related_ids in related_ids_by_row.items():
+        row_ids.extend([row_id] * len(row_related_ids))
+        related_ids.extend(row_related_ids)
+
+    with connection.cursor() as cursor:
+        if replace:
+            cursor.execute(
+                f"""
+                DELETE FROM {quote_name(through_table)} AS relation
+                WHERE relation.{row_column} = ANY(%s) AND NOT EXISTS (
+                    SELECT 1 FROM unnest(%s::bigint[], %s::bigint[])
+                        AS new_relation(row_id, related_id)
+                    WHERE new_relation.row_id = relation.{row_column}
+                    AND new_relation.related_id = relation.{related_column}
+                )
+                """,
+                [list(related_ids_by_row.keys()), row_ids, related_ids],
+            )
+
+        if len(row_ids) > 0:
+            cursor.execute(
+                f"""
+                INSERT INTO {quote_name(through_table)} ({row_column}, {related_column})
+                SELECT row_id, related_id
+                FROM unnest(%s::bigint[], %s::bigint[]) WITH ORDINALITY
+                    AS new_relation(row_id, related_id, position)
+                ORDER BY position
+                ON CONFLICT DO NOTHING
+                """,
+                [row_ids, related_ids],
+            )
@@ -4,6 +4,73 @@ from django.db.backends.base.schema import BaseDatabaseSchemaEditor
 from django.db.backends.utils import strip_quotes
 
 
+sql_create_try_cast = """
+    create or replace function %(function)s(
+        p_in text,
+        p_default int default null
+    )
+        returns %(type)s
+    as
+    $$
+    begin
+        begin
+            %(alter_column_prepare_old_value)s
+            %(alter_column_prepare_new_value)s
+            return p_in::%(type)s;
+        exception when others then
+            return p_default;
+        end;
+    end;
+    $$
+    language plpgsql;
+"""
+
+
+def get_create_try_cast_sql(
+    function_name,
+    new_type,
+    alter_column_prepare_old_value="",
+    alter_column_prepare_new_value="",
+):
+    """
+    Generates the SQL creating a function that converts the text representation of
+    a value to the new type. The `alter_column_prepare` statements are executed first
+    and if the casting fails, null is returned instead of raising an error.
+
+    :param function_name: The name of the function that must be created.
+    :type function_name: str
+    :param new_type: The database type that the function must return.
+    :type new_type: str
+    :param alter_column_prepare_old_value: A query statement converting the `p_in`
+        value to a string format. Can also be a tuple containing the statement and
+        the variables that must be passed along when executing the query.
+    :type alter_column_prepare_old_value: str or tuple
+    :param alter_column_prepare_new_value: A query statement converting the `p_in`
+        text value to the new type. Can also be a tuple containing the statement and
+        the variables that must be passed along when executing the query.
+    :type alter_column_prepare_new_value: str or tuple
+    :return: The SQL and the variables that must be passed along when executing it.
+    :rtype: tuple
+    """
+
+    variables = {}
+    if isinstance(alter_column_prepare_old_value, tuple):
+        alter_column_prepare_old_value, v = alter_column_prepare_old_value
+        variables = {**variables, **v}
+
+    if isinstance(alter_column_prepare_new_value, tuple):
+        alter_column_prepare_new_value, v = alter_column_prepare_new_value
+        variables = {**variables, **v}
+
+    sql = sql_create_try_cast % {
+        "function": function_name,
+        "type": new_type,
+        "alter_column_prepare_old_value": alter_column_prepare_old_value or "",
+        "alter_column_prepare_new_value": alter_column_prepare_new_value or "",
+    }
+    return sql, variables
+
+
 class PostgresqlLenientDatabaseSchemaEditor:
     """
     Class changes the behavior of the postgres database schema editor slightly. Normally
@@ -18,26 +85,6 @@ class PostgresqlLenientDatabaseSchemaEditor:
         "USING pg_temp.try_cast(%(column)s::text)"
     )
     sql_drop_try_cast = "DROP FUNCTION IF EXISTS pg_temp.try_cast(text, int)"
-    sql_create_try_cast = """
-        create or replace function pg_temp.try_cast(
-            p_in text,
-            p_default int default null
-        )
-            returns %(type)s
-        as
-        $$
-        begin
-            begin
-                %(alter_column_prepare_old_value)s
-                %(alter_column_prepare_new_value)s
-                return p_in::%(type)s;
-            exception when others then
-                return p_default;
-            end;
-        end;
-        $$
-        language plpgsql;
-    """
 
     def __init__(
         self,
@@ -66,31 +113,14 @@ class PostgresqlLenientDatabaseSchemaEditor:
             old_type = f"{old_type}_forced"
 
         if old_type != new_type:
-            variables = {}
-            if isinstance(self.alter_column_prepare_old_value, tuple):
-                alter_column_prepare_old_value, v = self.alter_column_prepare_old_value
-                variables = {**variables, **v}
-            else:
-                alter_column_prepare_old_value = self.alter_column_prepare_old_value
-
-            if isinstance(self.alter_column_prepare_new_value, tuple):
-                alter_column_prepare_new_value, v = self.alter_column_prepare_new_value
-                variables = {**variables, **v}
-            else:
-                alter_column_prepare_new_value = self.alter_column_prepare_new_value
-
-            quoted_column_name = self.quote_name(new_field.column)
-            self.execute(self.sql_drop_try_cast)
-            self.execute(
-                self.sql_create_try_cast
-                % {
-                    "column": quoted_column_name,
-                    "type": new_type,
-                    "alter_column_prepare_old_value": alter_column_prepare_old_value,
-                    "alter_column_prepare_new_value": alter_column_prepare_new_value,
-                },
-                variables,
+            sql, variables = get_create_try_cast_sql(
+                "pg_temp.try_cast",
+                new_type,
+                self.alter_column_prepare_old_value,
+                self.alter_column_prepare_new_value,
             )
+            self.execute(self.sql_drop_try_cast)
+            self.execute(sql, variables)
 
         return super()._alter_field(
             model,
@@ -3,8 +3,9 @@ import time
 from typing import Any, Callable
 
 import unicodecsv as csv
-from django.core.paginator import Paginator
-from django.db.models import QuerySet
+from django.db.models import QuerySet, prefetch_related_objects
+
+from baserow.core.db import get_estimated_count
 
 from baserow.contrib.database.export.exceptions import ExportJobCanceledException
 from baserow.contrib.database.table.models import FieldObject
@@ -60,12 +61,13 @@ class FileWriter(abc.ABC):
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Streams querysets to files in chunks of CHUNK_SIZE rows using a server side
+    cursor in a memory efficient manner. Also updates the provided job as it
+    progresses through any queryset writes every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    CHUNK_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -87,20 +89,59 @@ class PaginatedExportJobFileWriter(FileWriter):
         every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS as it progresses through writing
         the queryset.
 
+        Instead of executing a count and a query with an increasing offset for every
+        page, the rows are fetched via a single server side cursor. Because the
+        iterator ignores the prefetch related lookups, they are applied to every
+        chunk separately. The progress is based on the number of rows estimated by
+        the query planner.
+
         :param queryset: The queryset to write to the file.
         :param write_row: A callable function which takes each row from the queryset in
             turn and writes to the file.
         """
 
         self.last_check = time.perf_counter()
-        paginator = Paginator(queryset.all(), 2000)
+        estimated_rows = get_estimated_count(queryset)
         i = 0
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+        for chunk, is_last_chunk in self._iterate_in_chunks(queryset):
+            for index, row in enumerate(chunk):
                 i = i + 1
-                is_last_row = i == paginator.count
+                is_last_row = is_last_chunk and index == len(chunk) - 1
                 write_row(row, is_last_row)
-                self._check_and_update_job(i, paginator.count)
+                self._check_and_update_job(
+                    i, i if is_last_row else max(estimated_rows, i + 1)
+                )
+
+    def _iterate_in_chunks(self, queryset):
+        """
+        Iterates over the queryset using a server side cursor and yields the rows in
+        chunks of CHUNK_SIZE with the prefetch related lookups of the queryset
+        applied. One chunk is read ahead so that it's known whether the yielded chunk
+        is the last one.
+
+        :param queryset: The queryset to iterate over.
+        :return: A generator yielding a tuple containing a list of rows and a boolean
+            indicating whether it's the last chunk.
+        """
+
+        lookups = queryset._prefetch_related_lookups
+        iterator = queryset.prefetch_related(None).iterator(chunk_size=self.CHUNK_SIZE)
+
+        def next_chunk():
+            chunk = []
+            for row in iterator:
+                chunk.append(row)
+                if len(chunk) == self.CHUNK_SIZE:
+                    break
+            if lookups:
+                prefetch_related_objects(chunk, *lookups)
+            return chunk
+
+        chunk = next_chunk()
+        while chunk:
+            following_chunk = next_chunk() if len(chunk) == self.CHUNK_SIZE else []
+            yield chunk, not following_chunk
+            chunk = following_chunk
 
     def _check_and_update_job(self, current_row, total_rows):
         """
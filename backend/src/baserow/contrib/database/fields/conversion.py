@@ -0,0 +1,269 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Tuple
+
+from django.db import connection, transaction
+
+from baserow.contrib.database.db.schema import get_create_try_cast_sql
+
+# The number of rows that are converted in a single query. Every batch runs in its own
+# transaction, so rows are only locked while the batch that contains them is updated.
+CONVERSION_BATCH_SIZE = 10000
+
+
+@dataclass
+class ColumnConversion:
+    """
+    Describes how the column of a field is converted to the new type. Two conversions
+    are equal when they convert the values in the same way.
+    """
+
+    old_type: str
+    new_type: str
+    # The alter column prepare statements of the old and the new field type.
+    try_cast_sql: Tuple[Any, Any]
+    model: Any = field(compare=False)
+    model_field: Any = field(compare=False)
+    shadow_model_field: Any = field(compare=False)
+
+
+def get_shadow_column_name(field) -> str:
+    """
+    Returns the name of the temporary column that the converted values of the field
+    are written to before it replaces the column of the field.
+    """
+
+    return f"{field.db_column}_conversion"
+
+
+def get_conversion_function_names(model, column: str):
+    """
+    Returns the names of the functions that convert the values of the column. The
+    first one converts a single value and the second one is the trigger function that
+    converts the values of the rows that are written while the conversion runs.
+    """
+
+    prefix = f"{model._meta.db_table}_{column}"
+    return f"{prefix}_try_cast", f"{prefix}_conversion"
+
+
+def get_conversion_expression_sql(model, column: str, shadow_model_field, value_sql):
+    """
+    Returns the SQL expression converting the value to the type of the shadow column
+    using the try cast function of the column. If the shadow column can't contain
+    null, which is for example the case for a boolean, the default value of the field
+    is used when the value could not be converted.
+    """
+
+    try_cast_function, _ = get_conversion_function_names(model, column)
+    sql = f"{connection.ops.quote_name(try_cast_function)}({value_sql}::text)"
+    params = {}
+
+    if not shadow_model_field.null:
+        sql = f"COALESCE({sql}, %(shadow_default)s)"
+        params["shadow_default"] = shadow_model_field.get_db_prep_save(
+            shadow_model_field.get_default(), connection
+        )
+
+    return sql, params
+
+
+def add_shadow_column(model, model_field, shadow_model_field, try_cast_sql):
+    """
+    Adds the shadow column to the table together with a trigger that writes the
+    converted value to the shadow column every time a row is created or the value of
+    the original column is changed. This makes sure that rows written while the
+    existing rows are being converted also end up with the correct value.
+
+    :param model: The generated model of the table.
+    :param model_field: The model field of which the column must be converted.
+    :param shadow_model_field: The model field of the shadow column having the new
+        type.
+    :param try_cast_sql: The alter column prepare statements of the old and new field
+        type that must be used to convert the value.
+    :type try_cast_sql: tuple
+    """
+
+    quote_name = connection.ops.quote_name
+    table_name = quote_name(model._meta.db_table)
+    column = quote_name(model_field.column)
+    shadow_column = quote_name(shadow_model_field.column)
+    try_cast_function, trigger_function = get_conversion_function_names(
+        model, model_field.column
+    )
+    new_type = shadow_model_field.db_parameters(connection)["type"]
+    create_try_cast_sql, variables = get_create_try_cast_sql(
+        quote_name(try_cast_function), new_type, *try_cast_sql
+    )
+    new_value_sql, params = get_conversion_expression_sql(
+        model, model_field.column, shadow_model_field, f"NEW.{column}"
+    )
+
+    with transaction.atomic():
+        with connection.schema_editor() as schema_editor:
+            schema_editor.add_field(model, shadow_model_field)
+
+        with connection.cursor() as cursor:
+            cursor.execute(create_try_cast_sql, variables)
+            cursor.execute(
+                f"""
+                CREATE OR REPLACE FUNCTION {quote_name(trigger_function)}()
+                RETURNS trigger AS
+                $$
+                BEGIN
+                    NEW.{shadow_column} := {new_value_sql};
+                    RETURN NEW;
+                END;
+                $$
+                LANGUAGE plpgsql
+                """,
+                params,
+            )
+            cursor.execute(
+                f"""
+                CREATE TRIGGER {quote_name(trigger_function)}
+                BEFORE INSERT OR UPDATE OF {column} ON {table_name}
+                FOR EACH ROW EXECUTE PROCEDURE {quote_name(trigger_function)}()
+                """
+            )
+
+
+def backfill_shadow_column(
+    model,
+    model_field,
+    shadow_model_field,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Converts the values of all the existing rows to the shadow column in batches
+    ordered by id. Every batch continues after the last id of the previous batch, so
+    the cost of a batch doesn't grow with the number of rows converted before it.
+    Rows created after the conversion started are skipped because the trigger has
+    already converted those.
+
+    :param model: The generated model of the table.
+    :param model_field: The model field of which the column must be converted.
+    :param shadow_model_field: The model field of the shadow column.
+    :param on_progress: Called after every batch with the number of converted rows
+        and the total number of rows.
+    :return: The number of converted rows.
+    """
+
+    quote_name = connection.ops.quote_name
+    table_name = quote_name(model._meta.db_table)
+    shadow_column = quote_name(shadow_model_field.column)
+    value_sql, params = get_conversion_expression_sql(
+        model,
+        model_field.column,
+        shadow_model_field,
+        f"{table_name}.{quote_name(model_field.column)}",
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*), max(id) FROM {table_name}")
+        total, max_id = cursor.fetchone()
+
+    converted = 0
+    last_id = 0
+    while max_id is not None and last_id < max_id:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH batch AS (
+                    SELECT id FROM {table_name}
+                    WHERE id > %(last_id)s AND id <= %(max_id)s
+                    ORDER BY id
+                    LIMIT %(limit)s
+                ), updated AS (
+                    UPDATE {table_name} SET {shadow_column} = {value_sql}
+                    FROM batch WHERE {table_name}.id = batch.id
+                    RETURNING {table_name}.id
+                )
+                SELECT count(*), max(id) FROM updated
+                """,
+                {
+                    **params,
+                    "last_id": last_id,
+                    "max_id": max_id,
+                    "limit": CONVERSION_BATCH_SIZE,
+                },
+            )
+            count, batch_last_id = cursor.fetchone()
+
+        if count == 0:
+            break
+
+        converted += count
+        last_id = batch_last_id
+
+        if on_progress:
+            on_progress(converted, total)
+
+    return converted
+
+
+def conversion_trigger_exists(model, column: str) -> bool:
+    _, trigger_function = get_conversion_function_names(model, column)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_trigger WHERE tgname = %s AND tgrelid = %s::regclass",
+            [trigger_function, connection.ops.quote_name(model._meta.db_table)],
+        )
+        return cursor.fetchone() is not None
+
+
+def drop_conversion_trigger(model, column: str):
+    quote_name = connection.ops.quote_name
+    try_cast_function, trigger_function = get_conversion_function_names(model, column)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DROP TRIGGER IF EXISTS {quote_name(trigger_function)} "
+            f"ON {quote_name(model._meta.db_table)}"
+        )
+        cursor.execute(f"DROP FUNCTION IF EXISTS {quote_name(trigger_function)}()")
+        cursor.execute(
+            f"DROP FUNCTION IF EXISTS {quote_name(try_cast_function)}(text, int)"
+        )
+
+
+def swap_shadow_column(model, column: str, shadow_column: str):
+    """
+    Replaces the column with the shadow column containing the converted values. This
+    only changes the catalog of the table and doesn't rewrite it, so the table is only
+    locked for a short moment.
+
+    :param model: The generated model of the table.
+    :param column: The name of the column that must be replaced.
+    :param shadow_column: The name of the shadow column replacing the column.
+    """
+
+    quote_name = connection.ops.quote_name
+    table_name = quote_name(model._meta.db_table)
+    drop_conversion_trigger(model, column)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {table_name} DROP COLUMN {quote_name(column)}")
+        cursor.execute(
+            f"ALTER TABLE {table_name} RENAME COLUMN {quote_name(shadow_column)} "
+            f"TO {quote_name(column)}"
+        )
+
+
+def drop_shadow_column(model, column: str, shadow_column: str):
+    """
+    Removes the shadow column and the conversion trigger, for example when the
+    conversion failed.
+
+    :param model: The generated model of the table.
+    :param column: The name of the column that was being converted.
+    :param shadow_column: The name of the shadow column.
+    """
+
+    drop_conversion_trigger(model, column)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {connection.ops.quote_name(model._meta.db_table)} "
+            f"DROP COLUMN IF EXISTS {connection.ops.quote_name(shadow_column)}"
+        )
@@ -119,3 +119,22 @@ class AllProvidedMultipleSelectValuesMustBeSelectOption(Exception):
     contains a SelectOption ID that either does not exists or does not belong to the
     field.
     """
+
+
+class FieldConversionJobDoesNotExist(Exception):
+    """Raised when a field conversion job does not exist."""
+
+
+class FieldConversionJobAlreadyRunning(Exception):
+    """
+    Raised when a field conversion job is created for a field that is already being
+    converted in the background.
+    """
+
+
+class FieldChangedDuringConversion(Exception):
+    """
+    Raised when the field has been changed while its values were being converted in
+    the background, which means that the converted values might not be correct
+    anymore.
+    """
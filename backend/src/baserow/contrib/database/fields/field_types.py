@@ -15,7 +15,7 @@ from django.core.files.storage import default_storage
 from django.db import models, OperationalError
 from django.db.models import Case, When, Q, F, Func, Value, CharField
 from django.db.models.expressions import RawSQL
-from django.db.models.functions import Coalesce
+from django.db.models.functions import Cast, Coalesce
 from django.utils.timezone import make_aware
 from pytz import timezone
 from rest_framework import serializers
@@ -28,6 +28,7 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_TOO_DEEPLY_NESTED_FORMULA,
 )
 from baserow.contrib.database.api.fields.serializers import (
+    LinkRowValueListSerializer,
     LinkRowValueSerializer,
     FileFieldRequestSerializer,
     SelectOptionSerializer,
@@ -51,6 +52,11 @@ from baserow.contrib.database.formula.types.formula_types import (
     BASEROW_FORMULA_TYPE_ALLOWED_FIELDS,
 )
 from baserow.contrib.database.formula.types.table_typer import TypedBaserowTable
+from baserow.contrib.database.table.primary_values import (
+    get_cached_primary_values_expression,
+    get_primary_values_attribute_name,
+    get_related_primary_values,
+)
 from baserow.contrib.database.validators import UnicodeRegexValidator
 from baserow.core.models import UserFile
 from baserow.core.user_files.exceptions import UserFileDoesNotExist
@@ -166,6 +172,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_expression(self, field_name, model_field, field):
+        return F(field_name)
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType()
 
@@ -240,6 +249,9 @@ class TextFieldType(FieldType):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_expression(self, field_name, model_field, field):
+        return F(field_name)
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType()
 
@@ -273,6 +285,9 @@ class LongTextFieldType(FieldType):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_expression(self, field_name, model_field, field):
+        return F(field_name)
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType()
 
@@ -402,6 +417,9 @@ class NumberFieldType(FieldType):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_expression(self, field_name, model_field, field):
+        return Cast(field_name, output_field=models.TextField())
+
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
         value = getattr(row, field_name)
         return value if value is None else str(value)
@@ -564,18 +582,21 @@ class DateFieldType(FieldType):
         return AnnotatedQ(
             annotation={
                 f"formatted_date_{field_name}": Coalesce(
-                    Func(
-                        F(field_name),
-                        Value(field.get_psql_format()),
-                        function="to_char",
-                        output_field=CharField(),
-                    ),
+                    self.get_search_expression(field_name, model_field, field),
                     Value(""),
                 )
             },
             q={f"formatted_date_{field_name}__icontains": value},
         )
 
+    def get_search_expression(self, field_name, model_field, field):
+        return Func(
+            F(field_name),
+            Value(field.get_psql_format()),
+            function="to_char",
+            output_field=CharField(),
+        )
+
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
         """
         If the field type has changed into a date field then we want to parse the old
@@ -704,18 +725,21 @@ class CreatedOnLastModifiedBaseFieldType(DateFieldType):
         return AnnotatedQ(
             annotation={
                 f"formatted_date_{field_name}": Coalesce(
-                    RawSQL(
-                        f"""TO_CHAR({field_name} at time zone %s,
-                        '{field.get_psql_format()}')""",
-                        [field.get_timezone()],
-                        output_field=CharField(),
-                    ),
+                    self.get_search_expression(field_name, model_field, field),
                     Value(""),
                 )
             },
             q={f"formatted_date_{field_name}__icontains": value},
         )
 
+    def get_search_expression(self, field_name, model_field, field):
+        return RawSQL(
+            f"""TO_CHAR({field_name} at time zone %s,
+            '{field.get_psql_format()}')""",
+            [field.get_timezone()],
+            output_field=CharField(),
+        )
+
     def get_alter_column_prepare_old_value(self, connection, from_field, to_field):
         """
         If the field type has changed then we want to convert the date or timestamp to
@@ -829,10 +853,22 @@ class LinkRowFieldType(FieldType):
         Makes sure that the related rows are prefetched by Django. We also want to
         enhance the primary field of the related queryset. If for example the primary
         field is a single select field then the dropdown options need to be
-        prefetched in order to prevent many queries.
+        prefetched in order to prevent many queries. If the related table caches its
+        primary values, they are annotated instead so that the related table doesn't
+        have to be queried at all.
         """
 
         remote_model = queryset.model._meta.get_field(name).remote_field.model
+
+        if remote_model._cache_primary_values:
+            return queryset.annotate(
+                **{
+                    get_primary_values_attribute_name(
+                        name
+                    ): get_cached_primary_values_expression(queryset.model, name)
+                }
+            )
+
         related_queryset = remote_model.objects.all()
 
         try:
@@ -896,6 +932,15 @@ class LinkRowFieldType(FieldType):
         :return: A list of mapped linked primary key values.
         """
 
+        related_primary_values = get_related_primary_values(
+            getattr(value, "instance", None), field_object["name"]
+        )
+        if related_primary_values is not None:
+            return [
+                primary_value.value or f"unnamed row {primary_value.id}"
+                for primary_value in related_primary_values
+            ]
+
         instance = field_object["field"]
         if hasattr(instance, "_related_model"):
             related_model = instance._related_model
@@ -958,7 +1003,7 @@ class LinkRowFieldType(FieldType):
         be used to include the primary field's value in the response as a string.
         """
 
-        return serializers.ListSerializer(
+        return LinkRowValueListSerializer(
             child=LinkRowValueSerializer(), **{"required": False, **kwargs}
         )
 
@@ -1283,7 +1328,9 @@ class LinkRowFieldType(FieldType):
     def set_import_serialized_value(
         self, row, field_name, value, id_mapping, files_zip, storage
     ):
-        getattr(row, field_name).set(value)
+        # The related row ids are written to the through table after the rows have
+        # been inserted.
+        setattr(row, field_name, value)
 
     def get_related_items_to_trash(self, field) -> List[Any]:
         return [field.link_row_related_field]
@@ -1452,6 +1499,16 @@ class FileFieldType(FieldType):
     def contains_query(self, *args):
         return filename_contains_filter(*args)
 
+    def get_search_expression(self, field_name, model_field, field):
+        return RawSQL(
+            f"""(
+                SELECT STRING_AGG(attached_files ->> 'visible_name', ' ')
+                FROM JSONB_ARRAY_ELEMENTS("field_{field.id}") as attached_files
+            )""",
+            [],
+            output_field=CharField(),
+        )
+
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
         file_names = []
         user_file_handler = UserFileHandler()
@@ -1722,6 +1779,21 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
         if value == "":
             return Q()
 
+        query = self.get_search_expression(field_name, model_field, field)
+
+        # If there are no values then there is no way this search could match this
+        # field.
+        if query is None:
+            return Q()
+
+        return AnnotatedQ(
+            annotation={
+                f"select_option_value_{field_name}": Coalesce(query, Value(""))
+            },
+            q={f"select_option_value_{field_name}__icontains": value},
+        )
+
+    def get_search_expression(self, field_name, model_field, field):
         option_value_mappings = []
         option_values = []
         # We have to query for all option values here as the user table we are
@@ -1733,10 +1805,8 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
             option_values.append(option.value)
             option_value_mappings.append(f"(lower(%s), {int(option.id)})")
 
-        # If there are no values then there is no way this search could match this
-        # field.
         if len(option_value_mappings) == 0:
-            return Q()
+            return None
 
         convert_rows_select_id_to_value_sql = f"""(
                 SELECT key FROM (
@@ -1746,17 +1816,11 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
             )
         """
 
-        query = RawSQL(
+        return RawSQL(
             convert_rows_select_id_to_value_sql,
             params=option_values,
             output_field=models.CharField(),
         )
-        return AnnotatedQ(
-            annotation={
-                f"select_option_value_{field_name}": Coalesce(query, Value(""))
-            },
-            q={f"select_option_value_{field_name}__icontains": value},
-        )
 
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
         return getattr(row, field_name + "_id")
@@ -1944,7 +2008,9 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
         mapped_values = [
             id_mapping["database_field_select_options"][item] for item in value
         ]
-        getattr(row, field_name).set(mapped_values)
+        # The select option ids are written to the through table after the rows have
+        # been inserted.
+        setattr(row, field_name, mapped_values)
 
     def contains_query(self, field_name, value, model_field, field):
         value = value.strip()
@@ -1961,6 +2027,21 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
             q={f"select_option_value_{field_name}__icontains": value},
         )
 
+    def get_search_expression(self, field_name, model_field, field):
+        through_table = model_field.remote_field.through._meta.db_table
+        return RawSQL(
+            f"""(
+                SELECT STRING_AGG(select_option.value, ' ')
+                FROM "{through_table}" AS relation
+                INNER JOIN "{SelectOption._meta.db_table}" AS select_option
+                ON select_option.id = relation."{model_field.m2m_reverse_name()}"
+                WHERE relation."{model_field.m2m_column_name()}" =
+                "{model_field.model._meta.db_table}".id
+            )""",
+            [],
+            output_field=CharField(),
+        )
+
     def get_order(self, field, field_name, order_direction):
         """
         If the user wants to sort the results he expects them to be ordered
@@ -1970,7 +2051,19 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
         """
 
         sort_column_name = f"{field_name}_agg_sort"
-        query = Coalesce(StringAgg(f"{field_name}__value", ""), Value(""))
+        # The values are aggregated in the order that the user added them, which is
+        # the order of the id of the through table, just like the
+        # `MultipleSelectManyToManyDescriptor` does. This makes sure that the same row
+        # always results in the same sort value, which is needed for cursor
+        # pagination.
+        query = Coalesce(
+            StringAgg(
+                f"{field_name}__value",
+                "",
+                ordering=RawSQL(f'"{field.through_table_name}"."id"', ()),
+            ),
+            Value(""),
+        )
         annotation = {sort_column_name: query}
 
         order = F(sort_column_name)
@@ -2171,6 +2264,13 @@ class FormulaFieldType(FieldType):
         ) = self._get_field_instance_and_type_from_formula_field(field)
         return field_type.contains_query(field_name, value, model_field, field_instance)
 
+    def get_search_expression(self, field_name, model_field, field: FormulaField):
+        (
+            field_instance,
+            field_type,
+        ) = self._get_field_instance_and_type_from_formula_field(field)
+        return field_type.get_search_expression(field_name, model_field, field_instance)
+
     def expression_to_update_field_after_related_field_changes(self, field, to_model):
         if not (field.error or field.trashed):
             f = to_model._meta.get_field(field.db_column)
@@ -1,13 +1,35 @@
 import logging
 from copy import deepcopy
+from datetime import timedelta
 from typing import Dict, Any, Optional, List
 
 from django.conf import settings
-from django.db import connection
+from django.db import connection, transaction
+from django.db.models import Model
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.db.utils import ProgrammingError, DataError
 
 from baserow.contrib.database.db.schema import lenient_schema_editor
+from baserow.contrib.database.fields.conversion import (
+    ColumnConversion,
+    add_shadow_column,
+    backfill_shadow_column,
+    conversion_trigger_exists,
+    drop_conversion_trigger,
+    drop_shadow_column,
+    get_shadow_column_name,
+    swap_shadow_column,
+)
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.indexes import (
+    drop_field_indexes,
+    schedule_field_indexes_update,
+)
+from baserow.contrib.database.table.primary_values import (
+    update_primary_values_after_field_change,
+)
+from baserow.contrib.database.table.search import update_search_data_after_field_change
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import extract_allowed, set_allowed_attrs
@@ -23,10 +45,22 @@ from .exceptions import (
     ReservedBaserowFieldNameException,
     InvalidBaserowFieldName,
     MaxFieldNameLengthExceeded,
+    FieldConversionJobAlreadyRunning,
+    FieldChangedDuringConversion,
+)
+from .models import (
+    Field,
+    SelectOption,
+    FieldConversionJob,
+    FIELD_CONVERSION_JOB_PENDING_STATUS,
+    FIELD_CONVERSION_JOB_CONVERTING_STATUS,
+    FIELD_CONVERSION_JOB_COMPLETED_STATUS,
+    FIELD_CONVERSION_JOB_FAILED_STATUS,
+    FIELD_CONVERSION_JOB_RUNNING_STATUSES,
 )
-from .models import Field, SelectOption
 from .registries import field_type_registry, field_converter_registry
 from .signals import field_created, field_updated, field_deleted
+from .tasks import FIELD_CONVERSION_TIME_LIMIT, run_field_conversion_job
 from baserow.contrib.database.formula.types.typed_field_updater import (
     type_table_and_update_fields_given_changed_field,
     type_table_and_update_fields_given_deleted_field,
@@ -215,6 +249,10 @@ class FieldHandler:
                 schema_editor.add_field(to_model, model_field)
 
         typed_updated_table.update_values_for_all_updated_fields()
+        update_search_data_after_field_change(table)
+        update_primary_values_after_field_change(
+            table, [instance, *typed_updated_table.updated_fields]
+        )
 
         field_type.after_create(instance, to_model, user, connection, before)
 
@@ -232,7 +270,13 @@ class FieldHandler:
             return instance
 
     def update_field(
-        self, user, field, new_type_name=None, return_updated_fields=False, **kwargs
+        self,
+        user,
+        field,
+        new_type_name=None,
+        return_updated_fields=False,
+        shadow_column=None,
+        **kwargs,
     ):
         """
         Updates the values of the given field, if provided it is also possible to change
@@ -247,6 +291,11 @@ class FieldHandler:
         :param return_updated_fields: When True any other fields who changed as a
             result of this field update are returned with their new field instances.
         :type return_updated_fields: bool
+        :param shadow_column: The name of a column that already contains the
+            converted values of the field. If provided, the column of the field is
+            replaced by this column instead of being altered. This is used by the
+            field conversion job.
+        :type shadow_column: str
         :param kwargs: The field values that need to be updated
         :type kwargs: object
         :raises ValueError: When the provided field is not an instance of Field.
@@ -312,6 +361,11 @@ class FieldHandler:
         from_model_field = from_model._meta.get_field(field.db_column)
         to_model_field = to_model._meta.get_field(field.db_column)
 
+        # The operator class of an index on the column might not support the new
+        # type, so the indexes are dropped and recreated in the background later.
+        if baserow_field_type_changed:
+            drop_field_indexes(from_model, field.id)
+
         # Before a field is updated we are going to call the before_schema_change
         # method of the old field because some cleanup of related instances might
         # need to happen.
@@ -343,6 +397,10 @@ class FieldHandler:
                 user,
                 connection,
             )
+        elif shadow_column is not None:
+            # The values have already been converted to the shadow column by the
+            # field conversion job, so only the columns have to be swapped.
+            swap_shadow_column(from_model, from_model_field.column, shadow_column)
         else:
             if baserow_field_type_changed:
                 # If the baserow type has changed we always want to force run any alter
@@ -354,6 +412,14 @@ class FieldHandler:
                     old_field, field
                 )
 
+            # The column can't be altered while a conversion job keeps the shadow
+            # column up to date using a trigger. Dropping the trigger makes the job
+            # fail because the converted values can't be trusted anymore.
+            if FieldConversionJob.objects.filter(
+                field_id=field.id, status=FIELD_CONVERSION_JOB_CONVERTING_STATUS
+            ).exists():
+                drop_conversion_trigger(from_model, from_model_field.column)
+
             # If no field converter is found we are going to alter the field using the
             # the lenient schema editor.
             with lenient_schema_editor(
@@ -405,6 +471,11 @@ class FieldHandler:
             before,
         )
         typed_updated_table.update_values_for_all_updated_fields()
+        update_search_data_after_field_change(field.table)
+        update_primary_values_after_field_change(
+            field.table, [field, *typed_updated_table.updated_fields]
+        )
+        schedule_field_indexes_update(field.table_id)
 
         field_updated.send(
             self,
@@ -418,6 +489,308 @@ class FieldHandler:
         else:
             return field
 
+    def create_conversion_job(self, user, field, new_type_name=None, **kwargs):
+        """
+        Creates a job that updates the field in a background task. Unlike the
+        `update_field` method, the table isn't locked while the values of the rows
+        are converted to the new type, which can take a long time for large tables.
+
+        :param user: The user on whose behalf the field is updated.
+        :type user: User
+        :param field: The field instance that needs to be updated.
+        :type field: Field
+        :param new_type_name: If the type needs to be changed it can be provided here.
+        :type new_type_name: str
+        :param kwargs: The field values that need to be updated.
+        :type kwargs: object
+        :raises ValueError: When the provided field is not an instance of Field.
+        :raises FieldConversionJobAlreadyRunning: When the field is already being
+            converted by another job.
+        :return: The created pending job.
+        :rtype: FieldConversionJob
+        """
+
+        if not isinstance(field, Field):
+            raise ValueError("The field is not an instance of Field.")
+
+        group = field.table.database.group
+        group.has_user(user, raise_error=True)
+
+        field_type = field_type_registry.get_by_model(field)
+        if new_type_name and field_type.type != new_type_name:
+            field_type = field_type_registry.get(new_type_name)
+
+            if field.primary and not field_type.can_be_primary_field:
+                raise IncompatiblePrimaryFieldTypeError(new_type_name)
+
+        allowed_fields = ["name"] + field_type.allowed_fields
+        field_values = extract_allowed(kwargs, allowed_fields)
+        _validate_field_name(
+            field_values, field.table, field, raise_if_name_missing=False
+        )
+        # The values are stored as JSON, so model instances, like the table of a link
+        # row field, are stored by their id and are converted back by the
+        # `prepare_values` method of the field type.
+        field_values = {
+            key: value.pk if isinstance(value, Model) else value
+            for key, value in field_values.items()
+        }
+
+        if self._get_running_conversion_jobs(stale=False).filter(field=field).exists():
+            raise FieldConversionJobAlreadyRunning(
+                f"The field with id {field.id} is already being converted."
+            )
+
+        job = FieldConversionJob.objects.create(
+            user=user,
+            field=field,
+            new_type_name=new_type_name,
+            field_values=field_values,
+            status=FIELD_CONVERSION_JOB_PENDING_STATUS,
+        )
+        # The job must only run after the transaction has been committed, otherwise
+        # the task might not find the job.
+        transaction.on_commit(lambda: run_field_conversion_job.delay(job.id))
+        return job
+
+    def run_conversion_job(self, job):
+        """
+        Runs the provided field conversion job. If the column of the field must be
+        converted, the values are first converted to a shadow column in batches while
+        a trigger converts the rows that are written in the meantime. The field is then
+        updated in a short transaction that replaces the column with the shadow
+        column. The progress of the job is updated after every batch.
+
+        If the job fails, the error is stored on the job and the shadow column is
+        removed.
+
+        :param job: The job that must be run.
+        :type job: FieldConversionJob
+        :raises FieldChangedDuringConversion: When the field has been changed in a way
+            that affects the conversion while the values were being converted.
+        :return: The updated field.
+        :rtype: Field
+        """
+
+        job.status = FIELD_CONVERSION_JOB_CONVERTING_STATUS
+        job.started_at = timezone.now()
+        job.save(update_fields=["status", "started_at"])
+
+        def update_progress(converted, total):
+            job.progress_percentage = min(converted / total, 1.0)
+            job.save(update_fields=["progress_percentage"])
+
+        conversion = None
+        try:
+            field = job.field.specific
+            field.table.database.group.has_user(job.user, raise_error=True)
+            conversion = self._get_column_conversion(
+                job.user, field, job.new_type_name, job.field_values
+            )
+
+            if conversion is not None:
+                add_shadow_column(
+                    conversion.model,
+                    conversion.model_field,
+                    conversion.shadow_model_field,
+                    conversion.try_cast_sql,
+                )
+                backfill_shadow_column(
+                    conversion.model,
+                    conversion.model_field,
+                    conversion.shadow_model_field,
+                    update_progress,
+                )
+
+            with transaction.atomic():
+                field = self.get_field(
+                    field.id, base_queryset=Field.objects.select_for_update()
+                ).specific
+
+                if conversion != self._get_column_conversion(
+                    job.user, field, job.new_type_name, job.field_values
+                ) or (
+                    conversion is not None
+                    and not conversion_trigger_exists(
+                        conversion.model, conversion.model_field.column
+                    )
+                ):
+                    raise FieldChangedDuringConversion(
+                        f"The field with id {field.id} has been changed while it was "
+                        f"being converted."
+                    )
+
+                field = self.update_field(
+                    job.user,
+                    field,
+                    job.new_type_name,
+                    shadow_column=(
+                        conversion.shadow_model_field.column if conversion else None
+                    ),
+                    **job.field_values,
+                )
+        except Exception as e:
+            if conversion is not None:
+                drop_shadow_column(
+                    conversion.model,
+                    conversion.model_field.column,
+                    conversion.shadow_model_field.column,
+                )
+
+            job.status = FIELD_CONVERSION_JOB_FAILED_STATUS
+            job.progress_percentage = 0.0
+            job.error = str(e)
+            job.save()
+            raise e
+
+        job.status = FIELD_CONVERSION_JOB_COMPLETED_STATUS
+        job.progress_percentage = 1.0
+        job.save()
+        return field
+
+    # noinspection PyMethodMayBeStatic
+    def _get_running_conversion_jobs(self, stale):
+        """
+        Returns the pending and converting jobs. The task running a job is killed
+        when it exceeds the `FIELD_CONVERSION_TIME_LIMIT`, so a job that has been
+        pending or converting for longer than that has been abandoned, for example
+        because the worker crashed, and is considered stale.
+
+        :param stale: Whether only the stale or only the actually running jobs must
+            be returned.
+        :type stale: bool
+        :return: The queryset containing the running or stale jobs.
+        :rtype: QuerySet
+        """
+
+        stale_time = timezone.now() - timedelta(seconds=FIELD_CONVERSION_TIME_LIMIT)
+        queryset = FieldConversionJob.objects.annotate(
+            running_since=Coalesce("started_at", "created_at")
+        ).filter(status__in=FIELD_CONVERSION_JOB_RUNNING_STATUSES)
+
+        if stale:
+            return queryset.filter(running_since__lte=stale_time)
+        else:
+            return queryset.filter(running_since__gt=stale_time)
+
+    def clean_up_stale_conversion_jobs(self):
+        """
+        Fails the conversion jobs that have been abandoned without being marked as
+        failed, for example because the worker was killed by the time limit. The
+        trigger and the shadow column of the conversion are removed, so that the
+        field can be converted again and the rows of the table aren't converted on
+        every write anymore.
+        """
+
+        jobs = self._get_running_conversion_jobs(stale=True).select_related(
+            "field__table"
+        )
+        logger.info(f"Cleaning up {jobs.count()} stale field conversion jobs")
+
+        for job in jobs:
+            with transaction.atomic():
+                if job.status == FIELD_CONVERSION_JOB_CONVERTING_STATUS:
+                    drop_shadow_column(
+                        job.field.table.get_model(field_ids=[]),
+                        job.field.db_column,
+                        get_shadow_column_name(job.field),
+                    )
+
+                job.status = FIELD_CONVERSION_JOB_FAILED_STATUS
+                job.progress_percentage = 0.0
+                job.error = "The conversion did not finish within the time limit."
+                job.save()
+
+    # noinspection PyMethodMayBeStatic
+    def _get_column_conversion(self, user, field, new_type_name, field_values):
+        """
+        Determines how the column of the field would be converted when the field is
+        updated with the provided values, without changing the field.
+
+        :param user: The user on whose behalf the field is updated.
+        :type user: User
+        :param field: The specific field instance that would be updated.
+        :type field: Field
+        :param new_type_name: The type that the field would be changed to.
+        :type new_type_name: str
+        :param field_values: The field values that would be updated.
+        :type field_values: dict
+        :return: The conversion or None if the column doesn't have to be converted or
+            if the conversion can only be done by the `update_field` method. That is
+            the case if a field converter applies, if the new field has select options
+            that only exist after updating or if the values are computed by the
+            database.
+        :rtype: Optional[ColumnConversion]
+        """
+
+        old_field_type = field_type_registry.get_by_model(field)
+        field_type = (
+            field_type_registry.get(new_type_name) if new_type_name else old_field_type
+        )
+        baserow_field_type_changed = field_type.type != old_field_type.type
+
+        if (
+            field_type.can_have_select_options
+            or field_type.read_only
+            or old_field_type.read_only
+        ):
+            return None
+
+        new_field = deepcopy(field)
+        if baserow_field_type_changed:
+            new_field = field_type.model_class(
+                **{
+                    model_field.attname: getattr(field, model_field.attname)
+                    for model_field in Field._meta.concrete_fields
+                }
+            )
+            new_field.field_ptr_id = field.id
+
+        allowed_fields = ["name"] + field_type.allowed_fields
+        values = field_type.prepare_values(
+            extract_allowed(field_values, allowed_fields), user
+        )
+        new_field = set_allowed_attrs(values, allowed_fields, new_field)
+
+        model = field.table.get_model(field_ids=[], fields=[field])
+        model_field = model._meta.get_field(field.db_column)
+        if field_converter_registry.find_applicable_converter(model, field, new_field):
+            return None
+
+        shadow_column = get_shadow_column_name(field)
+        shadow_model_field = field_type.get_model_field(
+            new_field, db_column=shadow_column, verbose_name=new_field.name
+        )
+        shadow_model_field.set_attributes_from_name(shadow_column)
+        shadow_model_field.model = model
+        if shadow_model_field.remote_field is not None:
+            return None
+
+        old_type = model_field.db_parameters(connection)["type"]
+        new_type = shadow_model_field.db_parameters(connection)["type"]
+        if (
+            not baserow_field_type_changed
+            and old_type == new_type
+            and not field_type.force_same_type_alter_column(field, new_field)
+        ):
+            return None
+
+        return ColumnConversion(
+            old_type=old_type,
+            new_type=new_type,
+            try_cast_sql=(
+                old_field_type.get_alter_column_prepare_old_value(
+                    connection, field, new_field
+                ),
+                field_type.get_alter_column_prepare_new_value(
+                    connection, field, new_field
+                ),
+            ),
+            model=model,
+            model_field=model_field,
+            shadow_model_field=shadow_model_field,
+        )
+
     def delete_field(self, user, field):
         """
         Deletes an existing field if it is not a primary field.
@@ -447,6 +820,11 @@ class FieldHandler:
         typed_updated_table = type_table_and_update_fields_given_deleted_field(
             field.table, deleted_field_id=field.id, deleted_field_name=field.name
         )
+        update_search_data_after_field_change(field.table)
+        update_primary_values_after_field_change(
+            field.table, typed_updated_table.updated_fields
+        )
+        schedule_field_indexes_update(field.table_id)
         field_deleted.send(
             self,
             field_id=field.id,
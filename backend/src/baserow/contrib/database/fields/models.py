@@ -1,5 +1,7 @@
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import JSONField
 
 from baserow.contrib.database.fields.mixins import (
     BaseDateMixin,
@@ -19,6 +21,8 @@ from baserow.core.mixins import (
 )
 from baserow.core.utils import to_snake_case, remove_special_characters
 
+User = get_user_model()
+
 NUMBER_TYPE_INTEGER = "INTEGER"
 NUMBER_TYPE_DECIMAL = "DECIMAL"
 NUMBER_TYPE_CHOICES = (
@@ -28,6 +32,21 @@ NUMBER_TYPE_CHOICES = (
 
 NUMBER_MAX_DECIMAL_PLACES = 5
 
+FIELD_CONVERSION_JOB_PENDING_STATUS = "pending"
+FIELD_CONVERSION_JOB_CONVERTING_STATUS = "converting"
+FIELD_CONVERSION_JOB_COMPLETED_STATUS = "complete"
+FIELD_CONVERSION_JOB_FAILED_STATUS = "failed"
+FIELD_CONVERSION_JOB_STATUS_CHOICES = [
+    (FIELD_CONVERSION_JOB_PENDING_STATUS, FIELD_CONVERSION_JOB_PENDING_STATUS),
+    (FIELD_CONVERSION_JOB_CONVERTING_STATUS, FIELD_CONVERSION_JOB_CONVERTING_STATUS),
+    (FIELD_CONVERSION_JOB_COMPLETED_STATUS, FIELD_CONVERSION_JOB_COMPLETED_STATUS),
+    (FIELD_CONVERSION_JOB_FAILED_STATUS, FIELD_CONVERSION_JOB_FAILED_STATUS),
+]
+FIELD_CONVERSION_JOB_RUNNING_STATUSES = [
+    FIELD_CONVERSION_JOB_PENDING_STATUS,
+    FIELD_CONVERSION_JOB_CONVERTING_STATUS,
+]
+
 NUMBER_DECIMAL_PLACES_CHOICES = [
     (1, "1.0"),
     (2, "1.00"),
@@ -84,6 +103,27 @@ class Field(
     def get_max_name_length(cls):
         return cls._meta.get_field("name").max_length
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._bump_table_version()
+
+    def delete(self, *args, **kwargs):
+        table_id = self.table_id
+        result = super().delete(*args, **kwargs)
+        self._bump_table_version(table_id)
+        return result
+
+    def _bump_table_version(self, table_id=None):
+        """
+        Every change to a field, including creating, trashing, restoring and deleting
+        it, can change the generated model of the table. Increasing the version of the
+        table makes sure that no outdated cached model is used.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        Table.bump_version(table_id or self.table_id)
+
     @property
     def db_column(self):
         return f"field_{self.id}"
@@ -328,3 +368,35 @@ class FormulaField(Field):
             + f"error={self.error},\n"
             + ")"
         )
+
+
+class FieldConversionJob(models.Model):
+    """
+    Updates a field in the background. If the column of the field must be converted
+    to another type, the values are converted in batches to a new column which
+    replaces the original column at the end, so that the table isn't locked while
+    all the rows are converted.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    field = models.ForeignKey(Field, on_delete=models.CASCADE)
+    # The type that the field must be changed to, or None if the type stays the same.
+    new_type_name = models.TextField(null=True, blank=True)
+    # The validated values that must be passed into the `FieldHandler.update_field`
+    # method.
+    field_values = JSONField(default=dict)
+    status = models.TextField(choices=FIELD_CONVERSION_JOB_STATUS_CHOICES)
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # The moment the job started converting, used to detect jobs of which the worker
+    # has been killed or crashed.
+    started_at = models.DateTimeField(null=True, blank=True)
+    # A float going from 0.0 to 1.0 indicating how much progress has been made on the
+    # conversion.
+    progress_percentage = models.FloatField(default=0.0)
+
+    def is_running(self):
+        return self.status in FIELD_CONVERSION_JOB_RUNNING_STATUSES
+
+    class Meta:
+        ordering = ("id",)
@@ -1,6 +1,6 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
-from django.db.models import Q
+from django.db.models import Expression, Q
 
 from baserow.contrib.database.formula.types.formula_type import (
     BaserowFormulaType,
@@ -139,6 +139,26 @@ class FieldType(
 
         return Q()
 
+    def get_search_expression(
+        self, field_name, model_field, field
+    ) -> Optional[Expression]:
+        """
+        Returns an expression that converts the value of the field to the text that
+        is searched when the full text search mode is enabled for the table. It should
+        match the value that the `contains_query` searches.
+
+        :param field_name: The name of the field.
+        :type field_name: str
+        :param model_field: The field's actual django field model instance.
+        :type model_field: models.Field
+        :param field: The related field's instance.
+        :type field: Field
+        :return: An expression resulting in text or None if the field can't be
+            searched.
+        """
+
+        return None
+
     def get_serializer_field(self, instance, **kwargs):
         """
         Should return the serializer field based on the custom model instance
@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+FIELD_CONVERSION_SOFT_TIME_LIMIT = 60 * 60
+FIELD_CONVERSION_TIME_LIMIT = FIELD_CONVERSION_SOFT_TIME_LIMIT + 60
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=FIELD_CONVERSION_SOFT_TIME_LIMIT,
+    time_limit=FIELD_CONVERSION_TIME_LIMIT,
+)
+def run_field_conversion_job(self, job_id):
+    """
+    Runs the field conversion for a given job. Configured in base.py to run on a
+    separate queue to prevent starving regular websocket jobs.
+    """
+
+    from baserow.contrib.database.fields.handler import FieldHandler
+    from baserow.contrib.database.fields.models import (
+        FieldConversionJob,
+        FIELD_CONVERSION_JOB_PENDING_STATUS,
+    )
+
+    job = FieldConversionJob.objects.get(id=job_id)
+    # A job that stayed pending for too long could have been failed by the clean up
+    # in the meantime.
+    if job.status == FIELD_CONVERSION_JOB_PENDING_STATUS:
+        FieldHandler().run_conversion_job(job)
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+)
+def clean_up_stale_field_conversion_jobs(self):
+    """
+    Fails the field conversion jobs of which the worker has been killed or crashed
+    and removes their shadow columns.
+    """
+
+    from baserow.contrib.database.fields.handler import FieldHandler
+
+    FieldHandler().clean_up_stale_conversion_jobs()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_field_conversion_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(minutes=settings.FIELD_CONVERSION_CLEANUP_INTERVAL_MINUTES),
+        clean_up_stale_field_conversion_jobs.s(),
+    )
@@ -0,0 +1,24 @@
+from baserow.config.celery import app
+
+FORMULA_RECALCULATION_SOFT_TIME_LIMIT = 60 * 60
+FORMULA_RECALCULATION_TIME_LIMIT = FORMULA_RECALCULATION_SOFT_TIME_LIMIT + 60
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=FORMULA_RECALCULATION_SOFT_TIME_LIMIT,
+    time_limit=FORMULA_RECALCULATION_TIME_LIMIT,
+)
+def recalculate_field_values(self, table_id, field_ids):
+    """
+    Recalculates the values of the provided fields of a large table in chunks after
+    the fields, or the fields they depend on, have changed. Configured in base.py to
+    run on a separate queue to prevent starving regular websocket jobs.
+    """
+
+    from baserow.contrib.database.formula.types.typed_field_updater import (
+        recalculate_field_values_and_notify,
+    )
+
+    recalculate_field_values_and_notify(table_id, field_ids)
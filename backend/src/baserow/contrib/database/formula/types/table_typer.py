@@ -37,6 +37,7 @@ from baserow.contrib.database.formula.types.visitors import (
     FunctionsUsedVisitor,
 )
 from baserow.contrib.database.table import models
+from baserow.core.db import specific_iterator
 
 
 def _get_all_fields_and_build_name_dict(
@@ -44,12 +45,13 @@ def _get_all_fields_and_build_name_dict(
 ):
     all_fields = []
     field_name_to_id = {}
-    for field in table.field_set.all():
-        if overridden_field and field.id == overridden_field.id:
-            extracted_field = overridden_field
-        else:
-            extracted_field = field
-        extracted_field = extracted_field.specific
+    fields = [
+        overridden_field.specific
+        if overridden_field and field.id == overridden_field.id
+        else field
+        for field in table.field_set.all()
+    ]
+    for extracted_field in specific_iterator(fields):
         all_fields.append(extracted_field)
         field_name_to_id[extracted_field.name] = extracted_field.id
     return all_fields, field_name_to_id
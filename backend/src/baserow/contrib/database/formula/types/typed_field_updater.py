@@ -1,9 +1,12 @@
 from typing import Dict, List, Optional, Tuple
 
-from django.db import connection
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max, Min
 
 from baserow.contrib.database import models
 from baserow.contrib.database.fields.models import FormulaField, Field
+from baserow.contrib.database.fields.signals import field_updated
 from baserow.contrib.database.fields.registries import (
     field_type_registry,
     field_converter_registry,
@@ -19,6 +22,13 @@ from baserow.contrib.database.formula.types.table_typer import (
     TypedBaserowTable,
     type_all_fields_in_table,
 )
+from baserow.contrib.database.table.cache import typed_table_cache
+from baserow.contrib.database.table.primary_values import update_primary_values
+from baserow.contrib.database.table.search import (
+    SEARCH_MODE_FULL_TEXT,
+    update_search_data,
+)
+from baserow.core.db import get_estimated_count, specific_iterator
 from baserow.contrib.database.views.handler import ViewHandler
 
 
@@ -54,6 +64,12 @@ def _calculate_and_save_updated_fields(
     field_id_to_typed_field: Dict[int, TypedFieldWithReferences],
     field_which_changed=None,
 ) -> List[Field]:
+    # The formulas of the table are being retyped because a field changed, so the
+    # cached typed table is outdated. Saving a field also increases the schema version
+    # of the table which prevents outdated entries from being used, but there is no
+    # need to keep them in memory.
+    typed_table_cache.invalidate(table.id)
+
     other_changed_fields = {}
     for typed_field in field_id_to_typed_field.values():
         new_field = typed_field.new_field
@@ -122,23 +138,133 @@ class TypedBaserowTableWithUpdatedFields(TypedBaserowTable):
 
     def update_values_for_all_updated_fields(self):
         """
-        Does a single large update which refreshes the values of all fields which were
-        updated in the table as a result of a field change.
-        :return:
+        Refreshes the values of all fields which were updated in the table as a result
+        of a field change. Small tables are updated right away with a single update
+        query. Updating every row of a large table in one statement locks all the rows
+        until the transaction commits, so the values of tables having more rows than
+        the `FORMULA_BACKGROUND_RECALCULATION_THRESHOLD` setting are recalculated in
+        chunks by a background task once the field change has been committed.
         """
 
-        all_fields_update_dict = {}
-        for updated_field in self.all_updated_fields:
-            field_type = field_type_registry.get_by_model(updated_field)
-            expr = field_type.expression_to_update_field_after_related_field_changes(
-                updated_field, self.model
-            )
-            if expr is not None:
-                all_fields_update_dict[f"field_{updated_field.id}"] = expr
+        all_fields_update_dict = _get_update_expressions(
+            self.all_updated_fields, self.model
+        )
+
+        if len(all_fields_update_dict) == 0:
+            return
 
         # Also update trash rows so when restored they immediately have correct formula
         # values.
-        self.model.objects_and_trash.update(**all_fields_update_dict)
+        queryset = self.model.objects_and_trash.all()
+        threshold = settings.FORMULA_BACKGROUND_RECALCULATION_THRESHOLD
+        if threshold < 0 or get_estimated_count(queryset) <= threshold:
+            queryset.update(**all_fields_update_dict)
+        else:
+            from baserow.contrib.database.formula.tasks import (
+                recalculate_field_values,
+            )
+
+            table_id = self.table.id
+            field_ids = [field.id for field in self.all_updated_fields]
+            transaction.on_commit(
+                lambda: recalculate_field_values.delay(table_id, field_ids)
+            )
+
+
+def _get_update_expressions(fields: List[Field], model) -> Dict[str, object]:
+    """
+    Returns the Django expressions that recalculate the values of the provided fields
+    keyed by the name of the field. Fields that can't be recalculated are left out.
+    """
+
+    update_expressions = {}
+    for field in fields:
+        field_type = field_type_registry.get_by_model(field)
+        expr = field_type.expression_to_update_field_after_related_field_changes(
+            field, model
+        )
+        if expr is not None:
+            update_expressions[f"field_{field.id}"] = expr
+    return update_expressions
+
+
+def recalculate_field_values_in_chunks(
+    table: "models.Table", field_ids: List[int], chunk_size: Optional[int] = None
+) -> List[Field]:
+    """
+    Recalculates the values of the provided fields for all the rows in the table,
+    including the trashed ones. Instead of updating the whole table at once, the rows
+    are updated in chunks of consecutive ids where every chunk is updated in its own
+    transaction. This way only the rows of one chunk are locked at the same time and
+    concurrent row updates don't have to wait until the whole table has been updated.
+
+    Fields that have been deleted or trashed in the meantime are skipped and the
+    latest version of the other fields is used, so it doesn't matter if the fields
+    changed again after the recalculation was scheduled.
+
+    :param table: The table containing the fields.
+    :param field_ids: The ids of the fields that must be recalculated.
+    :param chunk_size: The maximum amount of rows updated per query. Defaults to the
+        `FORMULA_RECALCULATION_CHUNK_SIZE` setting.
+    :return: The fields that have been recalculated.
+    """
+
+    if chunk_size is None:
+        chunk_size = settings.FORMULA_RECALCULATION_CHUNK_SIZE
+
+    fields = list(
+        specific_iterator(Field.objects.filter(table=table, id__in=field_ids))
+    )
+    model = table.get_model()
+    update_expressions = _get_update_expressions(fields, model)
+
+    if len(update_expressions) == 0:
+        return []
+
+    bounds = model.objects_and_trash.aggregate(min_id=Min("id"), max_id=Max("id"))
+    if bounds["min_id"] is not None:
+        for start in range(bounds["min_id"], bounds["max_id"] + 1, chunk_size):
+            with transaction.atomic():
+                chunk = model.objects_and_trash.filter(
+                    id__gte=start, id__lt=start + chunk_size
+                )
+                chunk.update(**update_expressions)
+                # The searchable text of the rows contains the formula values, so it
+                # must be updated after they have been recalculated.
+                if model._search_mode == SEARCH_MODE_FULL_TEXT:
+                    update_search_data(model, chunk)
+                # The primary field can be one of the recalculated formula fields.
+                if model._cache_primary_values and any(
+                    field.primary for field in fields
+                ):
+                    update_primary_values(model, chunk)
+
+    return fields
+
+
+def recalculate_field_values_and_notify(table_id: int, field_ids: List[int]):
+    """
+    Recalculates the values of the provided fields in chunks and lets the users that
+    have the table open know that the values of the fields have changed.
+
+    :param table_id: The id of the table containing the fields.
+    :param field_ids: The ids of the fields that must be recalculated.
+    """
+
+    try:
+        table = models.Table.objects.get(id=table_id)
+    except models.Table.DoesNotExist:
+        return
+
+    fields = recalculate_field_values_in_chunks(table, field_ids)
+
+    for field in fields:
+        field_updated.send(
+            recalculate_field_values_and_notify,
+            field=field,
+            related_fields=[],
+            user=None,
+        )
 
 
 def type_table_and_update_fields(table: "models.Table"):
@@ -1,9 +1,6 @@
 import sys
-from decimal import Decimal
-from math import ceil
 
 from django.core.management.base import BaseCommand
-from django.db.models import Max
 from faker import Faker
 
 from baserow.contrib.database.fields.field_helpers import (
@@ -11,6 +8,7 @@ from baserow.contrib.database.fields.field_helpers import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.order import row_order_allocator
 from baserow.contrib.database.table.models import Table
 
 
@@ -56,8 +54,9 @@ def fill_table(limit, table, add_columns=False):
     if add_columns:
         create_a_column_for_every_type(table)
     model = table.get_model()
-    # Find out what the highest order is because we want to append the new rows.
-    order = ceil(model.objects.aggregate(max=Max("order")).get("max") or Decimal("0"))
+    # Allocate the orders after the highest order because we want to append the new
+    # rows.
+    orders = row_order_allocator.allocate(model, limit)
     for i in range(0, limit):
         # Based on the random_value function we have for each type we can
         # build a dict with a random value for each field.
@@ -69,8 +68,7 @@ def fill_table(limit, table, add_columns=False):
         }
 
         values, manytomany_values = row_handler.extract_manytomany_values(values, model)
-        order += Decimal("1")
-        values["order"] = order
+        values["order"] = orders[i]
 
         # Insert the row with the randomly created values.
         instance = model.objects.create(**values)
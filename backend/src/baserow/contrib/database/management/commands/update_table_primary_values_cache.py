@@ -0,0 +1,48 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table
+
+
+class Command(BaseCommand):
+    help = (
+        "Enables or disables the cache of the primary values of the rows of a table. "
+        "Link row fields pointing to a table that caches its primary values read "
+        "them from the cache instead of fetching the related rows, which makes "
+        "listing rows having many relations to large tables a lot faster."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "table_id",
+            type=int,
+            help="The table of which the primary values must be cached.",
+        )
+        parser.add_argument(
+            "--disable",
+            action="store_true",
+            help="Disables the cache and deletes the cached primary values.",
+        )
+
+    def handle(self, *args, **options):
+        table_id = options["table_id"]
+        cache_primary_values = not options["disable"]
+
+        try:
+            table = Table.objects.get(pk=table_id)
+        except Table.DoesNotExist:
+            self.stdout.write(
+                self.style.ERROR(f"The table with id {table_id} was not found.")
+            )
+            sys.exit(1)
+
+        TableHandler().update_cache_primary_values(table, cache_primary_values)
+
+        state = "enabled" if cache_primary_values else "disabled"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"The primary values cache of table {table_id} has been {state}."
+            )
+        )
@@ -0,0 +1,47 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.search import SEARCH_MODE_CHOICES
+
+
+class Command(BaseCommand):
+    help = (
+        "Changes the search mode of a table. The full_text mode stores the searchable "
+        "values of every row in an indexed column, which makes searching large tables "
+        "a lot faster."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "table_id", type=int, help="The table of which the search mode must change."
+        )
+        parser.add_argument(
+            "search_mode",
+            type=str,
+            choices=[choice for choice, _ in SEARCH_MODE_CHOICES],
+            help="The new search mode of the table.",
+        )
+
+    def handle(self, *args, **options):
+        table_id = options["table_id"]
+        search_mode = options["search_mode"]
+
+        try:
+            table = Table.objects.get(pk=table_id)
+        except Table.DoesNotExist:
+            self.stdout.write(
+                self.style.ERROR(f"The table with id {table_id} was not found.")
+            )
+            sys.exit(1)
+
+        TableHandler().update_search_mode(table, search_mode)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"The search mode of table {table_id} has been changed to "
+                f"{search_mode}."
+            )
+        )
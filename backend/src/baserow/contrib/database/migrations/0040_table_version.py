@@ -0,0 +1,25 @@
+# Generated by Django 3.2.6 on 2026-10-18 10:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0039_formulafield"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text=(
+                    "The schema version of the table. It is increased every time a "
+                    "field of the table changes so that cached generated models can "
+                    "be invalidated."
+                ),
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0040_table_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="search_mode",
+            field=models.CharField(
+                choices=[("default", "Default"), ("full_text", "Full text")],
+                default="default",
+                help_text=(
+                    "Indicates how the rows are searched. In the full text mode the "
+                    "searchable values of every row are stored in an indexed column."
+                ),
+                max_length=16,
+            ),
+        ),
+    ]
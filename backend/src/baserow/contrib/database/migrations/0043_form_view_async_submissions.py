@@ -0,0 +1,59 @@
+# Generated by Django 3.2.6 on 2026-10-18 15:14
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0042_field_conversion_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formview",
+            name="async_submissions",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the submissions are queued and created as "
+                "rows in batches by a background task instead of immediately. This is "
+                "useful for forms that receive many submissions at the same time.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="FormViewSubmission",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "values",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The validated values of the submission keyed by "
+                        "field name.",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "form_view",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="queued_submissions",
+                        to="database.formview",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("id",),
+            },
+        ),
+    ]
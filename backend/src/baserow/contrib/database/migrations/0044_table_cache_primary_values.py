@@ -0,0 +1,51 @@
+# Generated by Django 3.2.6 on 2026-10-18 17:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0043_form_view_async_submissions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="cache_primary_values",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the human readable primary values of the "
+                "rows are stored in a separate table, so that link row fields pointing "
+                "to this table can be serialized without fetching the related rows.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="RowPrimaryValue",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("row_id", models.PositiveIntegerField()),
+                ("value", models.TextField(blank=True)),
+                ("trashed", models.BooleanField(default=False)),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("table", "row_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.6 on 2026-10-18 18:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0044_table_cache_primary_values"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rowprimaryvalue",
+            name="order",
+            field=models.DecimalField(
+                decimal_places=20,
+                help_text="A copy of the order of the row, so that the related rows of "
+                "link row fields can be ordered without fetching them.",
+                max_digits=40,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0045_rowprimaryvalue_order"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fieldconversionjob",
+            name="started_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
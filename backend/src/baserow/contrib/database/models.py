@@ -7,6 +7,7 @@ from .views.models import (
     GridViewFieldOptions,
     FormView,
     FormViewFieldOptions,
+    FormViewSubmission,
     ViewFilter,
 )
 from .fields.models import (
@@ -31,6 +32,7 @@ __all__ = [
     "GridViewFieldOptions",
     "FormView",
     "FormViewFieldOptions",
+    "FormViewSubmission",
     "ViewFilter",
     "Field",
     "TextField",
@@ -1,2 +1,10 @@
 class RowDoesNotExist(Exception):
     """Raised when trying to get a row that doesn't exist."""
+
+
+class RowIdsNotUnique(Exception):
+    """Raised when the same row id is provided multiple times."""
+
+    def __init__(self, ids, *args, **kwargs):
+        self.ids = ids
+        super().__init__(*args, **kwargs)
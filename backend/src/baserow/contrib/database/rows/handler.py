@@ -1,21 +1,51 @@
 import re
-from decimal import Decimal
+from collections import Counter, defaultdict
+from decimal import localcontext
 
+from django.conf import settings
 from django.db import transaction
-from django.db.models import Max, F
+from django.db.models import F, Q
 from django.db.models.fields.related import ManyToManyField
-from math import floor, ceil
+from django.utils import timezone
+from math import floor
 
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.db.relations import set_many_to_many_relations
+from baserow.contrib.database.fields.models import Field, LinkRowField
+from baserow.contrib.database.formula.expression_generator.generator import (
+    baserow_expression_to_django_expression,
+)
+from baserow.contrib.database.table.primary_values import (
+    update_primary_value_orders,
+    update_primary_values,
+)
+from baserow.contrib.database.table.search import (
+    SEARCH_MODE_FULL_TEXT,
+    update_search_data,
+)
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import split_comma_separated_string
-from .exceptions import RowDoesNotExist
+from .exceptions import RowDoesNotExist, RowIdsNotUnique
+from .order import (
+    ORDER_PRECISION,
+    ORDER_REBALANCE_GAP,
+    ORDER_REBALANCE_INITIAL_WINDOW_SIZE,
+    ORDER_REBALANCE_WINDOW_GAP,
+    get_orders_between,
+    row_order_allocator,
+    schedule_row_orders_rebalance,
+)
 from .signals import (
     before_row_update,
     before_row_delete,
     row_created,
     row_updated,
     row_deleted,
+    before_rows_update,
+    before_rows_delete,
+    rows_created,
+    rows_updated,
+    rows_deleted,
+    row_orders_rebalanced,
 )
 
 
@@ -177,8 +207,7 @@ class RowHandler:
     def get_order_before_row(self, before, model):
         """
         Calculates a new unique order which will be before the provided before row
-        order. This order can be used by an existing or new row. Several other rows
-        could be updated as their order might need to change.
+        order. This order can be used by an existing or new row.
 
         :param before: The row instance where the before order must be calculated for.
         :type before: Table
@@ -188,29 +217,162 @@ class RowHandler:
         :rtype: Decimal
         """
 
-        if before:
-            # Here we calculate the order value, which indicates the position of the
-            # row, by subtracting a fraction of the row that it must be placed
-            # before. The same fraction is also going to be subtracted from the other
-            # rows that have been placed before. By using these fractions we don't
-            # have to re-order every row in the table.
-            change = Decimal("0.00000000000000000001")
-            order = before.order - change
-            model.objects.filter(order__gt=floor(order), order__lte=order).update(
-                order=F("order") - change
-            )
-        else:
-            # Because the row is by default added as last, we have to figure out what
-            # the highest order is and increase that by one. Because the order of new
-            # rows should always be a whole number we round it up.
-            order = (
-                ceil(
-                    model.objects.aggregate(max=Max("order")).get("max") or Decimal("0")
+        return self.get_orders_before_row(before, model, 1)[0]
+
+    def get_orders_before_row(self, before, model, amount):
+        """
+        Calculates the given amount of new unique orders which will be before the
+        provided before row order, or at the end of the table if no before row is
+        provided.
+
+        The orders at the end of the table are allocated by the `RowOrderAllocator`
+        without querying the table. The orders before a row are evenly spaced between
+        the order of the row and the order of the row before it, so no other row has
+        to be updated. If the gap between those rows becomes too small, the orders of
+        the table are rebalanced in the background and if there is no room left at
+        all, the rows that have been placed before the row are moved a fraction down.
+
+        :param before: The row instance where the before orders must be calculated
+            for.
+        :type before: Table
+        :param model: The model of the related table
+        :type model: Model
+        :param amount: The number of orders that must be calculated.
+        :type amount: int
+        :return: The new orders in ascending order.
+        :rtype: list
+        """
+
+        if not before:
+            return row_order_allocator.allocate(model, amount)
+
+        previous_order = (
+            model.objects_and_trash.filter(order__lt=before.order)
+            .order_by("-order")
+            .values_list("order", flat=True)
+            .first()
+        )
+        orders = get_orders_between(previous_order, before.order, amount)
+
+        if orders is None or before.order - orders[-1] < ORDER_REBALANCE_GAP:
+            schedule_row_orders_rebalance(model._table_id, before.id)
+
+        if orders is None:
+            # There is no room left between the rows, so we subtract a fraction from
+            # the order of the row that it must be placed before. The same fraction is
+            # also going to be subtracted from the other rows that have been placed
+            # before until the table is rebalanced.
+            change = ORDER_PRECISION
+            orders = [
+                before.order - change * (amount - index) for index in range(amount)
+            ]
+            model.objects_and_trash.filter(
+                order__gt=floor(orders[0]), order__lte=before.order - change
+            ).update(order=F("order") - change * amount)
+            if model._cache_primary_values:
+                # The range also covers the rows after they have been moved down.
+                update_primary_value_orders(
+                    model,
+                    model.objects_and_trash.filter(
+                        order__gt=floor(orders[0]) - change * amount,
+                        order__lte=before.order,
+                    ),
                 )
-                + 1
+
+        return orders
+
+    def rebalance_row_orders(self, table, row_id, max_window_size=None):
+        """
+        Renumbers the orders of the rows right before the provided row, including the
+        trashed ones, so that there is room to insert rows in between again. Only a
+        window of rows is renumbered instead of the whole table.
+
+        The window starts with the rows placed right before the row and doubles until
+        the rows in it can be evenly spaced at least `ORDER_REBALANCE_WINDOW_GAP`
+        apart or until it reaches the maximum window size. The rows in the window get
+        evenly spaced orders between the order of the row before the window and the
+        order of the provided row, which both keep their order. The rows therefore
+        stay in the same order and the rows outside of the window are not touched.
+
+        :param table: The table of which the row orders must be rebalanced.
+        :type table: Table
+        :param row_id: The id of the row before which the gap between the rows has
+            become too small.
+        :type row_id: int
+        :param max_window_size: The maximum amount of rows that are renumbered.
+            Defaults to the `ROW_ORDER_REBALANCE_WINDOW_SIZE` setting.
+        :type max_window_size: int | None
+        :return: The number of rows that have been renumbered.
+        :rtype: int
+        """
+
+        if max_window_size is None:
+            max_window_size = settings.ROW_ORDER_REBALANCE_WINDOW_SIZE
+
+        model = table.get_model(field_ids=[])
+
+        with transaction.atomic():
+            row = (
+                model.objects_and_trash.select_for_update()
+                .filter(id=row_id)
+                .only("id", "order")
+                .first()
+            )
+            if row is None:
+                return 0
+
+            queryset = (
+                model.objects_and_trash.select_for_update()
+                .filter(Q(order__lt=row.order) | Q(order=row.order, id__lt=row.id))
+                .order_by("-order", "-id")
+                .only("id", "order")
             )
+            window_size = min(ORDER_REBALANCE_INITIAL_WINDOW_SIZE, max_window_size)
+
+            while True:
+                rows = list(queryset[: window_size + 1])
+                if len(rows) > window_size:
+                    lower_order = rows.pop().order
+                else:
+                    # There is no row before the window, so the first row can be
+                    # moved down as well.
+                    lower_order = (rows[-1].order if rows else row.order) - 1
+
+                with localcontext() as context:
+                    context.prec = 60
+                    step = (row.order - lower_order) / (len(rows) + 1)
+
+                if (
+                    step >= ORDER_REBALANCE_WINDOW_GAP
+                    or len(rows) < window_size
+                    or window_size >= max_window_size
+                ):
+                    break
+
+                window_size = min(window_size * 2, max_window_size)
+
+            if len(rows) == 0:
+                return 0
+
+            with localcontext() as context:
+                context.prec = 60
+                for index, window_row in enumerate(reversed(rows)):
+                    window_row.order = (lower_order + step * (index + 1)).quantize(
+                        ORDER_PRECISION
+                    )
+
+            model.objects_and_trash.bulk_update(rows, ["order"])
+            if model._cache_primary_values:
+                update_primary_value_orders(
+                    model,
+                    model.objects_and_trash.filter(
+                        id__in=[window_row.id for window_row in rows]
+                    ),
+                )
+
+        row_orders_rebalanced.send(self, table=table)
 
-        return order
+        return len(rows)
 
     def get_row(self, user, table, row_id, model=None):
         """
@@ -371,11 +533,128 @@ class RowHandler:
                 fields=model.fields_requiring_refresh_after_insert()
             )
 
-        for name, value in manytomany_values.items():
-            getattr(instance, name).set(value)
+        self._set_manytomany_values(
+            model, [(instance.id, manytomany_values)], replace=False
+        )
+        self._update_search_data(model, [instance.id])
+        self._update_primary_values(model, [instance.id])
 
         return instance
 
+    def create_rows(
+        self,
+        user,
+        table,
+        rows_values,
+        model=None,
+        before=None,
+        user_field_names=False,
+    ):
+        """
+        Creates multiple new rows for a given table with the provided values if the
+        user belongs to the related group. Compared to calling `create_row` for every
+        row, the rows are inserted in bulk and only a single `rows_created` signal is
+        sent.
+
+        :param user: The user of whose behalf the rows are created.
+        :type user: User
+        :param table: The table for which to create the rows for.
+        :type table: Table
+        :param rows_values: A list containing the values of every row that must be
+            created. The keys must be the field ids.
+        :type rows_values: list
+        :param model: If a model is already generated it can be provided here to avoid
+            having to generate the model again.
+        :type model: Model
+        :param before: If provided the new rows will be placed right before that row
+            instance.
+        :type before: Table
+        :param user_field_names: Whether or not the values are keyed by the internal
+            Baserow field name (field_1,field_2 etc) or by the user field names.
+        :type user_field_names: True
+        :return: The created row instances in the same order as the provided values.
+        :rtype: list
+        """
+
+        if not model:
+            model = table.get_model()
+
+        group = table.database.group
+        group.has_user(user, raise_error=True)
+
+        instances = self.force_create_rows(
+            table, rows_values, model, before, user_field_names
+        )
+
+        rows_created.send(
+            self, rows=instances, before=before, user=user, table=table, model=model
+        )
+
+        return instances
+
+    def force_create_rows(
+        self, table, rows_values, model=None, before=None, user_field_names=False
+    ):
+        """
+        Creates multiple new rows for a given table with the provided values. The rows
+        are inserted with a single query, the orders are calculated once and the many
+        to many relations of all the rows are inserted in bulk.
+
+        :param table: The table for which to create the rows for.
+        :type table: Table
+        :param rows_values: A list containing the values of every row that must be
+            created. The keys must be the field ids.
+        :type rows_values: list
+        :param model: If a model is already generated it can be provided here to avoid
+            having to generate the model again.
+        :type model: Model
+        :param before: If provided the new rows will be placed right before that row
+            instance.
+        :type before: Table
+        :param user_field_names: Whether or not the values are keyed by the internal
+            Baserow field name (field_1,field_2 etc) or by the user field names.
+        :type user_field_names: True
+        :return: The created row instances in the same order as the provided values.
+            Their related rows are prefetched.
+        :rtype: list
+        """
+
+        if not model:
+            model = table.get_model()
+
+        if len(rows_values) == 0:
+            return []
+
+        orders = self.get_orders_before_row(before, model, len(rows_values))
+        instances = []
+        rows_manytomany_values = []
+
+        for values, order in zip(rows_values, orders):
+            if user_field_names:
+                values = self.map_user_field_name_dict_to_internal(
+                    model._field_objects, values
+                )
+
+            values = self.prepare_values(model._field_objects, values)
+            values, manytomany_values = self.extract_manytomany_values(values, model)
+            values["order"] = order
+            instances.append(model(**values))
+            rows_manytomany_values.append(manytomany_values)
+
+        instances = model.objects.bulk_create(instances)
+        row_ids = [instance.id for instance in instances]
+
+        self._update_expression_fields(
+            model, row_ids, model.fields_requiring_refresh_after_insert()
+        )
+        self._set_manytomany_values(
+            model, zip(row_ids, rows_manytomany_values), replace=False
+        )
+        self._update_search_data(model, row_ids)
+        self._update_primary_values(model, row_ids)
+
+        return self._get_rows_in_order(model, row_ids)
+
     # noinspection PyMethodMayBeStatic
     def map_user_field_name_dict_to_internal(
         self,
@@ -455,14 +734,32 @@ class RowHandler:
             for name, value in values.items():
                 setattr(row, name, value)
 
-            row.save()
+            # Only the changed fields, the fields that track the last modification
+            # date and the expression fields depending on any of them have to be
+            # written. The other expression fields don't reference any of the changed
+            # fields so their values can't have changed.
+            auto_now_field_names = self._get_auto_now_field_names(model)
+            expression_field_names = model.fields_requiring_refresh_after_update(
+                [*values.keys(), *auto_now_field_names]
+            )
+            row.save(
+                update_fields=[
+                    *values.keys(),
+                    *expression_field_names,
+                    *auto_now_field_names,
+                ]
+            )
             # We need to refresh here as ExpressionFields might have had their values
             # updated. Django does not support UPDATE .... RETURNING and so we need to
             # query for the rows updated values instead.
-            row.refresh_from_db(fields=model.fields_requiring_refresh_after_update())
+            if len(expression_field_names) > 0:
+                row.refresh_from_db(fields=expression_field_names)
 
-            for name, value in manytomany_values.items():
-                getattr(row, name).set(value)
+            self._set_manytomany_values(
+                model, [(row.id, manytomany_values)], replace=True
+            )
+            self._update_search_data(model, [row.id])
+            self._update_primary_values(model, [row.id])
 
         row_updated.send(
             self,
@@ -475,6 +772,113 @@ class RowHandler:
 
         return row
 
+    def update_rows(self, user, table, rows_values, model=None, user_field_names=False):
+        """
+        Updates one or more values of multiple rows at once. Compared to calling
+        `update_row` for every row, the rows are locked with a single query, the
+        values are updated in bulk and only a single `rows_updated` signal is sent.
+
+        :param user: The user of whose behalf the change is made.
+        :type user: User
+        :param table: The table for which the rows must be updated.
+        :type table: Table
+        :param rows_values: A list containing the values that must be updated for
+            every row. Every dict must contain the id of the row that must be updated
+            as `id` and the other keys must be the field ids.
+        :type rows_values: list
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :type model: Model
+        :param user_field_names: Whether or not the values are keyed by the internal
+            Baserow field name (field_1,field_2 etc) or by the user field names.
+        :type user_field_names: True
+        :raises RowIdsNotUnique: When the same row id is provided multiple times.
+        :raises RowDoesNotExist: When one of the rows with the provided ids does not
+            exist.
+        :return: The updated row instances in the same order as the provided values.
+        :rtype: list
+        """
+
+        group = table.database.group
+        group.has_user(user, raise_error=True)
+
+        if not model:
+            model = table.get_model()
+
+        row_ids = [values["id"] for values in rows_values]
+        duplicate_ids = [
+            row_id for row_id, count in Counter(row_ids).items() if count > 1
+        ]
+        if len(duplicate_ids) > 0:
+            raise RowIdsNotUnique(duplicate_ids)
+
+        with transaction.atomic():
+            rows = self._get_rows_in_order(
+                model, row_ids, model.objects.select_for_update()
+            )
+
+            before_return = before_rows_update.send(
+                self, rows=rows, user=user, table=table, model=model
+            )
+
+            updated_field_names = set()
+            rows_manytomany_values = []
+
+            for row, values in zip(rows, rows_values):
+                values = {key: value for key, value in values.items() if key != "id"}
+                if user_field_names:
+                    values = self.map_user_field_name_dict_to_internal(
+                        model._field_objects, values
+                    )
+                values = self.prepare_values(model._field_objects, values)
+                values, manytomany_values = self.extract_manytomany_values(
+                    values, model
+                )
+
+                for name, value in values.items():
+                    setattr(row, name, value)
+
+                updated_field_names.update(values.keys())
+                rows_manytomany_values.append((row.id, manytomany_values))
+
+            # `bulk_update` doesn't call `pre_save`, so the fields that track the last
+            # modification date must be set explicitly.
+            auto_now_field_names = self._get_auto_now_field_names(model)
+            now = timezone.now()
+            for row in rows:
+                for name in auto_now_field_names:
+                    setattr(row, name, now)
+
+            model.objects.bulk_update(
+                rows, [*updated_field_names, *auto_now_field_names]
+            )
+
+            self._update_expression_fields(
+                model,
+                row_ids,
+                model.fields_requiring_refresh_after_update(
+                    [*updated_field_names, *auto_now_field_names]
+                ),
+            )
+            self._set_manytomany_values(model, rows_manytomany_values, replace=True)
+            self._update_search_data(model, row_ids)
+            self._update_primary_values(model, row_ids)
+
+            # Fetch the rows again because the expression fields and related rows
+            # could have changed.
+            rows = self._get_rows_in_order(model, row_ids)
+
+        rows_updated.send(
+            self,
+            rows=rows,
+            user=user,
+            table=table,
+            model=model,
+            before_return=before_return,
+        )
+
+        return rows
+
     def move_row(self, user, table, row_id, before=None, model=None):
         """
         Moves the row related to the row_id before another row or to the end if no
@@ -512,6 +916,7 @@ class RowHandler:
 
         row.order = self.get_order_before_row(before, model)
         row.save()
+        self._update_primary_values(model, [row.id])
 
         row_updated.send(
             self,
@@ -557,6 +962,7 @@ class RowHandler:
         row_id = row.id
 
         TrashHandler.trash(user, group, table.database, row, parent_id=table.id)
+        self._update_primary_values(model, [row_id])
 
         row_deleted.send(
             self,
@@ -567,3 +973,238 @@ class RowHandler:
             model=model,
             before_return=before_return,
         )
+
+    def delete_rows(self, user, table, row_ids, model=None):
+        """
+        Trashes multiple existing rows of the given table at once. Compared to calling
+        `delete_row` for every row, the rows are trashed in bulk and only a single
+        `rows_deleted` signal is sent.
+
+        :param user: The user of whose behalf the change is made.
+        :type user: User
+        :param table: The table for which the rows must be deleted.
+        :type table: Table
+        :param row_ids: The ids of the rows that must be deleted.
+        :type row_ids: list
+        :param model: If the correct model has already been generated, it can be
+            provided so that it does not have to be generated for a second time.
+        :raises RowIdsNotUnique: When the same row id is provided multiple times.
+        :raises RowDoesNotExist: When one of the rows with the provided ids does not
+            exist.
+        """
+
+        group = table.database.group
+        group.has_user(user, raise_error=True)
+
+        if not model:
+            model = table.get_model()
+
+        duplicate_ids = [
+            row_id for row_id, count in Counter(row_ids).items() if count > 1
+        ]
+        if len(duplicate_ids) > 0:
+            raise RowIdsNotUnique(duplicate_ids)
+
+        rows = self._get_rows_in_order(model, row_ids)
+
+        before_return = before_rows_delete.send(
+            self, rows=rows, user=user, table=table, model=model
+        )
+
+        TrashHandler.trash_many(user, group, table.database, rows, parent_id=table.id)
+        self._update_primary_values(model, row_ids)
+
+        rows_deleted.send(
+            self,
+            rows=rows,
+            user=user,
+            table=table,
+            model=model,
+            before_return=before_return,
+        )
+
+    # noinspection PyMethodMayBeStatic
+    def _get_rows_in_order(self, model, row_ids, queryset=None):
+        """
+        Fetches the rows with the provided ids, including their prefetched related
+        rows, in the same order as the ids.
+
+        :param model: The model of the table where the rows must be fetched from.
+        :type model: Model
+        :param row_ids: The ids of the rows that must be fetched.
+        :type row_ids: list
+        :param queryset: Optionally a queryset of the model that must be used, for
+            example one that locks the rows.
+        :type queryset: QuerySet
+        :raises RowDoesNotExist: When one of the rows does not exist.
+        :return: The rows in the same order as the provided ids.
+        :rtype: list
+        """
+
+        if queryset is None:
+            queryset = model.objects.all()
+
+        rows_by_id = {
+            row.id: row for row in queryset.enhance_by_fields().filter(id__in=row_ids)
+        }
+        missing_ids = [row_id for row_id in row_ids if row_id not in rows_by_id]
+
+        if len(missing_ids) > 0:
+            raise RowDoesNotExist(
+                f"The rows with ids {', '.join(map(str, missing_ids))} do not exist."
+            )
+
+        return [rows_by_id[row_id] for row_id in row_ids]
+
+    # noinspection PyMethodMayBeStatic
+    def _get_auto_now_field_names(self, model):
+        """
+        Returns the names of the fields that are automatically set to the current
+        date when a row is saved, like `updated_on` and the last modified fields.
+
+        :param model: The model of the table containing the rows.
+        :type model: Model
+        :return: The names of the auto now fields.
+        :rtype: list
+        """
+
+        return [
+            field.name
+            for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+
+    # noinspection PyMethodMayBeStatic
+    def _update_expression_fields(self, model, row_ids, field_names):
+        """
+        Recalculates the values of the provided expression fields for all the
+        provided rows with a single update query. This replaces saving and refreshing
+        every row individually after it has been created or updated in bulk.
+
+        :param model: The model of the table containing the rows.
+        :type model: Model
+        :param row_ids: The ids of the rows that must be recalculated.
+        :type row_ids: list
+        :param field_names: The names of the expression fields that must be
+            recalculated.
+        :type field_names: list
+        """
+
+        expressions = {}
+        for field_name in field_names:
+            expression = model._meta.get_field(field_name).expression
+            if expression is not None:
+                expressions[field_name] = baserow_expression_to_django_expression(
+                    expression, None
+                )
+
+        if len(expressions) > 0:
+            model.objects.filter(id__in=row_ids).update(**expressions)
+
+    # noinspection PyMethodMayBeStatic
+    def _update_search_data(self, model, row_ids):
+        """
+        Updates the search data of the provided rows if the full text search mode is
+        enabled for the table, so that the rows can be found by their new values.
+
+        :param model: The model of the table containing the rows.
+        :type model: Model
+        :param row_ids: The ids of the rows that have been created or updated.
+        :type row_ids: list
+        """
+
+        if model._search_mode == SEARCH_MODE_FULL_TEXT:
+            update_search_data(model, model.objects_and_trash.filter(id__in=row_ids))
+
+    # noinspection PyMethodMayBeStatic
+    def _update_primary_values(self, model, row_ids):
+        """
+        Updates the cached primary values of the provided rows if the table caches
+        them, so that link row fields pointing to the rows show the new values and
+        leave out the trashed rows.
+
+        :param model: The model of the table containing the rows.
+        :type model: Model
+        :param row_ids: The ids of the rows that have been created, updated, moved
+            or trashed.
+        :type row_ids: list
+        """
+
+        if model._cache_primary_values:
+            update_primary_values(model, model.objects_and_trash.filter(id__in=row_ids))
+
+    def _set_manytomany_values(self, model, rows_manytomany_values, replace):
+        """
+        Sets the related rows of the many to many fields of multiple rows at once.
+        Instead of calling `set` on the related manager of every row and field, the
+        relations of a field are written to the through table with set based queries.
+        Just like `set`, existing relations are preserved so that the order of the
+        related rows doesn't change. The related row ids of a link row field that don't
+        exist are ignored, which is checked with a single query per field.
+
+        :param model: The model of the table containing the rows.
+        :type model: Model
+        :param rows_manytomany_values: An iterable containing a tuple with the row id
+            and the extracted many to many values of that row.
+        :type rows_manytomany_values: iterable
+        :param replace: Indicates whether the rows could already have relations that
+            must be removed if they are not in the new values.
+        :type replace: bool
+        """
+
+        related_ids_by_field = defaultdict(dict)
+        for row_id, manytomany_values in rows_manytomany_values:
+            for name, value in manytomany_values.items():
+                related_ids_by_field[name][row_id] = list(
+                    dict.fromkeys(getattr(v, "pk", v) for v in value or [])
+                )
+
+        link_row_field_names = {
+            field_object["name"]
+            for field_object in model._field_objects.values()
+            if isinstance(field_object["field"], LinkRowField)
+        }
+
+        for name, related_ids_by_row in related_ids_by_field.items():
+            if name in link_row_field_names:
+                related_ids_by_row = self._filter_existing_related_row_ids(
+                    model._meta.get_field(name).remote_field.model, related_ids_by_row
+                )
+
+            set_many_to_many_relations(model, name, related_ids_by_row, replace)
+
+    # noinspection PyMethodMayBeStatic
+    def _filter_existing_related_row_ids(self, related_model, related_ids_by_row):
+        """
+        Removes the related row ids that don't exist in the related table. Because the
+        through table of a link row field doesn't have foreign key constraints, they
+        would otherwise be stored without ever being displayed.
+
+        :param related_model: The model of the related table.
+        :type related_model: Model
+        :param related_ids_by_row: The related row ids by row id.
+        :type related_ids_by_row: dict
+        :return: The related row ids by row id containing only the existing ids.
+        :rtype: dict
+        """
+
+        related_ids = set(
+            related_id
+            for related_ids in related_ids_by_row.values()
+            for related_id in related_ids
+        )
+        if len(related_ids) == 0:
+            return related_ids_by_row
+
+        existing_ids = set(
+            related_model.objects_and_trash.filter(id__in=related_ids).values_list(
+                "id", flat=True
+            )
+        )
+
+        return {
+            row_id: [
+                related_id for related_id in related_ids if related_id in existing_ids
+            ]
+            for row_id, related_ids in related_ids_by_row.items()
+        }
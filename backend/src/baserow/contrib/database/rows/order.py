@@ -0,0 +1,161 @@
+from decimal import Decimal, localcontext
+from math import ceil
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+
+
+# The smallest difference between two orders that can be stored in the
+# `DecimalField(max_digits=40, decimal_places=20)` order column.
+ORDER_PRECISION = Decimal("0.00000000000000000001")
+
+# If the gap between two orders becomes smaller than this value, the orders of the
+# rows before the row are rebalanced in the background so that rows can keep being
+# inserted in between.
+ORDER_REBALANCE_GAP = Decimal("0.0000000001")
+
+# The number of rows that are renumbered when rebalancing starts with this window,
+# which doubles until the rows in it are at least `ORDER_REBALANCE_WINDOW_GAP` apart.
+ORDER_REBALANCE_INITIAL_WINDOW_SIZE = 16
+ORDER_REBALANCE_WINDOW_GAP = Decimal("0.5")
+
+ROW_ORDER_COUNTER_TIMEOUT = 60 * 60 * 24
+
+
+def get_row_order_counter_cache_key(table_id):
+    return f"row_order_counter_{table_id}"
+
+
+def get_row_order_rebalance_scheduled_cache_key(table_id, row_id):
+    return f"row_order_rebalance_scheduled_{table_id}_{row_id}"
+
+
+class RowOrderAllocator:
+    """
+    Allocates the orders of the rows that are added at the end of a table. Instead of
+    computing the highest order with an aggregate query for every new row, the highest
+    allocated order of every table is kept in a counter in the shared cache, which is
+    atomically increased by the amount of requested orders. The counter is
+    initialized with the highest order in the table if it doesn't exist yet, for
+    example because it has expired or the cache has been cleared.
+
+    Code that writes orders after the highest order without using the allocator, like
+    `copy_rows_into_table`, must call `reset` afterwards, so that the counter is
+    initialized again.
+    """
+
+    def reserve(self, model, amount: int = 1) -> int:
+        """
+        Reserves a range of `amount` consecutive whole orders after the highest order
+        in the table.
+
+        :param model: The generated model of the table.
+        :param amount: The number of orders that must be reserved.
+        :return: The first order of the reserved range.
+        """
+
+        key = get_row_order_counter_cache_key(model._table_id)
+
+        # The key can expire right between initializing and increasing it, in which
+        # case we simply try again.
+        while True:
+            try:
+                return cache.incr(key, amount) - amount + 1
+            except ValueError:
+                highest_order = (
+                    model.objects_and_trash.aggregate(max=Max("order")).get("max") or 0
+                )
+                cache.add(key, ceil(highest_order), timeout=ROW_ORDER_COUNTER_TIMEOUT)
+
+    def allocate(self, model, amount: int = 1) -> List[Decimal]:
+        """
+        Allocates `amount` new whole orders after the highest order in the table.
+
+        :param model: The generated model of the table.
+        :param amount: The number of orders that must be allocated.
+        :return: The allocated orders in ascending order.
+        """
+
+        first = self.reserve(model, amount)
+        return [Decimal(first + index) for index in range(amount)]
+
+    def reset(self, table_id: int):
+        """
+        Removes the counter of the table so that it's initialized again with the
+        highest order in the table the next time orders are allocated.
+
+        :param table_id: The id of the table of which the counter must be reset.
+        """
+
+        cache.delete(get_row_order_counter_cache_key(table_id))
+
+
+def get_orders_between(
+    lower: Optional[Decimal], upper: Decimal, amount: int
+) -> Optional[List[Decimal]]:
+    """
+    Calculates `amount` evenly spaced orders between the lower and the upper order,
+    rounded to the precision of the order column. Because the rows of a table are at
+    most 1 apart after rebalancing, the lower order is never lower than `upper - 1`.
+    This makes sure that rows inserted right before a row while the table is being
+    rebalanced still end up right before that row.
+
+    :param lower: The order of the row before the new rows or None if there is none.
+    :param upper: The order of the row after the new rows.
+    :param amount: The number of orders that must be calculated.
+    :return: The orders in ascending order or None if the gap between the lower and
+        upper order is too small to fit the orders.
+    """
+
+    with localcontext() as context:
+        # The default precision of 28 digits is too low for the 40 digits of the
+        # order column.
+        context.prec = 60
+
+        upper = Decimal(upper)
+        if lower is None or lower < upper - 1:
+            lower = upper - 1
+
+        step = (upper - lower) / (amount + 1)
+        orders = [
+            (lower + step * (index + 1)).quantize(ORDER_PRECISION)
+            for index in range(amount)
+        ]
+
+    if any(
+        previous >= order for previous, order in zip([lower] + orders, orders + [upper])
+    ):
+        return None
+
+    return orders
+
+
+def schedule_row_orders_rebalance(table_id: int, row_id: int):
+    """
+    Rebalances the orders of the rows before the provided row in a background task
+    once the current transaction commits. Inserting many rows at the same spot
+    schedules the rebalancing many times, so the task is only scheduled if it isn't
+    already waiting to run for the row. The task is delayed by the
+    `ROW_ORDER_REBALANCE_DELAY_SECONDS` setting so that a burst of inserts is
+    rebalanced once.
+
+    :param table_id: The id of the table containing the row.
+    :param row_id: The id of the row before which the gap has become too small.
+    """
+
+    from baserow.contrib.database.rows.tasks import rebalance_row_orders
+
+    delay = settings.ROW_ORDER_REBALANCE_DELAY_SECONDS
+
+    def schedule():
+        key = get_row_order_rebalance_scheduled_cache_key(table_id, row_id)
+        if cache.add(key, True, timeout=delay + 60):
+            rebalance_row_orders.apply_async((table_id, row_id), countdown=delay)
+
+    transaction.on_commit(schedule)
+
+
+row_order_allocator = RowOrderAllocator()
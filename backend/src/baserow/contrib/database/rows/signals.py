@@ -9,3 +9,12 @@ before_row_delete = Signal()
 row_created = Signal()
 row_updated = Signal()
 row_deleted = Signal()
+
+before_rows_update = Signal()
+before_rows_delete = Signal()
+
+rows_created = Signal()
+rows_updated = Signal()
+rows_deleted = Signal()
+
+row_orders_rebalanced = Signal()
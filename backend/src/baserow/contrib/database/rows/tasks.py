@@ -0,0 +1,37 @@
+from baserow.config.celery import app
+
+ROW_ORDER_REBALANCE_SOFT_TIME_LIMIT = 60 * 60
+ROW_ORDER_REBALANCE_TIME_LIMIT = ROW_ORDER_REBALANCE_SOFT_TIME_LIMIT + 60
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=ROW_ORDER_REBALANCE_SOFT_TIME_LIMIT,
+    time_limit=ROW_ORDER_REBALANCE_TIME_LIMIT,
+)
+def rebalance_row_orders(self, table_id, row_id):
+    """
+    Renumbers the orders of the rows before a row after the gap between them has
+    become too small. Configured in base.py to run on a separate queue because it
+    can update many rows.
+    """
+
+    from django.core.cache import cache
+
+    from baserow.contrib.database.rows.handler import RowHandler
+    from baserow.contrib.database.rows.order import (
+        get_row_order_rebalance_scheduled_cache_key,
+    )
+    from baserow.contrib.database.table.models import Table
+
+    # Rows that are inserted from now on must be able to schedule a new rebalance
+    # because their gap might not be fixed by this one anymore.
+    cache.delete(get_row_order_rebalance_scheduled_cache_key(table_id, row_id))
+
+    try:
+        table = Table.objects.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    RowHandler().rebalance_row_orders(table, row_id)
@@ -0,0 +1,231 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.db import transaction
+
+
+class GeneratedTableModelCache:
+    """
+    A per process least recently used cache of generated table models. Generating a
+    table model requires fetching all the fields, resolving their specific instances
+    and optionally typing the formulas, which is expensive for tables with lots of
+    fields. The generated model classes don't change until the schema of the table
+    changes, so they can be reused across requests.
+
+    Every entry stores the schema versions of all the tables that were involved in
+    generating the model. This includes the tables related via link row fields because
+    the related models are embedded in the generated model. An entry is only returned
+    if all the stored versions still match the current versions.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._dependencies: Dict[int, Set[int]] = {}
+        self._lock = Lock()
+
+    def get_dependencies(self, table_id: int) -> Set[int]:
+        """
+        Returns the ids of the tables of which the versions must be known in order
+        to validate the cached models of the provided table.
+
+        :param table_id: The id of the table for which the model is requested.
+        :return: A set containing the table id and related table ids.
+        """
+
+        with self._lock:
+            return {table_id, *self._dependencies.get(table_id, set())}
+
+    def set_dependencies(self, table_id: int, dependencies: Iterable[int]):
+        """
+        Remembers which related tables are involved in generating the model of the
+        provided table, so that their versions can be fetched upfront next time.
+
+        :param table_id: The id of the table that the model belongs to.
+        :param dependencies: The ids of all the tables involved in generating the
+            model.
+        """
+
+        with self._lock:
+            self._dependencies[table_id] = set(dependencies) - {table_id}
+
+    def get(self, key: Hashable, versions: Dict[int, int]):
+        """
+        Returns the cached model if the schema versions of all the tables that were
+        involved in generating the model still match.
+
+        :param key: The key that uniquely identifies the generated model.
+        :param versions: A dict containing the current version by table id.
+        :return: The cached model or None if there is no valid entry.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            entry_versions, model = entry
+            if any(
+                versions.get(table_id) != version
+                for table_id, version in entry_versions.items()
+            ):
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return model
+
+    def set(self, key: Hashable, table_id: int, versions: Dict[int, int], model):
+        """
+        Stores the generated model in the cache and evicts the least recently used
+        entries if the cache is full.
+
+        :param key: The key that uniquely identifies the generated model.
+        :param table_id: The id of the table that the model belongs to.
+        :param versions: A dict containing the versions, by table id, of all the tables
+            that were involved in generating the model.
+        :param model: The generated model.
+        """
+
+        if self.max_size <= 0:
+            return
+
+        self.set_dependencies(table_id, versions.keys())
+
+        with self._lock:
+            self._entries[key] = (versions, model)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                evicted_key, _ = self._entries.popitem(last=False)
+                if not any(
+                    other_key[0] == evicted_key[0] for other_key in self._entries
+                ):
+                    self._dependencies.pop(evicted_key[0], None)
+
+    def set_on_commit(
+        self, key: Hashable, table_id: int, versions: Dict[int, int], model
+    ):
+        """
+        Stores the generated model in the cache once the current transaction commits.
+        Versions that are bumped inside a transaction that is rolled back can be bumped
+        again later for a different schema, so models must never be cached for
+        uncommitted versions.
+        """
+
+        transaction.on_commit(lambda: self.set(key, table_id, versions, model))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dependencies.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TypedTableCache:
+    """
+    A per process least recently used cache of typed tables. Typing a table requires
+    fetching all the fields, parsing every formula, building the dependency graph
+    between the fields and typing every expression. The result only changes when the
+    fields of the table change, which always increases the schema version of the
+    table, so the typed table is stored together with the version it was typed for.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, table_id: int, version: int):
+        """
+        Returns the cached typed table if it was typed for the provided version.
+
+        :param table_id: The id of the table of which the typed table is requested.
+        :param version: The current schema version of the table.
+        :return: The cached `TypedBaserowTable` or None if there is no valid entry.
+        """
+
+        with self._lock:
+            entry = self._entries.get(table_id)
+
+            if entry is None:
+                return None
+
+            entry_version, typed_table = entry
+            if entry_version != version:
+                del self._entries[table_id]
+                return None
+
+            self._entries.move_to_end(table_id)
+            return typed_table
+
+    def set(self, table_id: int, version: int, typed_table):
+        """
+        Stores the typed table in the cache and evicts the least recently used entries
+        if the cache is full.
+
+        :param table_id: The id of the table that was typed.
+        :param version: The schema version of the table that was typed.
+        :param typed_table: The `TypedBaserowTable` of the table.
+        """
+
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[table_id] = (version, typed_table)
+            self._entries.move_to_end(table_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def set_on_commit(self, table_id: int, version: int, typed_table):
+        """
+        Stores the typed table in the cache once the current transaction commits for
+        the same reason as `GeneratedTableModelCache.set_on_commit`.
+        """
+
+        transaction.on_commit(lambda: self.set(table_id, version, typed_table))
+
+    def invalidate(self, table_id: int):
+        with self._lock:
+            self._entries.pop(table_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def get_model_cache_key(
+    table_id: int,
+    field_ids: Optional[List[int]],
+    field_names: Optional[List[str]],
+    attribute_names: bool,
+) -> Hashable:
+    """
+    Constructs the cache key of a generated model based on the arguments that change
+    the outcome of the `Table.get_model` method. Just like in that method, the field
+    ids and names are only taken into account if they are provided as a list.
+    """
+
+    return (
+        table_id,
+        tuple(sorted(set(field_ids))) if isinstance(field_ids, list) else None,
+        tuple(sorted(set(field_names))) if isinstance(field_names, list) else None,
+        bool(attribute_names),
+    )
+
+
+generated_table_model_cache = GeneratedTableModelCache(
+    settings.GENERATED_MODEL_CACHE_SIZE
+)
+
+typed_table_cache = TypedTableCache(settings.TYPED_TABLE_CACHE_SIZE)
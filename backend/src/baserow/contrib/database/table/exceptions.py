@@ -33,3 +33,7 @@ class InitialTableDataDuplicateName(Exception):
     """
     Raised when the initial table data contains duplicate field names.
     """
+
+
+class InvalidSearchMode(Exception):
+    """Raised when an unknown search mode is provided for a table."""
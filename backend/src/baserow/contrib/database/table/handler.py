@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.db import connection
 
+from baserow.contrib.database.db.copy import copy_rows_into_table
 from baserow.contrib.database.fields.constants import RESERVED_BASEROW_FIELD_NAMES
 from baserow.contrib.database.fields.exceptions import (
     MaxFieldLimitExceeded,
@@ -27,8 +28,18 @@ from .exceptions import (
     InvalidInitialTableData,
     InitialTableDataLimitExceeded,
     InitialTableDataDuplicateName,
+    InvalidSearchMode,
 )
 from .models import Table
+from .primary_values import delete_primary_values, update_primary_values_in_chunks
+from .search import (
+    SEARCH_MODE_CHOICES,
+    SEARCH_MODE_FULL_TEXT,
+    add_search_data_column,
+    create_search_data_index,
+    drop_search_data_column,
+    update_search_data_in_chunks,
+)
 from .signals import table_created, table_updated, table_deleted, tables_reordered
 
 
@@ -202,7 +213,8 @@ class TableHandler:
     def fill_initial_table_data(self, user, table, fields, data, model):
         """
         Fills the provided table with the normalized data that needs to be created upon
-        creation of the table.
+        creation of the table. The rows are streamed into the table using the
+        PostgreSQL `COPY` command because the data can contain lots of rows.
 
         :param user: The user on whose behalf the table is created.
         :type user: User`
@@ -220,17 +232,15 @@ class TableHandler:
 
         ViewHandler().create_view(user, table, GridViewType.type, name="Grid")
 
-        bulk_data = [
-            model(
-                order=index + 1,
-                **{
-                    f"field_{fields[index].id}": str(value)
-                    for index, value in enumerate(row)
-                },
-            )
+        field_names = [f"field_{field.id}" for field in fields]
+        rows = (
+            {
+                "order": index + 1,
+                **{field_names[index]: str(value) for index, value in enumerate(row)},
+            }
             for index, row in enumerate(data)
-        ]
-        model.objects.bulk_create(bulk_data)
+        )
+        copy_rows_into_table(model, rows)
 
     def fill_example_table_data(self, user, table):
         """
@@ -289,6 +299,81 @@ class TableHandler:
 
         return table
 
+    def update_search_mode(self, table, search_mode):
+        """
+        Changes the search mode of the table. Enabling the full text search mode adds
+        a column containing the searchable values of every row to the table, fills it
+        in chunks and indexes it. The mode is changed before the column is filled, so
+        that rows that change in the meantime are also kept up to date. Disabling the
+        mode drops the column again.
+
+        :param table: The table of which the search mode must be changed.
+        :type table: Table
+        :param search_mode: The new search mode.
+        :type search_mode: str
+        :raises InvalidSearchMode: When the provided search mode doesn't exist.
+        :return: The updated table instance.
+        :rtype: Table
+        """
+
+        if search_mode not in dict(SEARCH_MODE_CHOICES):
+            raise InvalidSearchMode(f"The search mode {search_mode} does not exist.")
+
+        if table.search_mode == search_mode:
+            return table
+
+        model = table.get_model()
+        if search_mode == SEARCH_MODE_FULL_TEXT:
+            add_search_data_column(model)
+
+        table.search_mode = search_mode
+        table.save(update_fields=["search_mode"])
+        # The search mode is part of the generated model, so the cached models must
+        # be invalidated.
+        Table.bump_version(table.id)
+
+        if search_mode == SEARCH_MODE_FULL_TEXT:
+            update_search_data_in_chunks(table.get_model())
+            create_search_data_index(model)
+        else:
+            drop_search_data_column(model)
+
+        return table
+
+    def update_cache_primary_values(self, table, cache_primary_values):
+        """
+        Enables or disables the cache of the human readable primary values of the rows
+        of the table. The option is changed before the cache is filled in chunks, so
+        that rows that change in the meantime are also kept up to date. Link row
+        fields pointing to the table fetch the primary values that haven't been
+        cached yet from the table itself. Disabling the option deletes the cached
+        values.
+
+        :param table: The table of which the option must be changed.
+        :type table: Table
+        :param cache_primary_values: Indicates whether the primary values must be
+            cached.
+        :type cache_primary_values: bool
+        :return: The updated table instance.
+        :rtype: Table
+        """
+
+        if table.cache_primary_values == cache_primary_values:
+            return table
+
+        table.cache_primary_values = cache_primary_values
+        table.save(update_fields=["cache_primary_values"])
+        # The option is part of the generated model, so the cached models must be
+        # invalidated.
+        Table.bump_version(table.id)
+
+        if cache_primary_values:
+            update_primary_values_in_chunks(table.get_model())
+        else:
+            delete_primary_values(table.id)
+
+        return table
+
     def order_tables(self, user, database, order):
         """
         Updates the order of the tables in the given database. The order of the views
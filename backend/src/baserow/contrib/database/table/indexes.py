@@ -0,0 +1,305 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import JSONField, TextField
+
+INDEX_TYPE_BTREE = "btree"
+INDEX_TYPE_HASH = "hash"
+INDEX_TYPE_SORT_ASC = "asc"
+INDEX_TYPE_SORT_DESC = "desc"
+INDEX_TYPE_GIN = "gin"
+INDEX_TYPE_TRIGRAM = "trigram"
+SORT_INDEX_TYPES = [INDEX_TYPE_SORT_ASC, INDEX_TYPE_SORT_DESC]
+
+
+@dataclass
+class FieldIndex:
+    """
+    An index on the column of a single field that speeds up the filters or the sorts
+    of one or more views.
+    """
+
+    name: str
+    field_id: int
+    column: str
+    index_type: str
+    usages: int
+
+    def get_create_sql(self, table_name: str, concurrently: bool) -> str:
+        quote_name = connection.ops.quote_name
+        column = quote_name(self.column)
+
+        if self.index_type == INDEX_TYPE_SORT_ASC:
+            # The views sort the rows by the `order` and `id` after the sorts of the
+            # view, so those are included to fully match the `ORDER BY` clause.
+            using = f'({column} ASC NULLS FIRST, "order", "id")'
+        elif self.index_type == INDEX_TYPE_SORT_DESC:
+            using = f'({column} DESC NULLS LAST, "order", "id")'
+        elif self.index_type == INDEX_TYPE_HASH:
+            using = f"USING HASH ({column})"
+        elif self.index_type == INDEX_TYPE_GIN:
+            using = f"USING GIN ({column} jsonb_path_ops)"
+        elif self.index_type == INDEX_TYPE_TRIGRAM:
+            # Matches the `UPPER(column::text) LIKE UPPER(...)` of the `icontains`
+            # lookup.
+            using = f"USING GIN (UPPER({column}::text) gin_trgm_ops)"
+        else:
+            using = f"({column})"
+
+        return (
+            f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+            f"{quote_name(self.name)} ON {quote_name(table_name)} {using}"
+        )
+
+
+def get_field_index_name(model, field_id: int, index_type: str) -> str:
+    return f"{model._meta.db_table}_field_{field_id}_{index_type}_idx"
+
+
+def get_field_index_name_prefix(model, field_id: Optional[int] = None) -> str:
+    prefix = f"{model._meta.db_table}_field_"
+    return prefix if field_id is None else f"{prefix}{field_id}_"
+
+
+def trigram_extension_is_installed() -> bool:
+    """
+    Indicates whether the `pg_trgm` extension, which is needed for the trigram indexes
+    speeding up the contains filters, is installed. It requires superuser rights to
+    install, so it's not available in every installation.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def get_model_field_index_type(
+    model_field, index_type: str, trigram_available: bool
+) -> Optional[str]:
+    """
+    Returns the kind of index that must be created on the column of the provided model
+    field for the kind of index that speeds up a filter or sort.
+
+    :param model_field: The field of the generated model.
+    :param index_type: The kind of index that speeds up the filter or sort.
+    :param trigram_available: Whether the `pg_trgm` extension is installed.
+    :return: The kind of index or None if the index can't be created on the column.
+    """
+
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+
+    if index_type in [INDEX_TYPE_BTREE, *SORT_INDEX_TYPES]:
+        # Foreign keys are already indexed by Django.
+        if model_field.db_index or model_field.primary_key:
+            return None
+        # A btree index can't contain values larger than about 2700 bytes, so a row
+        # having a long text value could not be written anymore. A hash index only
+        # stores the hash of the value, which still speeds up the equal filter.
+        if isinstance(model_field, TextField):
+            return INDEX_TYPE_HASH if index_type == INDEX_TYPE_BTREE else None
+    elif index_type == INDEX_TYPE_GIN:
+        if not isinstance(model_field, JSONField):
+            return None
+    elif index_type == INDEX_TYPE_TRIGRAM:
+        if not trigram_available:
+            return None
+
+    return index_type
+
+
+def get_desired_field_indexes(table, model=None) -> List[FieldIndex]:
+    """
+    Determines which indexes must exist on the columns of the table based on the
+    filters and sorts of all the views of the table. Every filter or sort using a
+    field counts as one usage of the matching index, and only the most used indexes
+    that fit in the `TABLE_INDEX_BUDGET` setting are returned, because every index
+    slows down writing rows.
+
+    :param table: The table for which the indexes must be determined.
+    :type table: Table
+    :param model: The generated model of the table, generated if not provided.
+    :return: The indexes ordered by the number of usages descending.
+    """
+
+    from baserow.contrib.database.views.models import ViewFilter, ViewSort
+    from baserow.contrib.database.views.registries import view_filter_type_registry
+
+    budget = settings.TABLE_INDEX_BUDGET
+    if budget <= 0:
+        return []
+
+    if model is None:
+        model = table.get_model()
+
+    trigram_available = trigram_extension_is_installed()
+    usages = Counter()
+
+    def add_usage(field_id, index_type):
+        model_field = model._meta.get_field(model._field_objects[field_id]["name"])
+        index_type = get_model_field_index_type(
+            model_field, index_type, trigram_available
+        )
+        if index_type is not None:
+            usages[(field_id, index_type)] += 1
+
+    view_filters = ViewFilter.objects.filter(
+        view__table_id=table.id, view__filters_disabled=False
+    ).values_list("field_id", "type")
+    for field_id, filter_type in view_filters:
+        # Filters on trashed fields are not applied.
+        if field_id not in model._field_objects:
+            continue
+
+        index_type = view_filter_type_registry.get(filter_type).get_index_type(
+            model._field_objects[field_id]["field"]
+        )
+        if index_type is not None:
+            add_usage(field_id, index_type)
+
+    view_sorts = ViewSort.objects.filter(view__table_id=table.id).values_list(
+        "field_id", "order"
+    )
+    for field_id, order in view_sorts:
+        if field_id not in model._field_objects:
+            continue
+
+        field_object = model._field_objects[field_id]
+        # Fields having a specific ordering expression, like the single select, don't
+        # sort on the value of the column.
+        if (
+            field_object["type"].get_order(
+                field_object["field"], field_object["name"], order
+            )
+            is not None
+        ):
+            continue
+
+        add_usage(
+            field_id, INDEX_TYPE_SORT_ASC if order == "ASC" else INDEX_TYPE_SORT_DESC
+        )
+
+    # A sort index starts with the column of the field, so it can also be used by the
+    # btree filters of the same field.
+    for field_id, index_type in list(usages.keys()):
+        if index_type != INDEX_TYPE_BTREE:
+            continue
+
+        sort_keys = [
+            (field_id, sort_type)
+            for sort_type in SORT_INDEX_TYPES
+            if (field_id, sort_type) in usages
+        ]
+        if len(sort_keys) > 0:
+            sort_key = max(sort_keys, key=lambda key: usages[key])
+            usages[sort_key] += usages.pop((field_id, INDEX_TYPE_BTREE))
+
+    indexes = [
+        FieldIndex(
+            name=get_field_index_name(model, field_id, index_type),
+            field_id=field_id,
+            column=model._meta.get_field(model._field_objects[field_id]["name"]).column,
+            index_type=index_type,
+            usages=count,
+        )
+        for (field_id, index_type), count in usages.items()
+    ]
+    indexes.sort(key=lambda index: (-index.usages, index.field_id, index.index_type))
+    return indexes[:budget]
+
+
+def get_existing_field_indexes(
+    model, field_id: Optional[int] = None
+) -> Dict[str, bool]:
+    """
+    Returns the field indexes that are managed by the index advisor and exist on the
+    table of the model.
+
+    :param model: The generated model of the table.
+    :param field_id: If provided, only the indexes of this field are returned.
+    :return: A dict containing whether the index is valid by index name. An index
+        created concurrently stays behind as an invalid index if creating it failed.
+    """
+
+    prefix = get_field_index_name_prefix(model, field_id)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT index_class.relname, pg_index.indisvalid
+            FROM pg_index
+            INNER JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid
+            WHERE pg_index.indrelid = %s::regclass
+            """,
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        return {
+            name: valid for name, valid in cursor.fetchall() if name.startswith(prefix)
+        }
+
+
+def drop_index(name: str, concurrently: bool):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS "
+            f"{connection.ops.quote_name(name)}"
+        )
+
+
+def update_field_indexes(table, model=None):
+    """
+    Creates the indexes that the views of the table benefit from and drops the
+    managed indexes that are not used anymore or that are invalid. Outside of a
+    transaction, which is the case in the background task, the indexes are created
+    and dropped concurrently, so that writing rows isn't blocked in the meantime.
+
+    :param table: The table of which the indexes must be updated.
+    :type table: Table
+    :param model: The generated model of the table, generated if not provided.
+    """
+
+    if model is None:
+        model = table.get_model()
+
+    concurrently = not connection.in_atomic_block
+    desired = {index.name: index for index in get_desired_field_indexes(table, model)}
+    existing = get_existing_field_indexes(model)
+
+    for name, valid in existing.items():
+        if name not in desired or not valid:
+            drop_index(name, concurrently)
+
+    for name, index in desired.items():
+        if not existing.get(name, False):
+            with connection.cursor() as cursor:
+                cursor.execute(index.get_create_sql(model._meta.db_table, concurrently))
+
+
+def drop_field_indexes(model, field_id: int):
+    """
+    Drops the managed indexes of a field. This must happen before the type of the
+    column changes because the operator class of the index might not support the new
+    type.
+
+    :param model: The generated model of the table.
+    :param field_id: The id of the field of which the indexes must be dropped.
+    """
+
+    concurrently = not connection.in_atomic_block
+    for name in get_existing_field_indexes(model, field_id):
+        drop_index(name, concurrently)
+
+
+def schedule_field_indexes_update(table_id: int):
+    """
+    Updates the indexes of the table in a background task once the current
+    transaction commits, because creating an index on a large table can take a while.
+
+    :param table_id: The id of the table of which the views changed.
+    """
+
+    from baserow.contrib.database.table.tasks import update_field_indexes_task
+
+    transaction.on_commit(lambda: update_field_indexes_task.delay(table_id))
@@ -1,5 +1,6 @@
 import re
-from typing import Dict, Any, Union
+from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional, Union
 
 from django.db import models
 from django.db.models import Q, F
@@ -17,6 +18,21 @@ from baserow.contrib.database.fields.field_filters import (
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.formula.types.table_typer import type_table
+from baserow.contrib.database.formula.types.visitors import (
+    FieldReferenceResolvingVisitor,
+)
+from baserow.contrib.database.table.cache import (
+    generated_table_model_cache,
+    get_model_cache_key,
+    typed_table_cache,
+)
+from baserow.contrib.database.table.search import (
+    SEARCH_MODE_CHOICES,
+    SEARCH_MODE_DEFAULT,
+    SEARCH_MODE_FULL_TEXT,
+    get_full_text_search_expression,
+    get_search_query,
+)
 from baserow.contrib.database.views.exceptions import ViewFilterTypeNotAllowedForField
 from baserow.contrib.database.views.registries import view_filter_type_registry
 from baserow.core.mixins import (
@@ -24,46 +40,79 @@ from baserow.core.mixins import (
     CreatedAndUpdatedOnMixin,
     TrashableModelMixin,
 )
+from baserow.core.db import specific_iterator
 from baserow.core.utils import split_comma_separated_string
 
 deconstruct_filter_key_regex = re.compile(r"filter__field_([0-9]+)__([a-zA-Z0-9_]*)$")
 
 
 class TableModelQuerySet(models.QuerySet):
-    def enhance_by_fields(self):
+    def enhance_by_fields(self, only_field_ids=None):
         """
         Enhances the queryset based on the `enhance_queryset` for each field in the
         table. For example the `link_row` field adds the `prefetch_related` to prevent
         N queries per row. This helper should only be used when multiple rows are going
         to be fetched.
 
+        :param only_field_ids: If provided only the fields with the ids in the list
+            are enhanced. This can be used if the values of the other fields are not
+            going to be serialized.
+        :type only_field_ids: list or None
         :return: The enhanced queryset.
         :rtype: QuerySet
         """
 
         for field_object in self.model._field_objects.values():
+            if (
+                only_field_ids is not None
+                and field_object["field"].id not in only_field_ids
+            ):
+                continue
             self = field_object["type"].enhance_queryset(
                 self, field_object["field"], field_object["name"]
             )
         return self
 
-    def search_all_fields(self, search):
+    def search_all_fields(self, search, only_search_by_field_ids=None):
         """
         Performs a very broad search across all supported fields with the given search
         query. If the primary key value matches then that result will be returned
         otherwise all field types other than link row and boolean fields are currently
         searched.
 
+        If the full text search mode is enabled for the table, the search data column
+        containing the searchable values of every row is searched instead, which uses
+        an index. In that case rows match if they contain words starting with every
+        term in the search query.
+
         :param search: The search query.
         :type search: str
+        :param only_search_by_field_ids: If provided only the fields with the ids in
+            the list are searched. This is ignored in the full text search mode
+            because the search data contains the values of all the fields.
+        :type only_search_by_field_ids: list or None
         :return: The queryset containing the search queries.
         :rtype: QuerySet
         """
 
+        if self.model._search_mode == SEARCH_MODE_FULL_TEXT:
+            search_query = get_search_query(search)
+            if search_query is None:
+                return self
+            return self.filter(
+                get_full_text_search_expression(self.model, search_query)
+            )
+
         filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR).filter(
             Q(id__contains=search)
         )
         for field_object in self.model._field_objects.values():
+            if (
+                only_search_by_field_ids is not None
+                and field_object["field"].id not in only_search_by_field_ids
+            ):
+                continue
+
             field_name = field_object["name"]
             model_field = self.model._meta.get_field(field_name)
 
@@ -292,12 +341,65 @@ class GeneratedTableModel(models.Model):
         ]
 
     @classmethod
-    def fields_requiring_refresh_after_update(cls):
-        return [
-            f.attname
-            for f in cls._meta.fields
-            if getattr(f, "requires_refresh_after_update", False)
-        ]
+    def fields_requiring_refresh_after_update(
+        cls, updated_field_names: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Returns the attribute names of the fields of which the value is calculated by
+        the database and must therefore be refreshed after a row has been updated.
+
+        :param updated_field_names: If provided, only the expression fields that
+            depend on at least one of these fields are returned. Expression fields
+            that don't reference any of the updated fields keep their value, so they
+            don't have to be recalculated.
+        :return: The attribute names of the fields that must be refreshed.
+        """
+
+        if updated_field_names is None:
+            return [
+                f.attname
+                for f in cls._meta.fields
+                if getattr(f, "requires_refresh_after_update", False)
+            ]
+
+        dependencies = cls.get_expression_field_dependencies()
+        affected = set()
+        for field_name in updated_field_names:
+            affected.update(dependencies.get(field_name, []))
+
+        return [f.attname for f in cls._meta.fields if f.attname in affected]
+
+    @classmethod
+    def get_expression_field_dependencies(cls) -> Dict[str, List[str]]:
+        """
+        Returns which expression fields, like the formula fields, must be recalculated
+        when the value of a field changes. The typed expression of a formula field
+        already has the expressions of the formula fields it references substituted,
+        so it only references regular fields. The result is a dict containing the
+        attribute names of the depending expression fields keyed by the name of the
+        referenced field, for example `{"field_1": ["field_3", "field_4"]}`. It's
+        calculated once per generated model class because the expressions don't
+        change until the model is generated again.
+        """
+
+        if "_expression_field_dependencies" not in cls.__dict__:
+            dependencies = defaultdict(list)
+            for field in cls._meta.fields:
+                expression = getattr(field, "expression", None)
+                if expression is None or not getattr(
+                    field, "requires_refresh_after_update", False
+                ):
+                    continue
+
+                referenced_field_ids = expression.accept(
+                    FieldReferenceResolvingVisitor()
+                )
+                for field_id in set(referenced_field_ids):
+                    dependencies[f"field_{field_id}"].append(field.attname)
+
+            cls._expression_field_dependencies = dict(dependencies)
+
+        return cls._expression_field_dependencies
 
     class Meta:
         abstract = True
@@ -310,6 +412,25 @@ class Table(
     database = models.ForeignKey("database.Database", on_delete=models.CASCADE)
     order = models.PositiveIntegerField()
     name = models.CharField(max_length=255)
+    version = models.PositiveIntegerField(
+        default=1,
+        help_text="The schema version of the table. It is increased every time a "
+        "field of the table changes so that cached generated models can be "
+        "invalidated.",
+    )
+    search_mode = models.CharField(
+        max_length=16,
+        choices=SEARCH_MODE_CHOICES,
+        default=SEARCH_MODE_DEFAULT,
+        help_text="Indicates how the rows are searched. In the full text mode the "
+        "searchable values of every row are stored in an indexed column.",
+    )
+    cache_primary_values = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the human readable primary values of the rows "
+        "are stored in a separate table, so that link row fields pointing to this "
+        "table can be serialized without fetching the related rows.",
+    )
 
     class Meta:
         ordering = ("order",)
@@ -319,6 +440,33 @@ class Table(
         queryset = Table.objects.filter(database=database)
         return cls.get_highest_order_of_queryset(queryset) + 1
 
+    @classmethod
+    def bump_version(cls, table_id):
+        """
+        Increases the schema version of the table with the provided id. This
+        invalidates all the cached generated models that depend on the table.
+
+        :param table_id: The id of the table of which the version must be increased.
+        :type table_id: int
+        """
+
+        cls.objects_and_trash.filter(id=table_id).update(version=F("version") + 1)
+
+    @classmethod
+    def get_versions(cls, table_ids):
+        """
+        Fetches the current schema versions of the provided tables in one query.
+
+        :param table_ids: The ids of the tables to fetch the versions of.
+        :type table_ids: iterable
+        :return: A dict containing the version by table id.
+        :rtype: dict
+        """
+
+        return dict(
+            cls.objects_and_trash.filter(id__in=table_ids).values_list("id", "version")
+        )
+
     def get_database_table_name(self):
         return f"{self.USER_TABLE_DATABASE_NAME_PREFIX}{self.id}"
 
@@ -335,7 +483,12 @@ class Table(
         Generates a temporary Django model based on available fields that belong to
         this table. Note that the model will not be registered with the apps because
         of the `DatabaseConfig.prevent_generated_model_for_registering` hack. We do
-        not want to the model cached because models with the same name can differ.
+        not want to the model cached in the apps because models with the same name can
+        differ. Instead, models generated without extra `fields`, `manytomany_models`
+        and `typed_table` are cached per process in the
+        `generated_table_model_cache`, keyed by the schema version of this table and
+        the tables related to it. If the table must be typed, the typed table is
+        retrieved from the `typed_table_cache` if possible.
 
         :param fields: Extra table field instances that need to be added the model.
         :type fields: list
@@ -362,12 +515,107 @@ class Table(
         :rtype: Model
         """
 
-        if not fields:
-            fields = []
+        # Generating a model without any fields doesn't require any queries, so there
+        # is nothing to gain by caching it.
+        without_fields = field_ids == [] or field_names == []
+        use_cache = (
+            not fields
+            and not without_fields
+            and manytomany_models is None
+            and typed_table is None
+        )
+        versions = {}
+
+        if use_cache:
+            cache_key = get_model_cache_key(
+                self.id, field_ids, field_names, attribute_names
+            )
+            versions = Table.get_versions(
+                generated_table_model_cache.get_dependencies(self.id)
+            )
+            model = generated_table_model_cache.get(cache_key, versions)
+            if model is not None:
+                return model
 
         if not manytomany_models:
             manytomany_models = {}
 
+        model = self._generate_model(
+            fields=fields,
+            field_ids=field_ids,
+            field_names=field_names,
+            attribute_names=attribute_names,
+            manytomany_models=manytomany_models,
+            typed_table=typed_table,
+            version=versions.get(self.id),
+        )
+
+        if use_cache:
+            # The related models of link row fields are embedded in the generated
+            # model, so the versions of those tables must match as well. If a related
+            # table was unknown before generating the model, its version was not
+            # fetched upfront and we can't be sure it matches, so the model is only
+            # cached the next time.
+            dependencies = {self.id, *manytomany_models.keys()}
+            if dependencies.issubset(versions.keys()):
+                generated_table_model_cache.set_on_commit(
+                    cache_key,
+                    self.id,
+                    {table_id: versions[table_id] for table_id in dependencies},
+                    model,
+                )
+            else:
+                generated_table_model_cache.set_dependencies(self.id, dependencies)
+
+        return model
+
+    def get_typed_table(self, version=None):
+        """
+        Returns the typed table of this table. Because typing a table is expensive,
+        the typed table is cached per process for the current schema version of the
+        table.
+
+        :param version: The current schema version of the table if it has already
+            been fetched.
+        :type version: int or None
+        :return: The typed table containing the type information of every field.
+        :rtype: TypedBaserowTable
+        """
+
+        if version is None:
+            version = Table.get_versions([self.id]).get(self.id)
+
+        # The table doesn't exist in the database, so there is no version to cache
+        # the typed table for.
+        if version is None:
+            return type_table(self)
+
+        typed_table = typed_table_cache.get(self.id, version)
+        if typed_table is None:
+            typed_table = type_table(self)
+            typed_table_cache.set_on_commit(self.id, version, typed_table)
+
+        return typed_table
+
+    def _generate_model(
+        self,
+        fields,
+        field_ids,
+        field_names,
+        attribute_names,
+        manytomany_models,
+        typed_table,
+        version=None,
+    ) -> GeneratedTableModel:
+        """
+        Generates the model without consulting the cache. See `get_model` for the
+        description of the parameters. The optionally provided `version` is the
+        already fetched schema version of the table.
+        """
+
+        if not fields:
+            fields = []
+
         app_label = "database_table"
         meta = type(
             "Meta",
@@ -402,6 +650,8 @@ class Table(
             "_generated_table_model": True,
             "_table_id": self.id,
             "_primary_field_id": -1,
+            "_search_mode": self.search_mode,
+            "_cache_primary_values": self.cache_primary_values,
             # An object containing the table fields, field types and the chosen names
             # with the table field id as key.
             "_field_objects": {},
@@ -447,8 +697,9 @@ class Table(
                 fields_query = fields_query.filter(name__in=field_names)
 
         # Create a combined list of fields that must be added and belong to the this
-        # table.
-        fields = list(fields) + [field for field in fields_query]
+        # table. The specific instances of the fetched fields are resolved with a
+        # query per field type instead of a query per field.
+        fields = list(fields) + list(specific_iterator(fields_query))
 
         # If there are duplicate field names we have to store them in a list so we know
         # later which ones are duplicate.
@@ -466,7 +717,7 @@ class Table(
             field_name = field.db_column
 
             if typed_table is None and field_type.requires_typing:
-                typed_table = type_table(self)
+                typed_table = self.get_typed_table(version)
 
             fields += field_type.add_related_fields_to_model(
                 typed_table, field, already_included_field_ids
@@ -541,3 +792,26 @@ class Table(
             )
 
         return model
+
+
+class RowPrimaryValue(models.Model):
+    """
+    The denormalized human readable primary value of a row of a table that has the
+    `cache_primary_values` option enabled. Link row fields read the values of the
+    related rows from here instead of fetching the related rows themselves.
+    """
+
+    table = models.ForeignKey(Table, on_delete=models.CASCADE)
+    row_id = models.PositiveIntegerField()
+    value = models.TextField(blank=True)
+    order = models.DecimalField(
+        max_digits=40,
+        decimal_places=20,
+        null=True,
+        help_text="A copy of the order of the row, so that the related rows of link "
+        "row fields can be ordered without fetching them.",
+    )
+    trashed = models.BooleanField(default=False)
+
+    class Meta:
+        unique_together = ("table", "row_id")
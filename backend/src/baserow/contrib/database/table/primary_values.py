@@ -0,0 +1,301 @@
+from decimal import Decimal
+from typing import List, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import JSONField, Max, Min
+from django.db.models.expressions import RawSQL
+
+from baserow.core.db import get_estimated_count
+
+
+class RelatedPrimaryValue(NamedTuple):
+    """
+    The cached primary value of a related row. It renders to the human readable
+    primary value, just like the related row itself, so that it can be serialized by
+    the `LinkRowValueSerializer`.
+    """
+
+    id: int
+    value: str
+
+    def __str__(self):
+        return self.value
+
+
+def get_primary_values_attribute_name(field_name: str) -> str:
+    return f"{field_name}_primary_values"
+
+
+def get_primary_value_queryset(model, queryset):
+    """
+    Limits the provided queryset to the fields needed to render the rows to their
+    human readable primary value and to order them, and enhances it with the primary
+    field type.
+    """
+
+    queryset = queryset.order_by()
+    primary_field_object = model._field_objects.get(model._primary_field_id, None)
+
+    if primary_field_object is None:
+        return queryset.only("id", "order", "trashed")
+
+    name = primary_field_object["name"]
+    model_field = model._meta.get_field(name)
+    if model_field.concrete and not model_field.many_to_many:
+        queryset = queryset.only("id", "order", "trashed", name)
+
+    return primary_field_object["type"].enhance_queryset(
+        queryset, primary_field_object["field"], name
+    )
+
+
+def update_primary_values(model, queryset=None):
+    """
+    Stores the human readable primary values and the orders of the rows in the
+    provided queryset in the `RowPrimaryValue` table. This must be called after rows
+    have been created, updated, moved, trashed or restored if the table caches its
+    primary values.
+
+    :param model: The generated model of the table.
+    :param queryset: The queryset containing the rows that must be updated.
+        Defaults to all the rows in the table, including the trashed ones.
+    """
+
+    from baserow.contrib.database.table.models import RowPrimaryValue
+
+    if queryset is None:
+        queryset = model.objects_and_trash.all()
+
+    rows = list(get_primary_value_queryset(model, queryset))
+    if len(rows) == 0:
+        return
+
+    table_name = connection.ops.quote_name(RowPrimaryValue._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table_name} (table_id, row_id, value, "order", trashed)
+            SELECT %s, row_id, value, "order", trashed
+            FROM unnest(%s::integer[], %s::text[], %s::numeric[], %s::boolean[])
+                AS primary_value(row_id, value, "order", trashed)
+            ON CONFLICT (table_id, row_id) DO UPDATE
+            SET value = EXCLUDED.value,
+                "order" = EXCLUDED."order",
+                trashed = EXCLUDED.trashed
+            """,
+            [
+                model._table_id,
+                [row.id for row in rows],
+                [str(row) for row in rows],
+                [row.order for row in rows],
+                [row.trashed for row in rows],
+            ],
+        )
+
+
+def update_primary_value_orders(model, queryset):
+    """
+    Copies the orders of the rows in the provided queryset to their cached primary
+    values. This must be called after the orders of rows have changed if the table
+    caches its primary values, so that the related rows of link row fields keep
+    being ordered like the rows in the table.
+
+    :param model: The generated model of the table.
+    :param queryset: The queryset containing the rows of which the order has changed.
+    """
+
+    from baserow.contrib.database.table.models import RowPrimaryValue
+
+    sql, params = queryset.order_by().values("id", "order").query.sql_with_params()
+    table_name = connection.ops.quote_name(RowPrimaryValue._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table_name} SET "order" = row."order"
+            FROM ({sql}) AS row
+            WHERE {table_name}.table_id = %s AND {table_name}.row_id = row.id
+            """,
+            [*params, model._table_id],
+        )
+
+
+def update_primary_values_in_chunks(model, chunk_size: Optional[int] = None):
+    """
+    Updates the cached primary values of all the rows in the table, including the
+    trashed ones, in chunks of consecutive ids where every chunk is updated in its own
+    transaction.
+
+    :param model: The generated model of the table.
+    :param chunk_size: The maximum amount of rows updated per query. Defaults to the
+        `FORMULA_RECALCULATION_CHUNK_SIZE` setting.
+    """
+
+    if chunk_size is None:
+        chunk_size = settings.FORMULA_RECALCULATION_CHUNK_SIZE
+
+    bounds = model.objects_and_trash.aggregate(min_id=Min("id"), max_id=Max("id"))
+    if bounds["min_id"] is None:
+        return
+
+    for start in range(bounds["min_id"], bounds["max_id"] + 1, chunk_size):
+        with transaction.atomic():
+            update_primary_values(
+                model,
+                model.objects_and_trash.filter(
+                    id__gte=start, id__lt=start + chunk_size
+                ),
+            )
+
+
+def update_primary_values_after_field_change(table, updated_fields=None):
+    """
+    Updates the cached primary values of all the rows in the table after the primary
+    field has changed. Besides the field that has been created, updated, deleted or
+    restored, this includes the formula fields of which the values have changed as a
+    result, because the primary field can be a formula field depending on another
+    field. Just like the recalculation of the formula values, tables having more rows
+    than the `FORMULA_BACKGROUND_RECALCULATION_THRESHOLD` setting are updated in
+    chunks by a background task once the field change has been committed.
+
+    :param table: The table of which a field has changed.
+    :param updated_fields: The fields that have changed. Nothing happens if the
+        primary field of the table isn't one of them. If not provided, the primary
+        values are always updated.
+    """
+
+    if not table.cache_primary_values:
+        return
+
+    if updated_fields is not None and not any(
+        field.primary and field.table_id == table.id for field in updated_fields
+    ):
+        return
+
+    model = table.get_model()
+    threshold = settings.FORMULA_BACKGROUND_RECALCULATION_THRESHOLD
+    if threshold < 0 or get_estimated_count(model.objects_and_trash.all()) <= threshold:
+        update_primary_values(model)
+    else:
+        from baserow.contrib.database.table.tasks import update_primary_values_task
+
+        table_id = table.id
+        transaction.on_commit(lambda: update_primary_values_task.delay(table_id))
+
+
+def delete_primary_values(table_id: int, row_ids: Optional[List[int]] = None):
+    """
+    Deletes the cached primary values of the provided rows, or of all the rows if no
+    row ids are provided.
+
+    :param table_id: The id of the table containing the rows.
+    :param row_ids: The ids of the rows that have been permanently deleted.
+    """
+
+    from baserow.contrib.database.table.models import RowPrimaryValue
+
+    queryset = RowPrimaryValue.objects.filter(table_id=table_id)
+    if row_ids is not None:
+        queryset = queryset.filter(row_id__in=row_ids)
+    queryset.delete()
+
+
+def get_cached_primary_values_expression(model, field_name: str):
+    """
+    Returns an expression that aggregates the ids and cached primary values of the
+    rows related to a row via the provided many to many field into a JSON array,
+    without touching the related table. The related rows are ordered by their cached
+    order, just like the related rows themselves. Related rows that are trashed are
+    left out and related rows of which the primary value hasn't been cached yet have
+    a `null` value and order.
+
+    :param model: The generated model containing the link row field.
+    :param field_name: The name of the link row field.
+    :return: An expression resulting in a JSON array of `[id, value, order]` items
+        where the order is a string to preserve its precision.
+    """
+
+    from baserow.contrib.database.table.models import RowPrimaryValue
+
+    quote_name = connection.ops.quote_name
+    model_field = model._meta.get_field(field_name)
+    through_table = quote_name(model_field.remote_field.through._meta.db_table)
+    row_column = quote_name(model_field.m2m_column_name())
+    related_column = quote_name(model_field.m2m_reverse_name())
+    primary_value_table = quote_name(RowPrimaryValue._meta.db_table)
+    table_name = quote_name(model._meta.db_table)
+
+    return RawSQL(
+        f"""
+        SELECT COALESCE(
+            jsonb_agg(
+                jsonb_build_array(
+                    relation.{related_column},
+                    primary_value.value,
+                    primary_value."order"::text
+                )
+                ORDER BY primary_value."order", relation.{related_column}
+            ),
+            '[]'::jsonb
+        )
+        FROM {through_table} AS relation
+        LEFT JOIN {primary_value_table} AS primary_value
+            ON primary_value.table_id = %s
+            AND primary_value.row_id = relation.{related_column}
+        WHERE relation.{row_column} = {table_name}.id
+        AND primary_value.trashed IS NOT TRUE
+        """,
+        [model_field.related_model._table_id],
+        output_field=JSONField(),
+    )
+
+
+def get_related_primary_values(row, field_name: str) -> Optional[List]:
+    """
+    Returns the cached primary values of the rows related to the provided row if they
+    have been annotated by the `enhance_queryset` method of the link row field type.
+    The primary values of the related rows that haven't been cached yet, for example
+    because the cache is still being filled, are fetched from the related table.
+
+    :param row: The row containing the link row field.
+    :param field_name: The name of the link row field.
+    :return: A list of `RelatedPrimaryValue` or None if the primary values have not
+        been annotated.
+    """
+
+    primary_values = getattr(row, get_primary_values_attribute_name(field_name), None)
+    if primary_values is None:
+        return None
+
+    # Values cached before their order was stored are also fetched again.
+    missing_ids = [
+        row_id
+        for row_id, value, order in primary_values
+        if value is None or order is None
+    ]
+    if len(missing_ids) > 0:
+        related_model = row._meta.get_field(field_name).related_model
+        missing_rows = {
+            related_row.id: related_row
+            for related_row in get_primary_value_queryset(
+                related_model, related_model.objects.filter(id__in=missing_ids)
+            )
+        }
+        primary_values = sorted(
+            (
+                (row_id, value, Decimal(order))
+                if row_id not in missing_rows
+                else (
+                    row_id,
+                    str(missing_rows[row_id]),
+                    missing_rows[row_id].order,
+                )
+                for row_id, value, order in primary_values
+                if order is not None or row_id in missing_rows
+            ),
+            key=lambda primary_value: (primary_value[2], primary_value[0]),
+        )
+
+    return [RelatedPrimaryValue(row_id, value) for row_id, value, _ in primary_values]
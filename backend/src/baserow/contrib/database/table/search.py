@@ -0,0 +1,222 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import BooleanField, Func, Max, Min, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+
+from baserow.core.db import get_estimated_count
+
+SEARCH_MODE_DEFAULT = "default"
+SEARCH_MODE_FULL_TEXT = "full_text"
+SEARCH_MODE_CHOICES = (
+    (SEARCH_MODE_DEFAULT, "Default"),
+    (SEARCH_MODE_FULL_TEXT, "Full text"),
+)
+
+# The name of the `tsvector` column that is added to the table when the full text
+# search mode is enabled. It's not a field of the generated model so that it isn't
+# fetched when selecting rows.
+SEARCH_DATA_COLUMN = "search_data"
+# The `simple` configuration doesn't remove stop words or stem words, which makes it
+# work for every language and keeps the results close to the default contains search.
+SEARCH_CONFIG = "simple"
+
+
+def get_search_data_index_name(model) -> str:
+    return f"{model._meta.db_table}_{SEARCH_DATA_COLUMN}_idx"
+
+
+def get_search_text_expression(model):
+    """
+    Returns an expression that concatenates the searchable values of all the fields
+    of a row, including the row id, into a single text. Field types that can't be
+    searched are left out.
+
+    :param model: The generated model of the table.
+    :return: An expression resulting in the searchable text of a row.
+    """
+
+    expressions = [Cast("id", output_field=TextField())]
+    for field_object in model._field_objects.values():
+        field_name = field_object["name"]
+        expression = field_object["type"].get_search_expression(
+            field_name, model._meta.get_field(field_name), field_object["field"]
+        )
+        if expression is not None:
+            expressions.append(expression)
+
+    return Func(
+        Value(" "), *expressions, function="CONCAT_WS", output_field=TextField()
+    )
+
+
+def update_search_data(model, queryset=None):
+    """
+    Updates the search data of the rows in the provided queryset by converting the
+    searchable text of every row to a `tsvector`. This must be called after the
+    values of rows have changed if the full text search mode is enabled.
+
+    :param model: The generated model of the table.
+    :param queryset: The queryset containing the rows that must be updated.
+        Defaults to all the rows in the table, including the trashed ones.
+    """
+
+    if queryset is None:
+        queryset = model.objects_and_trash.all()
+
+    sql, params = (
+        queryset.order_by()
+        .annotate(search_text=get_search_text_expression(model))
+        .values("id", "search_text")
+        .query.sql_with_params()
+    )
+    table_name = connection.ops.quote_name(model._meta.db_table)
+    column_name = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table_name} "
+            f"SET {column_name} = TO_TSVECTOR('{SEARCH_CONFIG}', search.search_text) "
+            f"FROM ({sql}) AS search WHERE {table_name}.id = search.id",
+            params,
+        )
+
+
+def update_search_data_in_chunks(model, chunk_size: Optional[int] = None):
+    """
+    Updates the search data of all the rows in the table, including the trashed ones,
+    in chunks of consecutive ids where every chunk is updated in its own transaction,
+    so that only the rows of one chunk are locked at the same time.
+
+    :param model: The generated model of the table.
+    :param chunk_size: The maximum amount of rows updated per query. Defaults to the
+        `SEARCH_DATA_UPDATE_CHUNK_SIZE` setting.
+    """
+
+    if chunk_size is None:
+        chunk_size = settings.SEARCH_DATA_UPDATE_CHUNK_SIZE
+
+    bounds = model.objects_and_trash.aggregate(min_id=Min("id"), max_id=Max("id"))
+    if bounds["min_id"] is None:
+        return
+
+    for start in range(bounds["min_id"], bounds["max_id"] + 1, chunk_size):
+        with transaction.atomic():
+            update_search_data(
+                model,
+                model.objects_and_trash.filter(
+                    id__gte=start, id__lt=start + chunk_size
+                ),
+            )
+
+
+def update_search_data_after_field_change(table):
+    """
+    Updates the search data of all the rows in the table after a field has been
+    created, updated, deleted or restored because the searchable text of every row
+    changes. Rebuilding the `tsvector` of every row in a single statement locks all
+    the rows of the table, so the search data of tables having more rows than the
+    `SEARCH_DATA_BACKGROUND_THRESHOLD` setting is rebuilt in chunks by a background
+    task once the field change has been committed. Until then, the rows are searched
+    using their old search data.
+
+    :param table: The table of which a field has changed.
+    """
+
+    if table.search_mode != SEARCH_MODE_FULL_TEXT:
+        return
+
+    model = table.get_model()
+    threshold = settings.SEARCH_DATA_BACKGROUND_THRESHOLD
+    if threshold < 0 or get_estimated_count(model.objects_and_trash.all()) <= threshold:
+        update_search_data(model)
+    else:
+        from baserow.contrib.database.table.tasks import update_search_data_task
+
+        table_id = table.id
+        transaction.on_commit(lambda: update_search_data_task.delay(table_id))
+
+
+def add_search_data_column(model):
+    """
+    Adds the nullable `tsvector` column containing the search data to the table.
+    """
+
+    table_name = connection.ops.quote_name(model._meta.db_table)
+    column_name = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {column_name} tsvector"
+        )
+
+
+def create_search_data_index(model):
+    """
+    Creates the GIN index on the search data column. It's created after the search
+    data of the existing rows has been filled because that is a lot faster than
+    updating the index for every row. The column is analyzed afterwards because the
+    query planner otherwise has no statistics about it and falls back to a
+    sequential scan.
+    """
+
+    table_name = connection.ops.quote_name(model._meta.db_table)
+    column_name = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+    index_name = connection.ops.quote_name(get_search_data_index_name(model))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} "
+            f"USING GIN ({column_name})"
+        )
+        cursor.execute(f"ANALYZE {table_name} ({column_name})")
+
+
+def drop_search_data_column(model):
+    """
+    Drops the search data column, and with that the index, from the table.
+    """
+
+    table_name = connection.ops.quote_name(model._meta.db_table)
+    column_name = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS {column_name}")
+
+
+def get_search_query(search: str) -> Optional[str]:
+    """
+    Converts the search query of a user to a `tsquery` that matches rows containing
+    words starting with every provided term. The terms are quoted so that characters
+    having a special meaning in a `tsquery` are searched literally.
+
+    :param search: The search query provided by the user.
+    :return: The `tsquery` or None if the search doesn't contain any terms.
+    """
+
+    terms = [
+        "'" + term.replace("\\", "\\\\").replace("'", "''") + "':*"
+        for term in search.split()
+    ]
+
+    if len(terms) == 0:
+        return None
+
+    return " & ".join(terms)
+
+
+def get_full_text_search_expression(model, search_query: str):
+    """
+    Returns a boolean expression that can be used to filter the rows of the model
+    on the search data column, which uses the GIN index.
+
+    :param model: The generated model of the table.
+    :param search_query: The `tsquery` returned by `get_search_query`.
+    """
+
+    table_name = connection.ops.quote_name(model._meta.db_table)
+    column_name = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+    return RawSQL(
+        f"{table_name}.{column_name} @@ TO_TSQUERY('{SEARCH_CONFIG}', %s)",
+        [search_query],
+        output_field=BooleanField(),
+    )
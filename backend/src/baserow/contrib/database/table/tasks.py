@@ -0,0 +1,87 @@
+from baserow.config.celery import app
+
+SEARCH_DATA_UPDATE_SOFT_TIME_LIMIT = 60 * 60
+SEARCH_DATA_UPDATE_TIME_LIMIT = SEARCH_DATA_UPDATE_SOFT_TIME_LIMIT + 60
+PRIMARY_VALUES_UPDATE_SOFT_TIME_LIMIT = 60 * 60
+PRIMARY_VALUES_UPDATE_TIME_LIMIT = PRIMARY_VALUES_UPDATE_SOFT_TIME_LIMIT + 60
+FIELD_INDEXES_UPDATE_SOFT_TIME_LIMIT = 60 * 60
+FIELD_INDEXES_UPDATE_TIME_LIMIT = FIELD_INDEXES_UPDATE_SOFT_TIME_LIMIT + 60
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=SEARCH_DATA_UPDATE_SOFT_TIME_LIMIT,
+    time_limit=SEARCH_DATA_UPDATE_TIME_LIMIT,
+)
+def update_search_data_task(self, table_id):
+    """
+    Updates the search data of all the rows of a large table in chunks after a field
+    of the table has changed. Configured in base.py to run on a separate queue to
+    prevent starving regular websocket jobs.
+    """
+
+    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.search import (
+        SEARCH_MODE_FULL_TEXT,
+        update_search_data_in_chunks,
+    )
+
+    try:
+        table = Table.objects.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    if table.search_mode == SEARCH_MODE_FULL_TEXT:
+        update_search_data_in_chunks(table.get_model())
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=PRIMARY_VALUES_UPDATE_SOFT_TIME_LIMIT,
+    time_limit=PRIMARY_VALUES_UPDATE_TIME_LIMIT,
+)
+def update_primary_values_task(self, table_id):
+    """
+    Updates the cached primary values of all the rows of a large table in chunks
+    after a field of the table has changed. Configured in base.py to run on a
+    separate queue to prevent starving regular websocket jobs.
+    """
+
+    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.primary_values import (
+        update_primary_values_in_chunks,
+    )
+
+    try:
+        table = Table.objects.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    if table.cache_primary_values:
+        update_primary_values_in_chunks(table.get_model())
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=FIELD_INDEXES_UPDATE_SOFT_TIME_LIMIT,
+    time_limit=FIELD_INDEXES_UPDATE_TIME_LIMIT,
+)
+def update_field_indexes_task(self, table_id):
+    """
+    Creates and drops the indexes on the columns of a table after the filters or
+    sorts of its views have changed. Configured in base.py to run on a separate queue
+    because creating an index on a large table can take a while.
+    """
+
+    from baserow.contrib.database.table.indexes import update_field_indexes
+    from baserow.contrib.database.table.models import Table
+
+    try:
+        table = Table.objects.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    update_field_indexes(table)
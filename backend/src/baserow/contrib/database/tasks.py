@@ -0,0 +1,31 @@
+from .fields.tasks import (
+    clean_up_stale_field_conversion_jobs,
+    run_field_conversion_job,
+)
+from .formula.tasks import recalculate_field_values
+from .rows.tasks import rebalance_row_orders
+from .table.tasks import (
+    update_field_indexes_task,
+    update_primary_values_task,
+    update_search_data_task,
+)
+from .tokens.tasks import flush_token_usage
+from .views.tasks import (
+    process_all_form_view_submissions,
+    process_form_view_submissions,
+)
+from .ws.rows.tasks import flush_rows_updated_buffer
+
+__all__ = [
+    "run_field_conversion_job",
+    "clean_up_stale_field_conversion_jobs",
+    "recalculate_field_values",
+    "rebalance_row_orders",
+    "update_field_indexes_task",
+    "update_primary_values_task",
+    "update_search_data_task",
+    "flush_token_usage",
+    "process_all_form_view_submissions",
+    "process_form_view_submissions",
+    "flush_rows_updated_buffer",
+]
@@ -15,6 +15,7 @@ from .exceptions import (
     NoPermissionToTable,
 )
 from .models import Token, TokenPermission
+from .usage import token_usage_buffer
 
 
 class TokenHandler:
@@ -423,7 +424,8 @@ class TokenHandler:
     def update_token_usage(self, token):
         """
         Increases the amount of handled calls and updates the last call timestamp of
-        the token.
+        the token. The usage is buffered in the cache and written to the database by
+        the `flush_token_usage` periodic task, unless the flush interval is zero.
 
         :param token: The token instance that needs to be updated.
         :param token: Token
@@ -433,6 +435,16 @@ class TokenHandler:
 
         token.handled_calls += 1
         token.last_call = timezone.now()
-        token.save()
+        token_usage_buffer.add(token.id, token.last_call)
+
+        if token_usage_buffer.should_flush():
+            self.flush_token_usage()
 
         return token
+
+    def flush_token_usage(self):
+        """
+        Writes the buffered usage of all the tokens to the database.
+        """
+
+        token_usage_buffer.flush()
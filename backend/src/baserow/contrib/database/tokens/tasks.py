@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+# noinspection PyUnusedLocal
+@app.task(bind=True)
+def flush_token_usage(self):
+    """
+    Writes the API token usage that has been buffered in the cache by all the
+    backend processes to the database.
+    """
+
+    from baserow.contrib.database.tokens.handler import TokenHandler
+
+    TokenHandler().flush_token_usage()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_token_usage_tasks(sender, **kwargs):
+    if settings.API_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS > 0:
+        sender.add_periodic_task(
+            timedelta(seconds=settings.API_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS),
+            flush_token_usage.s(),
+        )
@@ -0,0 +1,158 @@
+from contextlib import contextmanager
+from datetime import datetime
+from time import monotonic, sleep
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+
+from .models import Token
+
+# The maximum number of seconds that the buffer is locked while it's flushed.
+TOKEN_USAGE_BUFFER_LOCK_TIMEOUT = 30
+
+
+def get_token_usage_cache_key(name) -> str:
+    return f"api_token_usage_{name}"
+
+
+class TokenUsageBuffer:
+    """
+    A buffer of the API token usage that is shared by all the backend processes via
+    the cache. Updating the `handled_calls` and `last_call` of a token for every
+    request results in a write to the same row for every API call and concurrent
+    calls using the same token have to wait for each other's row lock. Instead, the
+    handled calls are counted in the cache and written to the database with a single
+    atomic update per token by a periodic task every `flush_interval` seconds.
+    Because nothing is kept in the memory of the process handling the request, the
+    usage isn't lost if that process stops or stays idle.
+
+    A token is registered at the next position of the buffer when its counter is
+    increased from zero, so that the flush only has to look at the tokens that have
+    actually been used.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+
+    def add(self, token_id: int, last_call: datetime):
+        """
+        Registers a handled call for the provided token.
+
+        :param token_id: The id of the token that was used.
+        :param last_call: The moment the token was used.
+        """
+
+        cache.set(
+            get_token_usage_cache_key(f"{token_id}_last_call"), last_call, timeout=None
+        )
+        if self._increase(get_token_usage_cache_key(f"{token_id}_calls")) == 1:
+            self._register(token_id)
+
+    def should_flush(self) -> bool:
+        """
+        Indicates whether the usage must be written to the database right away
+        instead of by the periodic task, which is the case if the flush interval is
+        zero.
+        """
+
+        return self.flush_interval <= 0
+
+    def flush(self):
+        """
+        Writes the buffered usage of all tokens to the database. The handled calls are
+        incremented using an F expression and only the flushed amount is subtracted
+        from the counter in the cache, so calls that are handled while flushing are
+        written by the next flush.
+        """
+
+        last_key = get_token_usage_cache_key("last")
+        flushed_key = get_token_usage_cache_key("flushed")
+
+        with self._lock():
+            positions = cache.get_many([last_key, flushed_key])
+            last = positions.get(last_key, 0)
+            flushed = positions.get(flushed_key, 0)
+
+            # The counter starts over if it has been evicted from the cache.
+            if flushed > last:
+                flushed = 0
+
+            if flushed == last:
+                return
+
+            keys = [
+                get_token_usage_cache_key(position)
+                for position in range(flushed + 1, last + 1)
+            ]
+            registered = cache.get_many(keys)
+            if len(registered) < len(keys):
+                # Another process could have increased the position, but not have
+                # stored the token id yet.
+                sleep(0.05)
+                registered.update(
+                    cache.get_many([key for key in keys if key not in registered])
+                )
+
+            cache.set(flushed_key, last, timeout=None)
+            cache.delete_many(keys)
+
+            for token_id in dict.fromkeys(registered.values()):
+                self._flush_token(token_id)
+
+    def _flush_token(self, token_id: int):
+        calls_key = get_token_usage_cache_key(f"{token_id}_calls")
+        last_call_key = get_token_usage_cache_key(f"{token_id}_last_call")
+        usage = cache.get_many([calls_key, last_call_key])
+        handled_calls = usage.get(calls_key, 0)
+        last_call = usage.get(last_call_key, None)
+
+        if handled_calls > 0:
+            update = {"handled_calls": F("handled_calls") + handled_calls}
+            if last_call is not None:
+                update["last_call"] = Greatest(F("last_call"), Value(last_call))
+            Token.objects.filter(id=token_id).update(**update)
+
+        try:
+            remaining = cache.decr(calls_key, handled_calls)
+        except ValueError:
+            return
+
+        # Calls that have been handled while flushing didn't register the token
+        # because its counter wasn't zero, so it's registered again.
+        if remaining > 0:
+            self._register(token_id)
+
+    def _register(self, token_id: int):
+        position = self._increase(get_token_usage_cache_key("last"))
+        cache.set(get_token_usage_cache_key(position), token_id, timeout=None)
+
+    # noinspection PyMethodMayBeStatic
+    def _increase(self, key: str) -> int:
+        # The key can be evicted right between initializing and increasing it, in
+        # which case we simply try again.
+        while True:
+            try:
+                return cache.incr(key)
+            except ValueError:
+                cache.add(key, 0, timeout=None)
+
+    # noinspection PyMethodMayBeStatic
+    @contextmanager
+    def _lock(self):
+        key = get_token_usage_cache_key("lock")
+        deadline = monotonic() + TOKEN_USAGE_BUFFER_LOCK_TIMEOUT
+
+        while not cache.add(key, True, timeout=TOKEN_USAGE_BUFFER_LOCK_TIMEOUT):
+            if monotonic() > deadline:
+                break
+            sleep(0.01)
+
+        try:
+            yield
+        finally:
+            cache.delete(key)
+
+
+token_usage_buffer = TokenUsageBuffer(settings.API_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS)
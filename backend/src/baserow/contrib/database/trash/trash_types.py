@@ -1,4 +1,4 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, Dict, List
 
 from django.db import connection
 
@@ -11,7 +11,14 @@ from baserow.contrib.database.formula.types.typed_field_updater import (
     type_table_and_update_fields_given_deleted_field,
 )
 from baserow.contrib.database.rows.signals import row_created
+from baserow.contrib.database.table.indexes import schedule_field_indexes_update
 from baserow.contrib.database.table.models import Table, GeneratedTableModel
+from baserow.contrib.database.table.primary_values import (
+    delete_primary_values,
+    update_primary_values,
+    update_primary_values_after_field_change,
+)
+from baserow.contrib.database.table.search import update_search_data_after_field_change
 from baserow.contrib.database.table.signals import table_created
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.models import TrashEntry
@@ -22,6 +29,7 @@ class TableTrashableItemType(TrashableItemType):
 
     type = "table"
     model_class = Table
+    permanent_deletion_order = 30
 
     def get_parent(self, trashed_item: Any, parent_id: int) -> Optional[Any]:
         return trashed_item.database
@@ -75,6 +83,7 @@ class FieldTrashableItemType(TrashableItemType):
 
     type = "field"
     model_class = Field
+    permanent_deletion_order = 40
 
     def get_parent(self, trashed_item: Any, parent_id: int) -> Optional[Any]:
         return trashed_item.table
@@ -108,6 +117,11 @@ class FieldTrashableItemType(TrashableItemType):
             user=None,
         )
         typed_updated_table.update_values_for_all_updated_fields()
+        update_search_data_after_field_change(trashed_item.table)
+        update_primary_values_after_field_change(
+            trashed_item.table, [trashed_item, *typed_updated_table.updated_fields]
+        )
+        schedule_field_indexes_update(trashed_item.table_id)
 
     def permanently_delete_item(
         self,
@@ -160,6 +174,8 @@ class RowTrashableItemType(TrashableItemType):
 
     type = "row"
     model_class = GeneratedTableModel
+    permanent_deletion_order = 50
+    permanent_deletion_batch_size = 1000
 
     @property
     def requires_parent_id(self) -> bool:
@@ -186,6 +202,10 @@ class RowTrashableItemType(TrashableItemType):
         table = self.get_parent(trashed_item, trash_entry.parent_trash_item_id)
 
         model = table.get_model()
+        if model._cache_primary_values:
+            update_primary_values(
+                model, model.objects_and_trash.filter(id=trashed_item.id)
+            )
         row_created.send(
             self,
             row=trashed_item,
@@ -196,8 +216,66 @@ class RowTrashableItemType(TrashableItemType):
         )
 
     def permanently_delete_item(self, row, trash_item_lookup_cache=None):
+        if row._cache_primary_values:
+            delete_primary_values(row._table_id, [row.id])
         row.delete()
 
+    def permanently_delete_items(
+        self, trash_entries: List[TrashEntry], trash_item_lookup_cache=None
+    ) -> Dict[int, Any]:
+        """
+        Deletes the trashed rows of the entries, which all belong to the same table,
+        and their relations using a single query per table instead of fetching and
+        deleting every row separately.
+        """
+
+        try:
+            model = self._get_cached_table_model(
+                trash_entries[0].parent_trash_item_id, trash_item_lookup_cache
+            )
+        except TrashItemDoesNotExist:
+            # The table has been deleted and its rows together with it.
+            return {}
+
+        quote_name = connection.ops.quote_name
+        table_name = quote_name(model._meta.db_table)
+        row_ids = [trash_entry.trash_item_id for trash_entry in trash_entries]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT id FROM {table_name} WHERE id = ANY(%s) AND trashed",
+                [row_ids],
+            )
+            row_ids = [row_id for row_id, in cursor.fetchall()]
+            if not row_ids:
+                return {}
+
+            # The relations of the link row and multiple select fields are stored in
+            # through tables without foreign key constraints, so they are not
+            # cascaded by the database.
+            for model_field in model._meta.many_to_many:
+                through = model_field.remote_field.through
+                columns = [model_field.m2m_column_name()]
+                # A link row field can link to rows in the same table.
+                if model_field.related_model == model:
+                    columns.append(model_field.m2m_reverse_name())
+                where = " OR ".join(
+                    f"{quote_name(column)} = ANY(%(row_ids)s)" for column in columns
+                )
+                cursor.execute(
+                    f"DELETE FROM {quote_name(through._meta.db_table)} WHERE {where}",
+                    {"row_ids": row_ids},
+                )
+            cursor.execute(
+                f"DELETE FROM {table_name} WHERE id = ANY(%s)",
+                [row_ids],
+            )
+
+        if model._cache_primary_values:
+            delete_primary_values(model._table_id, row_ids)
+
+        return {row_id: None for row_id in row_ids}
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
@@ -212,21 +290,9 @@ class RowTrashableItemType(TrashableItemType):
         :return: An instance of the model_class with trashed_item_id
         """
 
-        # Cache the expensive table.get_model function call if we are looking up
-        # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = self._get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
@@ -237,10 +303,28 @@ class RowTrashableItemType(TrashableItemType):
         table = self._get_table(table_id)
         return table.get_model()
 
+    def _get_cached_table_model(self, table_id, trash_item_lookup_cache=None):
+        # Cache the expensive table.get_model function call if we are looking up
+        # many trash items at once.
+        if trash_item_lookup_cache is None:
+            return self._get_table_model(table_id)
+
+        model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+        try:
+            return model_cache[table_id]
+        except KeyError:
+            return model_cache.setdefault(table_id, self._get_table_model(table_id))
+
     # noinspection PyMethodMayBeStatic
     def get_extra_description(self, trashed_item: Any, table) -> Optional[str]:
 
-        model = table.get_model()
+        # The trashed row is an instance of a generated model which most likely
+        # already contains the primary field. Reusing it avoids generating a model
+        # for every row when many rows are trashed at once.
+        model = type(trashed_item)
+        if not any(field["field"].primary for field in model._field_objects.values()):
+            model = table.get_model()
+
         for field in model._field_objects.values():
             if field["field"].primary:
                 primary_value = field["type"].get_human_readable_value(
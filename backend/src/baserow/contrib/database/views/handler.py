@@ -1,3 +1,8 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
 from django.db.models import F
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 
@@ -13,7 +18,8 @@ from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.rows.handler import RowHandler
-from baserow.contrib.database.rows.signals import row_created
+from baserow.contrib.database.rows.signals import row_created, rows_created
+from baserow.contrib.database.table.indexes import schedule_field_indexes_update
 from .exceptions import (
     ViewDoesNotExist,
     ViewNotInTable,
@@ -28,7 +34,7 @@ from .exceptions import (
     ViewDoesNotSupportFieldOptions,
 )
 from .validators import EMPTY_VALUES
-from .models import View, ViewFilter, ViewSort, FormView
+from .models import View, ViewFilter, ViewSort, FormView, FormViewSubmission
 from .registries import view_type_registry, view_filter_type_registry
 from .signals import (
     view_created,
@@ -45,6 +51,13 @@ from .signals import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+def get_form_view_submissions_scheduled_cache_key(form_view_id):
+    return f"form_view_submissions_scheduled_{form_view_id}"
+
+
 class ViewHandler:
     def get_view(self, view_id, view_model=None, base_queryset=None):
         """
@@ -149,9 +162,13 @@ class ViewHandler:
             "filter_type",
             "filters_disabled",
         ] + view_type.allowed_fields
+        filters_disabled = view.filters_disabled
         view = set_allowed_attrs(kwargs, allowed_fields, view)
         view.save()
 
+        if filters_disabled != view.filters_disabled:
+            schedule_field_indexes_update(view.table_id)
+
         view_updated.send(self, view=view, user=user)
 
         return view
@@ -203,6 +220,7 @@ class ViewHandler:
 
         view_id = view.id
         view.delete()
+        schedule_field_indexes_update(view.table_id)
 
         view_deleted.send(self, view_id=view_id, view=view, user=user)
 
@@ -427,6 +445,7 @@ class ViewHandler:
         view_filter = ViewFilter.objects.create(
             view=view, field=field, type=view_filter_type.type, value=value
         )
+        schedule_field_indexes_update(view.table_id)
 
         view_filter_created.send(self, view_filter=view_filter, user=user)
 
@@ -478,6 +497,7 @@ class ViewHandler:
         view_filter.value = value
         view_filter.type = type_name
         view_filter.save()
+        schedule_field_indexes_update(view_filter.view.table_id)
 
         view_filter_updated.send(self, view_filter=view_filter, user=user)
 
@@ -498,6 +518,7 @@ class ViewHandler:
 
         view_filter_id = view_filter.id
         view_filter.delete()
+        schedule_field_indexes_update(view_filter.view.table_id)
 
         view_filter_deleted.send(
             self, view_filter_id=view_filter_id, view_filter=view_filter, user=user
@@ -668,6 +689,7 @@ class ViewHandler:
             )
 
         view_sort = ViewSort.objects.create(view=view, field=field, order=order)
+        schedule_field_indexes_update(view.table_id)
 
         view_sort_created.send(self, view_sort=view_sort, user=user)
 
@@ -726,6 +748,7 @@ class ViewHandler:
         view_sort.field = field
         view_sort.order = order
         view_sort.save()
+        schedule_field_indexes_update(view_sort.view.table_id)
 
         view_sort_updated.send(self, view_sort=view_sort, user=user)
 
@@ -746,12 +769,35 @@ class ViewHandler:
 
         view_sort_id = view_sort.id
         view_sort.delete()
+        schedule_field_indexes_update(view_sort.view.table_id)
 
         view_sort_deleted.send(
             self, view_sort_id=view_sort_id, view_sort=view_sort, user=user
         )
 
-    def get_queryset(self, view, search=None, model=None):
+    def get_filter_and_sort_field_ids(self, view):
+        """
+        Returns the ids of the fields that are needed to filter and sort the rows of
+        the provided view. The model that is used to query the rows of the view must
+        at least contain these fields.
+
+        :param view: The view of which the filter and sort field ids are needed.
+        :type view: View
+        :return: The ids of the fields that are filtered or sorted on.
+        :rtype: set
+        """
+
+        view_type = view_type_registry.get_by_model(view.specific_class)
+        field_ids = set()
+
+        if view_type.can_filter and not view.filters_disabled:
+            field_ids.update(view.viewfilter_set.values_list("field_id", flat=True))
+        if view_type.can_sort:
+            field_ids.update(view.viewsort_set.values_list("field_id", flat=True))
+
+        return field_ids
+
+    def get_queryset(self, view, search=None, model=None, only_field_ids=None):
         """
         Returns a queryset for the provided view which is appropriately sorted,
         filtered and searched according to the view type and its settings.
@@ -761,6 +807,10 @@ class ViewHandler:
             not specified then the model will be generated automatically.
         :param view: The view to get the export queryset and fields for.
         :type view: View
+        :param only_field_ids: If provided only the fields with the ids in the list
+            are prefetched and searched. The other fields of the model are then only
+            used to filter and sort the rows.
+        :type only_field_ids: list or None
         :return: The export queryset.
         :rtype: QuerySet
         """
@@ -768,7 +818,7 @@ class ViewHandler:
         if model is None:
             model = view.table.get_model()
 
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(only_field_ids=only_field_ids)
 
         view_type = view_type_registry.get_by_model(view.specific_class)
         if view_type.can_filter:
@@ -776,7 +826,9 @@ class ViewHandler:
         if view_type.can_sort:
             queryset = self.apply_sorting(view, queryset)
         if search is not None:
-            queryset = queryset.search_all_fields(search)
+            queryset = queryset.search_all_fields(
+                search, only_search_by_field_ids=only_field_ids
+            )
         return queryset
 
     def rotate_form_view_slug(self, user, form):
@@ -818,7 +870,9 @@ class ViewHandler:
         """
 
         try:
-            form = FormView.objects.get(slug=slug)
+            form = FormView.objects.select_related("table__database__group").get(
+                slug=slug
+            )
         except (FormView.DoesNotExist, ValidationError):
             raise ViewDoesNotExist("The form does not exist.")
 
@@ -844,8 +898,9 @@ class ViewHandler:
         :param enabled_field_options: If the enabled field options have already been
             fetched, they can be provided here.
         :type enabled_field_options: QuerySet | list | None
-        :return: The newly created row.
-        :rtype: Model
+        :return: The newly created row or None if the form has `async_submissions`
+            enabled, in which case the submission is queued.
+        :rtype: Model | None
         """
 
         table = form.table
@@ -874,6 +929,11 @@ class ViewHandler:
             raise ValidationError(field_errors)
 
         allowed_values = extract_allowed(values, allowed_field_names)
+
+        if form.async_submissions:
+            self.queue_form_view_submission(form, allowed_values)
+            return None
+
         instance = RowHandler().force_create_row(table, allowed_values, model)
 
         row_created.send(
@@ -881,3 +941,127 @@ class ViewHandler:
         )
 
         return instance
+
+    def queue_form_view_submission(self, form, values):
+        """
+        Queues an already validated submission of the form. The queued submissions are
+        created as rows in batches by the `process_form_view_submissions` task, so
+        that bursts of submissions don't all have to calculate the order of the new
+        row and broadcast a real time event separately.
+
+        :param form: The form view that is submitted.
+        :type form: FormView
+        :param values: The validated values of the submission keyed by field name.
+        :type values: dict
+        :return: The queued submission.
+        :rtype: FormViewSubmission
+        """
+
+        submission = FormViewSubmission.objects.create(form_view=form, values=values)
+        transaction.on_commit(
+            lambda: self.schedule_form_view_submissions_processing(form.id)
+        )
+        return submission
+
+    def schedule_form_view_submissions_processing(self, form_view_id):
+        """
+        Schedules the task that processes the queued submissions of the form after
+        `FORM_VIEW_SUBMISSIONS_BATCH_DELAY_SECONDS`, unless it has already been
+        scheduled. All the submissions that are queued in the meantime are then
+        processed by the same task.
+
+        :param form_view_id: The id of the form view that has queued submissions.
+        :type form_view_id: int
+        """
+
+        from .tasks import process_form_view_submissions
+
+        delay = settings.FORM_VIEW_SUBMISSIONS_BATCH_DELAY_SECONDS
+        # The key expires in case the task never runs, so that the next submission
+        # schedules it again.
+        if cache.add(
+            get_form_view_submissions_scheduled_cache_key(form_view_id),
+            True,
+            timeout=delay + 60,
+        ):
+            process_form_view_submissions.apply_async((form_view_id,), countdown=delay)
+
+    def process_form_view_submissions(self, form, batch_size=None):
+        """
+        Creates the rows of the queued submissions of the form in batches. Every batch
+        is inserted with a single query, calculates the order of the new rows once and
+        sends a single `rows_created` signal. The submissions are locked while being
+        processed, so multiple workers can safely process the same form at the same
+        time.
+
+        :param form: The form view of which the queued submissions must be processed.
+        :type form: FormView
+        :param batch_size: The maximum number of submissions that are processed in a
+            single transaction. Defaults to `FORM_VIEW_SUBMISSIONS_BATCH_SIZE`.
+        :type batch_size: int | None
+        :return: The number of rows that have been created.
+        :rtype: int
+        """
+
+        if batch_size is None:
+            batch_size = settings.FORM_VIEW_SUBMISSIONS_BATCH_SIZE
+
+        rows_count = 0
+        while True:
+            with transaction.atomic():
+                submissions = list(
+                    FormViewSubmission.objects.filter(form_view=form)
+                    .select_for_update(skip_locked=True)
+                    .order_by("id")[:batch_size]
+                )
+
+                if len(submissions) == 0:
+                    break
+
+                rows_count += len(
+                    self._create_form_view_submission_rows(form, submissions)
+                )
+                FormViewSubmission.objects.filter(
+                    id__in=[submission.id for submission in submissions]
+                ).delete()
+
+        return rows_count
+
+    def _create_form_view_submission_rows(self, form, submissions):
+        """
+        Creates a row for every submission. If the batch can't be created, for example
+        because a field has changed since the form was submitted, the rows are created
+        one by one and the submissions that are no longer valid are dropped.
+        """
+
+        table = form.table
+        model = table.get_model()
+        # Fields could have been deleted since the form was submitted.
+        field_names = [field["name"] for field in model._field_objects.values()]
+        rows_values = [
+            extract_allowed(submission.values, field_names)
+            for submission in submissions
+        ]
+        row_handler = RowHandler()
+
+        try:
+            with transaction.atomic():
+                rows = row_handler.force_create_rows(table, rows_values, model)
+        except (ValidationError, DatabaseError):
+            rows = []
+            for submission, values in zip(submissions, rows_values):
+                try:
+                    with transaction.atomic():
+                        rows.append(row_handler.force_create_row(table, values, model))
+                except (ValidationError, DatabaseError) as e:
+                    logger.warning(
+                        f"Dropped the queued submission {submission.id} of form "
+                        f"{form.id} because it's no longer valid: {e}"
+                    )
+
+        if len(rows) > 0:
+            rows_created.send(
+                self, rows=rows, before=None, user=None, table=table, model=model
+            )
+
+        return rows
@@ -1,6 +1,7 @@
 import secrets
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 from baserow.core.utils import get_model_reference_field_name
@@ -275,6 +276,12 @@ class FormView(View):
         f"then the visitors will be redirected to the this URL after submitting the "
         f"form.",
     )
+    async_submissions = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the submissions are queued and created as rows in "
+        "batches by a background task instead of immediately. This is useful for forms "
+        "that receive many submissions at the same time.",
+    )
 
     def rotate_slug(self):
         self.slug = secrets.token_urlsafe()
@@ -321,3 +328,22 @@ class FormViewFieldOptions(ParentFieldTrashableModelMixin, models.Model):
             "order",
             "field_id",
         )
+
+
+class FormViewSubmission(models.Model):
+    """
+    A validated submission of a form that has `async_submissions` enabled. It is
+    converted to a row by the `process_form_view_submissions` task.
+    """
+
+    form_view = models.ForeignKey(
+        FormView, on_delete=models.CASCADE, related_name="queued_submissions"
+    )
+    values = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        help_text="The validated values of the submission keyed by field name.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("id",)
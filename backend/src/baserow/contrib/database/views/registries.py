@@ -1,4 +1,4 @@
-from typing import Callable, Union, List
+from typing import Callable, Union, List, Optional
 
 from rest_framework.serializers import Serializer
 
@@ -336,6 +336,14 @@ class ViewFilterType(Instance):
     checked and returns True if compatible or False if not.
     """
 
+    index_type: Optional[str] = None
+    """
+    Defines which kind of index on the column of the field, one of the `INDEX_TYPE_*`
+    constants in `baserow.contrib.database.table.indexes`, speeds up the filter. The
+    most used indexes of a table are created automatically. None if the filter can't
+    use an index.
+    """
+
     def get_filter(self, field_name, value, model_field, field) -> OptionallyAnnotatedQ:
         """
         Should return either a Q object or and AnnotatedQ containing the requested
@@ -355,6 +363,20 @@ class ViewFilterType(Instance):
 
         raise NotImplementedError("Each must have his own get_filter method.")
 
+    def get_index_type(self, field) -> Optional[str]:
+        """
+        Returns the kind of index on the column of the provided field that speeds up
+        the filter. This can be overwritten if it depends on the type of the field.
+
+        :param field: The specific instance of the field that is filtered on.
+        :type field: Field
+        :return: One of the `INDEX_TYPE_*` constants or None if the filter can't use
+            an index.
+        :rtype: str
+        """
+
+        return self.index_type
+
     def get_preload_values(self, view_filter) -> dict:
         """
         Optionally a view filter type can preload certain values for displaying
@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+from baserow.config.celery import app
+
+FORM_VIEW_SUBMISSIONS_CHECK_INTERVAL = timedelta(minutes=1)
+
+
+# noinspection PyUnusedLocal
+@app.task(bind=True)
+def process_form_view_submissions(self, form_view_id):
+    """
+    Creates the rows of the queued submissions of a form that has
+    `async_submissions` enabled.
+    """
+
+    from django.core.cache import cache
+
+    from baserow.contrib.database.views.handler import (
+        ViewHandler,
+        get_form_view_submissions_scheduled_cache_key,
+    )
+    from baserow.contrib.database.views.models import FormView
+
+    # Submissions that are queued from now on must schedule a new task because they
+    # might not be processed by this one anymore.
+    cache.delete(get_form_view_submissions_scheduled_cache_key(form_view_id))
+
+    try:
+        form = FormView.objects.select_related("table").get(id=form_view_id)
+    except FormView.DoesNotExist:
+        return
+
+    ViewHandler().process_form_view_submissions(form)
+
+
+# noinspection PyUnusedLocal
+@app.task(bind=True)
+def process_all_form_view_submissions(self):
+    """
+    Processes the submissions that are still queued, for example because the worker
+    stopped while processing them.
+    """
+
+    from baserow.contrib.database.views.models import FormViewSubmission
+
+    form_view_ids = (
+        FormViewSubmission.objects.values_list("form_view_id", flat=True)
+        .order_by()
+        .distinct()
+    )
+    for form_view_id in form_view_ids:
+        process_form_view_submissions(form_view_id)
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_form_view_submissions_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        FORM_VIEW_SUBMISSIONS_CHECK_INTERVAL,
+        process_all_form_view_submissions.s(),
+    )
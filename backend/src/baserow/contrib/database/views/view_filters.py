@@ -34,6 +34,11 @@ from baserow.contrib.database.fields.field_types import (
     FormulaFieldType,
 )
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.table.indexes import (
+    INDEX_TYPE_BTREE,
+    INDEX_TYPE_GIN,
+    INDEX_TYPE_TRIGRAM,
+)
 from baserow.core.expressions import Timezone
 from .registries import ViewFilterType
 from baserow.contrib.database.formula.types.formula_types import (
@@ -49,6 +54,10 @@ class NotViewFilterTypeMixin:
     def get_filter(self, *args, **kwargs):
         return ~super().get_filter(*args, **kwargs)
 
+    def get_index_type(self, field):
+        # A negated filter matches most of the rows, so an index doesn't help.
+        return None
+
 
 class EqualViewFilterType(ViewFilterType):
     """
@@ -72,6 +81,7 @@ class EqualViewFilterType(ViewFilterType):
             BaserowFormulaNumberType.type,
         ),
     ]
+    index_type = INDEX_TYPE_BTREE
 
     def get_filter(self, field_name, value, model_field, field):
         value = value.strip()
@@ -122,6 +132,7 @@ class HasFileTypeViewFilterType(ViewFilterType):
 
     type = "has_file_type"
     compatible_field_types = [FileFieldType.type]
+    index_type = INDEX_TYPE_GIN
 
     def get_filter(self, field_name, value, model_field, field):
         value = value.strip()
@@ -161,10 +172,38 @@ class ContainsViewFilterType(ViewFilterType):
         ),
     ]
 
+    trigram_compatible_field_types = [
+        TextFieldType.type,
+        LongTextFieldType.type,
+        URLFieldType.type,
+        EmailFieldType.type,
+        PhoneNumberFieldType.type,
+        NumberFieldType.type,
+        FormulaFieldType.compatible_with_formula_types(
+            BaserowFormulaTextType.type,
+            BaserowFormulaCharType.type,
+            BaserowFormulaNumberType.type,
+        ),
+    ]
+    """
+    The field types of which the contains query compares the uppercased text value
+    of the column, which can use a trigram index.
+    """
+
     def get_filter(self, field_name, value, model_field, field) -> OptionallyAnnotatedQ:
         field_type = field_type_registry.get_by_model(field)
         return field_type.contains_query(field_name, value, model_field, field)
 
+    def get_index_type(self, field):
+        field_type = field_type_registry.get_by_model(field.specific_class)
+        if any(
+            callable(t) and t(field) or t == field_type.type
+            for t in self.trigram_compatible_field_types
+        ):
+            return INDEX_TYPE_TRIGRAM
+
+        return None
+
 
 class ContainsNotViewFilterType(NotViewFilterTypeMixin, ContainsViewFilterType):
     type = "contains_not"
@@ -184,6 +223,7 @@ class HigherThanViewFilterType(ViewFilterType):
             BaserowFormulaNumberType.type,
         ),
     ]
+    index_type = INDEX_TYPE_BTREE
 
     def get_filter(self, field_name, value, model_field, field):
         value = value.strip()
@@ -220,6 +260,7 @@ class LowerThanViewFilterType(ViewFilterType):
             BaserowFormulaNumberType.type,
         ),
     ]
+    index_type = INDEX_TYPE_BTREE
 
     def get_filter(self, field_name, value, model_field, field):
         value = value.strip()
@@ -259,6 +300,11 @@ class DateEqualViewFilterType(ViewFilterType):
         ),
     ]
 
+    def get_index_type(self, field):
+        # The values of fields having a timezone are converted to that timezone before
+        # they're compared, which can't use an index on the column.
+        return None if hasattr(field, "timezone") else INDEX_TYPE_BTREE
+
     def get_filter(self, field_name, value, model_field, field):
         """
         Parses the provided value string and converts it to an aware datetime object.
@@ -354,6 +400,14 @@ class BaseDateFieldLookupFilterType(ViewFilterType):
         except ValueError as e:
             raise e
 
+    def get_index_type(self, field):
+        # Only dates without a time are compared to the value of the column, the
+        # others are converted to a date first.
+        if hasattr(field, "timezone") or getattr(field, "date_include_time", True):
+            return None
+
+        return INDEX_TYPE_BTREE
+
     def get_filter(self, field_name, value, model_field, field):
         # in order to only compare the date part of a datetime field
         # we need to verify that we are in fact dealing with a datetime field
@@ -432,6 +486,11 @@ class DateEqualsTodayViewFilterType(ViewFilterType):
     ]
     query_for = ["year", "month", "day"]
 
+    def get_index_type(self, field):
+        # The values of fields having a timezone are converted to that timezone before
+        # they're compared, which can't use an index on the column.
+        return None if hasattr(field, "timezone") else INDEX_TYPE_BTREE
+
     def get_filter(self, field_name, value, model_field, field):
         timezone_string = value if value in all_timezones else "UTC"
         timezone_object = timezone(timezone_string)
@@ -491,6 +550,7 @@ class SingleSelectEqualViewFilterType(ViewFilterType):
 
     type = "single_select_equal"
     compatible_field_types = [SingleSelectFieldType.type]
+    index_type = INDEX_TYPE_BTREE
 
     def get_filter(self, field_name, value, model_field, field):
         value = value.strip()
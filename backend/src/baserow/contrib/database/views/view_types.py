@@ -87,6 +87,26 @@ class GridViewType(ViewType):
 
         return grid_view
 
+    def get_visible_field_ids(self, grid_view):
+        """
+        Returns the ids of the fields that are not hidden in the provided grid view.
+        Fields that don't have field options yet are visible by default.
+
+        :param grid_view: The grid view of which the visible field ids are needed.
+        :type grid_view: GridView
+        :return: The ids of the visible fields.
+        :rtype: list
+        """
+
+        hidden_field_ids = GridViewFieldOptions.objects.filter(
+            grid_view=grid_view, hidden=True
+        ).values("field_id")
+        return list(
+            grid_view.table.field_set.exclude(id__in=hidden_field_ids).values_list(
+                "id", flat=True
+            )
+        )
+
     def get_fields_and_model(self, view):
         """
         Returns the model and the field options in the correct order for exporting
@@ -128,6 +148,7 @@ class FormViewType(ViewType):
         "submit_action",
         "submit_action_message",
         "submit_action_redirect_url",
+        "async_submissions",
     ]
     serializer_field_names = [
         "slug",
@@ -139,6 +160,7 @@ class FormViewType(ViewType):
         "submit_action",
         "submit_action_message",
         "submit_action_redirect_url",
+        "async_submissions",
     ]
     serializer_field_overrides = {
         "slug": CharField(
@@ -209,6 +231,7 @@ class FormViewType(ViewType):
         serialized["submit_action"] = form.submit_action
         serialized["submit_action_message"] = form.submit_action_message
         serialized["submit_action_redirect_url"] = form.submit_action_redirect_url
+        serialized["async_submissions"] = form.async_submissions
 
         serialized_field_options = []
         for field_option in form.get_field_options():
@@ -0,0 +1,211 @@
+from contextlib import contextmanager
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+# The number of seconds that a buffered update is kept if it's never broadcasted, for
+# example because Celery isn't running.
+ROWS_UPDATED_BUFFER_TIMEOUT = 60 * 5
+# The maximum number of seconds that the buffer of a table is locked while it's
+# broadcasted.
+ROWS_UPDATED_BUFFER_LOCK_TIMEOUT = 30
+
+
+def get_rows_updated_buffer_cache_key(table_id: int, name) -> str:
+    return f"ws_rows_updated_buffer_{table_id}_{name}"
+
+
+class RowsUpdatedBuffer:
+    """
+    A buffer of the real time row updated events that is shared by all the backend
+    processes via the cache. Broadcasting every update separately results in a
+    metadata query per metadata type and a web socket message to every user looking
+    at the table for every updated row, which floods the browsers if for example a
+    script updates many rows one by one. Instead, the updates are buffered per table
+    for `window` seconds and then broadcasted by a single Celery task as one
+    `rows_updated` message per web socket id that made changes. Multiple updates of
+    the same row are merged, keeping the row before the first update and after the
+    last update.
+
+    Every buffered update gets the next position of the table, so the updates are
+    broadcasted in the order they were made, no matter which process made them.
+    Because the creation or deletion of rows could conflict with the buffered
+    updates, `flush_table` must be called before such a message is broadcasted. The
+    buffer of a table is locked while it's flushed, so only one process broadcasts
+    its updates at the same time.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+
+    def add(
+        self,
+        table_id: int,
+        rows_before_update: List[dict],
+        rows: List[dict],
+        ignore_web_socket_id: Optional[str] = None,
+    ):
+        """
+        Adds the updated rows to the buffer of the table. The buffer is broadcasted
+        by a background task once the window has passed since the first update was
+        added.
+
+        :param table_id: The id of the table that the rows belong to.
+        :param rows_before_update: The serialized rows before they were updated.
+        :param rows: The serialized rows after they were updated, in the same order.
+        :param ignore_web_socket_id: The web socket id that made the change and must
+            not receive the message.
+        """
+
+        from .tasks import flush_rows_updated_buffer
+
+        position = self._increase_last_position(table_id)
+        cache.set(
+            get_rows_updated_buffer_cache_key(table_id, position),
+            (ignore_web_socket_id, rows_before_update, rows),
+            timeout=ROWS_UPDATED_BUFFER_TIMEOUT,
+        )
+
+        if cache.add(
+            get_rows_updated_buffer_cache_key(table_id, "scheduled"),
+            True,
+            timeout=self.window + 60,
+        ):
+            flush_rows_updated_buffer.apply_async((table_id,), countdown=self.window)
+
+    def flush_table(self, table_id: int):
+        """
+        Broadcasts the buffered updates of the provided table that haven't been
+        broadcasted yet. This must be called before a message that could conflict
+        with the buffered updates, like the creation or deletion of rows, is
+        broadcasted.
+
+        :param table_id: The id of the table of which the updates must be
+            broadcasted.
+        """
+
+        last_key = get_rows_updated_buffer_cache_key(table_id, "last")
+        flushed_key = get_rows_updated_buffer_cache_key(table_id, "flushed")
+
+        with self._lock(table_id):
+            positions = cache.get_many([last_key, flushed_key])
+            last = positions.get(last_key, 0)
+            flushed = positions.get(flushed_key, 0)
+
+            # The counter starts over if it has been evicted from the cache.
+            if flushed > last:
+                flushed = 0
+
+            if flushed == last:
+                return
+
+            keys = [
+                get_rows_updated_buffer_cache_key(table_id, position)
+                for position in range(flushed + 1, last + 1)
+            ]
+            updates = cache.get_many(keys)
+            if len(updates) < len(keys):
+                # Another process could have increased the position, but not have
+                # stored its update yet.
+                sleep(0.05)
+                updates.update(
+                    cache.get_many([key for key in keys if key not in updates])
+                )
+
+            cache.set(flushed_key, last, timeout=None)
+            cache.delete_many(keys)
+            self._broadcast(table_id, [updates[key] for key in keys if key in updates])
+
+    # noinspection PyMethodMayBeStatic
+    def _increase_last_position(self, table_id: int) -> int:
+        key = get_rows_updated_buffer_cache_key(table_id, "last")
+
+        # The key can be evicted right between initializing and increasing it, in
+        # which case we simply try again.
+        while True:
+            try:
+                return cache.incr(key)
+            except ValueError:
+                cache.add(key, 0, timeout=None)
+
+    # noinspection PyMethodMayBeStatic
+    @contextmanager
+    def _lock(self, table_id: int):
+        key = get_rows_updated_buffer_cache_key(table_id, "lock")
+        deadline = monotonic() + ROWS_UPDATED_BUFFER_LOCK_TIMEOUT
+
+        while not cache.add(key, True, timeout=ROWS_UPDATED_BUFFER_LOCK_TIMEOUT):
+            if monotonic() > deadline:
+                break
+            sleep(0.01)
+
+        try:
+            yield
+        finally:
+            cache.delete(key)
+
+    # noinspection PyMethodMayBeStatic
+    def _merge(
+        self, updates: List[Tuple[Optional[str], List[dict], List[dict]]]
+    ) -> List[Tuple[Optional[str], Dict[int, dict], Dict[int, dict]]]:
+        """
+        Merges the updates into as few messages as possible. An update is merged
+        into the last message of the same web socket id, unless a later message
+        contains one of the updated rows, because the update would then be
+        broadcasted before that message.
+        """
+
+        messages = []
+        for ignore_web_socket_id, rows_before_update, rows in updates:
+            row_ids = {row["id"] for row in rows}
+            message = None
+            for previous_message in reversed(messages):
+                if previous_message[0] == ignore_web_socket_id:
+                    message = previous_message
+                    break
+                if not row_ids.isdisjoint(previous_message[2].keys()):
+                    break
+
+            if message is None:
+                message = (ignore_web_socket_id, {}, {})
+                messages.append(message)
+
+            _, befores, afters = message
+            for row_before_update, row in zip(rows_before_update, rows):
+                befores.setdefault(row["id"], row_before_update)
+                afters[row["id"]] = row
+
+        return messages
+
+    def _broadcast(self, table_id: int, updates: list):
+        from baserow.contrib.database.rows.registries import row_metadata_registry
+        from baserow.contrib.database.table.models import Table
+        from baserow.ws.registries import page_registry
+
+        try:
+            table = Table.objects.get(id=table_id)
+        except Table.DoesNotExist:
+            return
+
+        table_page_type = page_registry.get("table")
+        for ignore_web_socket_id, befores, afters in self._merge(updates):
+            table_page_type.broadcast(
+                {
+                    "type": "rows_updated",
+                    "table_id": table_id,
+                    "rows_before_update": [befores[row_id] for row_id in afters.keys()],
+                    "rows": list(afters.values()),
+                    "metadata": (
+                        row_metadata_registry.generate_and_merge_metadata_for_rows(
+                            table, afters.keys()
+                        )
+                    ),
+                },
+                ignore_web_socket_id,
+                table_id=table_id,
+            )
+
+
+rows_updated_buffer = RowsUpdatedBuffer(settings.WS_ROWS_UPDATED_BUFFER_SECONDS)
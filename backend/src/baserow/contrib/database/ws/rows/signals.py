@@ -10,12 +10,16 @@ from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
 )
 
+from .buffer import rows_updated_buffer
+
 
 @receiver(row_signals.row_created)
 def row_created(sender, row, before, user, table, model, **kwargs):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
-        lambda: table_page_type.broadcast(
+
+    def broadcast():
+        rows_updated_buffer.flush_table(table.id)
+        table_page_type.broadcast(
             {
                 "type": "row_created",
                 "table_id": table.id,
@@ -30,7 +34,8 @@ def row_created(sender, row, before, user, table, model, **kwargs):
             getattr(user, "web_socket_id", None),
             table_id=table.id,
         )
-    )
+
+    transaction.on_commit(broadcast)
 
 
 @receiver(row_signals.before_row_update)
@@ -43,6 +48,21 @@ def before_row_update(sender, row, user, table, model, **kwargs):
 
 @receiver(row_signals.row_updated)
 def row_updated(sender, row, user, table, model, before_return, **kwargs):
+    if rows_updated_buffer.window > 0:
+        transaction.on_commit(
+            lambda: rows_updated_buffer.add(
+                table.id,
+                [dict(before_return)[before_row_update]],
+                [
+                    get_row_serializer_class(model, RowSerializer, is_response=True)(
+                        row
+                    ).data
+                ],
+                getattr(user, "web_socket_id", None),
+            )
+        )
+        return
+
     table_page_type = page_registry.get("table")
     transaction.on_commit(
         lambda: table_page_type.broadcast(
@@ -77,8 +97,10 @@ def before_row_delete(sender, row, user, table, model, **kwargs):
 @receiver(row_signals.row_deleted)
 def row_deleted(sender, row_id, row, user, table, model, before_return, **kwargs):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
-        lambda: table_page_type.broadcast(
+
+    def broadcast():
+        rows_updated_buffer.flush_table(table.id)
+        table_page_type.broadcast(
             {
                 "type": "row_deleted",
                 "table_id": table.id,
@@ -90,4 +112,110 @@ def row_deleted(sender, row_id, row, user, table, model, before_return, **kwargs
             getattr(user, "web_socket_id", None),
             table_id=table.id,
         )
+
+    transaction.on_commit(broadcast)
+
+
+@receiver(row_signals.rows_created)
+def rows_created(sender, rows, before, user, table, model, **kwargs):
+    table_page_type = page_registry.get("table")
+
+    def broadcast():
+        rows_updated_buffer.flush_table(table.id)
+        table_page_type.broadcast(
+            {
+                "type": "rows_created",
+                "table_id": table.id,
+                "rows": get_row_serializer_class(
+                    model, RowSerializer, is_response=True
+                )(rows, many=True).data,
+                "metadata": row_metadata_registry.generate_and_merge_metadata_for_rows(
+                    table, (row.id for row in rows)
+                ),
+                "before_row_id": before.id if before else None,
+            },
+            getattr(user, "web_socket_id", None),
+            table_id=table.id,
+        )
+
+    transaction.on_commit(broadcast)
+
+
+@receiver(row_signals.before_rows_update)
+def before_rows_update(sender, rows, user, table, model, **kwargs):
+    return get_row_serializer_class(model, RowSerializer, is_response=True)(
+        rows, many=True
+    ).data
+
+
+@receiver(row_signals.rows_updated)
+def rows_updated(sender, rows, user, table, model, before_return, **kwargs):
+    if rows_updated_buffer.window > 0:
+        transaction.on_commit(
+            lambda: rows_updated_buffer.add(
+                table.id,
+                dict(before_return)[before_rows_update],
+                get_row_serializer_class(model, RowSerializer, is_response=True)(
+                    rows, many=True
+                ).data,
+                getattr(user, "web_socket_id", None),
+            )
+        )
+        return
+
+    table_page_type = page_registry.get("table")
+    transaction.on_commit(
+        lambda: table_page_type.broadcast(
+            {
+                "type": "rows_updated",
+                "table_id": table.id,
+                "rows_before_update": dict(before_return)[before_rows_update],
+                "rows": get_row_serializer_class(
+                    model, RowSerializer, is_response=True
+                )(rows, many=True).data,
+                "metadata": row_metadata_registry.generate_and_merge_metadata_for_rows(
+                    table, (row.id for row in rows)
+                ),
+            },
+            getattr(user, "web_socket_id", None),
+            table_id=table.id,
+        )
+    )
+
+
+@receiver(row_signals.before_rows_delete)
+def before_rows_delete(sender, rows, user, table, model, **kwargs):
+    return get_row_serializer_class(model, RowSerializer, is_response=True)(
+        rows, many=True
+    ).data
+
+
+@receiver(row_signals.rows_deleted)
+def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
+    table_page_type = page_registry.get("table")
+
+    def broadcast():
+        rows_updated_buffer.flush_table(table.id)
+        table_page_type.broadcast(
+            {
+                "type": "rows_deleted",
+                "table_id": table.id,
+                "row_ids": [row.id for row in rows],
+                "rows": dict(before_return)[before_rows_delete],
+            },
+            getattr(user, "web_socket_id", None),
+            table_id=table.id,
+        )
+
+    transaction.on_commit(broadcast)
+
+
+@receiver(row_signals.row_orders_rebalanced)
+def row_orders_rebalanced(sender, table, **kwargs):
+    table_page_type = page_registry.get("table")
+    transaction.on_commit(
+        lambda: table_page_type.broadcast(
+            {"type": "row_orders_rebalanced", "table_id": table.id},
+            table_id=table.id,
+        )
     )
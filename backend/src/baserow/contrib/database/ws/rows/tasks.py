@@ -0,0 +1,25 @@
+from baserow.config.celery import app
+
+
+@app.task(bind=True)
+def flush_rows_updated_buffer(self, table_id):
+    """
+    Broadcasts the real time row updated events of a table that have been buffered
+    by the `RowsUpdatedBuffer`.
+
+    :param table_id: The id of the table of which the buffered updates must be
+        broadcasted.
+    :type table_id: int
+    """
+
+    from django.core.cache import cache
+
+    from baserow.contrib.database.ws.rows.buffer import (
+        get_rows_updated_buffer_cache_key,
+        rows_updated_buffer,
+    )
+
+    # Updates that are buffered from now on must schedule a new task because they
+    # might not be broadcasted by this one anymore.
+    cache.delete(get_rows_updated_buffer_cache_key(table_id, "scheduled"))
+    rows_updated_buffer.flush_table(table_id)
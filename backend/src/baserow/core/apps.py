@@ -11,3 +11,6 @@ class CoreConfig(AppConfig):
 
         trash_item_type_registry.register(GroupTrashableItemType())
         trash_item_type_registry.register(ApplicationTrashableItemType())
+
+        # Connects the receivers that invalidate the cached group permissions.
+        import baserow.core.cache  # noqa: F401
@@ -0,0 +1,360 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import monotonic, time_ns
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from baserow.core.models import GroupUser
+
+# Values that are cached for the duration of a single request. This is None outside
+# of a request, for example in a Celery task, in which case nothing is cached in it.
+_request_cache: ContextVar[Optional[Dict[Any, Any]]] = ContextVar(
+    "baserow_request_cache", default=None
+)
+
+# Cached in place of the permissions if the user is not a member of the group because
+# the cache backend doesn't distinguish between a cached None and a missing key.
+NOT_IN_GROUP = ""
+
+# Returned by the cache backend if a key doesn't exist, so that None can be cached.
+_MISSING = object()
+
+CACHE_STATS_NAMESPACES_KEY = "baserow:cache_stats:namespaces"
+CACHE_STATS_COUNTERS = ("hits", "misses", "latency_us")
+
+
+class CacheStats:
+    """
+    Keeps track of the number of hits and misses and the total lookup latency per
+    cache namespace. Updating the counters in the shared cache for every lookup would
+    double the number of round trips, so they are accumulated in memory and added to
+    the counters in the shared cache once every `flush_interval` seconds. This makes
+    the stats of all the backend processes available to the `cache_stats`
+    management command.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._lock = Lock()
+        self._last_flush = monotonic()
+
+    def record(self, namespace: str, hit: bool, latency: float):
+        """
+        Registers a lookup in the provided namespace and flushes the counters if the
+        flush interval has passed.
+
+        :param namespace: The namespace of the key that was looked up.
+        :param hit: Indicates whether the key was found in the cache.
+        :param latency: The number of seconds that the lookup took.
+        """
+
+        with self._lock:
+            for counter, value in (
+                ("hits" if hit else "misses", 1),
+                ("latency_us", int(latency * 1_000_000)),
+            ):
+                key = (namespace, counter)
+                self._counters[key] = self._counters.get(key, 0) + value
+
+        if self.should_flush():
+            self.flush()
+
+    def should_flush(self) -> bool:
+        return monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self):
+        """
+        Adds the counters accumulated by this process to the counters in the shared
+        cache. The counters are incremented atomically, so multiple processes can
+        safely flush at the same time.
+        """
+
+        with self._lock:
+            counters = self._counters
+            self._counters = {}
+            self._last_flush = monotonic()
+
+        if not counters:
+            return
+
+        namespaces = {namespace for namespace, _ in counters}
+        known_namespaces = cache.get(CACHE_STATS_NAMESPACES_KEY, set())
+        if not namespaces.issubset(known_namespaces):
+            cache.set(
+                CACHE_STATS_NAMESPACES_KEY, known_namespaces | namespaces, timeout=None
+            )
+
+        for (namespace, counter), value in counters.items():
+            key = get_cache_stats_key(namespace, counter)
+            cache.add(key, 0, timeout=None)
+            try:
+                cache.incr(key, value)
+            except ValueError:
+                # The counter has been reset after it was added.
+                cache.add(key, value, timeout=None)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the counters of all the backend processes that have been flushed to
+        the shared cache.
+
+        :return: A dict containing the counters by namespace.
+        """
+
+        namespaces = sorted(cache.get(CACHE_STATS_NAMESPACES_KEY, set()))
+        keys = {
+            get_cache_stats_key(namespace, counter): (namespace, counter)
+            for namespace in namespaces
+            for counter in CACHE_STATS_COUNTERS
+        }
+        values = cache.get_many(keys.keys())
+
+        stats = {
+            namespace: dict.fromkeys(CACHE_STATS_COUNTERS, 0)
+            for namespace in namespaces
+        }
+        for key, (namespace, counter) in keys.items():
+            stats[namespace][counter] = values.get(key, 0)
+        return stats
+
+    def reset(self):
+        """Resets the counters in the shared cache and in this process."""
+
+        with self._lock:
+            self._counters = {}
+
+        namespaces = cache.get(CACHE_STATS_NAMESPACES_KEY, set())
+        cache.delete_many(
+            [
+                get_cache_stats_key(namespace, counter)
+                for namespace in namespaces
+                for counter in CACHE_STATS_COUNTERS
+            ]
+            + [CACHE_STATS_NAMESPACES_KEY]
+        )
+
+
+def get_cache_stats_key(namespace: str, counter: str) -> str:
+    return f"baserow:cache_stats:{namespace}:{counter}"
+
+
+cache_stats = CacheStats(settings.CACHE_STATS_FLUSH_INTERVAL_SECONDS)
+
+
+def get_scope_version_cache_key(namespace: str, scope_id: int) -> str:
+    return f"baserow:{namespace}:{scope_id}:version"
+
+
+def _new_scope_version() -> int:
+    # The version starts at the current time instead of at 1, so that the versions of
+    # old entries are never reused if the version key has been evicted.
+    return time_ns() // 1000
+
+
+def get_scope_version(namespace: str, scope_id: int) -> int:
+    """
+    Returns the current version of the scope. All the keys of a scope contain its
+    version, so increasing it invalidates all of them at once without having to know
+    which keys exist.
+
+    :param namespace: The namespace of the scope, for example `table`.
+    :param scope_id: The id of the object that the scope belongs to.
+    :return: The current version of the scope.
+    """
+
+    key = get_scope_version_cache_key(namespace, scope_id)
+    version = cache.get(key)
+
+    if version is None:
+        cache.add(key, _new_scope_version(), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def _increase_scope_version(namespace: str, scope_id: int):
+    key = get_scope_version_cache_key(namespace, scope_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _new_scope_version(), timeout=None)
+
+
+def invalidate_scope(namespace: str, scope_id: int):
+    """
+    Invalidates all the cached values of the scope by increasing its version. This
+    happens again when the transaction commits because another process could have
+    cached values based on the data from before the change in the meantime.
+
+    :param namespace: The namespace of the scope, for example `table`.
+    :param scope_id: The id of the object that the scope belongs to.
+    """
+
+    _increase_scope_version(namespace, scope_id)
+    transaction.on_commit(lambda: _increase_scope_version(namespace, scope_id))
+
+
+def invalidate_scopes(namespace: str, scope_ids: Iterable[int]):
+    for scope_id in set(scope_ids):
+        invalidate_scope(namespace, scope_id)
+
+
+def get_cache_key(namespace: str, scope_id: int, *parts: Any) -> str:
+    """
+    Constructs a namespaced cache key that contains the current version of the scope.
+
+    :param namespace: The namespace of the scope, for example `table`.
+    :param scope_id: The id of the object that the scope belongs to.
+    :param parts: The parts that identify the value within the scope.
+    :return: The cache key.
+    """
+
+    version = get_scope_version(namespace, scope_id)
+    return ":".join(
+        ["baserow", namespace, str(scope_id), f"v{version}", *map(str, parts)]
+    )
+
+
+def get_or_set(
+    namespace: str,
+    scope_id: int,
+    parts: Iterable[Any],
+    default: Callable[[], Any],
+    timeout: Optional[int] = DEFAULT_TIMEOUT,
+) -> Any:
+    """
+    Returns the cached value or computes it using the `default` callable and caches
+    it once the transaction commits. The value is cached with the version of the scope
+    from before it was computed, so a value computed from data that changed in the
+    meantime is never used.
+
+    :param namespace: The namespace of the scope, for example `table`.
+    :param scope_id: The id of the object that the scope belongs to.
+    :param parts: The parts that identify the value within the scope.
+    :param default: Called to compute the value if it isn't cached.
+    :param timeout: The number of seconds that the value is cached. Defaults to the
+        timeout of the cache backend.
+    :return: The cached or computed value.
+    """
+
+    key = get_cache_key(namespace, scope_id, *parts)
+
+    start = monotonic()
+    value = cache.get(key, _MISSING)
+    cache_stats.record(namespace, value is not _MISSING, monotonic() - start)
+
+    if value is _MISSING:
+        value = default()
+        transaction.on_commit(lambda: cache.set(key, value, timeout))
+
+    return value
+
+
+@contextmanager
+def request_cache_scope():
+    """
+    Enables the request cache for the duration of the context. Used by the
+    `RequestCacheMiddleware` so that the values are never shared between requests.
+    """
+
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def get_group_user_permissions_cache_key(user_id: int, group_id: int) -> str:
+    return f"group_user_permissions_{group_id}_{user_id}"
+
+
+def get_group_user_permissions(user_id: int, group_id: int) -> Optional[str]:
+    """
+    Returns the permissions that the user has in the group. The result is cached for
+    the rest of the request and for `GROUP_USER_PERMISSIONS_CACHE_SECONDS` in the
+    shared cache, so that checking the permissions of the same user multiple times
+    only queries the database once.
+
+    Note that this doesn't check whether the group has been trashed because the
+    group instance is normally already known when checking the permissions.
+
+    :param user_id: The id of the user of which the permissions are requested.
+    :param group_id: The id of the group.
+    :return: The permissions of the user or None if the user is not a member of the
+        group.
+    """
+
+    key = (user_id, group_id)
+    request_cache = _request_cache.get()
+
+    if request_cache is not None and key in request_cache:
+        permissions = request_cache[key]
+    else:
+        cache_key = get_group_user_permissions_cache_key(user_id, group_id)
+        timeout = settings.GROUP_USER_PERMISSIONS_CACHE_SECONDS
+        permissions = None
+
+        if timeout > 0:
+            start = monotonic()
+            permissions = cache.get(cache_key)
+            cache_stats.record(
+                "group_user_permissions", permissions is not None, monotonic() - start
+            )
+
+        if permissions is None:
+            permissions = (
+                GroupUser.objects_and_trash.filter(user_id=user_id, group_id=group_id)
+                .values_list("permissions", flat=True)
+                .first()
+            ) or NOT_IN_GROUP
+
+            # The permissions could have been read from uncommitted changes, so they
+            # are only shared with other requests once they are committed.
+            if timeout > 0:
+                transaction.on_commit(
+                    lambda: cache.set(cache_key, permissions, timeout)
+                )
+
+        if request_cache is not None:
+            request_cache[key] = permissions
+
+    return permissions or None
+
+
+def invalidate_group_user_permissions(user_id: int, group_id: int):
+    """
+    Removes the cached permissions of the user in the group. The shared cache entry is
+    removed again when the transaction commits because another process could have
+    cached the old permissions in the meantime.
+
+    :param user_id: The id of the user of which the permissions have changed.
+    :param group_id: The id of the group.
+    """
+
+    request_cache = _request_cache.get()
+    if request_cache is not None:
+        request_cache.pop((user_id, group_id), None)
+
+    cache_key = get_group_user_permissions_cache_key(user_id, group_id)
+    cache.delete(cache_key)
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+@receiver(post_save, sender=GroupUser)
+@receiver(post_delete, sender=GroupUser)
+def group_user_changed(sender, instance, **kwargs):
+    """
+    Adding, updating or removing a group user, which for example happens when an
+    invitation is accepted, a user leaves the group or is removed from it, changes
+    the permissions of the user in the group.
+    """
+
+    invalidate_group_user_permissions(instance.user_id, instance.group_id)
@@ -1,4 +1,12 @@
-from django.db import DEFAULT_DB_ALIAS
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import BooleanField, F, Field, Func, Model, Q, QuerySet, Value
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import OrderBy
 from django.db.transaction import Atomic, get_connection
 
 
@@ -34,3 +42,238 @@ class LockedAtomicTransaction(Atomic):
 
     def __exit__(self, *args, **kwargs):
         return super().__exit__(*args, **kwargs)
+
+
+class RowValueComparison(Func):
+    """
+    Compares two row values, for example `("order", "id") > (1.5, 10)`. PostgreSQL
+    can use a multi column index for such a comparison, which makes it the preferred
+    way of seeking to a position in an ordered table.
+    """
+
+    output_field = BooleanField()
+
+    def __init__(self, lhs, rhs, operator=">"):
+        if len(lhs) != len(rhs):
+            raise ValueError("Both sides of the row value must have the same length.")
+
+        self.operator = operator
+        super().__init__(*lhs, *rhs)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql_parts, params = [], []
+        for expression in self.source_expressions:
+            sql, expression_params = compiler.compile(expression)
+            sql_parts.append(sql)
+            params.extend(expression_params)
+
+        half = len(sql_parts) // 2
+        lhs, rhs = ", ".join(sql_parts[:half]), ", ".join(sql_parts[half:])
+        return f"({lhs}) {self.operator} ({rhs})", params
+
+
+@dataclass
+class KeysetColumn:
+    """
+    Describes one of the expressions that a queryset is ordered by in a way that can
+    be used to seek past a certain row.
+    """
+
+    name: str
+    descending: bool
+    nulls_first: bool
+    model_field: Optional[Field] = None
+
+    @property
+    def nullable(self):
+        return self.model_field is None or self.model_field.null
+
+    def get_value(self, instance):
+        return getattr(instance, self.name)
+
+    def to_python(self, value):
+        if self.model_field is None or value is None:
+            return value
+        return self.model_field.to_python(value)
+
+
+def get_keyset_columns(queryset) -> Tuple[QuerySet, List[KeysetColumn]]:
+    """
+    Inspects the ordering of the provided queryset and returns the columns that can be
+    used for keyset pagination. Ordering expressions that are not a plain reference to
+    a model field or annotation are annotated on the queryset so that their value is
+    available on every row and can be filtered on.
+
+    :param queryset: The ordered queryset that must be paginated. The ordering must
+        end with unique columns like the primary key.
+    :return: The possibly annotated queryset and the list of keyset columns.
+    """
+
+    model = queryset.model
+    order_by = queryset.query.order_by or model._meta.ordering or ["pk"]
+    columns = []
+    annotations = {}
+
+    for index, order in enumerate(order_by):
+        if isinstance(order, str):
+            descending = order.startswith("-")
+            order = OrderBy(F(order.lstrip("-+")), descending=descending)
+        elif not isinstance(order, OrderBy):
+            order = order.asc()
+
+        # PostgreSQL puts null values last when ordering ascending and first when
+        # ordering descending unless explicitly specified otherwise.
+        nulls_first = order.nulls_first or (order.descending and not order.nulls_last)
+        expression = order.expression
+        model_field = None
+
+        if isinstance(expression, F) and expression.name in queryset.query.annotations:
+            name = expression.name
+        elif isinstance(expression, F) and LOOKUP_SEP not in expression.name:
+            field_name = "id" if expression.name == "pk" else expression.name
+            model_field = model._meta.get_field(field_name)
+            name = model_field.attname
+        else:
+            name = f"keyset_{index}"
+            annotations[name] = expression
+
+        columns.append(KeysetColumn(name, order.descending, nulls_first, model_field))
+
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+
+    return queryset, columns
+
+
+def filter_after_keyset(queryset, columns: List[KeysetColumn], values: List[Any]):
+    """
+    Filters the queryset so that only the rows that come after the row with the
+    provided keyset values remain, according to the ordering described by the
+    columns. The trailing columns that can't contain null values and are ordered in
+    the same direction, like `order` and `id`, are compared using a single row value
+    comparison. The preceding columns are compared one by one, taking the ordering
+    of null values into account.
+
+    :param queryset: The queryset returned by `get_keyset_columns`.
+    :param columns: The keyset columns returned by `get_keyset_columns`.
+    :param values: The values of the last row of the previous page in the same order
+        as the columns.
+    :return: The filtered queryset.
+    """
+
+    values = [column.to_python(value) for column, value in zip(columns, values)]
+
+    tail_start = len(columns)
+    while (
+        tail_start > 0
+        and not columns[tail_start - 1].nullable
+        and columns[tail_start - 1].descending == columns[-1].descending
+    ):
+        tail_start -= 1
+
+    condition = Q(pk__in=[])
+    equal_condition = Q()
+
+    for column, value in zip(columns[:tail_start], values[:tail_start]):
+        if value is None:
+            after = (
+                Q(**{f"{column.name}__isnull": False}) if column.nulls_first else None
+            )
+            equal = Q(**{f"{column.name}__isnull": True})
+        else:
+            lookup = "lt" if column.descending else "gt"
+            after = Q(**{f"{column.name}__{lookup}": value})
+            if not column.nulls_first:
+                after |= Q(**{f"{column.name}__isnull": True})
+            equal = Q(**{column.name: value})
+
+        if after is not None:
+            condition |= equal_condition & after
+        equal_condition &= equal
+
+    if tail_start < len(columns):
+        tail = RowValueComparison(
+            [F(column.name) for column in columns[tail_start:]],
+            [Value(value) for value in values[tail_start:]],
+            "<" if columns[-1].descending else ">",
+        )
+        condition |= equal_condition & Q(tail)
+
+    return queryset.filter(condition)
+
+
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Returns the number of rows that the PostgreSQL planner expects the queryset to
+    return. The estimate is based on the table statistics like `pg_class.reltuples`,
+    which makes it a lot cheaper than an exact count on large tables, but it can be
+    off, especially if the table has not been analyzed recently. It should therefore
+    only be used for informational purposes like progress indications.
+
+    :param queryset: The queryset of which the number of rows must be estimated.
+    :return: The estimated number of rows.
+    """
+
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def specific_iterator(
+    queryset_or_list: Union[QuerySet, Iterable[Model]]
+) -> Iterator[Model]:
+    """
+    Yields the provided instances of a model using the `PolymorphicContentTypeMixin`
+    in their most specific form, in the same order. Calling `.specific` on every
+    instance executes a query per instance, while this helper groups the instances
+    by their content type and fetches all the instances of the same specific model
+    with a single query. Objects that were prefetched or selected via
+    `select_related` on the base instances are copied to the specific instances so
+    that they don't have to be fetched again.
+
+    :param queryset_or_list: A queryset or list of instances that must be resolved
+        to their specific form. Instances that are already specific are yielded as
+        they are.
+    :return: An iterator yielding the specific instances.
+    """
+
+    objects = list(queryset_or_list)
+    ids_per_content_type = defaultdict(list)
+
+    for obj in objects:
+        model_class = obj.specific_class
+        if model_class is not None and not isinstance(obj, model_class):
+            ids_per_content_type[obj.content_type_id].append(obj.id)
+
+    specific_objects = {}
+    for content_type_id, ids in ids_per_content_type.items():
+        model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+        # The base manager is used because the instances could have been fetched via
+        # a manager that includes trashed instances.
+        for specific_obj in model_class._base_manager.filter(id__in=ids):
+            specific_objects[specific_obj.id] = specific_obj
+
+    for obj in objects:
+        specific_obj = specific_objects.get(obj.id)
+
+        if specific_obj is None:
+            yield obj.specific
+            continue
+
+        prefetched_objects_cache = getattr(obj, "_prefetched_objects_cache", None)
+        if prefetched_objects_cache:
+            specific_obj._prefetched_objects_cache = {
+                **prefetched_objects_cache,
+                **getattr(specific_obj, "_prefetched_objects_cache", {}),
+            }
+
+        for name, value in obj._state.fields_cache.items():
+            specific_obj._state.fields_cache.setdefault(name, value)
+
+        # Store the result on the base instance so that accessing its `specific`
+        # property doesn't execute another query.
+        obj.__dict__["specific"] = specific_obj
+        yield specific_obj
@@ -40,6 +40,7 @@ from .exceptions import (
     TemplateFileDoesNotExist,
     TemplateDoesNotExist,
 )
+from .db import specific_iterator
 from .trash.handler import TrashHandler
 from .utils import extract_allowed, set_allowed_attrs
 from .registries import application_type_registry
@@ -747,14 +748,13 @@ class CoreHandler:
             self, application_id=application_id, application=application, user=user
         )
 
-    def export_group_applications(self, group, files_buffer, storage=None):
+    def export_group_applications(
+        self, group, files_buffer, storage=None, stream_rows=False
+    ):
         """
         Exports the applications of a group to a list. They can later be imported via
         the `import_applications_to_group` method. The result can be serialized to JSON.
 
-        @TODO look into speed optimizations by streaming to a JSON file instead of
-            generating the entire file in memory.
-
         :param group: The group of which the applications must be exported.
         :type group: Group
         :param files_buffer: A file buffer where the files must be written to in ZIP
@@ -762,6 +762,10 @@ class CoreHandler:
         :type files_buffer: IOBase
         :param storage: The storage where the files can be loaded from.
         :type storage: Storage or None
+        :param stream_rows: Indicates whether the rows must be written as JSON lines
+            to the ZIP file while exporting instead of being included in the list.
+            This keeps the memory usage flat for groups containing lots of rows.
+        :type stream_rows: bool
         :return: A list containing the exported applications.
         :rtype: list
         """
@@ -769,14 +773,13 @@ class CoreHandler:
         if not storage:
             storage = default_storage
 
-        with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
+        with ZipFile(files_buffer, "a", ZIP_DEFLATED, True) as files_zip:
             exported_applications = []
             applications = group.application_set.all()
-            for a in applications:
-                application = a.specific
+            for application in specific_iterator(applications):
                 application_type = application_type_registry.get_by_model(application)
                 exported_application = application_type.export_serialized(
-                    application, files_zip, storage
+                    application, files_zip, storage, stream_rows=stream_rows
                 )
                 exported_applications.append(exported_application)
 
@@ -787,10 +790,8 @@ class CoreHandler:
     ):
         """
         Imports multiple exported applications into the given group. It is compatible
-        with an export of the `export_group_applications` method.
-
-        @TODO look into speed optimizations by streaming from a JSON file instead of
-            loading the entire file into memory.
+        with an export of the `export_group_applications` method. Rows that have been
+        exported to the ZIP file are read from the `files_buffer` in batches.
 
         :param group: The group that the applications must be imported to.
         :type group: Group
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from baserow.core.cache import cache_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Shows the number of hits and misses and the average lookup latency per cache "
+        "namespace of all the backend processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Resets the counters after showing them.",
+        )
+
+    def handle(self, *args, **options):
+        cache_stats.flush()
+        stats = cache_stats.get_stats()
+
+        if not stats:
+            self.stdout.write("No cache lookups have been recorded yet.")
+
+        for namespace, counters in stats.items():
+            lookups = counters["hits"] + counters["misses"]
+            hit_ratio = counters["hits"] / lookups * 100 if lookups else 0
+            latency = counters["latency_us"] / lookups / 1000 if lookups else 0
+            self.stdout.write(
+                f"{namespace}: {counters['hits']} hits, {counters['misses']} misses, "
+                f"{hit_ratio:.1f}% hit ratio, {latency:.3f} ms average latency"
+            )
+
+        if options["reset"]:
+            cache_stats.reset()
+            self.stdout.write(self.style.SUCCESS("The cache stats have been reset."))
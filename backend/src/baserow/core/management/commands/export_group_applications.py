@@ -33,11 +33,19 @@ class Command(BaseCommand):
             "`group_ID.zip` by default, but can optionally be named differently by "
             "proving this argument.",
         )
+        parser.add_argument(
+            "--stream-rows",
+            action="store_true",
+            help="Writes the rows of the tables as JSON lines to the ZIP file while "
+            "exporting instead of including them in the JSON file. This keeps the "
+            "memory usage low when exporting groups containing lots of rows.",
+        )
 
     def handle(self, *args, **options):
         group_id = options["group_id"]
         indent = options["indent"]
         name = options["name"]
+        stream_rows = options["stream_rows"]
 
         try:
             group = Group.objects.get(pk=group_id)
@@ -54,7 +62,7 @@ class Command(BaseCommand):
 
         with open(files_path, "wb") as files_buffer:
             exported_applications = CoreHandler().export_group_applications(
-                group, files_buffer=files_buffer
+                group, files_buffer=files_buffer, stream_rows=stream_rows
             )
 
         with open(export_path, "w") as export_buffer:
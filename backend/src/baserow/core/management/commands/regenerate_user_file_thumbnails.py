@@ -1,47 +1,82 @@
-from PIL import Image
+from multiprocessing import Pool
 
 from django.core.management.base import BaseCommand
-from django.core.files.storage import default_storage
+from django.db import connections
 
 from baserow.core.user_files.models import UserFile
 from baserow.core.user_files.handler import UserFileHandler
 
 
+def regenerate_thumbnails(user_file_ids):
+    """
+    Regenerates the thumbnails of the provided image user files. This is called in a
+    worker process if multiple workers are used.
+
+    :param user_file_ids: The ids of the user files of which the thumbnails must be
+        regenerated.
+    :type user_file_ids: list
+    :return: The number of user files of which the thumbnails have been regenerated.
+    :rtype: int
+    """
+
+    handler = UserFileHandler()
+    count = 0
+
+    for user_file in UserFile.objects.filter(id__in=user_file_ids):
+        handler.generate_user_file_thumbnails(user_file)
+        count += 1
+
+    return count
+
+
 class Command(BaseCommand):
     help = (
         "Regenerates all the user file thumbnails based on the current settings. "
         "Existing files will be overwritten."
     )
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="The number of processes that regenerate the thumbnails in parallel.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of user files that a process regenerates at once.",
+        )
+
     def handle(self, *args, **options):
         """
         Regenerates the thumbnails of all image user files. If the USER_THUMBNAILS
         setting ever changes then this file can be used to fix all the thumbnails.
         """
 
+        workers = max(options["workers"], 1)
+        batch_size = max(options["batch_size"], 1)
+        user_file_ids = list(
+            UserFile.objects.filter(is_image=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        batches = [
+            user_file_ids[i : i + batch_size]
+            for i in range(0, len(user_file_ids), batch_size)
+        ]
+
         i = 0
-        handler = UserFileHandler()
-        buffer_size = 100
-        queryset = UserFile.objects.filter(is_image=True)
-        count = queryset.count()
-
-        while i < count:
-            user_files = queryset[i : min(count, i + buffer_size)]
-            for user_file in user_files:
-                i += 1
-
-                full_path = handler.user_file_path(user_file)
-                stream = default_storage.open(full_path)
-
-                try:
-                    image = Image.open(stream)
-                    handler.generate_and_save_image_thumbnails(
-                        image, user_file, storage=default_storage
-                    )
-                    image.close()
-                except IOError:
-                    pass
-
-                stream.close()
+        if workers == 1:
+            for batch in batches:
+                i += regenerate_thumbnails(batch)
+        else:
+            # The worker processes are forked and must not share the database
+            # connection of this process, they each open their own one instead.
+            connections.close_all()
+            with Pool(workers) as pool:
+                for count in pool.imap_unordered(regenerate_thumbnails, batches):
+                    i += count
 
         self.stdout.write(self.style.SUCCESS(f"{i} thumbnails have been regenerated."))
@@ -0,0 +1,16 @@
+from baserow.core.cache import request_cache_scope
+
+
+class RequestCacheMiddleware:
+    """
+    Enables the request cache of `baserow.core.cache` while handling a request, so
+    that for example the group permissions of the user are only fetched once per
+    request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with request_cache_scope():
+            return self.get_response(request)
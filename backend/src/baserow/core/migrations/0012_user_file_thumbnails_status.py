@@ -0,0 +1,28 @@
+# Generated by Django 3.2.6 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_settings_instance_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userfile",
+            name="thumbnails_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "pending"),
+                    ("complete", "complete"),
+                    ("failed", "failed"),
+                ],
+                default="complete",
+                help_text="Indicates whether the thumbnails of an image are still "
+                "being generated in the background.",
+                max_length=16,
+            ),
+        ),
+    ]
@@ -137,26 +137,25 @@ class Group(TrashableModelMixin, CreatedAndUpdatedOnMixin):
             else:
                 return False
 
-        if include_trash:
-            manager = GroupUser.objects_and_trash
-        else:
-            manager = GroupUser.objects
+        from baserow.core.cache import get_group_user_permissions
 
-        queryset = manager.filter(user_id=user.id, group_id=self.id)
+        # The permissions are cached, so checking them multiple times in the same
+        # request only queries the database once.
+        group_user_permissions = None
+        if include_trash or not self.trashed:
+            group_user_permissions = get_group_user_permissions(user.id, self.id)
 
-        if raise_error:
-            try:
-                group_user = queryset.get()
-            except GroupUser.DoesNotExist:
+        if group_user_permissions is None:
+            if raise_error:
                 raise UserNotInGroup(user, self)
+            return False
 
-            if permissions is not None and group_user.permissions not in permissions:
+        if permissions is not None and group_user_permissions not in permissions:
+            if raise_error:
                 raise UserInvalidGroupPermissionsError(user, self, permissions)
-        else:
-            if permissions is not None:
-                queryset = queryset.filter(permissions__in=permissions)
+            return False
 
-            return queryset.exists()
+        return True
 
     def __str__(self):
         return f"<Group id={self.id}, name={self.name}>"
@@ -168,7 +168,7 @@ class ApplicationType(
         :type application: Application
         """
 
-    def export_serialized(self, application, files_zip, storage):
+    def export_serialized(self, application, files_zip, storage, stream_rows=False):
         """
         Exports the application to a serialized dict that can be imported by the
         `import_serialized` method. The dict is JSON serializable.
@@ -180,6 +180,11 @@ class ApplicationType(
         :type files_zip: ZipFile
         :param storage: The storage where the files can be loaded from.
         :type storage: Storage or None
+        :param stream_rows: Indicates whether large amounts of data, like the rows of
+            a table, must be written incrementally to a file in the `files_zip`
+            instead of being added to the serialized dict. This keeps the memory usage
+            flat when exporting lots of data.
+        :type stream_rows: bool
         :return: The exported and serialized application.
         :rtype: dict
         """
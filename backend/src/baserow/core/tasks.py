@@ -3,9 +3,11 @@ from .trash.tasks import (
     mark_old_trash_for_permanent_deletion,
     setup_period_trash_tasks,
 )
+from .user_files.tasks import generate_user_file_thumbnails
 
 __all__ = [
     "permanently_delete_marked_trash",
     "mark_old_trash_for_permanent_deletion",
     "setup_period_trash_tasks",
+    "generate_user_file_thumbnails",
 ]
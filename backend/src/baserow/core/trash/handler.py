@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, Dict, Any
+import time
+from collections import defaultdict
+from typing import Optional, Dict, Any, List
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -21,7 +23,10 @@ from baserow.core.trash.exceptions import (
     CannotDeleteAlreadyDeletedItem,
 )
 from baserow.core.trash.registries import TrashableItemType, trash_item_type_registry
-from baserow.core.trash.signals import permanently_deleted
+from baserow.core.trash.signals import (
+    permanently_deleted,
+    items_permanently_deleted,
+)
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -82,9 +87,6 @@ class TrashHandler:
                     name=trash_item_type.get_name(trash_item),
                     parent_name=parent_name,
                     parent_trash_item_id=parent_id,
-                    # If we ever introduce the ability to trash many rows at once this
-                    # call will generate a model per row currently, instead a model
-                    # cache should be added so generated models can be shared.
                     extra_description=trash_item_type.get_extra_description(
                         trash_item, parent
                     ),
@@ -95,6 +97,76 @@ class TrashHandler:
                 else:
                     raise e
 
+    @staticmethod
+    def trash_many(
+        requesting_user: User,
+        group: Group,
+        application: Optional[Application],
+        trash_items: List[Any],
+        parent_id=None,
+    ) -> List[TrashEntry]:
+        """
+        Marks all the provided trashable items as trashed, just like the `trash`
+        method, but marks the items as trashed and creates their trash entries in bulk.
+        All the items must be of the same trashable item type and have the same parent.
+
+        :param parent_id: The id of the parent object if known
+        :param requesting_user: The user who is requesting that the items be trashed.
+        :param group: The group the trashed items are in.
+        :param application: If the items are in an application the application.
+        :param trash_items: The items to be trashed.
+        :return: The newly created entries in the TrashEntry table for the items.
+        """
+
+        if len(trash_items) == 0:
+            return []
+
+        with transaction.atomic():
+            trash_item_type = trash_item_type_registry.get_by_model(trash_items[0])
+
+            _check_parent_id_valid(parent_id, trash_item_type)
+
+            item_ids_to_trash_by_model = defaultdict(list)
+            for trash_item in trash_items:
+                for item in trash_item_type.get_items_to_trash(trash_item):
+                    item.trashed = True
+                    item_ids_to_trash_by_model[type(item)].append(item.id)
+
+            for model, item_ids in item_ids_to_trash_by_model.items():
+                model._base_manager.filter(id__in=item_ids).update(trashed=True)
+
+            parent = trash_item_type.get_parent(trash_items[0], parent_id)
+            if parent is not None:
+                parent_type = trash_item_type_registry.get_by_model(parent)
+                parent_name = parent_type.get_name(parent)
+            else:
+                parent_name = None
+
+            try:
+                return TrashEntry.objects.bulk_create(
+                    [
+                        TrashEntry(
+                            user_who_trashed=requesting_user,
+                            group=group,
+                            application=application,
+                            trash_item_type=trash_item_type.type,
+                            trash_item_id=trash_item.id,
+                            name=trash_item_type.get_name(trash_item),
+                            parent_name=parent_name,
+                            parent_trash_item_id=parent_id,
+                            extra_description=trash_item_type.get_extra_description(
+                                trash_item, parent
+                            ),
+                        )
+                        for trash_item in trash_items
+                    ]
+                )
+            except IntegrityError as e:
+                if "unique constraint" in e.args[0]:
+                    raise CannotDeleteAlreadyDeletedItem()
+                else:
+                    raise e
+
     @staticmethod
     def restore_item(user, trash_item_type, trash_item_id, parent_trash_item_id=None):
         """
@@ -203,49 +275,119 @@ class TrashHandler:
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+
+        The entries are grouped by their trash item type and parent and every group is
+        deleted in batches. Groups of types containing items of other types are
+        deleted first, so entries of items that were deleted together with their
+        parent only have to be removed. When the
+        `TRASH_PERMANENT_DELETION_TIME_BUDGET_SECONDS` setting is exceeded it stops and
+        the remaining entries are deleted the next time this method is called.
         """
 
+        deadline = (
+            time.monotonic() + settings.TRASH_PERMANENT_DELETION_TIME_BUDGET_SECONDS
+        )
+        marked_entries = TrashEntry.objects.filter(should_be_permanently_deleted=True)
         trash_item_lookup_cache = {}
         deleted_count = 0
-        while True:
-            with transaction.atomic():
-                # Perm deleting a group or application can cause cascading deletion of
-                # other trash entries hence we only look up one a time. If we instead
-                # looped over a single queryset lookup of all TrashEntries then we could
-                # end up trying to delete TrashEntries which have already been deleted
-                # by a previous cascading delete of a group or application.
-                trash_entry = TrashEntry.objects.filter(
-                    should_be_permanently_deleted=True
-                ).first()
-                if not trash_entry:
-                    break
+        out_of_time = False
+
+        while not out_of_time:
+            groups = sorted(
+                (
+                    (trash_item_type_registry.get(trash_item_type), parent_id)
+                    for trash_item_type, parent_id in marked_entries.values_list(
+                        "trash_item_type", "parent_trash_item_id"
+                    ).distinct()
+                ),
+                key=lambda group: (group[0].permanent_deletion_order, group[1] or 0),
+            )
+            if not groups:
+                break
 
-                trash_item_type = trash_item_type_registry.get(
-                    trash_entry.trash_item_type
-                )
+            for trash_item_type, parent_id in groups:
+                while True:
+                    if time.monotonic() > deadline:
+                        out_of_time = True
+                        break
 
-                try:
-                    to_delete = trash_item_type.lookup_trashed_item(
-                        trash_entry, trash_item_lookup_cache
-                    )
-                    TrashHandler._permanently_delete_and_signal(
+                    count = TrashHandler._permanently_delete_trash_entries_batch(
                         trash_item_type,
-                        to_delete,
-                        trash_entry.parent_trash_item_id,
+                        marked_entries.filter(
+                            trash_item_type=trash_item_type.type,
+                            parent_trash_item_id=parent_id,
+                        ),
                         trash_item_lookup_cache,
                     )
-                except TrashItemDoesNotExist:
-                    # When a parent item is deleted it should also delete all of it's
-                    # children. Hence we expect that many of these TrashEntries to no
-                    # longer point to an existing item. In such a situation we just want
-                    # to delete the entry as the item itself has been correctly deleted.
-                    pass
-                trash_entry.delete()
-                deleted_count += 1
+                    deleted_count += count
+                    if count < trash_item_type.permanent_deletion_batch_size:
+                        break
+
+                if out_of_time:
+                    break
+
         logger.info(
             f"Successfully deleted {deleted_count} trash entries and their associated "
             "trashed items."
         )
+        if out_of_time:
+            logger.info(
+                "Stopped permanently deleting trash because the time budget was "
+                "exceeded, the remaining trash entries will be deleted later."
+            )
+
+    @staticmethod
+    def _permanently_delete_trash_entries_batch(
+        trash_item_type: TrashableItemType,
+        trash_entries: QuerySet,
+        trash_item_lookup_cache: Dict[str, Any],
+    ) -> int:
+        """
+        Permanently deletes the next batch of the provided trash entries and their
+        items in a single transaction.
+
+        :param trash_item_type: The trashable item type of the entries.
+        :param trash_entries: The marked trash entries of a single type and parent.
+        :param trash_item_lookup_cache: The cache shared by all the batches.
+        :return: The number of deleted trash entries.
+        """
+
+        with transaction.atomic():
+            # Perm deleting a group or application can cause cascading deletion of
+            # other trash entries, so the batch is looked up again every time instead
+            # of looping over a queryset of all the entries.
+            batch = list(
+                trash_entries.order_by("id")[
+                    : trash_item_type.permanent_deletion_batch_size
+                ]
+            )
+            if not batch:
+                return 0
+
+            # When a parent item is deleted it also deletes all of it's children.
+            # Hence we expect that many of these entries no longer point to an existing
+            # item, those are left out of the deleted items and only the entry is
+            # deleted.
+            deleted_items = trash_item_type.permanently_delete_items(
+                batch, trash_item_lookup_cache
+            )
+            parent_id = batch[0].parent_trash_item_id
+            for trash_item_id, trash_item in deleted_items.items():
+                permanently_deleted.send(
+                    sender=trash_item_type.type,
+                    trash_item_id=trash_item_id,
+                    trash_item=trash_item,
+                    parent_id=parent_id,
+                )
+            if deleted_items:
+                items_permanently_deleted.send(
+                    sender=trash_item_type.type,
+                    trash_item_ids=list(deleted_items.keys()),
+                    parent_id=parent_id,
+                )
+            TrashEntry.objects.filter(id__in=[entry.id for entry in batch]).delete()
+
+        return len(batch)
 
     @staticmethod
     def _permanently_delete_and_signal(
@@ -278,6 +420,11 @@ class TrashHandler:
             trash_item=to_delete,
             parent_id=parent_id,
         )
+        items_permanently_deleted.send(
+            sender=trash_item_type.type,
+            trash_item_ids=[trash_item_id],
+            parent_id=parent_id,
+        )
 
     @staticmethod
     def permanently_delete(trashable_item, parent_id=None):
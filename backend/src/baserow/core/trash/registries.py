@@ -15,6 +15,16 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
     A TrashableItemType specifies a baserow model which can be trashed.
     """
 
+    # Trash entries marked for permanent deletion are processed in ascending order of
+    # this value. Types whose items contain items of other types, like a group
+    # containing applications, must have a lower value so their children are deleted
+    # together with them instead of one by one.
+    permanent_deletion_order = 100
+
+    # The maximum number of items of this type that are passed to
+    # `permanently_delete_items` at once and deleted in a single transaction.
+    permanent_deletion_batch_size = 1
+
     def lookup_trashed_item(
         self, trashed_entry, trash_item_lookup_cache: Dict[str, Any] = None
     ):
@@ -52,6 +62,38 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
 
         pass
 
+    def permanently_delete_items(
+        self,
+        trash_entries: List[Any],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ) -> Dict[int, Any]:
+        """
+        Permanently deletes the items of the provided trash entries, which all have the
+        same parent. By default every item is looked up and deleted separately, types
+        of which many items can be trashed at once can override this method to delete
+        them using set based queries.
+
+        :param trash_entries: The trash entries of which the items must be deleted.
+        :param trash_item_lookup_cache: A dictionary which can be used to store
+            expensive objects used to lookup and delete the items.
+        :return: The deleted items by their trash item id. Items that have been deleted
+            without being fetched from the database are None. Items that didn't exist
+            anymore, because they were deleted together with their parent, are left
+            out.
+        """
+
+        deleted_items = {}
+        for trash_entry in trash_entries:
+            try:
+                trashed_item = self.lookup_trashed_item(
+                    trash_entry, trash_item_lookup_cache
+                )
+            except TrashItemDoesNotExist:
+                continue
+            self.permanently_delete_item(trashed_item, trash_item_lookup_cache)
+            deleted_items[trash_entry.trash_item_id] = trashed_item
+        return deleted_items
+
     @property
     def requires_parent_id(self) -> bool:
         """
@@ -9,3 +9,14 @@ Sent when any trashable item in Baserow is permanently deleted with kwargs conta
     None.
 :param parent_id: The parent id of the trashable item if required for that type.
 """
+
+items_permanently_deleted = django.dispatch.Signal()
+"""
+Sent once for every batch of trashable items of the same type and parent that have
+been permanently deleted together, in addition to a permanently_deleted signal for
+every item. Receivers that need to query the database should listen to this signal so
+the number of queries doesn't grow with the number of deleted items. The kwargs are:
+
+:param trash_item_ids: The ids of the items that were deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
@@ -10,6 +10,7 @@ class ApplicationTrashableItemType(TrashableItemType):
 
     type = "application"
     model_class = Application
+    permanent_deletion_order = 20
 
     def get_parent(self, trashed_item: Any, parent_id: int) -> Optional[Any]:
         return trashed_item.group
@@ -42,6 +43,7 @@ class GroupTrashableItemType(TrashableItemType):
 
     type = "group"
     model_class = Group
+    permanent_deletion_order = 10
 
     def get_parent(self, trashed_item: Any, parent_id: int) -> Optional[Any]:
         return None
@@ -14,6 +14,7 @@ from PIL import Image, ImageOps
 from django.conf import settings
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 
 from baserow.core.utils import sha256_hash, stream_size, random_string, truncate_middle
 
@@ -24,7 +25,13 @@ from .exceptions import (
     MaximumUniqueTriesError,
     InvalidFileURLError,
 )
-from .models import UserFile
+from .models import (
+    UserFile,
+    USER_FILE_THUMBNAILS_PENDING_STATUS,
+    USER_FILE_THUMBNAILS_COMPLETED_STATUS,
+    USER_FILE_THUMBNAILS_FAILED_STATUS,
+)
+from .tasks import generate_user_file_thumbnails
 
 
 class UserFileHandler:
@@ -99,14 +106,50 @@ class UserFileHandler:
             ).exists():
                 return unique
 
+    def get_thumbnail_sizes(self, image_width, image_height):
+        """
+        Calculates the size of every thumbnail in the `USER_THUMBNAILS` setting for an
+        image of the provided size. If the width or height of a thumbnail is None, it
+        is calculated so that the aspect ratio of the image is kept.
+
+        :param image_width: The width of the original image.
+        :type image_width: int
+        :param image_height: The height of the original image.
+        :type image_height: int
+        :return: The width and height of each thumbnail by thumbnail name.
+        :rtype: dict
+        """
+
+        sizes = {}
+
+        for name, size in settings.USER_THUMBNAILS.items():
+            size_copy = size.copy()
+
+            # If the width or height is None we want to keep the aspect ratio.
+            if size_copy[0] is None and size_copy[1] is not None:
+                size_copy[0] = round(image_width / image_height * size_copy[1])
+            elif size_copy[1] is None and size_copy[0] is not None:
+                size_copy[1] = round(image_height / image_width * size_copy[0])
+
+            sizes[name] = size_copy
+
+        return sizes
+
     def generate_and_save_image_thumbnails(self, image, user_file, storage=None):
         """
         Generates the thumbnails based on the current settings and saves them to the
         provided storage. Note that existing files with the same name will be
         overwritten.
 
+        Decoding and resizing the full image is the slowest part, so if the image is a
+        lot larger than the thumbnails, JPEG images are decoded at a lower scale and
+        other images are first reduced using a fast box filter. The image is never
+        reduced to less than twice the size of the largest thumbnail, so it is still
+        resized with antialiasing afterwards.
+
         :param image: The original Pillow image that serves as base when generating the
-            the image.
+            the image. It must not have been loaded yet to decode a JPEG image at a
+            lower scale.
         :type image: Image
         :param user_file: The user file for which the thumbnails must be generated
             and saved.
@@ -122,19 +165,25 @@ class UserFileHandler:
         storage = storage or default_storage
         image_width = user_file.image_width
         image_height = user_file.image_height
+        image_format = image.format
+        sizes = self.get_thumbnail_sizes(image_width, image_height)
+
+        reduce_factor = min(
+            [
+                min(image_width // max(width, 1), image_height // max(height, 1)) // 2
+                for width, height in sizes.values()
+            ],
+            default=1,
+        )
+        if reduce_factor > 1:
+            reduced_size = (image_width // reduce_factor, image_height // reduce_factor)
+            if image.draft(image.mode, reduced_size) is None:
+                image = image.reduce(reduce_factor)
 
-        for name, size in settings.USER_THUMBNAILS.items():
-            size_copy = size.copy()
-
-            # If the width or height is None we want to keep the aspect ratio.
-            if size_copy[0] is None and size_copy[1] is not None:
-                size_copy[0] = round(image_width / image_height * size_copy[1])
-            elif size_copy[1] is None and size_copy[0] is not None:
-                size_copy[1] = round(image_height / image_width * size_copy[0])
-
-            thumbnail = ImageOps.fit(image.copy(), size_copy, Image.ANTIALIAS)
+        for name, size in sizes.items():
+            thumbnail = ImageOps.fit(image, size, Image.ANTIALIAS)
             thumbnail_stream = BytesIO()
-            thumbnail.save(thumbnail_stream, image.format)
+            thumbnail.save(thumbnail_stream, image_format)
             thumbnail_stream.seek(0)
             thumbnail_path = self.user_file_thumbnail_path(user_file, name)
             storage.save(thumbnail_path, thumbnail_stream)
@@ -142,6 +191,38 @@ class UserFileHandler:
             del thumbnail
             del thumbnail_stream
 
+    def generate_user_file_thumbnails(self, user_file, storage=None):
+        """
+        Opens the image of the user file from the storage, generates its thumbnails
+        and updates the thumbnails status of the user file. This is called by a
+        background task after an image has been uploaded.
+
+        :param user_file: The image user file of which the thumbnails must be
+            generated.
+        :type user_file: UserFile
+        :param storage: The storage where the image is stored and the thumbnails must
+            be saved to.
+        :type storage: Storage or None
+        """
+
+        storage = storage or default_storage
+
+        try:
+            with storage.open(self.user_file_path(user_file)) as stream:
+                image = Image.open(stream)
+                self.generate_and_save_image_thumbnails(
+                    image, user_file, storage=storage
+                )
+                image.close()
+            thumbnails_status = USER_FILE_THUMBNAILS_COMPLETED_STATUS
+        except IOError:
+            thumbnails_status = USER_FILE_THUMBNAILS_FAILED_STATUS
+
+        user_file.thumbnails_status = thumbnails_status
+        UserFile.objects.filter(id=user_file.id).update(
+            thumbnails_status=thumbnails_status
+        )
+
     def upload_user_file(self, user, file_name, stream, storage=None):
         """
         Saves the provided uploaded file in the provided storage. If no storage is
@@ -203,6 +284,12 @@ class UserFileHandler:
         except IOError:
             pass
 
+        # The thumbnails are generated in the background after the file has been saved
+        # because that can take a while for large images. The background task only
+        # has access to the default storage, so they are generated right away if
+        # another storage is provided, like when importing into a different storage.
+        generate_thumbnails_in_background = is_image and storage is default_storage
+
         user_file = UserFile.objects.create(
             original_name=file_name,
             original_extension=extension,
@@ -214,17 +301,22 @@ class UserFileHandler:
             is_image=is_image,
             image_width=image_width,
             image_height=image_height,
+            thumbnails_status=(
+                USER_FILE_THUMBNAILS_PENDING_STATUS
+                if generate_thumbnails_in_background
+                else USER_FILE_THUMBNAILS_COMPLETED_STATUS
+            ),
         )
 
         # If the uploaded file is an image we need to generate the configurable
         # thumbnails for it. We want to generate them before the file is saved to the
         # storage because some storages close the stream after saving.
-        if image:
+        if image and not generate_thumbnails_in_background:
             self.generate_and_save_image_thumbnails(image, user_file, storage=storage)
 
-            # When all the thumbnails have been generated, the image can be deleted
-            # from memory.
-            del image
+        # The image only has been opened to read its size and, if needed, generate the
+        # thumbnails, so it can be deleted from memory.
+        del image
 
         # Save the file to the storage.
         full_path = self.user_file_path(user_file)
@@ -233,6 +325,11 @@ class UserFileHandler:
         # Close the stream because we don't need it anymore.
         stream.close()
 
+        if generate_thumbnails_in_background:
+            transaction.on_commit(
+                lambda: generate_user_file_thumbnails.delay(user_file.id)
+            )
+
         return user_file
 
     def upload_user_file_by_url(self, user, url, storage=None):
@@ -11,6 +11,15 @@ deconstruct_user_file_regex = re.compile(
     r"([a-zA-Z0-9]*)_([a-zA-Z0-9]*)\.([a-zA-Z0-9]*)$"
 )
 
+USER_FILE_THUMBNAILS_PENDING_STATUS = "pending"
+USER_FILE_THUMBNAILS_COMPLETED_STATUS = "complete"
+USER_FILE_THUMBNAILS_FAILED_STATUS = "failed"
+USER_FILE_THUMBNAILS_STATUS_CHOICES = [
+    (USER_FILE_THUMBNAILS_PENDING_STATUS, USER_FILE_THUMBNAILS_PENDING_STATUS),
+    (USER_FILE_THUMBNAILS_COMPLETED_STATUS, USER_FILE_THUMBNAILS_COMPLETED_STATUS),
+    (USER_FILE_THUMBNAILS_FAILED_STATUS, USER_FILE_THUMBNAILS_FAILED_STATUS),
+]
+
 
 class UserFile(models.Model):
     original_name = models.CharField(max_length=255)
@@ -24,6 +33,13 @@ class UserFile(models.Model):
     uploaded_at = models.DateTimeField(auto_now_add=True)
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     sha256_hash = models.CharField(max_length=64, db_index=True)
+    thumbnails_status = models.CharField(
+        max_length=16,
+        choices=USER_FILE_THUMBNAILS_STATUS_CHOICES,
+        default=USER_FILE_THUMBNAILS_COMPLETED_STATUS,
+        help_text="Indicates whether the thumbnails of an image are still being "
+        "generated in the background.",
+    )
 
     objects = UserFileQuerySet.as_manager()
 
@@ -0,0 +1,22 @@
+from baserow.config.celery import app
+
+
+@app.task(bind=True)
+def generate_user_file_thumbnails(self, user_file_id):
+    """
+    Generates the thumbnails of an uploaded image user file outside of the upload
+    request.
+
+    :param user_file_id: The id of the image user file.
+    :type user_file_id: int
+    """
+
+    from baserow.core.user_files.handler import UserFileHandler
+    from baserow.core.user_files.models import UserFile
+
+    try:
+        user_file = UserFile.objects.get(id=user_file_id)
+    except UserFile.DoesNotExist:
+        return
+
+    UserFileHandler().generate_user_file_thumbnails(user_file)
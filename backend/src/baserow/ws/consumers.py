@@ -4,6 +4,21 @@ from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from baserow.ws.registries import page_registry
 
 
+def get_user_group_name(user_id):
+    """
+    Returns the name of the channel group that all the connections of the user with
+    the provided id join. Messages that are meant for specific users are only sent to
+    their groups, so that the connections of other users don't have to handle them.
+
+    :param user_id: The id of the user.
+    :type user_id: int
+    :return: The name of the channel group.
+    :rtype: str
+    """
+
+    return f"user-{user_id}"
+
+
 class CoreConsumer(AsyncJsonWebsocketConsumer):
     async def connect(self):
         await self.accept()
@@ -23,7 +38,9 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
             await self.close()
             return
 
-        await self.channel_layer.group_add("users", self.channel_name)
+        await self.channel_layer.group_add(
+            get_user_group_name(user.id), self.channel_name
+        )
 
     async def receive_json(self, content, **parameters):
         if "page" in content:
@@ -106,8 +123,9 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
     async def broadcast_to_users(self, event):
         """
         Broadcasts a message to all the users that are in the provided user_ids list.
-        Optionally the ignore_web_socket_id is ignored because that is often the
-        sender.
+        The event is only sent to the user groups of the users in the list, but the
+        user id is checked again to be safe. Optionally the ignore_web_socket_id is
+        ignored because that is often the sender.
 
         :param event: The event containing the payload, user ids and the web socket
             id that must be ignored.
@@ -142,4 +160,9 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
 
     async def disconnect(self, message):
         await self.discard_current_page(send_confirmation=False)
-        await self.channel_layer.group_discard("users", self.channel_name)
+
+        user = self.scope["user"]
+        if user:
+            await self.channel_layer.group_discard(
+                get_user_group_name(user.id), self.channel_name
+            )
@@ -21,16 +21,25 @@ def broadcast_to_users(self, user_ids, payload, ignore_web_socket_id=None):
 
     from channels.layers import get_channel_layer
 
+    from baserow.ws.consumers import get_user_group_name
+
     channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
-        "users",
-        {
-            "type": "broadcast_to_users",
-            "user_ids": user_ids,
-            "payload": payload,
-            "ignore_web_socket_id": ignore_web_socket_id,
-        },
-    )
+
+    async def send_to_user_groups():
+        # Every connection joins the group of its user, so the message is only sent
+        # to the groups of the recipients instead of to every connection.
+        for user_id in set(user_ids):
+            await channel_layer.group_send(
+                get_user_group_name(user_id),
+                {
+                    "type": "broadcast_to_users",
+                    "user_ids": [user_id],
+                    "payload": payload,
+                    "ignore_web_socket_id": ignore_web_socket_id,
+                },
+            )
+
+    async_to_sync(send_to_user_groups)()
 
 
 @app.task(bind=True)
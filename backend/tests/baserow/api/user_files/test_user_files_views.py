@@ -20,7 +20,9 @@ from baserow.core.models import UserFile
 
 
 @pytest.mark.django_db
-def test_upload_file(api_client, data_fixture, tmpdir):
+def test_upload_file(
+    api_client, data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
     user, token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
     )
@@ -114,7 +116,9 @@ def test_upload_file(api_client, data_fixture, tmpdir):
     image.save(file, format="PNG")
     file.seek(0)
 
-    with patch("baserow.core.user_files.handler.default_storage", new=storage):
+    with patch(
+        "baserow.core.user_files.handler.default_storage", new=storage
+    ), django_capture_on_commit_callbacks(execute=True):
         response = api_client.post(
             reverse("api:user_files:upload_file"),
             data={"file": file},
@@ -124,6 +128,7 @@ def test_upload_file(api_client, data_fixture, tmpdir):
 
     response_json = response.json()
     assert response.status_code == HTTP_200_OK
+    assert response_json["thumbnails_status"] == "pending"
     assert response_json["mime_type"] == "image/png"
     assert response_json["is_image"] is True
     assert response_json["image_width"] == 100
@@ -135,7 +140,9 @@ def test_upload_file(api_client, data_fixture, tmpdir):
     assert response_json["thumbnails"]["tiny"]["height"] == 21
     assert response_json["original_name"] == "test.png"
 
+    # The thumbnails are generated in the background after the file was uploaded.
     user_file = UserFile.objects.all().last()
+    assert user_file.thumbnails_status == "complete"
     file_path = tmpdir.join("user_files", user_file.name)
     assert file_path.isfile()
     file_path = tmpdir.join("thumbnails", "tiny", user_file.name)
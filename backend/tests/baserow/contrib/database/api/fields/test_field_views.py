@@ -493,3 +493,71 @@ def test_delete_field(api_client, data_fixture):
     response_json = response.json()
     assert response.status_code == HTTP_400_BAD_REQUEST
     assert response_json["error"] == "ERROR_CANNOT_DELETE_PRIMARY_FIELD"
+
+
+@pytest.mark.django_db
+def test_convert_field(api_client, data_fixture, django_capture_on_commit_callbacks):
+    user, token = data_fixture.create_user_and_token()
+    user_2, token_2 = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text = data_fixture.create_text_field(table=table, primary=True)
+    field = data_fixture.create_text_field(table=table, name="Amount")
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field.id}": "12"})
+
+    url = reverse("api:database:fields:convert", kwargs={"field_id": field.id})
+    response = api_client.post(
+        url, {"type": "number"}, format="json", HTTP_AUTHORIZATION=f"JWT {token_2}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    url = reverse("api:database:fields:convert", kwargs={"field_id": 999999})
+    response = api_client.post(
+        url, {"type": "number"}, format="json", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+    url = reverse("api:database:fields:convert", kwargs={"field_id": field.id})
+    response = api_client.post(
+        url,
+        {"type": "number", "name": text.name},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_FIELD_WITH_SAME_NAME_ALREADY_EXISTS"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            url,
+            {"type": "number", "number_decimal_places": 2},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["field"] == field.id
+    assert response_json["new_type_name"] == "number"
+    assert response_json["status"] == "pending"
+    assert response_json["progress_percentage"] == 0.0
+
+    job_url = reverse(
+        "api:database:fields:conversion_job", kwargs={"job_id": response_json["id"]}
+    )
+    response = api_client.get(job_url, HTTP_AUTHORIZATION=f"JWT {token_2}")
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_CONVERSION_JOB_DOES_NOT_EXIST"
+
+    response = api_client.get(job_url, HTTP_AUTHORIZATION=f"JWT {token}")
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["status"] == "complete"
+    assert response_json["progress_percentage"] == 1.0
+    assert response_json["error"] is None
+
+    field = NumberField.objects.get(id=field.id)
+    assert field.number_decimal_places == 2
+    row = table.get_model().objects.get(id=row.id)
+    assert getattr(row, f"field_{field.id}") == 12
@@ -509,6 +509,7 @@ def test_create_row(api_client, data_fixture):
     assert response_json_row_4[f"field_{text_field_2.id}"] == ""
     assert response_json_row_4["order"] == "4.00000000000000000000"
 
+    TokenHandler().flush_token_usage()
     token.refresh_from_db()
     assert token.handled_calls == 1
 
@@ -530,8 +531,9 @@ def test_create_row(api_client, data_fixture):
     assert response_json_row_5[f"field_{number_field.id}"] == "480"
     assert not response_json_row_5[f"field_{boolean_field.id}"]
     assert response_json_row_5[f"field_{text_field_2.id}"] == ""
-    assert response_json_row_5["order"] == "2.99999999999999999999"
+    assert response_json_row_5["order"] == "2.50000000000000000000"
 
+    TokenHandler().flush_token_usage()
     token.refresh_from_db()
     assert token.handled_calls == 2
 
@@ -1092,12 +1094,12 @@ def test_move_row(api_client, data_fixture):
     response_json_row_1 = response.json()
     assert response.status_code == HTTP_200_OK
     assert response_json_row_1["id"] == row_1.id
-    assert response_json_row_1["order"] == "2.99999999999999999999"
+    assert response_json_row_1["order"] == "2.50000000000000000000"
 
     row_1.refresh_from_db()
     row_2.refresh_from_db()
     row_3.refresh_from_db()
-    assert row_1.order == Decimal("2.99999999999999999999")
+    assert row_1.order == Decimal("2.50000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
     assert row_3.order == Decimal("3.00000000000000000000")
 
@@ -1115,7 +1117,7 @@ def test_move_row(api_client, data_fixture):
     assert response_json_row_1 == {
         "New Field": None,
         "id": row_1.id,
-        "order": "4.00000000000000000000",
+        "order": "5.00000000000000000000",
     }
 
     # Make sure that we receive an error message when calling move row
@@ -1213,6 +1215,78 @@ def test_delete_row(api_client, data_fixture):
     assert model.objects.count() == 0
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(name="Name", table=table, primary=True)
+    data_fixture.create_number_field(name="Price", table=table)
+
+    model = table.get_model(attribute_names=True)
+    row_1 = model.objects.create(name="Product 1", price=50, order=Decimal("1"))
+    row_2 = model.objects.create(name="Product 2", price=None, order=Decimal("1"))
+    row_3 = model.objects.create(name="Product 3", price=50, order=Decimal("3"))
+    row_4 = model.objects.create(name="Product 4", price=10, order=Decimal("2"))
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        url, {"cursor": "", "size": 3}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert "count" not in response_json
+    assert [row["id"] for row in response_json["results"]] == [
+        row_1.id,
+        row_2.id,
+        row_4.id,
+    ]
+
+    response = api_client.get(
+        response_json["next"], HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert [row["id"] for row in response_json["results"]] == [row_3.id]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        url,
+        {
+            "cursor": "",
+            "size": 2,
+            "order_by": "-Price",
+            "user_field_names": "true",
+            "include_count": "true",
+        },
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response_json["count"] == 4
+    assert [row["id"] for row in response_json["results"]] == [row_1.id, row_3.id]
+
+    response = api_client.get(
+        response_json["next"], HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert [row["id"] for row in response_json["results"]] == [row_4.id, row_2.id]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        url,
+        {"cursor": "invalid"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "size": 201},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
 @pytest.mark.django_db
 def test_list_rows_with_attribute_names(api_client, data_fixture):
     user, jwt_token = data_fixture.create_user_and_token(
@@ -1451,3 +1525,333 @@ def test_list_rows_with_attribute_names(api_client, data_fixture):
         response_json["detail"]
         == f"The field field_{field_1.id} was not found in the table."
     )
+
+
+@pytest.mark.django_db
+def test_batch_create_rows(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(
+        table=table, order=0, name="Color", text_default="white", primary=True
+    )
+    number_field = data_fixture.create_number_field(
+        table=table, order=1, name="Horsepower"
+    )
+    customers_table = data_fixture.create_database_table(database=table.database)
+    customers_primary = data_fixture.create_text_field(
+        table=customers_table, primary=True
+    )
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Customers", link_row_table=customers_table
+    )
+    customer = customers_table.get_model().objects.create(
+        **{f"field_{customers_primary.id}": "John"}
+    )
+
+    token = TokenHandler().create_token(user, table.database.group, "Good")
+    wrong_token = TokenHandler().create_token(user, table.database.group, "Wrong")
+    TokenHandler().update_token_permissions(user, wrong_token, False, True, True, True)
+
+    model = table.get_model()
+    row_1 = model.objects.create(order=1)
+
+    url = reverse("api:database:rows:batch", kwargs={"table_id": 9999})
+    response = api_client.post(
+        url, {"items": [{}]}, format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_TABLE_DOES_NOT_EXIST"
+
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table_2.id})
+    response = api_client.post(
+        url, {"items": [{}]}, format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table.id})
+    response = api_client.post(
+        url,
+        {"items": [{}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {wrong_token.key}",
+    )
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.json()["error"] == "ERROR_NO_PERMISSION_TO_TABLE"
+
+    response = api_client.post(
+        url, {"items": []}, format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert response.json()["detail"]["items"][0]["code"] == "min_length"
+
+    response = api_client.post(
+        url,
+        {"items": [{} for _ in range(201)]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["items"][0]["code"] == "max_length"
+
+    response = api_client.post(
+        url,
+        {"items": [{}, {f"field_{number_field.id}": "abc"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert (
+        response.json()["detail"]["items"]["1"][f"field_{number_field.id}"][0]["code"]
+        == "invalid"
+    )
+    assert model.objects.count() == 1
+
+    response = api_client.post(
+        f"{url}?before=99999",
+        {"items": [{}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    response = api_client.post(
+        url,
+        {
+            "items": [
+                {
+                    f"field_{text_field.id}": "green",
+                    f"field_{number_field.id}": 120,
+                    f"field_{link_field.id}": [customer.id],
+                },
+                {},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {token.key}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert len(response_json["items"]) == 2
+    assert response_json["items"][0][f"field_{text_field.id}"] == "green"
+    assert response_json["items"][0][f"field_{number_field.id}"] == "120"
+    assert response_json["items"][0][f"field_{link_field.id}"] == [
+        {"id": customer.id, "value": "John"}
+    ]
+    assert response_json["items"][0]["order"] == "2.00000000000000000000"
+    assert response_json["items"][1][f"field_{text_field.id}"] == "white"
+    assert response_json["items"][1][f"field_{link_field.id}"] == []
+    assert response_json["items"][1]["order"] == "3.00000000000000000000"
+
+    response = api_client.post(
+        f"{url}?before={row_1.id}&user_field_names",
+        {"items": [{"Color": "red"}, {"Color": "blue"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [item["Color"] for item in response_json["items"]] == ["red", "blue"]
+    assert [row.id for row in model.objects.all()] == [
+        response_json["items"][0]["id"],
+        response_json["items"][1]["id"],
+        row_1.id,
+        row_1.id + 1,
+        row_1.id + 2,
+    ]
+
+
+@pytest.mark.django_db
+def test_batch_update_rows(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(
+        table=table, order=0, name="Color", text_default="white", primary=True
+    )
+    number_field = data_fixture.create_number_field(
+        table=table, order=1, name="Horsepower"
+    )
+
+    token = TokenHandler().create_token(user, table.database.group, "Good")
+    wrong_token = TokenHandler().create_token(user, table.database.group, "Wrong")
+    TokenHandler().update_token_permissions(user, wrong_token, True, True, False, True)
+
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{f"field_{text_field.id}": "green", f"field_{number_field.id}": 120}
+    )
+    row_2 = model.objects.create(
+        **{f"field_{text_field.id}": "red", f"field_{number_field.id}": 240}
+    )
+
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table_2.id})
+    response = api_client.patch(
+        url,
+        {"items": [{"id": row_1.id}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table.id})
+    response = api_client.patch(
+        url,
+        {"items": [{"id": row_1.id}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {wrong_token.key}",
+    )
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.json()["error"] == "ERROR_NO_PERMISSION_TO_TABLE"
+
+    response = api_client.patch(
+        url,
+        {"items": [{f"field_{text_field.id}": "blue"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert response.json()["detail"]["items"]["0"]["id"][0]["code"] == "required"
+
+    response = api_client.patch(
+        url,
+        {"items": [{"id": row_1.id}, {"id": 99999}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    response = api_client.patch(
+        url,
+        {"items": [{"id": row_1.id}, {"id": row_1.id}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROW_IDS_NOT_UNIQUE"
+
+    response = api_client.patch(
+        url,
+        {
+            "items": [
+                {"id": row_2.id, f"field_{number_field.id}": 250},
+                {"id": row_1.id, f"field_{text_field.id}": "blue"},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {token.key}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["items"][0]["id"] == row_2.id
+    assert response_json["items"][0][f"field_{text_field.id}"] == "red"
+    assert response_json["items"][0][f"field_{number_field.id}"] == "250"
+    assert response_json["items"][1]["id"] == row_1.id
+    assert response_json["items"][1][f"field_{text_field.id}"] == "blue"
+    assert response_json["items"][1][f"field_{number_field.id}"] == "120"
+
+    response = api_client.patch(
+        f"{url}?user_field_names",
+        {"items": [{"id": row_1.id, "Horsepower": 130}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["items"] == [
+        {
+            "id": row_1.id,
+            "order": "1.00000000000000000000",
+            "Color": "blue",
+            "Horsepower": "130",
+        }
+    ]
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, f"field_{text_field.id}") == "blue"
+    assert getattr(row_1, f"field_{number_field.id}") == 130
+    assert getattr(row_2, f"field_{text_field.id}") == "red"
+    assert getattr(row_2, f"field_{number_field.id}") == 250
+
+
+@pytest.mark.django_db
+def test_batch_delete_rows(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="Color", primary=True)
+
+    token = TokenHandler().create_token(user, table.database.group, "Good")
+    wrong_token = TokenHandler().create_token(user, table.database.group, "Wrong")
+    TokenHandler().update_token_permissions(user, wrong_token, True, True, True, False)
+
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+    row_3 = model.objects.create()
+
+    url = reverse("api:database:rows:batch-delete", kwargs={"table_id": table_2.id})
+    response = api_client.post(
+        url,
+        {"items": [row_1.id]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    url = reverse("api:database:rows:batch-delete", kwargs={"table_id": table.id})
+    response = api_client.post(
+        url,
+        {"items": [row_1.id]},
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {wrong_token.key}",
+    )
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.json()["error"] == "ERROR_NO_PERMISSION_TO_TABLE"
+
+    response = api_client.post(
+        url,
+        {"items": list(range(1, 202))},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+
+    response = api_client.post(
+        url,
+        {"items": [row_1.id, 99999]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    response = api_client.post(
+        url,
+        {"items": [row_1.id, row_1.id]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROW_IDS_NOT_UNIQUE"
+    assert model.objects.count() == 3
+
+    response = api_client.post(
+        url,
+        {"items": [row_3.id, row_1.id]},
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {token.key}",
+    )
+    assert response.status_code == 204
+    assert [row.id for row in model.objects.all()] == [row_2.id]
+    assert model.trash.count() == 2
@@ -4,7 +4,7 @@ from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NO
 
 from django.shortcuts import reverse
 
-from baserow.contrib.database.views.models import FormView
+from baserow.contrib.database.views.models import FormView, FormViewSubmission
 
 
 @pytest.mark.django_db
@@ -36,6 +36,7 @@ def test_create_form_view(api_client, data_fixture):
     assert response_json["logo_image"] is None
     assert response_json["submit_action"] == "MESSAGE"
     assert response_json["submit_action_redirect_url"] == ""
+    assert response_json["async_submissions"] is False
 
     form = FormView.objects.all()[0]
     assert response_json["id"] == form.id
@@ -134,12 +135,14 @@ def test_update_form_view(api_client, data_fixture):
             "logo_image": {"name": user_file_2.name},
             "submit_action": "REDIRECT",
             "submit_action_redirect_url": "https://localhost",
+            "async_submissions": True,
         },
         format="json",
         HTTP_AUTHORIZATION=f"JWT {token}",
     )
     response_json = response.json()
     assert response.status_code == HTTP_200_OK
+    assert response_json["async_submissions"] is True
     assert response_json["slug"] != "test"
     assert response_json["slug"] == str(view.slug)
     assert response_json["name"] == "Test Form 2"
@@ -161,6 +164,7 @@ def test_update_form_view(api_client, data_fixture):
     assert form.logo_image_id == user_file_2.id
     assert form.submit_action == "REDIRECT"
     assert form.submit_action_redirect_url == "https://localhost"
+    assert form.async_submissions is True
 
     url = reverse("api:database:views:item", kwargs={"view_id": view.id})
     response = api_client.patch(
@@ -479,6 +483,58 @@ def test_submit_form_view(api_client, data_fixture):
     assert len(response_json["detail"]) == 7
 
 
+@pytest.mark.django_db
+def test_submit_form_view_async(api_client, data_fixture):
+    table = data_fixture.create_database_table()
+    form = data_fixture.create_form_view(
+        table=table, public=True, async_submissions=True
+    )
+    text_field = data_fixture.create_text_field(table=table)
+    data_fixture.create_form_view_field_option(
+        form, text_field, required=True, enabled=True
+    )
+
+    url = reverse("api:database:views:form:submit", kwargs={"slug": form.slug})
+    response = api_client.post(url, {}, format="json")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert FormViewSubmission.objects.count() == 0
+
+    response = api_client.post(
+        url, {f"field_{text_field.id}": "Value 1"}, format="json"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["submit_action"] == "MESSAGE"
+
+    submission = FormViewSubmission.objects.get()
+    assert submission.form_view_id == form.id
+    assert submission.values == {f"field_{text_field.id}": "Value 1"}
+    assert table.get_model().objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_submit_form_view_async_is_processed(api_client, data_fixture):
+    table = data_fixture.create_database_table()
+    form = data_fixture.create_form_view(
+        table=table, public=True, async_submissions=True
+    )
+    text_field = data_fixture.create_text_field(table=table)
+    data_fixture.create_form_view_field_option(
+        form, text_field, required=True, enabled=True
+    )
+
+    url = reverse("api:database:views:form:submit", kwargs={"slug": form.slug})
+    response = api_client.post(
+        url, {f"field_{text_field.id}": "Value 1"}, format="json"
+    )
+    assert response.status_code == HTTP_200_OK
+
+    rows = list(table.get_model().objects.all())
+    assert len(rows) == 1
+    assert getattr(rows[0], f"field_{text_field.id}") == "Value 1"
+    assert FormViewSubmission.objects.count() == 0
+
+
 @pytest.mark.django_db
 def test_form_view_link_row_lookup_view(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import List, Dict, Any
 
 import pytest
@@ -11,6 +12,7 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
@@ -196,6 +198,163 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+def _fetch_all_pages_by_cursor(api_client, url, token, params):
+    ids = []
+    response = api_client.get(
+        url, {"cursor": "", **params}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    while True:
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        ids.extend(row["id"] for row in response_json["results"])
+        # Rows must never be repeated, otherwise the cursor could be stuck.
+        assert len(set(ids)) == len(ids)
+        if not response_json["next"]:
+            return ids
+        response = api_client.get(
+            response_json["next"], HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("order", ["ASC", "DESC"])
+def test_list_rows_with_cursor_pagination(api_client, data_fixture, order):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Color")
+    number_field = data_fixture.create_number_field(table=table, name="Horsepower")
+    option_field = data_fixture.create_single_select_field(table=table, name="Option")
+    option_a = data_fixture.create_select_option(field=option_field, value="A")
+    option_b = data_fixture.create_select_option(field=option_field, value="B")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=text_field, order=order)
+    data_fixture.create_view_sort(view=grid, field=option_field, order=order)
+    data_fixture.create_view_sort(view=grid, field=number_field, order=order)
+
+    model = table.get_model()
+    for index, (color, option, number) in enumerate(
+        [
+            ("Green", option_a, 10),
+            (None, None, None),
+            ("Green", option_b, None),
+            (None, option_a, 5),
+            ("Blue", None, 1),
+            ("Green", option_a, None),
+            ("Blue", None, 1),
+            (None, None, 2),
+            ("Green", option_b, 3),
+        ]
+    ):
+        model.objects.create(
+            order=index % 3,
+            **{
+                f"field_{text_field.id}": color,
+                f"field_{option_field.id}": option,
+                f"field_{number_field.id}": number,
+            },
+        )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, {"size": 100}, HTTP_AUTHORIZATION=f"JWT {token}")
+    expected_ids = [row["id"] for row in response.json()["results"]]
+    assert len(expected_ids) == 9
+
+    for size in [1, 2, 4]:
+        ids = _fetch_all_pages_by_cursor(api_client, url, token, {"size": size})
+        assert ids == expected_ids
+
+    response = api_client.get(
+        url, {"cursor": "", "size": 4}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert "count" not in response_json
+    assert len(response_json["results"]) == 4
+    assert "cursor=" in response_json["next"]
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "size": 4, "include_count": ""},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json()["count"] == 9
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination_sorted_by_multiple_select(
+    api_client, data_fixture
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_multiple_select_field(table=table, name="Options")
+    option_a = data_fixture.create_select_option(field=field, value="A")
+    option_b = data_fixture.create_select_option(field=field, value="B")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=field, order="DESC")
+
+    model = table.get_model()
+    for options in [[option_a], [], [option_b], [option_a, option_b], [option_a]]:
+        row = model.objects.create()
+        getattr(row, f"field_{field.id}").set([option.id for option in options])
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, {"size": 100}, HTTP_AUTHORIZATION=f"JWT {token}")
+    expected_ids = [row["id"] for row in response.json()["results"]]
+
+    ids = _fetch_all_pages_by_cursor(api_client, url, token, {"size": 1})
+    assert ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination_sorted_by_created_on(
+    api_client, data_fixture
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    created_on_field = data_fixture.create_created_on_field(
+        table=table, date_include_time=True
+    )
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=created_on_field, order="ASC")
+
+    model = table.get_model()
+    # The values only differ in their microseconds.
+    for microsecond in [300, 100, 200, 100, 400]:
+        row = model.objects.create()
+        model.objects.filter(id=row.id).update(
+            **{
+                f"field_{created_on_field.id}": datetime(
+                    2021, 1, 1, 12, 0, 0, microsecond, tzinfo=timezone.utc
+                )
+            }
+        )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, {"size": 100}, HTTP_AUTHORIZATION=f"JWT {token}")
+    expected_ids = [row["id"] for row in response.json()["results"]]
+    assert len(expected_ids) == 5
+
+    for size in [1, 2]:
+        ids = _fetch_all_pages_by_cursor(api_client, url, token, {"size": size})
+        assert ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_list_rows_with_invalid_cursor(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="Color")
+    grid = data_fixture.create_grid_view(table=table)
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    for cursor in ["invalid", "W10=", "WyJhIiwgImIiXQ=="]:
+        response = api_client.get(
+            url, {"cursor": cursor}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
 @pytest.mark.django_db
 def test_list_rows_include_field_options(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -236,6 +395,92 @@ def test_list_rows_include_field_options(api_client, data_fixture):
     assert "filters_disabled" not in response_json
 
 
+@pytest.mark.django_db
+def test_list_rows_exclude_hidden_fields(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True, name="Name")
+    hidden_field = data_fixture.create_text_field(table=table, name="Notes")
+    number_field = data_fixture.create_number_field(table=table, name="Horsepower")
+    link_table = data_fixture.create_database_table(database=table.database)
+    data_fixture.create_text_field(table=link_table, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", link_row_table=link_table, name="Link"
+    )
+    grid = data_fixture.create_grid_view(table=table)
+    grid.get_field_options(create_if_not_exists=True)
+    grid.get_field_options().filter(
+        field_id__in=[hidden_field.id, number_field.id, link_field.id]
+    ).update(hidden=True)
+    data_fixture.create_view_filter(
+        view=grid, field=number_field, type="higher_than", value="1"
+    )
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+
+    model = table.get_model()
+    model.objects.create(
+        **{
+            f"field_{text_field.id}": "Audi",
+            f"field_{hidden_field.id}": "Tesla",
+            f"field_{number_field.id}": 2,
+        }
+    )
+    row_2 = model.objects.create(
+        **{
+            f"field_{text_field.id}": "Volvo",
+            f"field_{hidden_field.id}": "Tesla",
+            f"field_{number_field.id}": 3,
+        }
+    )
+    model.objects.create(
+        **{f"field_{text_field.id}": "BMW", f"field_{number_field.id}": 1}
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url,
+        {"exclude_hidden_fields": "", "include": "field_options"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 2
+    # The hidden field that is filtered and sorted on is included, so that the
+    # client can check whether the row still matches after it has been changed.
+    assert response_json["results"][0] == {
+        "id": row_2.id,
+        "order": "1.00000000000000000000",
+        f"field_{text_field.id}": "Volvo",
+        f"field_{number_field.id}": "3",
+    }
+    assert response_json["results"][1][f"field_{text_field.id}"] == "Audi"
+    assert len(response_json["field_options"]) == 4
+    assert response_json["field_options"][str(hidden_field.id)]["hidden"] is True
+
+    # The hidden fields are not searched.
+    response = api_client.get(
+        url,
+        {"exclude_hidden_fields": "", "search": "tesla"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json()["count"] == 0
+
+    response = api_client.get(
+        url,
+        {"exclude_hidden_fields": "", "search": "tesla", "count": ""},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json() == {"count": 0}
+
+    response = api_client.get(
+        url, {"search": "tesla"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert response_json["count"] == 2
+    assert response_json["results"][0][f"field_{hidden_field.id}"] == "Tesla"
+    assert response_json["results"][0][f"field_{link_field.id}"] == []
+
+
 @pytest.mark.django_db
 def test_list_rows_include_row_metadata(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -0,0 +1,141 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from baserow.contrib.database.db.copy import copy_rows_into_table, to_copy_text
+from baserow.contrib.database.fields.handler import FieldHandler
+
+
+def test_to_copy_text():
+    assert to_copy_text(None) == "\\N"
+    assert to_copy_text(True) == "t"
+    assert to_copy_text(False) == "f"
+    assert to_copy_text(10) == "10"
+    assert to_copy_text(Decimal("1.50")) == "1.50"
+    assert to_copy_text("a\tb\nc\rd\\e") == "a\\tb\\nc\\rd\\\\e"
+
+
+@pytest.mark.django_db
+def test_copy_rows_into_table(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, text_default="Default")
+    number_field = data_fixture.create_number_field(
+        table=table, number_type="DECIMAL", number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=select_field)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"concat(field('{text_field.name}'), '!')"
+    )
+    model = table.get_model()
+
+    rows = [
+        {
+            "order": 1,
+            f"field_{text_field.id}": "Tab\tnew\nline \\ backslash",
+            f"field_{number_field.id}": "1.5",
+            f"field_{boolean_field.id}": True,
+            f"field_{date_field.id}": date(2021, 1, 2),
+            f"field_{select_field.id}_id": option.id,
+        },
+        {"order": 2, f"field_{text_field.id}": None},
+        {"order": 3},
+    ]
+
+    # Two copy batches and one update of the formula field.
+    with django_assert_num_queries(3):
+        count = copy_rows_into_table(model, iter(rows), batch_size=2)
+
+    assert count == 3
+    row_1, row_2, row_3 = model.objects.all()
+    assert getattr(row_1, f"field_{text_field.id}") == "Tab\tnew\nline \\ backslash"
+    assert getattr(row_1, f"field_{number_field.id}") == Decimal("1.50")
+    assert getattr(row_1, f"field_{boolean_field.id}") is True
+    assert getattr(row_1, f"field_{date_field.id}") == date(2021, 1, 2)
+    assert getattr(row_1, f"field_{select_field.id}_id") == option.id
+    assert getattr(row_1, f"field_{formula_field.id}") == "Tab\tnew\nline \\ backslash!"
+    assert row_1.created_on is not None
+    assert row_1.updated_on is not None
+    assert getattr(row_2, f"field_{text_field.id}") is None
+    assert getattr(row_2, f"field_{boolean_field.id}") is False
+    assert getattr(row_3, f"field_{text_field.id}") == "Default"
+    assert getattr(row_3, f"field_{formula_field.id}") == "Default!"
+    assert [row.order for row in (row_1, row_2, row_3)] == [1, 2, 3]
+
+    # The ids are generated by the sequence, so creating a new row must work.
+    row_4 = model.objects.create()
+    assert row_4.id == row_3.id + 1
+
+
+@pytest.mark.django_db
+def test_copy_rows_into_table_with_ids(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+
+    count = copy_rows_into_table(
+        model,
+        [
+            {"id": 10, "order": 1, f"field_{text_field.id}": "a"},
+            {"id": 5, "order": 2, f"field_{text_field.id}": "b"},
+        ],
+    )
+
+    assert count == 2
+    assert list(
+        model.objects.values_list("id", f"field_{text_field.id}").order_by("id")
+    ) == [(5, "b"), (10, "a")]
+
+
+@pytest.mark.django_db
+def test_copy_rows_into_table_with_many_to_many_values(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(database=table.database)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+    select_field = data_fixture.create_multiple_select_field(table=table)
+    option_1 = data_fixture.create_select_option(field=select_field)
+    option_2 = data_fixture.create_select_option(field=select_field)
+    related_model = related_table.get_model()
+    related_row_1 = related_model.objects.create()
+    related_row_2 = related_model.objects.create()
+    model = table.get_model()
+
+    rows = [
+        {
+            "id": 1,
+            "order": 1,
+            f"field_{link_field.id}": [related_row_2.id, related_row_1.id],
+            f"field_{select_field.id}": [option_1.id],
+        },
+        {"id": 2, "order": 2, f"field_{link_field.id}": []},
+        {"id": 3, "order": 3, f"field_{select_field.id}": [option_2.id, option_2.id]},
+    ]
+
+    # Per batch one copy and one insert per many to many field having values.
+    with django_assert_num_queries(5):
+        count = copy_rows_into_table(model, iter(rows), batch_size=2)
+
+    assert count == 3
+    row_1, row_2, row_3 = model.objects.all()
+    assert [row.id for row in getattr(row_1, f"field_{link_field.id}").all()] == [
+        related_row_1.id,
+        related_row_2.id,
+    ]
+    assert [
+        option.id for option in getattr(row_1, f"field_{select_field.id}").all()
+    ] == [option_1.id]
+    assert getattr(row_2, f"field_{link_field.id}").count() == 0
+    assert [
+        option.id for option in getattr(row_3, f"field_{select_field.id}").all()
+    ] == [option_2.id]
+
+    with pytest.raises(ValueError):
+        copy_rows_into_table(model, [{f"field_{link_field.id}": [related_row_1.id]}])
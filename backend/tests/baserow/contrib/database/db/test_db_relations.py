@@ -0,0 +1,80 @@
+import pytest
+
+from baserow.contrib.database.db.relations import set_many_to_many_relations
+from baserow.contrib.database.fields.handler import FieldHandler
+
+
+@pytest.mark.django_db
+def test_set_many_to_many_relations(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    customers_table = data_fixture.create_database_table(database=table.database)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Customers", link_row_table=customers_table
+    )
+    customers_model = customers_table.get_model()
+    c_1, c_2, c_3 = [customers_model.objects.create() for _ in range(3)]
+    model = table.get_model()
+    row_1, row_2 = model.objects.create(), model.objects.create()
+    name = f"field_{link_field.id}"
+
+    def related_ids(row):
+        return [related.id for related in getattr(row, name).order_by("id")]
+
+    def related_ids_in_relation_order(row):
+        through_model = model._meta.get_field(name).remote_field.through
+        related_column = model._meta.get_field(name).m2m_reverse_name()
+        return list(
+            through_model.objects.filter(
+                **{model._meta.get_field(name).m2m_column_name(): row.id}
+            )
+            .order_by("id")
+            .values_list(related_column, flat=True)
+        )
+
+    with django_assert_num_queries(1):
+        set_many_to_many_relations(
+            model, name, {row_1.id: [c_2.id, c_1.id], row_2.id: [c_3.id]}, False
+        )
+    assert related_ids_in_relation_order(row_1) == [c_2.id, c_1.id]
+    assert related_ids(row_2) == [c_3.id]
+
+    # Existing relations are kept, so the order of the related rows doesn't change.
+    with django_assert_num_queries(2):
+        set_many_to_many_relations(
+            model, name, {row_1.id: [c_3.id, c_1.id, c_2.id], row_2.id: []}, True
+        )
+    assert related_ids_in_relation_order(row_1) == [c_2.id, c_1.id, c_3.id]
+    assert related_ids(row_2) == []
+
+    with django_assert_num_queries(2):
+        set_many_to_many_relations(model, name, {row_1.id: [c_1.id]}, True)
+    assert related_ids(row_1) == [c_1.id]
+
+    with django_assert_num_queries(1):
+        set_many_to_many_relations(model, name, {row_1.id: []}, True)
+    assert related_ids(row_1) == []
+
+    with django_assert_num_queries(0):
+        set_many_to_many_relations(model, name, {}, True)
+
+
+@pytest.mark.django_db
+def test_set_many_to_many_relations_multiple_select(data_fixture):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_multiple_select_field(table=table)
+    option_1 = data_fixture.create_select_option(field=field)
+    option_2 = data_fixture.create_select_option(field=field)
+    model = table.get_model()
+    row = model.objects.create()
+    name = f"field_{field.id}"
+
+    set_many_to_many_relations(model, name, {row.id: [option_1.id]}, False)
+    set_many_to_many_relations(model, name, {row.id: [option_1.id, option_2.id]}, False)
+    assert [option.id for option in getattr(row, name).order_by("id")] == [
+        option_1.id,
+        option_2.id,
+    ]
+
+    set_many_to_many_relations(model, name, {row.id: [option_2.id]}, True)
+    assert [option.id for option in getattr(row, name).all()] == [option_2.id]
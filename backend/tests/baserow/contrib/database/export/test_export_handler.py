@@ -20,6 +20,7 @@ from baserow.contrib.database.export.exceptions import (
     ViewUnsupportedForExporterType,
     ExportJobCanceledException,
 )
+from baserow.contrib.database.export.file_writer import PaginatedExportJobFileWriter
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import (
     EXPORT_JOB_CANCELLED_STATUS,
@@ -644,6 +645,84 @@ def test_adding_more_rows_doesnt_increase_number_of_queries_run(
         run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_rows_are_exported_in_chunks(storage_mock, data_fixture):
+    add_row, add_linked_row, user, table, grid_view = setup_testing_table(data_fixture)
+
+    linked_row_1 = add_linked_row("linked_row_1")
+    linked_row_2 = add_linked_row("linked_row_2")
+    for i in range(5):
+        add_row(
+            f"row_{i}",
+            "2020-02-01 01:23",
+            "A" if i % 2 else "B",
+            i,
+            [{"name": "hashed_name.txt", "visible_name": "a.txt"}],
+            [linked_row_1.id, linked_row_2.id] if i % 2 else [linked_row_1.id],
+        )
+
+    _, expected = run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
+
+    with patch.object(PaginatedExportJobFileWriter, "CHUNK_SIZE", 2):
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    assert contents == expected
+    assert '"linked_row_1,linked_row_2"' in contents
+    job.refresh_from_db()
+    assert job.status == EXPORT_JOB_COMPLETED_STATUS
+    assert job.progress_percentage == 1.0
+
+
+@pytest.mark.django_db
+@patch.object(PaginatedExportJobFileWriter, "CHUNK_SIZE", 2)
+def test_write_rows_prefetches_per_chunk_and_flags_last_row(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    option_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=option_field)
+    model = table.get_model()
+    for i in range(5):
+        model.objects.create(**{f"field_{option_field.id}": option})
+    job = ExportJob.objects.create(
+        user=user,
+        table=table,
+        exporter_type="csv",
+        status=EXPORT_JOB_EXPORTING_STATUS,
+        export_options={},
+    )
+    file_writer = PaginatedExportJobFileWriter(BytesIO(), job)
+    queryset = model.objects.all().enhance_by_fields()
+
+    written = []
+
+    def write_row(row, is_last_row):
+        written.append((row.id, getattr(row, f"field_{option_field.id}"), is_last_row))
+
+    # The estimate, the server side cursor, the select options for each of the three
+    # chunks and refreshing and saving the job for the last row.
+    with django_assert_num_queries(7):
+        file_writer.write_rows(queryset, write_row)
+
+    assert [row_id for row_id, _, _ in written] == list(
+        model.objects.values_list("id", flat=True)
+    )
+    assert all(value.id == option.id for _, value, _ in written)
+    assert [is_last_row for _, _, is_last_row in written] == [
+        False,
+        False,
+        False,
+        False,
+        True,
+    ]
+    job.refresh_from_db()
+    assert job.progress_percentage == 1.0
+
+
 @pytest.mark.django_db
 def test_creating_job_with_view_that_is_not_in_the_table(
     data_fixture,
@@ -0,0 +1,280 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from freezegun import freeze_time
+
+from baserow.contrib.database.fields.conversion import (
+    add_shadow_column,
+    backfill_shadow_column,
+    drop_shadow_column,
+)
+from baserow.contrib.database.fields.exceptions import (
+    FieldChangedDuringConversion,
+    FieldConversionJobAlreadyRunning,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import (
+    BooleanField,
+    NumberField,
+    SingleSelectField,
+    FIELD_CONVERSION_JOB_COMPLETED_STATUS,
+    FIELD_CONVERSION_JOB_CONVERTING_STATUS,
+    FIELD_CONVERSION_JOB_FAILED_STATUS,
+    FIELD_CONVERSION_JOB_PENDING_STATUS,
+)
+from baserow.contrib.database.fields.tasks import (
+    clean_up_stale_field_conversion_jobs,
+)
+
+
+def get_columns(table):
+    with connection.cursor() as cursor:
+        return [
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, table.get_database_table_name()
+            )
+        ]
+
+
+def get_conversion_objects(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT proname FROM pg_proc WHERE proname LIKE %(prefix)s
+            UNION ALL
+            SELECT tgname FROM pg_trigger WHERE tgname LIKE %(prefix)s
+            """,
+            {"prefix": f"{table.get_database_table_name()}_%"},
+        )
+        return cursor.fetchall()
+
+
+@pytest.mark.django_db
+def test_run_conversion_job(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Amount")
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": value})
+        for value in ["12", "abc", None, "1.5", "42"]
+    ]
+
+    handler = FieldHandler()
+    job = handler.create_conversion_job(
+        user, field, "number", name="Price", number_type="DECIMAL"
+    )
+    assert job.status == FIELD_CONVERSION_JOB_PENDING_STATUS
+    assert job.progress_percentage == 0.0
+
+    with pytest.raises(FieldConversionJobAlreadyRunning):
+        handler.create_conversion_job(user, field, "boolean")
+
+    progress = []
+    original_save = job.save
+
+    def save(*args, **kwargs):
+        progress.append(job.progress_percentage)
+        original_save(*args, **kwargs)
+
+    job.save = save
+    with patch("baserow.contrib.database.fields.conversion.CONVERSION_BATCH_SIZE", 2):
+        field = handler.run_conversion_job(job)
+
+    job.refresh_from_db()
+    assert job.status == FIELD_CONVERSION_JOB_COMPLETED_STATUS
+    assert job.progress_percentage == 1.0
+    assert progress == [0.0, 0.4, 0.8, 1.0, 1.0]
+
+    assert isinstance(field, NumberField)
+    assert field.name == "Price"
+    assert field.number_decimal_places == 1
+    assert f"field_{field.id}_conversion" not in get_columns(table)
+    assert get_conversion_objects(table) == []
+
+    model = table.get_model()
+    assert [
+        getattr(row, f"field_{field.id}")
+        for row in model.objects.filter(id__in=[row.id for row in rows])
+    ] == [Decimal("12.0"), None, Decimal("0.0"), Decimal("1.5"), Decimal("42.0")]
+
+
+@pytest.mark.django_db
+def test_shadow_column_is_kept_up_to_date(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "yes"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "abc"})
+
+    conversion = FieldHandler()._get_column_conversion(user, field, "boolean", {})
+    add_shadow_column(
+        conversion.model,
+        conversion.model_field,
+        conversion.shadow_model_field,
+        conversion.try_cast_sql,
+    )
+    assert f"field_{field.id}_conversion" in get_columns(table)
+
+    # Rows that are written before their batch has been converted and rows that are
+    # created after the backfill started are converted by the trigger.
+    row_3 = model.objects.create(**{f"field_{field.id}": "true"})
+    setattr(row_2, f"field_{field.id}", "on")
+    row_2.save()
+
+    progress = []
+    with patch("baserow.contrib.database.fields.conversion.CONVERSION_BATCH_SIZE", 1):
+        converted = backfill_shadow_column(
+            conversion.model,
+            conversion.model_field,
+            conversion.shadow_model_field,
+            lambda *args: progress.append(args),
+        )
+
+    assert converted == 3
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    setattr(row_1, f"field_{field.id}", "invalid")
+    row_1.save()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT id, field_{field.id}_conversion FROM "
+            f"{table.get_database_table_name()} ORDER BY id"
+        )
+        assert cursor.fetchall() == [
+            (row_1.id, False),
+            (row_2.id, True),
+            (row_3.id, True),
+        ]
+
+    drop_shadow_column(
+        conversion.model, conversion.model_field.column, f"field_{field.id}_conversion"
+    )
+    assert f"field_{field.id}_conversion" not in get_columns(table)
+    assert get_conversion_objects(table) == []
+
+
+@pytest.mark.django_db
+def test_run_conversion_job_field_changed(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{field.id}": "1"})
+
+    handler = FieldHandler()
+    job = handler.create_conversion_job(user, field, "boolean")
+
+    def change_field(*args):
+        handler.update_field(user, field, "number")
+
+    with patch(
+        "baserow.contrib.database.fields.handler.backfill_shadow_column",
+        side_effect=change_field,
+    ):
+        with pytest.raises(FieldChangedDuringConversion):
+            handler.run_conversion_job(job)
+
+    job.refresh_from_db()
+    assert job.status == FIELD_CONVERSION_JOB_FAILED_STATUS
+    assert "has been changed while it was being converted" in job.error
+    assert f"field_{field.id}_conversion" not in get_columns(table)
+    assert get_conversion_objects(table) == []
+
+
+@pytest.mark.django_db
+def test_run_conversion_job_without_shadow_column(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field.id}": "Red"})
+
+    handler = FieldHandler()
+
+    # The select options only exist after the field has been updated, so the values
+    # are converted by altering the column.
+    assert (
+        handler._get_column_conversion(
+            user, field, "single_select", {"select_options": []}
+        )
+        is None
+    )
+    # The column doesn't have to be converted when only the name changes.
+    assert handler._get_column_conversion(user, boolean_field, None, {}) is None
+
+    job = handler.create_conversion_job(
+        user,
+        field,
+        "single_select",
+        select_options=[{"value": "Red", "color": "red"}],
+    )
+    with patch(
+        "baserow.contrib.database.fields.handler.add_shadow_column"
+    ) as add_shadow_column_mock:
+        field = handler.run_conversion_job(job)
+
+    add_shadow_column_mock.assert_not_called()
+    job.refresh_from_db()
+    assert job.status == FIELD_CONVERSION_JOB_COMPLETED_STATUS
+    assert isinstance(field, SingleSelectField)
+    row = table.get_model().objects.get(id=row.id)
+    assert getattr(row, f"field_{field.id}").value == "Red"
+
+    job = handler.create_conversion_job(user, boolean_field, name="Checked")
+    boolean_field = handler.run_conversion_job(job)
+    assert isinstance(boolean_field, BooleanField)
+    assert boolean_field.name == "Checked"
+
+
+@pytest.mark.django_db
+def test_clean_up_stale_conversion_jobs(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    other_field = data_fixture.create_text_field(table=table)
+    handler = FieldHandler()
+
+    # The worker of this job is killed after adding the shadow column.
+    with freeze_time("2021-01-01 12:00"):
+        job = handler.create_conversion_job(user, field, "boolean")
+        with patch(
+            "baserow.contrib.database.fields.handler.backfill_shadow_column",
+            side_effect=SystemExit,
+        ), pytest.raises(SystemExit):
+            handler.run_conversion_job(job)
+        pending_job = handler.create_conversion_job(user, other_field, "boolean")
+
+    job.refresh_from_db()
+    assert job.status == FIELD_CONVERSION_JOB_CONVERTING_STATUS
+    assert f"field_{field.id}_conversion" in get_columns(table)
+    assert get_conversion_objects(table) != []
+
+    with freeze_time("2021-01-01 12:30"):
+        with pytest.raises(FieldConversionJobAlreadyRunning):
+            handler.create_conversion_job(user, field, "number")
+        clean_up_stale_field_conversion_jobs()
+
+    job.refresh_from_db()
+    assert job.status == FIELD_CONVERSION_JOB_CONVERTING_STATUS
+
+    with freeze_time("2021-01-01 14:00"):
+        # Jobs exceeding the time limit are not considered to be running anymore.
+        new_job = handler.create_conversion_job(user, field, "number")
+        clean_up_stale_field_conversion_jobs()
+
+    job.refresh_from_db()
+    assert job.status == FIELD_CONVERSION_JOB_FAILED_STATUS
+    assert job.error == "The conversion did not finish within the time limit."
+    pending_job.refresh_from_db()
+    assert pending_job.status == FIELD_CONVERSION_JOB_FAILED_STATUS
+    new_job.refresh_from_db()
+    assert new_job.status == FIELD_CONVERSION_JOB_PENDING_STATUS
+    assert f"field_{field.id}_conversion" not in get_columns(table)
+    assert get_conversion_objects(table) == []
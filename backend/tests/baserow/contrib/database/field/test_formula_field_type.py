@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 import pytest
+from django.test.utils import override_settings
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.registries import field_type_registry
@@ -8,6 +11,10 @@ from baserow.contrib.database.formula.parser.ast_mapper import (
 from baserow.contrib.database.formula.types.formula_type import (
     BaserowFormulaInvalidType,
 )
+from baserow.contrib.database.formula.tasks import recalculate_field_values
+from baserow.contrib.database.formula.types.typed_field_updater import (
+    recalculate_field_values_in_chunks,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.handler import ViewHandler
 
@@ -274,3 +281,79 @@ def test_formula_with_row_id_is_populated_after_creating_row(
 
     row = RowHandler().create_row(user=user, table=table)
     assert getattr(row, f"field_{formula_field.id}") == row.id
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.fields.signals.field_updated.send")
+def test_formula_values_of_large_tables_are_recalculated_in_the_background(
+    send_mock, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Formula", formula="field('Text')"
+    )
+    model = table.get_model()
+    rows = [
+        RowHandler().create_row(
+            user=user, table=table, model=model, values={text_field.id: f"row {i}"}
+        )
+        for i in range(5)
+    ]
+
+    with override_settings(FORMULA_BACKGROUND_RECALCULATION_THRESHOLD=0), patch(
+        "baserow.contrib.database.formula.tasks.recalculate_field_values.delay"
+    ) as delay_mock, django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(
+            user, formula_field, formula="concat(field('Text'), '!')"
+        )
+
+    delay_mock.assert_called_once_with(table.id, [formula_field.id])
+    # The values are only recalculated when the background task runs.
+    for index, row in enumerate(rows):
+        row.refresh_from_db()
+        assert getattr(row, f"field_{formula_field.id}") != f"row {index}!"
+
+    send_mock.reset_mock()
+    with override_settings(FORMULA_RECALCULATION_CHUNK_SIZE=2):
+        recalculate_field_values(table.id, [formula_field.id])
+
+    for index, row in enumerate(rows):
+        row.refresh_from_db()
+        assert getattr(row, f"field_{formula_field.id}") == f"row {index}!"
+    send_mock.assert_called_once()
+    assert send_mock.call_args[1]["field"].id == formula_field.id
+    assert send_mock.call_args[1]["user"] is None
+
+
+@pytest.mark.django_db
+def test_recalculate_field_values_in_chunks(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Formula", formula="field('Text')"
+    )
+    trashed_formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Trashed", formula="field('Text')"
+    )
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{text_field.id}": f"row {i}"}) for i in range(5)
+    ]
+    rows[0].trashed = True
+    rows[0].save()
+    model.objects_and_trash.update(**{f"field_{formula_field.id}": None})
+    FieldHandler().delete_field(user, trashed_formula_field)
+
+    fields = recalculate_field_values_in_chunks(
+        table, [formula_field.id, trashed_formula_field.id, 99999], chunk_size=2
+    )
+
+    assert [field.id for field in fields] == [formula_field.id]
+    for index, row in enumerate(rows):
+        row.refresh_from_db()
+        assert getattr(row, f"field_{formula_field.id}") == f"row {index}"
+
+    assert recalculate_field_values_in_chunks(table, [99999]) == []
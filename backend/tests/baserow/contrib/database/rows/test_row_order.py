@@ -0,0 +1,60 @@
+from decimal import Decimal
+
+import pytest
+
+from baserow.contrib.database.db.copy import copy_rows_into_table
+from baserow.contrib.database.rows.order import (
+    get_orders_between,
+    row_order_allocator,
+)
+
+
+@pytest.mark.django_db
+def test_row_order_allocator(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    row_order_allocator.reset(table.id)
+
+    assert row_order_allocator.allocate(model) == [Decimal("1")]
+    assert row_order_allocator.allocate(model, 2) == [Decimal("2"), Decimal("3")]
+
+    # Rows created without the allocator are not known until the counter is reset.
+    model.objects.create(order=Decimal("10.5"))
+    assert row_order_allocator.allocate(model) == [Decimal("4")]
+    row_order_allocator.reset(table.id)
+    assert row_order_allocator.reserve(model, 3) == 12
+    assert row_order_allocator.allocate(model) == [Decimal("15")]
+
+    # Trashed rows keep their order, so the new orders must be after them.
+    model.objects.create(order=Decimal("20"), trashed=True)
+    row_order_allocator.reset(table.id)
+    assert row_order_allocator.allocate(model) == [Decimal("21")]
+
+    # Copying rows into the table resets the counter.
+    copy_rows_into_table(model, [{"order": Decimal("30")}])
+    assert row_order_allocator.allocate(model) == [Decimal("31")]
+
+
+def test_get_orders_between():
+    assert get_orders_between(Decimal("1"), Decimal("2"), 1) == [Decimal("1.5")]
+    assert get_orders_between(Decimal("1"), Decimal("2"), 3) == [
+        Decimal("1.25"),
+        Decimal("1.5"),
+        Decimal("1.75"),
+    ]
+    # The lower order is never more than 1 below the upper order.
+    assert get_orders_between(None, Decimal("1"), 1) == [Decimal("0.5")]
+    assert get_orders_between(Decimal("1"), Decimal("10"), 1) == [Decimal("9.5")]
+    # Large orders don't lose precision.
+    assert get_orders_between(
+        Decimal("12345678901234567890"), Decimal("12345678901234567891"), 1
+    ) == [Decimal("12345678901234567890.5")]
+    assert get_orders_between(Decimal("1.99999999999999999998"), Decimal("2"), 1) == [
+        Decimal("1.99999999999999999999")
+    ]
+    assert (
+        get_orders_between(Decimal("1.99999999999999999999"), Decimal("2"), 1) is None
+    )
+    assert (
+        get_orders_between(Decimal("1.99999999999999999998"), Decimal("2"), 2) is None
+    )
@@ -3,11 +3,15 @@ from unittest.mock import patch
 
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
 
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.exceptions import RowDoesNotExist, RowIdsNotUnique
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInGroup
+from baserow.core.models import TrashEntry
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -173,7 +177,7 @@ def test_create_row(send_mock, data_fixture):
     row_2.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
     assert send_mock.call_args[1]["before"].id == row_2.id
 
     row_4 = handler.create_row(user=user, table=table, before=row_2)
@@ -182,8 +186,8 @@ def test_create_row(send_mock, data_fixture):
     row_3.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999998")
-    assert row_4.order == Decimal("1.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
 
     row_5 = handler.create_row(user=user, table=table, before=row_3)
     row_1.refresh_from_db()
@@ -192,9 +196,9 @@ def test_create_row(send_mock, data_fixture):
     row_4.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999998")
-    assert row_4.order == Decimal("1.99999999999999999999")
-    assert row_5.order == Decimal("1.99999999999999999997")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
+    assert row_5.order == Decimal("1.25000000000000000000")
 
     row_6 = handler.create_row(user=user, table=table, before=row_2)
     row_1.refresh_from_db()
@@ -204,10 +208,10 @@ def test_create_row(send_mock, data_fixture):
     row_5.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999997")
-    assert row_4.order == Decimal("1.99999999999999999998")
-    assert row_5.order == Decimal("1.99999999999999999996")
-    assert row_6.order == Decimal("1.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
+    assert row_5.order == Decimal("1.25000000000000000000")
+    assert row_6.order == Decimal("1.87500000000000000000")
 
     row_7 = handler.create_row(user, table=table, before=row_1)
     row_1.refresh_from_db()
@@ -218,11 +222,11 @@ def test_create_row(send_mock, data_fixture):
     row_6.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999997")
-    assert row_4.order == Decimal("1.99999999999999999998")
-    assert row_5.order == Decimal("1.99999999999999999996")
-    assert row_6.order == Decimal("1.99999999999999999999")
-    assert row_7.order == Decimal("0.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
+    assert row_5.order == Decimal("1.25000000000000000000")
+    assert row_6.order == Decimal("1.87500000000000000000")
+    assert row_7.order == Decimal("0.50000000000000000000")
 
     with pytest.raises(ValidationError):
         handler.create_row(user=user, table=table, values={price_field.id: -10.22})
@@ -399,7 +403,7 @@ def test_move_row(before_send_mock, send_mock, data_fixture):
     row_1.refresh_from_db()
     row_2.refresh_from_db()
     row_3.refresh_from_db()
-    assert row_1.order == Decimal("2.99999999999999999999")
+    assert row_1.order == Decimal("2.50000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
     assert row_3.order == Decimal("3.00000000000000000000")
 
@@ -590,3 +594,676 @@ def test_has_row(data_fixture):
 
     assert handler.has_row(user=user, table=table, row_id=row.id, raise_error=False)
     assert handler.has_row(user=user, table=table, row_id=row.id, raise_error=True)
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_created.send")
+def test_create_rows(send_mock, data_fixture):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    name_field = data_fixture.create_text_field(
+        table=table, name="Name", text_default="Test", primary=True
+    )
+    speed_field = data_fixture.create_number_field(
+        table=table, name="Max speed", number_negative=True
+    )
+    price_field = data_fixture.create_number_field(
+        table=table, name="Price", number_negative=False
+    )
+    customers_table = data_fixture.create_database_table(
+        name="Customers", database=table.database
+    )
+    customers_primary = data_fixture.create_text_field(
+        table=customers_table, primary=True
+    )
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Customers", link_row_table=customers_table
+    )
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_1 = data_fixture.create_select_option(field=multiple_select_field)
+    option_2 = data_fixture.create_select_option(field=multiple_select_field)
+    formula_field = FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="Formula",
+        formula="concat(field('Name'), row_id())",
+    )
+
+    customers_model = customers_table.get_model()
+    customer_1 = customers_model.objects.create(
+        **{f"field_{customers_primary.id}": "John"}
+    )
+    customer_2 = customers_model.objects.create(
+        **{f"field_{customers_primary.id}": "Jane"}
+    )
+
+    handler = RowHandler()
+
+    with pytest.raises(UserNotInGroup):
+        handler.create_rows(user=user_2, table=table, rows_values=[{}])
+
+    row_1, row_2 = handler.create_rows(
+        user=user,
+        table=table,
+        rows_values=[
+            {
+                name_field.id: "Tesla",
+                speed_field.id: 240,
+                f"field_{link_field.id}": [customer_2.id, customer_1.id],
+                f"field_{multiple_select_field.id}": [option_1.id],
+            },
+            {
+                f"field_{multiple_select_field.id}": [option_2.id, option_1.id],
+            },
+        ],
+    )
+
+    assert getattr(row_1, f"field_{name_field.id}") == "Tesla"
+    assert getattr(row_1, f"field_{speed_field.id}") == 240
+    assert getattr(row_1, f"field_{formula_field.id}") == f"Tesla{row_1.id}"
+    assert [r.id for r in getattr(row_1, f"field_{link_field.id}").all()] == [
+        customer_1.id,
+        customer_2.id,
+    ]
+    assert [
+        o.id for o in getattr(row_1, f"field_{multiple_select_field.id}").all()
+    ] == [option_1.id]
+    assert row_1.order == Decimal("1.00000000000000000000")
+    assert getattr(row_2, f"field_{name_field.id}") == "Test"
+    assert getattr(row_2, f"field_{formula_field.id}") == f"Test{row_2.id}"
+    assert getattr(row_2, f"field_{link_field.id}").count() == 0
+    assert [
+        o.id for o in getattr(row_2, f"field_{multiple_select_field.id}").all()
+    ] == [
+        option_2.id,
+        option_1.id,
+    ]
+    assert row_2.order == Decimal("2.00000000000000000000")
+
+    # The related rows must also be visible from the other side of the relation.
+    assert [
+        r.id
+        for r in getattr(
+            customer_2, f"field_{link_field.link_row_related_field.id}"
+        ).all()
+    ] == [row_1.id]
+
+    send_mock.assert_called_once()
+    assert [r.id for r in send_mock.call_args[1]["rows"]] == [row_1.id, row_2.id]
+    assert send_mock.call_args[1]["user"].id == user.id
+    assert send_mock.call_args[1]["table"].id == table.id
+    assert send_mock.call_args[1]["before"] is None
+    assert send_mock.call_args[1]["model"]._generated_table_model
+
+    row_3, row_4 = handler.create_rows(
+        user=user, table=table, rows_values=[{}, {}], before=row_2
+    )
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert row_1.order == Decimal("1.00000000000000000000")
+    assert row_2.order == Decimal("2.00000000000000000000")
+    assert row_3.order == Decimal("1.33333333333333333333")
+    assert row_4.order == Decimal("1.66666666666666666667")
+    assert send_mock.call_args[1]["before"].id == row_2.id
+
+    (row_5,) = handler.create_rows(
+        user=user,
+        table=table,
+        rows_values=[{"Name": "Audi"}],
+        before=row_3,
+        user_field_names=True,
+    )
+    row_3.refresh_from_db()
+    row_4.refresh_from_db()
+    assert getattr(row_5, f"field_{name_field.id}") == "Audi"
+    assert row_3.order == Decimal("1.33333333333333333333")
+    assert row_4.order == Decimal("1.66666666666666666667")
+    assert row_5.order == Decimal("1.16666666666666666666")
+
+    with pytest.raises(ValidationError):
+        handler.create_rows(
+            user=user, table=table, rows_values=[{}, {price_field.id: -10}]
+        )
+
+    model = table.get_model()
+    assert [row.id for row in model.objects.all()] == [
+        row_1.id,
+        row_5.id,
+        row_3.id,
+        row_4.id,
+        row_2.id,
+    ]
+    assert handler.create_rows(user=user, table=table, rows_values=[]) == []
+
+
+@pytest.mark.django_db
+def test_create_rows_number_of_queries(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    customers_table = data_fixture.create_database_table(database=table.database)
+    data_fixture.create_text_field(table=customers_table, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Customers", link_row_table=customers_table
+    )
+    customers_model = customers_table.get_model()
+    customer = customers_model.objects.create()
+    model = table.get_model()
+    handler = RowHandler()
+
+    def create_rows(count):
+        handler.create_rows(
+            user,
+            table,
+            [{f"field_{link_field.id}": [customer.id]} for _ in range(count)],
+            model=model,
+        )
+
+    # The first call initializes the row order counter of the table.
+    create_rows(1)
+
+    with CaptureQueriesContext(connection) as one_row_queries:
+        create_rows(1)
+
+    with django_assert_num_queries(len(one_row_queries)):
+        create_rows(50)
+
+    assert model.objects.count() == 52
+
+
+@pytest.mark.django_db
+def test_update_row_only_recalculates_depending_expression_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name", primary=True)
+    color_field = data_fixture.create_text_field(table=table, name="Color")
+    name_formula = FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="Name formula",
+        formula="concat(field('Name'), '!')",
+    )
+    nested_formula = FieldHandler().create_field(
+        user, table, "formula", name="Nested", formula="upper(field('Name formula'))"
+    )
+    color_formula = FieldHandler().create_field(
+        user, table, "formula", name="Color formula", formula="lower(field('Color'))"
+    )
+
+    model = table.get_model()
+    assert model.fields_requiring_refresh_after_update([f"field_{name_field.id}"]) == [
+        f"field_{name_formula.id}",
+        f"field_{nested_formula.id}",
+    ]
+    assert model.fields_requiring_refresh_after_update([f"field_{color_field.id}"]) == [
+        f"field_{color_formula.id}"
+    ]
+    assert model.fields_requiring_refresh_after_update(["order"]) == []
+    assert len(model.fields_requiring_refresh_after_update()) == 3
+
+    handler = RowHandler()
+    row = handler.create_row(
+        user=user,
+        table=table,
+        model=model,
+        values={name_field.id: "Tesla", color_field.id: "Red"},
+    )
+    updated_on = row.updated_on
+
+    with CaptureQueriesContext(connection) as captured:
+        row = handler.update_row(
+            user=user,
+            table=table,
+            row_id=row.id,
+            model=model,
+            values={name_field.id: "Audi"},
+        )
+
+    update_query = next(
+        query["sql"] for query in captured if query["sql"].startswith("UPDATE")
+    )
+    assert f"field_{name_formula.id}" in update_query
+    assert f"field_{nested_formula.id}" in update_query
+    assert f"field_{color_field.id}" not in update_query
+    assert f"field_{color_formula.id}" not in update_query
+    assert getattr(row, f"field_{name_formula.id}") == "Audi!"
+    assert getattr(row, f"field_{nested_formula.id}") == "AUDI!"
+    assert getattr(row, f"field_{color_formula.id}") == "red"
+    assert row.updated_on > updated_on
+
+    row = handler.update_row(
+        user=user,
+        table=table,
+        row_id=row.id,
+        model=model,
+        values={color_field.id: "Blue"},
+    )
+    row.refresh_from_db()
+    assert getattr(row, f"field_{name_formula.id}") == "Audi!"
+    assert getattr(row, f"field_{nested_formula.id}") == "AUDI!"
+    assert getattr(row, f"field_{color_formula.id}") == "blue"
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+@patch("baserow.contrib.database.rows.signals.before_rows_update.send")
+def test_update_rows(before_send_mock, send_mock, data_fixture):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    name_field = data_fixture.create_text_field(
+        table=table, name="Name", text_default="Test", primary=True
+    )
+    speed_field = data_fixture.create_number_field(
+        table=table, name="Max speed", number_negative=True
+    )
+    price_field = data_fixture.create_number_field(
+        table=table, name="Price", number_negative=False
+    )
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_1 = data_fixture.create_select_option(field=multiple_select_field)
+    option_2 = data_fixture.create_select_option(field=multiple_select_field)
+    option_3 = data_fixture.create_select_option(field=multiple_select_field)
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Formula", formula="concat(field('Name'), '!')"
+    )
+
+    handler = RowHandler()
+    row_1 = handler.create_row(
+        user=user,
+        table=table,
+        values={
+            name_field.id: "Tesla",
+            speed_field.id: 240,
+            multiple_select_field.id: [option_1.id, option_2.id],
+        },
+    )
+    row_2 = handler.create_row(user=user, table=table, values={name_field.id: "Audi"})
+
+    with pytest.raises(UserNotInGroup):
+        handler.update_rows(user=user_2, table=table, rows_values=[{"id": row_1.id}])
+
+    with pytest.raises(RowDoesNotExist):
+        handler.update_rows(
+            user=user, table=table, rows_values=[{"id": row_1.id}, {"id": 99999}]
+        )
+
+    with pytest.raises(RowIdsNotUnique) as exc:
+        handler.update_rows(
+            user=user, table=table, rows_values=[{"id": row_1.id}, {"id": row_1.id}]
+        )
+    assert exc.value.ids == [row_1.id]
+
+    updated_row_2, updated_row_1 = handler.update_rows(
+        user=user,
+        table=table,
+        rows_values=[
+            {"id": row_2.id, f"field_{speed_field.id}": 120},
+            {
+                "id": row_1.id,
+                name_field.id: "Tesla Model 3",
+                multiple_select_field.id: [option_3.id, option_2.id],
+            },
+        ],
+    )
+
+    assert updated_row_1.id == row_1.id
+    assert getattr(updated_row_1, f"field_{name_field.id}") == "Tesla Model 3"
+    assert getattr(updated_row_1, f"field_{speed_field.id}") == 240
+    assert getattr(updated_row_1, f"field_{formula_field.id}") == "Tesla Model 3!"
+    # The already existing relation must be preserved so that it stays first.
+    assert [
+        o.id for o in getattr(updated_row_1, f"field_{multiple_select_field.id}").all()
+    ] == [option_2.id, option_3.id]
+    assert updated_row_2.id == row_2.id
+    assert getattr(updated_row_2, f"field_{name_field.id}") == "Audi"
+    assert getattr(updated_row_2, f"field_{speed_field.id}") == 120
+    assert getattr(updated_row_2, f"field_{formula_field.id}") == "Audi!"
+
+    row_1.refresh_from_db()
+    assert getattr(row_1, f"field_{name_field.id}") == "Tesla Model 3"
+    assert getattr(row_1, f"field_{formula_field.id}") == "Tesla Model 3!"
+
+    before_send_mock.assert_called_once()
+    assert [r.id for r in before_send_mock.call_args[1]["rows"]] == [
+        row_2.id,
+        row_1.id,
+    ]
+    assert before_send_mock.call_args[1]["user"].id == user.id
+    assert before_send_mock.call_args[1]["table"].id == table.id
+    assert before_send_mock.call_args[1]["model"]._generated_table_model
+
+    send_mock.assert_called_once()
+    assert [r.id for r in send_mock.call_args[1]["rows"]] == [row_2.id, row_1.id]
+    assert send_mock.call_args[1]["user"].id == user.id
+    assert send_mock.call_args[1]["table"].id == table.id
+    assert send_mock.call_args[1]["model"]._generated_table_model
+    assert send_mock.call_args[1]["before_return"] == before_send_mock.return_value
+
+    (updated_row_1,) = handler.update_rows(
+        user=user,
+        table=table,
+        rows_values=[{"id": row_1.id, "Name": "Tesla Model S"}],
+        user_field_names=True,
+    )
+    assert getattr(updated_row_1, f"field_{name_field.id}") == "Tesla Model S"
+
+    with pytest.raises(ValidationError):
+        handler.update_rows(
+            user=user,
+            table=table,
+            rows_values=[{"id": row_1.id, price_field.id: -10}],
+        )
+
+
+@pytest.mark.django_db
+def test_update_rows_updates_last_modified_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name", primary=True)
+    last_modified_field = data_fixture.create_last_modified_field(
+        table=table, date_include_time=True
+    )
+
+    handler = RowHandler()
+    with freeze_time("2021-01-01 12:00"):
+        row_1 = handler.create_row(user=user, table=table, values={})
+        row_2 = handler.create_row(user=user, table=table, values={})
+
+    with freeze_time("2021-02-01 12:00"):
+        updated_row_1, updated_row_2 = handler.update_rows(
+            user=user,
+            table=table,
+            rows_values=[
+                {"id": row_1.id, name_field.id: "Tesla"},
+                {"id": row_2.id, name_field.id: "Audi"},
+            ],
+        )
+
+    for row in [updated_row_1, updated_row_2]:
+        row.refresh_from_db()
+        assert row.updated_on.isoformat() == "2021-02-01T12:00:00+00:00"
+        assert (
+            getattr(row, f"field_{last_modified_field.id}").isoformat()
+            == "2021-02-01T12:00:00+00:00"
+        )
+
+
+@pytest.mark.django_db
+def test_update_row_refreshes_formulas_referencing_last_modified_fields(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name", primary=True)
+    field_handler = FieldHandler()
+    field_handler.create_field(
+        user, table, "last_modified", name="Last modified", date_include_time=True
+    )
+    formula_field = field_handler.create_field(
+        user, table, "formula", name="Formula", formula="totext(field('Last modified'))"
+    )
+
+    handler = RowHandler()
+    with freeze_time("2021-01-01 12:00"):
+        row_1 = handler.create_row(user=user, table=table, values={})
+        row_2 = handler.create_row(user=user, table=table, values={})
+
+    with freeze_time("2021-02-01 12:00"):
+        row_1 = handler.update_row(user, table, row_1.id, {name_field.id: "Tesla"})
+    assert getattr(row_1, f"field_{formula_field.id}") == "01/02/2021 12:00"
+
+    with freeze_time("2021-03-01 12:00"):
+        updated_row_1, updated_row_2 = handler.update_rows(
+            user=user,
+            table=table,
+            rows_values=[
+                {"id": row_1.id, name_field.id: "Audi"},
+                {"id": row_2.id, name_field.id: "BMW"},
+            ],
+        )
+    assert getattr(updated_row_1, f"field_{formula_field.id}") == "01/03/2021 12:00"
+    assert getattr(updated_row_2, f"field_{formula_field.id}") == "01/03/2021 12:00"
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_deleted.send")
+@patch("baserow.contrib.database.rows.signals.before_rows_delete.send")
+def test_delete_rows(before_send_mock, send_mock, data_fixture):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    name_field = data_fixture.create_text_field(
+        table=table, name="Name", text_default="Test", primary=True
+    )
+
+    handler = RowHandler()
+    model = table.get_model()
+    row_1 = handler.create_row(user=user, table=table, values={name_field.id: "Audi"})
+    row_2 = handler.create_row(user=user, table=table)
+    row_3 = handler.create_row(user=user, table=table)
+
+    with pytest.raises(UserNotInGroup):
+        handler.delete_rows(user=user_2, table=table, row_ids=[row_1.id])
+
+    with pytest.raises(RowDoesNotExist):
+        handler.delete_rows(user=user, table=table, row_ids=[row_1.id, 99999])
+
+    with pytest.raises(RowIdsNotUnique):
+        handler.delete_rows(user=user, table=table, row_ids=[row_1.id, row_1.id])
+
+    handler.delete_rows(user=user, table=table, row_ids=[row_1.id, row_2.id])
+    assert [row.id for row in model.objects.all()] == [row_3.id]
+    assert model.trash.all().count() == 2
+
+    trash_entries = TrashEntry.objects.filter(trash_item_type="row").order_by("id")
+    assert [(e.trash_item_id, e.parent_trash_item_id) for e in trash_entries] == [
+        (row_1.id, table.id),
+        (row_2.id, table.id),
+    ]
+    assert trash_entries[0].extra_description == "Audi"
+    assert trash_entries[1].extra_description == "Test"
+
+    before_send_mock.assert_called_once()
+    assert [r.id for r in before_send_mock.call_args[1]["rows"]] == [
+        row_1.id,
+        row_2.id,
+    ]
+    assert before_send_mock.call_args[1]["user"].id == user.id
+    assert before_send_mock.call_args[1]["table"].id == table.id
+    assert before_send_mock.call_args[1]["model"]._generated_table_model
+
+    send_mock.assert_called_once()
+    assert [r.id for r in send_mock.call_args[1]["rows"]] == [row_1.id, row_2.id]
+    assert send_mock.call_args[1]["user"].id == user.id
+    assert send_mock.call_args[1]["table"].id == table.id
+    assert send_mock.call_args[1]["model"]._generated_table_model
+    assert send_mock.call_args[1]["before_return"] == before_send_mock.return_value
+
+    with pytest.raises(RowDoesNotExist):
+        handler.delete_rows(user=user, table=table, row_ids=[row_1.id])
+
+    # Every row gets its own trash entry, so they can be restored individually.
+    TrashHandler.restore_item(user, "row", row_2.id, parent_trash_item_id=table.id)
+    assert [row.id for row in model.objects.all()] == [row_2.id, row_3.id]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.tasks.rebalance_row_orders.apply_async")
+def test_create_row_before_schedules_row_orders_rebalance(
+    mock_apply_async, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = RowHandler()
+    model = table.get_model()
+    handler.create_row(user=user, table=table, model=model)
+    row_2 = handler.create_row(user=user, table=table, model=model)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(30):
+            handler.create_row(user=user, table=table, model=model, before=row_2)
+    mock_apply_async.assert_not_called()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(10):
+            handler.create_row(user=user, table=table, model=model, before=row_2)
+    mock_apply_async.assert_called_once()
+    assert mock_apply_async.call_args[0][0] == (table.id, row_2.id)
+
+    # When there is no room left between the rows, the rows placed before the row
+    # are moved a fraction down.
+    table_2 = data_fixture.create_database_table(user=user)
+    model_2 = table_2.get_model()
+    row_3 = model_2.objects.create(order=Decimal("1.5"))
+    row_4 = model_2.objects.create(order=Decimal("1.50000000000000000001"))
+    with django_capture_on_commit_callbacks(execute=True):
+        row_5 = handler.create_row(user=user, table=table_2, before=row_4)
+    row_3.refresh_from_db()
+    assert row_3.order == Decimal("1.49999999999999999999")
+    assert row_5.order == Decimal("1.50000000000000000000")
+    assert [row.id for row in model_2.objects.all()] == [row_3.id, row_5.id, row_4.id]
+    assert mock_apply_async.call_count == 2
+    assert mock_apply_async.call_args[0][0] == (table_2.id, row_4.id)
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.row_orders_rebalanced.send")
+def test_rebalance_row_orders(send_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = RowHandler()
+    model = table.get_model()
+
+    assert handler.rebalance_row_orders(table, 1) == 0
+    send_mock.assert_not_called()
+
+    row_1 = model.objects.create(order=Decimal("1"))
+    row_2 = model.objects.create(order=Decimal("1.99999999999999999998"))
+    row_3 = model.objects.create(order=Decimal("1.99999999999999999999"), trashed=True)
+    row_4 = model.objects.create(order=Decimal("1.99999999999999999999"))
+    row_5 = model.objects.create(order=Decimal("2"))
+    row_6 = handler.create_row(user=user, table=table, model=model)
+
+    assert handler.rebalance_row_orders(table, row_1.id) == 0
+    send_mock.assert_not_called()
+
+    # All the rows before the row fit in the window, so the first row is moved down
+    # as well.
+    assert handler.rebalance_row_orders(table, row_5.id) == 4
+    send_mock.assert_called_once()
+    assert send_mock.call_args[1]["table"].id == table.id
+
+    rows = list(model.objects_and_trash.all())
+    assert [row.id for row in rows] == [
+        row_1.id,
+        row_2.id,
+        row_3.id,
+        row_4.id,
+        row_5.id,
+        row_6.id,
+    ]
+    assert [row.order for row in rows] == [
+        Decimal("0.4"),
+        Decimal("0.8"),
+        Decimal("1.2"),
+        Decimal("1.6"),
+        Decimal("2"),
+        Decimal("3"),
+    ]
+
+    row_4.refresh_from_db()
+    row_7 = handler.create_row(user=user, table=table, model=model, before=row_4)
+    assert row_7.order == Decimal("1.4")
+
+
+@pytest.mark.django_db
+def test_rebalance_row_orders_only_renumbers_a_window(data_fixture):
+    table = data_fixture.create_database_table()
+    handler = RowHandler()
+    model = table.get_model()
+    rows = [model.objects.create(order=Decimal(order)) for order in range(1, 101)]
+    # The rows inserted right before the last row don't leave enough room.
+    crowded = [
+        model.objects.create(order=Decimal("100") - Decimal(2) ** -index)
+        for index in range(1, 41)
+    ]
+
+    assert handler.rebalance_row_orders(table, rows[-1].id, max_window_size=32) == 32
+    # The window doubles until the rows in it can be spaced far enough apart.
+    assert handler.rebalance_row_orders(table, rows[-1].id) == 128
+
+    orders = list(model.objects.values_list("order", flat=True))
+    assert [row.id for row in model.objects.all()] == [
+        row.id for row in rows[:-1] + crowded + rows[-1:]
+    ]
+    # The rows before the window and the row itself keep their order.
+    assert orders[:11] == [Decimal(order) for order in range(1, 12)]
+    assert orders[-1] == Decimal("100")
+    assert all(
+        upper - lower >= Decimal("0.5") for lower, upper in zip(orders, orders[1:])
+    )
+
+
+@pytest.mark.django_db
+def test_update_row_link_row_number_of_queries(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    customers_table = data_fixture.create_database_table(database=table.database)
+    data_fixture.create_text_field(table=customers_table, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Customers", link_row_table=customers_table
+    )
+    customers_model = customers_table.get_model()
+    customers = [customers_model.objects.create() for _ in range(100)]
+    customer_ids = [customer.id for customer in customers]
+    model = table.get_model()
+    handler = RowHandler()
+    row = handler.create_row(user, table, model=model)
+
+    def update_row(related_ids):
+        handler.update_row(
+            user, table, row.id, {f"field_{link_field.id}": related_ids}, model=model
+        )
+
+    with CaptureQueriesContext(connection) as one_related_row_queries:
+        update_row(customer_ids[:1])
+
+    with django_assert_num_queries(len(one_related_row_queries)):
+        update_row(customer_ids[::-1])
+
+    related = getattr(row, f"field_{link_field.id}")
+    assert related.count() == 100
+
+    # Related rows that don't exist are ignored and the existing relations are kept
+    # in the same order.
+    update_row([customer_ids[1], 999999, customer_ids[0]])
+    through_model = model._meta.get_field(f"field_{link_field.id}").remote_field.through
+    assert (
+        list(
+            through_model.objects.filter(
+                **{
+                    model._meta.get_field(
+                        f"field_{link_field.id}"
+                    ).m2m_column_name(): row.id
+                }
+            )
+            .order_by("id")
+            .values_list(
+                model._meta.get_field(f"field_{link_field.id}").m2m_reverse_name(),
+                flat=True,
+            )
+        )
+        == [customer_ids[0], customer_ids[1]]
+    )
+
+    row_2 = handler.create_row(
+        user, table, {f"field_{link_field.id}": [999999, customer_ids[2]]}, model=model
+    )
+    assert [r.id for r in getattr(row_2, f"field_{link_field.id}").all()] == [
+        customer_ids[2]
+    ]
@@ -0,0 +1,178 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import override_settings
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.table.indexes import (
+    get_desired_field_indexes,
+    get_existing_field_indexes,
+    get_field_index_name,
+    update_field_indexes,
+)
+from baserow.contrib.database.table.tasks import update_field_indexes_task
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+def get_index_types(table):
+    return [
+        (index.field_id, index.index_type, index.usages)
+        for index in get_desired_field_indexes(table)
+    ]
+
+
+@pytest.mark.django_db
+def test_get_desired_field_indexes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    phone_field = data_fixture.create_phone_number_field(table=table)
+    file_field = data_fixture.create_file_field(table=table)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=False)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    view_1 = data_fixture.create_grid_view(table=table)
+    view_2 = data_fixture.create_grid_view(table=table)
+    view_3 = data_fixture.create_grid_view(table=table, filters_disabled=True)
+
+    assert get_index_types(table) == []
+
+    for view in [view_1, view_2, view_3]:
+        data_fixture.create_view_filter(
+            view=view, field=number_field, type="higher_than", value="1"
+        )
+    data_fixture.create_view_sort(view=view_1, field=number_field, order="DESC")
+    data_fixture.create_view_filter(view=view_1, field=text_field, type="equal")
+    data_fixture.create_view_filter(view=view_1, field=text_field, type="not_equal")
+    data_fixture.create_view_filter(view=view_1, field=text_field, type="contains")
+    data_fixture.create_view_sort(view=view_2, field=text_field)
+    data_fixture.create_view_filter(view=view_2, field=phone_field, type="equal")
+    data_fixture.create_view_filter(
+        view=view_1, field=file_field, type="has_file_type", value="image"
+    )
+    data_fixture.create_view_filter(
+        view=view_1, field=date_field, type="date_before", value="2021-01-01"
+    )
+    data_fixture.create_view_filter(
+        view=view_1, field=single_select_field, type="single_select_equal", value="1"
+    )
+    data_fixture.create_view_sort(view=view_2, field=single_select_field)
+
+    # The btree filters of the number field are added to the sort index, the text
+    # fields can't be sorted using a btree index and the single select is already
+    # indexed because it's a foreign key.
+    assert get_index_types(table) == [
+        (number_field.id, "desc", 3),
+        (text_field.id, "hash", 1),
+        (phone_field.id, "btree", 1),
+        (file_field.id, "gin", 1),
+        (date_field.id, "btree", 1),
+    ]
+
+    with patch(
+        "baserow.contrib.database.table.indexes.trigram_extension_is_installed",
+        return_value=True,
+    ):
+        assert (text_field.id, "trigram", 1) in get_index_types(table)
+
+    with override_settings(TABLE_INDEX_BUDGET=2):
+        assert get_index_types(table) == [
+            (number_field.id, "desc", 3),
+            (text_field.id, "hash", 1),
+        ]
+
+    with override_settings(TABLE_INDEX_BUDGET=0):
+        assert get_index_types(table) == []
+
+    # Filters and sorts on trashed fields are not applied.
+    FieldHandler().delete_field(user, number_field)
+    assert get_index_types(table)[0] == (text_field.id, "hash", 1)
+
+
+@pytest.mark.django_db
+def test_update_field_indexes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    file_field = data_fixture.create_file_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    number_index_name = get_field_index_name(model, number_field.id, "asc")
+    file_index_name = get_field_index_name(model, file_field.id, "gin")
+
+    view_sort = data_fixture.create_view_sort(view=view, field=number_field)
+    data_fixture.create_view_filter(
+        view=view, field=file_field, type="has_file_type", value="image"
+    )
+
+    update_field_indexes(table)
+    assert get_existing_field_indexes(model) == {
+        number_index_name: True,
+        file_index_name: True,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE indexname = %s",
+            [number_index_name],
+        )
+        assert 'NULLS FIRST, "order", id)' in cursor.fetchone()[0]
+
+    view_sort.delete()
+    update_field_indexes(table)
+    assert get_existing_field_indexes(model) == {file_index_name: True}
+
+    # Converting the field must not fail because the `jsonb_path_ops` operator class
+    # doesn't support text columns.
+    FieldHandler().update_field(user, file_field, new_type_name="text")
+    assert get_existing_field_indexes(model) == {}
+
+
+@pytest.mark.django_db
+def test_field_indexes_are_updated_when_views_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+    handler = ViewHandler()
+
+    with patch(
+        "baserow.contrib.database.table.tasks.update_field_indexes_task.delay"
+    ) as delay_mock, django_capture_on_commit_callbacks(execute=True):
+        view_filter = handler.create_filter(
+            user, view, number_field, "higher_than", "1"
+        )
+        handler.update_filter(user, view_filter, type_name="lower_than")
+        handler.delete_filter(user, view_filter)
+        view_sort = handler.create_sort(user, view, number_field, "ASC")
+        handler.update_sort(user, view_sort, order="DESC")
+        handler.delete_sort(user, view_sort)
+        handler.update_view(user, view, name="Renamed")
+        handler.update_view(user, view, filters_disabled=True)
+        handler.delete_view(user, view)
+
+    assert delay_mock.call_count == 8
+    delay_mock.assert_called_with(table.id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_field_indexes_task_creates_indexes_concurrently(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=number_field, type="higher_than", value="1"
+    )
+    model = table.get_model()
+
+    # The task doesn't run in a transaction, so the index is created concurrently.
+    update_field_indexes_task(table.id)
+
+    assert get_existing_field_indexes(model) == {
+        get_field_index_name(model, number_field.id, "btree"): True
+    }
+
+    # Tables that have been deleted in the meantime are ignored.
+    update_field_indexes_task(0)
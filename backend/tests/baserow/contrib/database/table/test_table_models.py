@@ -1,21 +1,30 @@
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import make_aware, utc
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.exceptions import (
     OrderByFieldNotPossible,
     OrderByFieldNotFound,
     FilterFieldNotFound,
 )
+from baserow.contrib.database.formula.types.table_typer import type_table
+from baserow.contrib.database.table.cache import (
+    GeneratedTableModelCache,
+    TypedTableCache,
+    typed_table_cache,
+)
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.views.exceptions import (
     ViewFilterTypeNotAllowedForField,
     ViewFilterTypeDoesNotExist,
 )
+from baserow.core.trash.handler import TrashHandler
 
 
 @pytest.mark.django_db
@@ -707,3 +716,234 @@ def test_table_model_fields_requiring_refresh_after_update(data_fixture):
     )
     assert len(fields_from_normal_formula_model) == 1
     assert fields_from_normal_formula_model[0] == f"field_{formula_field.id}"
+
+
+@pytest.mark.django_db
+def test_get_table_model_query_count_does_not_depend_on_the_number_of_fields(
+    data_fixture,
+):
+    table = data_fixture.create_database_table(name="Cars")
+    data_fixture.create_text_field(table=table, name="Color")
+    data_fixture.create_number_field(table=table, name="Horsepower")
+    data_fixture.create_formula_field(
+        table=table, name="Formula", formula="field('Color')", formula_type="text"
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        table.get_model()
+    num_queries = len(captured)
+
+    for i in range(10):
+        data_fixture.create_text_field(table=table, name=f"Text {i}")
+        data_fixture.create_number_field(table=table, name=f"Number {i}")
+        data_fixture.create_boolean_field(table=table, name=f"Boolean {i}")
+        data_fixture.create_formula_field(
+            table=table, name=f"Formula {i}", formula="'a'", formula_type="text"
+        )
+
+    with CaptureQueriesContext(connection) as captured:
+        model = table.get_model()
+
+    # A query is executed per field type instead of per field, so adding a field type
+    # that wasn't used yet only results in one more query when typing the formulas
+    # and one more when generating the model.
+    assert len(captured) == num_queries + 2
+    assert len(model._field_objects) == 43
+
+
+@pytest.mark.django_db
+def test_get_table_model_is_cached_after_commit(
+    data_fixture, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    table = data_fixture.create_database_table(name="Cars")
+    data_fixture.create_text_field(table=table, name="Color")
+    data_fixture.create_number_field(table=table, name="Horsepower")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        model = table.get_model()
+
+    # Only the versions of the table must be fetched to validate the cached model.
+    with django_assert_num_queries(1):
+        assert table.get_model() is model
+
+    # Different arguments result in a different model.
+    with django_capture_on_commit_callbacks(execute=True):
+        model_with_attribute_names = table.get_model(attribute_names=True)
+    assert model_with_attribute_names is not model
+    assert table.get_model(attribute_names=True) is model_with_attribute_names
+    assert table.get_model(field_ids=[]) is not model
+
+    # Extra fields are never cached.
+    extra_field = data_fixture.create_text_field(table=table, name="Extra")
+    assert table.get_model(fields=[extra_field]) is not model
+
+
+@pytest.mark.django_db
+def test_get_table_model_is_not_cached_without_commit(data_fixture):
+    table = data_fixture.create_database_table(name="Cars")
+    data_fixture.create_text_field(table=table, name="Color")
+
+    with CaptureQueriesContext(connection):
+        model = table.get_model()
+
+    assert table.get_model() is not model
+
+
+@pytest.mark.django_db
+def test_cached_table_model_invalidated_when_fields_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user, name="Cars")
+    data_fixture.create_text_field(table=table, name="Color", primary=True)
+    handler = FieldHandler()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        model = table.get_model()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        field = handler.create_field(user, table, "number", name="Horsepower")
+        model = table.get_model()
+    assert field.id in model._field_objects
+    assert table.get_model() is model
+
+    with django_capture_on_commit_callbacks(execute=True):
+        handler.update_field(user, field, name="Speed")
+        model = table.get_model()
+    assert model._field_objects[field.id]["field"].name == "Speed"
+    assert table.get_model() is model
+
+    with django_capture_on_commit_callbacks(execute=True):
+        handler.delete_field(user, field)
+        model = table.get_model()
+    assert field.id not in model._field_objects
+    assert field.id in model._trashed_field_objects
+    assert table.get_model() is model
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TrashHandler.restore_item(user, "field", field.id)
+        model = table.get_model()
+    assert field.id in model._field_objects
+    assert table.get_model() is model
+
+
+@pytest.mark.django_db
+def test_cached_table_model_invalidated_when_related_table_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=related_table, name="Name", primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+
+    # The first time the related table is unknown, so its version isn't fetched
+    # upfront and the model can't be cached yet.
+    with django_capture_on_commit_callbacks(execute=True):
+        table.get_model()
+    with django_capture_on_commit_callbacks(execute=True):
+        model = table.get_model()
+    assert table.get_model() is model
+
+    related_field = data_fixture.create_text_field(table=related_table, name="Other")
+    model = table.get_model()
+    related_model = model._meta.get_field(link_field.db_column).remote_field.model
+    assert related_field.id in related_model._field_objects
+
+
+def test_generated_table_model_cache_evicts_least_recently_used():
+    cache = GeneratedTableModelCache(max_size=2)
+
+    cache.set((1,), 1, {1: 1}, "model_1")
+    cache.set((2,), 2, {2: 1, 3: 1}, "model_2")
+    assert cache.get_dependencies(2) == {2, 3}
+
+    assert cache.get((1,), {1: 1}) == "model_1"
+    cache.set((4,), 4, {4: 1}, "model_4")
+
+    assert len(cache) == 2
+    assert cache.get((2,), {2: 1, 3: 1}) is None
+    assert cache.get_dependencies(2) == {2}
+    assert cache.get((1,), {1: 1}) == "model_1"
+    assert cache.get((4,), {4: 2}) is None
+    assert len(cache) == 1
+
+
+def test_generated_table_model_cache_disabled():
+    cache = GeneratedTableModelCache(max_size=0)
+    cache.set((1,), 1, {1: 1}, "model_1")
+    assert cache.get((1,), {1: 1}) is None
+
+
+@pytest.mark.django_db
+def test_typed_table_is_cached_per_table_version(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Formula", formula="field('Text')"
+    )
+
+    with patch(
+        "baserow.contrib.database.table.models.type_table", wraps=type_table
+    ) as type_table_mock:
+        with django_capture_on_commit_callbacks(execute=True):
+            model = table.get_model()
+        assert type_table_mock.call_count == 1
+
+        # A different model that requires typing reuses the typed table.
+        with django_capture_on_commit_callbacks(execute=True):
+            table.get_model(field_ids=[formula_field.id])
+            table.get_model(fields=[text_field], field_ids=[formula_field.id])
+        assert type_table_mock.call_count == 1
+
+        with CaptureQueriesContext(connection) as captured:
+            typed_table = table.get_typed_table()
+        assert len(captured.captured_queries) == 1
+        assert typed_table is table.get_typed_table()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            FieldHandler().update_field(
+                user, formula_field, formula="concat(field('Text'), '!')"
+            )
+        assert table.id not in typed_table_cache._entries
+
+        with django_capture_on_commit_callbacks(execute=True):
+            new_typed_table = table.get_typed_table()
+        assert new_typed_table is not typed_table
+        assert (
+            new_typed_table.get_typed_field_instance(formula_field.id).formula
+            == f"concat(field_by_id({text_field.id}), '!')"
+        )
+        assert table.get_typed_table() is new_typed_table
+
+    row = table.get_model().objects.create(**{f"field_{text_field.id}": "a"})
+    assert model is not table.get_model()
+    assert getattr(row, f"field_{formula_field.id}") == "a!"
+
+
+def test_typed_table_cache():
+    cache = TypedTableCache(max_size=2)
+
+    cache.set(1, 1, "typed_table_1")
+    cache.set(2, 1, "typed_table_2")
+    assert cache.get(1, 1) == "typed_table_1"
+    cache.set(3, 1, "typed_table_3")
+
+    assert len(cache) == 2
+    assert cache.get(2, 1) is None
+    assert cache.get(1, 2) is None
+    assert cache.get(3, 1) == "typed_table_3"
+    assert len(cache) == 1
+
+    cache.invalidate(3)
+    assert cache.get(3, 1) is None
+
+    disabled_cache = TypedTableCache(max_size=0)
+    disabled_cache.set(1, 1, "typed_table_1")
+    assert disabled_cache.get(1, 1) is None
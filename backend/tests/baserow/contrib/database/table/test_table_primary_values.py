@@ -0,0 +1,312 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_row_serializer_class,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import RowPrimaryValue
+from baserow.contrib.database.table.tasks import update_primary_values_task
+from baserow.core.trash.handler import TrashHandler
+
+
+def get_cached_values(table):
+    return dict(
+        RowPrimaryValue.objects.filter(table=table, trashed=False).values_list(
+            "row_id", "value"
+        )
+    )
+
+
+def serialize_link_row_values(table, link_field):
+    model = table.get_model()
+    serializer_class = get_row_serializer_class(model, RowSerializer, is_response=True)
+    rows = model.objects.all().enhance_by_fields()
+    return [
+        row[f"field_{link_field.id}"] for row in serializer_class(rows, many=True).data
+    ]
+
+
+def setup_linked_tables(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database, name="Customers")
+    related_table = data_fixture.create_database_table(database=database, name="Cars")
+    data_fixture.create_text_field(table=table, name="Name", primary=True)
+    related_primary_field = data_fixture.create_text_field(
+        table=related_table, name="Name", primary=True
+    )
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Cars", link_row_table=related_table
+    )
+    return user, table, related_table, related_primary_field, link_field
+
+
+@pytest.mark.django_db
+def test_update_cache_primary_values(data_fixture):
+    user, table, related_table, primary_field, link_field = setup_linked_tables(
+        data_fixture
+    )
+    handler = RowHandler()
+    tesla = handler.create_row(
+        user, related_table, {f"field_{primary_field.id}": "Tesla"}
+    )
+    audi = handler.create_row(
+        user, related_table, {f"field_{primary_field.id}": "Audi"}
+    )
+    handler.create_row(user, table, {f"field_{link_field.id}": [audi.id, tesla.id]})
+    assert RowPrimaryValue.objects.count() == 0
+
+    TableHandler().update_cache_primary_values(related_table, True)
+
+    related_table.refresh_from_db()
+    assert related_table.cache_primary_values
+    assert related_table.get_model()._cache_primary_values
+    assert get_cached_values(related_table) == {tesla.id: "Tesla", audi.id: "Audi"}
+    # The related rows are ordered like the rows in the related table.
+    assert serialize_link_row_values(table, link_field) == [
+        [{"id": tesla.id, "value": "Tesla"}, {"id": audi.id, "value": "Audi"}]
+    ]
+
+    TableHandler().update_cache_primary_values(related_table, False)
+
+    related_table.refresh_from_db()
+    assert not related_table.cache_primary_values
+    assert RowPrimaryValue.objects.count() == 0
+    assert serialize_link_row_values(table, link_field) == [
+        [{"id": tesla.id, "value": "Tesla"}, {"id": audi.id, "value": "Audi"}]
+    ]
+
+
+@pytest.mark.django_db
+def test_link_row_values_are_read_from_the_cache(data_fixture):
+    user, table, related_table, primary_field, link_field = setup_linked_tables(
+        data_fixture
+    )
+    TableHandler().update_cache_primary_values(related_table, True)
+    handler = RowHandler()
+    tesla, audi = handler.create_rows(
+        user,
+        related_table,
+        [{f"field_{primary_field.id}": "Tesla"}, {f"field_{primary_field.id}": "Audi"}],
+    )
+    handler.create_row(user, table, {f"field_{link_field.id}": [tesla.id, audi.id]})
+    handler.create_row(user, table, {})
+    assert get_cached_values(related_table) == {tesla.id: "Tesla", audi.id: "Audi"}
+
+    model = table.get_model()
+    serializer_class = get_row_serializer_class(model, RowSerializer, is_response=True)
+    with CaptureQueriesContext(connection) as captured:
+        rows = serializer_class(model.objects.all().enhance_by_fields(), many=True).data
+    assert [row[f"field_{link_field.id}"] for row in rows] == [
+        [{"id": tesla.id, "value": "Tesla"}, {"id": audi.id, "value": "Audi"}],
+        [],
+    ]
+    assert len(captured.captured_queries) == 1
+    assert (
+        related_table.get_database_table_name() + '"'
+        not in captured.captured_queries[0]["sql"]
+    )
+
+    handler.update_row(user, related_table, tesla.id, {primary_field.id: "Model 3"})
+    assert serialize_link_row_values(table, link_field)[0] == [
+        {"id": tesla.id, "value": "Model 3"},
+        {"id": audi.id, "value": "Audi"},
+    ]
+
+    handler.delete_row(user, related_table, audi.id)
+    assert serialize_link_row_values(table, link_field)[0] == [
+        {"id": tesla.id, "value": "Model 3"}
+    ]
+
+    TrashHandler.restore_item(
+        user, "row", audi.id, parent_trash_item_id=related_table.id
+    )
+    assert serialize_link_row_values(table, link_field)[0] == [
+        {"id": tesla.id, "value": "Model 3"},
+        {"id": audi.id, "value": "Audi"},
+    ]
+
+    # Values that aren't cached yet are fetched from the related table.
+    RowPrimaryValue.objects.filter(row_id=tesla.id).delete()
+    assert serialize_link_row_values(table, link_field)[0] == [
+        {"id": tesla.id, "value": "Model 3"},
+        {"id": audi.id, "value": "Audi"},
+    ]
+
+    model = table.get_model()
+    row = model.objects.all().enhance_by_fields().first()
+    link_field_object = model._field_objects[link_field.id]
+    assert (
+        link_field_object["type"].get_human_readable_value(
+            getattr(row, f"field_{link_field.id}"), link_field_object
+        )
+        == "Model 3, Audi"
+    )
+
+    TrashHandler.permanently_delete(audi, related_table.id)
+    assert not RowPrimaryValue.objects.filter(row_id=audi.id).exists()
+
+
+@pytest.mark.django_db
+def test_primary_values_are_updated_after_primary_field_change(data_fixture):
+    user, table, related_table, primary_field, link_field = setup_linked_tables(
+        data_fixture
+    )
+    TableHandler().update_cache_primary_values(related_table, True)
+    handler = RowHandler()
+    tesla = handler.create_row(
+        user, related_table, {f"field_{primary_field.id}": "3.14"}
+    )
+    handler.create_row(user, table, {f"field_{link_field.id}": [tesla.id]})
+
+    with patch(
+        "baserow.contrib.database.table.primary_values.update_primary_values"
+    ) as update_mock:
+        FieldHandler().create_field(user, related_table, "text", name="Color")
+    update_mock.assert_not_called()
+
+    FieldHandler().update_field(
+        user, primary_field, new_type_name="number", number_decimal_places=1
+    )
+
+    # Converting the text to a number changes the human readable value.
+    converted_value = str(related_table.get_model().objects.get(id=tesla.id))
+    assert converted_value != "3.14"
+    assert get_cached_values(related_table) == {tesla.id: converted_value}
+    assert serialize_link_row_values(table, link_field) == [
+        [{"id": tesla.id, "value": converted_value}]
+    ]
+
+
+@pytest.mark.django_db
+def test_primary_values_are_updated_after_primary_formula_dependency_change(
+    data_fixture,
+):
+    user, table, related_table, primary_field, link_field = setup_linked_tables(
+        data_fixture
+    )
+    handler = FieldHandler()
+    dependency = handler.create_field(user, related_table, "text", name="Dependency")
+    formula_field = handler.create_field(
+        user, related_table, "formula", name="Formula", formula="field('Dependency')"
+    )
+    Field.objects.filter(id=primary_field.id).update(primary=False)
+    Field.objects.filter(id=formula_field.id).update(primary=True)
+    TableHandler().update_cache_primary_values(related_table, True)
+    tesla = RowHandler().create_row(
+        user, related_table, {f"field_{dependency.id}": "3.14"}
+    )
+    RowHandler().create_row(user, table, {f"field_{link_field.id}": [tesla.id]})
+    assert get_cached_values(related_table) == {tesla.id: "3.14"}
+
+    handler.update_field(user, dependency, new_type_name="number")
+
+    converted_value = str(related_table.get_model().objects.get(id=tesla.id))
+    assert converted_value == "3"
+    assert get_cached_values(related_table) == {tesla.id: converted_value}
+    assert serialize_link_row_values(table, link_field) == [
+        [{"id": tesla.id, "value": converted_value}]
+    ]
+
+
+@pytest.mark.django_db
+def test_cached_related_rows_are_ordered_like_the_related_table(data_fixture):
+    user, table, related_table, primary_field, link_field = setup_linked_tables(
+        data_fixture
+    )
+    TableHandler().update_cache_primary_values(related_table, True)
+    handler = RowHandler()
+    tesla, audi, bmw = handler.create_rows(
+        user,
+        related_table,
+        [
+            {f"field_{primary_field.id}": "Tesla"},
+            {f"field_{primary_field.id}": "Audi"},
+            {f"field_{primary_field.id}": "BMW"},
+        ],
+    )
+    handler.create_row(
+        user, table, {f"field_{link_field.id}": [bmw.id, audi.id, tesla.id]}
+    )
+    assert [
+        value["id"] for value in serialize_link_row_values(table, link_field)[0]
+    ] == [tesla.id, audi.id, bmw.id]
+
+    handler.move_row(user, related_table, bmw.id, before=tesla)
+    assert [
+        value["id"] for value in serialize_link_row_values(table, link_field)[0]
+    ] == [bmw.id, tesla.id, audi.id]
+
+    # Rows created before another row shift the orders of the rows after it.
+    porsche = handler.create_row(
+        user, related_table, {f"field_{primary_field.id}": "Porsche"}, before=tesla
+    )
+    handler.update_row(
+        user,
+        table,
+        table.get_model().objects.first().id,
+        {f"field_{link_field.id}": [tesla.id, porsche.id, bmw.id]},
+    )
+    assert [
+        value["id"] for value in serialize_link_row_values(table, link_field)[0]
+    ] == [bmw.id, porsche.id, tesla.id]
+    related_model = related_table.get_model()
+    assert [
+        row.id
+        for row in related_model.objects.filter(id__in=[tesla.id, porsche.id, bmw.id])
+    ] == [bmw.id, porsche.id, tesla.id]
+
+
+@pytest.mark.django_db
+def test_primary_values_of_large_tables_are_updated_in_the_background(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user, table, related_table, primary_field, link_field = setup_linked_tables(
+        data_fixture
+    )
+    TableHandler().update_cache_primary_values(related_table, True)
+    tesla = RowHandler().create_row(
+        user, related_table, {f"field_{primary_field.id}": "Tesla"}
+    )
+    related_table.refresh_from_db()
+
+    with override_settings(FORMULA_BACKGROUND_RECALCULATION_THRESHOLD=0), patch(
+        "baserow.contrib.database.table.tasks.update_primary_values_task.delay"
+    ) as delay_mock, django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(
+            user, primary_field, new_type_name="number", number_decimal_places=1
+        )
+
+    delay_mock.assert_called_once_with(related_table.id)
+    assert get_cached_values(related_table) == {tesla.id: "Tesla"}
+
+    update_primary_values_task(related_table.id)
+    assert get_cached_values(related_table) == {tesla.id: ""}
+
+
+@pytest.mark.django_db
+def test_update_table_primary_values_cache_command(data_fixture):
+    table = data_fixture.create_database_table()
+    primary_field = data_fixture.create_text_field(table=table, primary=True)
+    row = table.get_model().objects.create(**{f"field_{primary_field.id}": "Tesla"})
+
+    call_command("update_table_primary_values_cache", table.id)
+
+    table.refresh_from_db()
+    assert table.cache_primary_values
+    assert get_cached_values(table) == {row.id: "Tesla"}
+
+    call_command("update_table_primary_values_cache", table.id, "--disable")
+
+    table.refresh_from_db()
+    assert not table.cache_primary_values
+    assert RowPrimaryValue.objects.count() == 0
@@ -0,0 +1,223 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import override_settings
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.exceptions import InvalidSearchMode
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.search import (
+    SEARCH_DATA_COLUMN,
+    SEARCH_MODE_DEFAULT,
+    SEARCH_MODE_FULL_TEXT,
+    get_search_data_index_name,
+    get_search_query,
+)
+from baserow.contrib.database.table.tasks import update_search_data_task
+from baserow.core.trash.handler import TrashHandler
+
+
+def get_columns(table):
+    with connection.cursor() as cursor:
+        return [
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, table.get_database_table_name()
+            )
+        ]
+
+
+def search(table, query):
+    return sorted(
+        row.id for row in table.get_model().objects.all().search_all_fields(query)
+    )
+
+
+def test_get_search_query():
+    assert get_search_query("") is None
+    assert get_search_query("  ") is None
+    assert get_search_query("Tesla") == "'Tesla':*"
+    assert get_search_query("Tesla  model") == "'Tesla':* & 'model':*"
+    assert get_search_query("it's a\\b") == "'it''s':* & 'a\\\\b':*"
+
+
+@pytest.mark.django_db
+def test_update_search_mode(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name", primary=True)
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{text_field.id}": "Tesla model 3"})
+    row_2 = model.objects.create(**{f"field_{text_field.id}": "Audi"})
+
+    handler = TableHandler()
+
+    with pytest.raises(InvalidSearchMode):
+        handler.update_search_mode(table, "unknown")
+
+    handler.update_search_mode(table, SEARCH_MODE_FULL_TEXT)
+
+    table.refresh_from_db()
+    assert table.search_mode == SEARCH_MODE_FULL_TEXT
+    assert SEARCH_DATA_COLUMN in get_columns(table)
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(
+            cursor, table.get_database_table_name()
+        )
+    assert get_search_data_index_name(model) in constraints
+
+    assert table.get_model()._search_mode == SEARCH_MODE_FULL_TEXT
+    assert search(table, "tesla") == [row_1.id]
+    assert search(table, "mod") == [row_1.id]
+    assert search(table, "tesla 3") == [row_1.id]
+    assert search(table, "audi tesla") == []
+    assert search(table, str(row_2.id)) == [row_2.id]
+    assert search(table, " ") == [row_1.id, row_2.id]
+
+    handler.update_search_mode(table, SEARCH_MODE_DEFAULT)
+
+    table.refresh_from_db()
+    assert table.search_mode == SEARCH_MODE_DEFAULT
+    assert SEARCH_DATA_COLUMN not in get_columns(table)
+    assert table.get_model()._search_mode == SEARCH_MODE_DEFAULT
+    assert search(table, "esla") == [row_1.id]
+
+
+@pytest.mark.django_db
+def test_full_text_search_all_field_types(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = FieldHandler()
+    text_field = handler.create_field(user, table, "text", name="Text", primary=True)
+    long_text_field = handler.create_field(user, table, "long_text", name="Long")
+    number_field = handler.create_field(
+        user,
+        table,
+        "number",
+        name="Number",
+        number_type="DECIMAL",
+        number_decimal_places=2,
+    )
+    date_field = handler.create_field(
+        user, table, "date", name="Date", date_format="ISO"
+    )
+    single_select_field = handler.create_field(
+        user,
+        table,
+        "single_select",
+        name="Single",
+        select_options=[{"value": "Red", "color": "red"}],
+    )
+    multiple_select_field = handler.create_field(
+        user,
+        table,
+        "multiple_select",
+        name="Multiple",
+        select_options=[
+            {"value": "Green", "color": "green"},
+            {"value": "Blue", "color": "blue"},
+        ],
+    )
+    file_field = handler.create_field(user, table, "file", name="File")
+    handler.create_field(
+        user, table, "formula", name="Formula", formula="concat(field('Text'), 'xyz')"
+    )
+    user_file = data_fixture.create_user_file(original_name="invoice.pdf")
+
+    TableHandler().update_search_mode(table, SEARCH_MODE_FULL_TEXT)
+    table.refresh_from_db()
+
+    select_option = single_select_field.select_options.get()
+    multiple_options = list(multiple_select_field.select_options.order_by("id"))
+
+    row_handler = RowHandler()
+    row_1 = row_handler.create_row(
+        user,
+        table,
+        {
+            text_field.id: "Tesla",
+            long_text_field.id: "An electric\ncar",
+            number_field.id: "12.50",
+            date_field.id: "2021-10-18",
+            single_select_field.id: select_option.id,
+            multiple_select_field.id: [multiple_options[1].id],
+            file_field.id: [{"name": user_file.name, "visible_name": "quote.pdf"}],
+        },
+    )
+    row_2 = row_handler.create_rows(
+        user,
+        table,
+        [{text_field.id: "Audi", multiple_select_field.id: [multiple_options[0].id]}],
+    )[0]
+
+    assert search(table, "tesla") == [row_1.id]
+    assert search(table, "electric car") == [row_1.id]
+    assert search(table, "12.5") == [row_1.id]
+    assert search(table, "2021-10") == [row_1.id]
+    assert search(table, "red") == [row_1.id]
+    assert search(table, "blue") == [row_1.id]
+    assert search(table, "green") == [row_2.id]
+    assert search(table, "quote") == [row_1.id]
+    assert search(table, "audixyz") == [row_2.id]
+
+    row_handler.update_row(user, table, row_1.id, {text_field.id: "Volvo"})
+    assert search(table, "tesla") == []
+    assert search(table, "volvoxyz") == [row_1.id]
+
+    row_handler.update_rows(
+        user,
+        table,
+        [{"id": row_2.id, multiple_select_field.id: [multiple_options[1].id]}],
+    )
+    assert search(table, "green") == []
+    assert search(table, "blue") == [row_1.id, row_2.id]
+
+    # Renaming a select option changes the searchable text of all rows.
+    handler.update_field(
+        user,
+        multiple_select_field,
+        select_options=[
+            {"id": multiple_options[0].id, "value": "Green", "color": "green"},
+            {"id": multiple_options[1].id, "value": "Purple", "color": "blue"},
+        ],
+    )
+    assert search(table, "blue") == []
+    assert search(table, "purple") == [row_1.id, row_2.id]
+
+    handler.delete_field(user, long_text_field)
+    assert search(table, "electric") == []
+
+    TrashHandler.restore_item(user, "field", long_text_field.id)
+    assert search(table, "electric") == [row_1.id]
+
+
+@pytest.mark.django_db
+def test_search_data_of_large_tables_is_updated_in_the_background(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name", primary=True)
+    description_field = data_fixture.create_text_field(table=table, name="Description")
+    model = table.get_model()
+    row = model.objects.create(
+        **{
+            f"field_{text_field.id}": "Tesla",
+            f"field_{description_field.id}": "Electric",
+        }
+    )
+    TableHandler().update_search_mode(table, SEARCH_MODE_FULL_TEXT)
+    table.refresh_from_db()
+
+    with override_settings(SEARCH_DATA_BACKGROUND_THRESHOLD=0), patch(
+        "baserow.contrib.database.table.tasks.update_search_data_task.delay"
+    ) as delay_mock, django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().delete_field(user, description_field)
+
+    delay_mock.assert_called_once_with(table.id)
+    assert search(table, "electric") == [row.id]
+
+    update_search_data_task(table.id)
+    assert search(table, "electric") == []
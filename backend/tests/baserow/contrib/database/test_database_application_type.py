@@ -1,7 +1,18 @@
+import json
+from io import BytesIO
+from unittest.mock import patch
+from zipfile import ZIP_DEFLATED, ZipFile
+
 import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
 
+from baserow.contrib.database.application_types import DatabaseApplicationType
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import FormulaField, TextField
+from baserow.core.handler import CoreHandler
 from baserow.core.registries import application_type_registry
+from baserow.core.user_files.handler import UserFileHandler
 
 
 @pytest.mark.django_db
@@ -68,3 +79,82 @@ def test_import_export_database(data_fixture):
     # It must still be possible to create a new row in the imported table
     row_2 = imported_model.objects.create()
     assert row_2.id == 2
+
+
+@pytest.mark.django_db
+@patch.object(DatabaseApplicationType, "ROWS_BATCH_SIZE", 2)
+def test_export_import_database_with_streamed_rows(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    imported_group = data_fixture.create_group(user=user)
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    customers_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    file_field = data_fixture.create_file_field(table=table, name="file")
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="link", link_row_table=customers_table
+    )
+
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    user_file = UserFileHandler().upload_user_file(
+        user, "test.txt", ContentFile(b"Hello World"), storage=storage
+    )
+
+    customer = customers_table.get_model().objects.create()
+    model = table.get_model()
+    rows = []
+    for i in range(5):
+        row = model.objects.create(
+            **{
+                f"field_{text_field.id}": f"Row {i}",
+                f"field_{file_field.id}": [
+                    {"name": user_file.name, "visible_name": f"{i}.txt"}
+                ],
+            }
+        )
+        getattr(row, f"field_{link_field.id}").set([customer.id])
+        rows.append(row)
+
+    files_buffer = BytesIO()
+    core_handler = CoreHandler()
+    exported_applications = core_handler.export_group_applications(
+        database.group, files_buffer=files_buffer, storage=storage, stream_rows=True
+    )
+
+    serialized_table = exported_applications[0]["tables"][0]
+    assert "rows" not in serialized_table
+    assert serialized_table["rows_file_name"] == f"database_table_{table.id}_rows.jsonl"
+
+    with ZipFile(files_buffer, "r", ZIP_DEFLATED, False) as files_zip:
+        assert files_zip.read(user_file.name) == b"Hello World"
+        lines = files_zip.read(serialized_table["rows_file_name"]).splitlines()
+
+    serialized_rows = [json.loads(line) for line in lines]
+    assert [row["id"] for row in serialized_rows] == [row.id for row in rows]
+    assert serialized_rows[0][f"field_{text_field.id}"] == "Row 0"
+    assert serialized_rows[0][f"field_{link_field.id}"] == [customer.id]
+
+    imported_applications, id_mapping = core_handler.import_applications_to_group(
+        imported_group, exported_applications, files_buffer, storage
+    )
+
+    imported_table = imported_applications[0].table_set.get(
+        id=id_mapping["database_tables"][table.id]
+    )
+    imported_model = imported_table.get_model()
+    imported_text_field_name = f'field_{id_mapping["database_fields"][text_field.id]}'
+    imported_file_field_name = f'field_{id_mapping["database_fields"][file_field.id]}'
+    imported_link_field_name = f'field_{id_mapping["database_fields"][link_field.id]}'
+    imported_rows = list(imported_model.objects.all())
+    assert [row.id for row in imported_rows] == [row.id for row in rows]
+    assert [getattr(row, imported_text_field_name) for row in imported_rows] == [
+        f"Row {i}" for i in range(5)
+    ]
+    assert [
+        getattr(row, imported_file_field_name)[0]["visible_name"]
+        for row in imported_rows
+    ] == [f"{i}.txt" for i in range(5)]
+    assert [
+        [related.id for related in getattr(row, imported_link_field_name).all()]
+        for row in imported_rows
+    ] == [[customer.id]] * 5
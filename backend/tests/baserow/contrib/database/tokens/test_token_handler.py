@@ -1,9 +1,11 @@
 import pytest
 import string
+from unittest.mock import patch
 from pytz import timezone
 from freezegun import freeze_time
 from datetime import datetime
 
+from django.core.cache import cache
 from django.http import HttpRequest
 from rest_framework.request import Request
 
@@ -12,6 +14,11 @@ from baserow.contrib.database.exceptions import DatabaseDoesNotBelongToGroup
 from baserow.contrib.database.table.exceptions import TableDoesNotBelongToGroup
 from baserow.contrib.database.tokens.models import Token, TokenPermission
 from baserow.contrib.database.tokens.handler import TokenHandler
+from baserow.contrib.database.tokens.tasks import flush_token_usage
+from baserow.contrib.database.tokens.usage import (
+    get_token_usage_cache_key,
+    token_usage_buffer,
+)
 from baserow.contrib.database.tokens.exceptions import (
     TokenDoesNotExist,
     MaximumUniqueTokenTriesError,
@@ -643,15 +650,86 @@ def test_delete_token(data_fixture):
 
 @pytest.mark.django_db
 def test_update_token_usage(data_fixture):
+    cache.clear()
     token_1 = data_fixture.create_token()
+    token_2 = data_fixture.create_token()
 
     handler = TokenHandler()
 
     assert token_1.handled_calls == 0
     assert token_1.last_call is None
 
-    with freeze_time("2020-01-01 12:00"):
-        token_1 = handler.update_token_usage(token_1)
+    with patch.object(token_usage_buffer, "flush_interval", 5):
+        with freeze_time("2020-01-01 12:00"):
+            token_1 = handler.update_token_usage(token_1)
+            handler.update_token_usage(token_2)
+        with freeze_time("2020-01-01 12:01"):
+            handler.update_token_usage(Token.objects.get(id=token_1.id))
 
     assert token_1.handled_calls == 1
     assert token_1.last_call == datetime(2020, 1, 1, 12, 00, tzinfo=timezone("UTC"))
+
+    # The usage must only be written to the database when it's flushed.
+    token_1.refresh_from_db()
+    assert token_1.handled_calls == 0
+    assert token_1.last_call is None
+
+    flush_token_usage()
+    assert cache.get(get_token_usage_cache_key(f"{token_1.id}_calls")) == 0
+    assert cache.get(get_token_usage_cache_key("flushed")) == 2
+
+    token_1.refresh_from_db()
+    token_2.refresh_from_db()
+    assert token_1.handled_calls == 2
+    assert token_1.last_call == datetime(2020, 1, 1, 12, 1, tzinfo=timezone("UTC"))
+    assert token_2.handled_calls == 1
+    assert token_2.last_call == datetime(2020, 1, 1, 12, 0, tzinfo=timezone("UTC"))
+
+    # Flushing again doesn't write anything because no calls have been handled.
+    handler.flush_token_usage()
+    token_1.refresh_from_db()
+    assert token_1.handled_calls == 2
+
+    # Another process could have flushed a more recent last call already, in which
+    # case it must not be overwritten, but the handled calls must be added.
+    with patch.object(token_usage_buffer, "flush_interval", 0):
+        with freeze_time("2020-01-01 11:00"):
+            handler.update_token_usage(token_1)
+
+    token_1.refresh_from_db()
+    assert token_1.handled_calls == 3
+    assert token_1.last_call == datetime(2020, 1, 1, 12, 1, tzinfo=timezone("UTC"))
+
+
+@pytest.mark.django_db
+def test_token_usage_handled_while_flushing_is_flushed_later(data_fixture):
+    cache.clear()
+    token = data_fixture.create_token()
+    handler = TokenHandler()
+
+    with patch.object(token_usage_buffer, "flush_interval", 5):
+        handler.update_token_usage(token)
+
+        # Simulates a call that is handled by another process while the token is
+        # written to the database.
+        original_update = Token.objects.filter(id=token.id).update
+
+        def update_and_handle_call(**kwargs):
+            handler.update_token_usage(token)
+            return original_update(**kwargs)
+
+        with patch(
+            "baserow.contrib.database.tokens.usage.Token.objects.filter"
+        ) as filter_mock:
+            filter_mock.return_value.update.side_effect = update_and_handle_call
+            handler.flush_token_usage()
+
+    token.refresh_from_db()
+    assert token.handled_calls == 1
+    assert cache.get(get_token_usage_cache_key(f"{token.id}_calls")) == 1
+
+    handler.flush_token_usage()
+
+    token.refresh_from_db()
+    assert token.handled_calls == 2
+    assert cache.get(get_token_usage_cache_key(f"{token.id}_calls")) == 0
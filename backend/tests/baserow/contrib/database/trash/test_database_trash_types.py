@@ -52,6 +52,9 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
 
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
+    # One of the queries fetches the table versions to look up the model in the
+    # generated model cache. It's a miss here because the test transaction is never
+    # committed.
     with django_assert_num_queries(13):
         TrashHandler.permanently_delete_marked_trash()
 
@@ -70,21 +73,109 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
 
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
-    # We only want seven more queries when deleting 2 rows instead of 1 compared to
-    # above:
-    # 1. An extra query to open the second trash entries savepoint
-    # 2. An extra query to lookup the second trash entry
-    # 3. A query to lookup the extra row we are deleting
-    # 4. A query to delete said row
-    # 5. A query to delete it's trash entry.
-    # 6. A query to delete any related row comments.
-    # 7. An extra query to close the second trash entries savepoint
-    # If we weren't caching the table models an extra number of queries would be first
-    # performed to lookup the table information which breaks this assertion.
-    with django_assert_num_queries(20):
+    # The rows of the same table are deleted together using set based queries, so
+    # deleting two rows takes exactly as many queries as deleting one.
+    with django_assert_num_queries(13):
         TrashHandler.permanently_delete_marked_trash()
 
 
+@pytest.mark.django_db
+def test_perm_deleting_rows_deletes_their_relations_in_batches(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    customers_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_text_field(table=customers_table, primary=True)
+    field_handler = FieldHandler()
+    link_field = field_handler.create_field(
+        user, table, "link_row", name="Customers", link_row_table=customers_table
+    )
+    self_link_field = field_handler.create_field(
+        user, table, "link_row", name="Related", link_row_table=table
+    )
+    multiple_select_field = field_handler.create_field(
+        user,
+        table,
+        "multiple_select",
+        name="Tags",
+        select_options=[{"value": "A", "color": "red"}],
+    )
+    option = multiple_select_field.select_options.first()
+    customer = customers_table.get_model().objects.create()
+
+    handler = RowHandler()
+    rows = []
+    for _ in range(3):
+        rows.append(
+            handler.create_row(
+                user,
+                table,
+                {
+                    f"field_{link_field.id}": [customer.id],
+                    f"field_{multiple_select_field.id}": [option.id],
+                },
+            )
+        )
+    kept_row = handler.create_row(
+        user, table, {f"field_{self_link_field.id}": [rows[0].id]}
+    )
+    handler.update_row(
+        user, table, rows[1].id, {f"field_{self_link_field.id}": [kept_row.id]}
+    )
+
+    for row in rows:
+        TrashHandler.trash(user, database.group, database, row, parent_id=table.id)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    deleted = []
+    with patch(
+        "baserow.contrib.database.trash.trash_types.RowTrashableItemType."
+        "permanent_deletion_batch_size",
+        2,
+    ), patch(
+        "baserow.core.trash.handler.items_permanently_deleted.send",
+        side_effect=lambda **kwargs: deleted.append(kwargs["trash_item_ids"]),
+    ):
+        TrashHandler.permanently_delete_marked_trash()
+
+    assert deleted == [[rows[0].id, rows[1].id], [rows[2].id]]
+    assert TrashEntry.objects.count() == 0
+
+    model = table.get_model()
+    assert list(model.objects_and_trash.values_list("id", flat=True)) == [kept_row.id]
+    for field in [link_field, self_link_field, multiple_select_field]:
+        assert getattr(model, f"field_{field.id}").through.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_perm_deleting_a_table_before_its_trashed_rows_and_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    database = table.database
+
+    rows = [model.objects.create() for _ in range(10)]
+    for row in rows:
+        TrashHandler.trash(user, database.group, database, row, parent_id=table.id)
+    TrashHandler.trash(user, database.group, database, field)
+    TrashHandler.trash(user, database.group, database, table)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    with patch(
+        "baserow.contrib.database.trash.trash_types.FieldTrashableItemType."
+        "permanently_delete_item"
+    ) as permanently_delete_field:
+        TrashHandler.permanently_delete_marked_trash()
+
+    # The field and the rows were deleted together with the table.
+    permanently_delete_field.assert_not_called()
+    assert TrashEntry.objects.count() == 0
+    assert not Table.objects_and_trash.filter(id=table.id).exists()
+    assert f"database_table_{table.id}" not in connection.introspection.table_names()
+
+
 @pytest.mark.django_db
 def test_can_delete_fields_and_rows_in_the_same_perm_delete_batch(
     data_fixture, django_assert_num_queries
@@ -826,8 +917,8 @@ def test_trashing_a_field_with_a_sort_trashes_the_sort(
 def test_can_perm_delete_tables(
     data_fixture,
 ):
-    patcher = patch("baserow.core.models.TrashEntry.delete")
-    trash_entry_delete = patcher.start()
+    patcher = patch("baserow.core.trash.handler.items_permanently_deleted.send")
+    items_permanently_deleted = patcher.start()
 
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(name="Car", user=user)
@@ -839,7 +930,9 @@ def test_can_perm_delete_tables(
 
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
-    trash_entry_delete.side_effect = RuntimeError("Force the outer transaction to fail")
+    items_permanently_deleted.side_effect = RuntimeError(
+        "Force the outer transaction to fail"
+    )
     with pytest.raises(RuntimeError):
         TrashHandler.permanently_delete_marked_trash()
 
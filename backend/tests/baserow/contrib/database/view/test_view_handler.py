@@ -10,6 +10,7 @@ from baserow.contrib.database.views.models import (
     View,
     GridView,
     FormView,
+    FormViewSubmission,
     ViewFilter,
     ViewSort,
 )
@@ -1375,3 +1376,95 @@ def test_submit_form_view(send_mock, data_fixture):
     assert getattr(all[1], f"field_{text_field.id}") == "Another value"
     assert getattr(all[1], f"field_{number_field.id}") == 10
     assert not getattr(all[1], f"field_{boolean_field.id}")
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_created.send")
+@patch("baserow.contrib.database.rows.signals.row_created.send")
+def test_submit_form_view_async(row_created_mock, rows_created_mock, data_fixture):
+    table = data_fixture.create_database_table()
+    form = data_fixture.create_form_view(table=table, async_submissions=True)
+    text_field = data_fixture.create_text_field(table=table)
+    data_fixture.create_form_view_field_option(
+        form, text_field, required=True, enabled=True
+    )
+    model = table.get_model()
+    handler = ViewHandler()
+
+    with pytest.raises(ValidationError):
+        handler.submit_form_view(form=form, values={})
+
+    for index in range(5):
+        assert (
+            handler.submit_form_view(
+                form=form, values={f"field_{text_field.id}": f"Value {index}"}
+            )
+            is None
+        )
+
+    assert FormViewSubmission.objects.filter(form_view=form).count() == 5
+    assert model.objects.count() == 0
+    row_created_mock.assert_not_called()
+
+    assert handler.process_form_view_submissions(form, batch_size=2) == 5
+
+    assert FormViewSubmission.objects.count() == 0
+    rows = list(model.objects.all())
+    assert [getattr(row, f"field_{text_field.id}") for row in rows] == [
+        f"Value {index}" for index in range(5)
+    ]
+    assert len({row.order for row in rows}) == 5
+    # One signal per batch.
+    assert rows_created_mock.call_count == 3
+    assert rows_created_mock.call_args[1]["user"] is None
+    assert [row.id for row in rows_created_mock.call_args[1]["rows"]] == [rows[4].id]
+    row_created_mock.assert_not_called()
+
+    assert handler.process_form_view_submissions(form) == 0
+
+
+@pytest.mark.django_db
+def test_process_form_view_submissions_no_longer_valid(data_fixture):
+    table = data_fixture.create_database_table()
+    form = data_fixture.create_form_view(table=table, async_submissions=True)
+    text_field = data_fixture.create_text_field(table=table)
+    deleted_field = data_fixture.create_text_field(table=table)
+    select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=select_field, value="A")
+    deleted_option = data_fixture.create_select_option(field=select_field, value="B")
+    for field in [text_field, deleted_field, select_field]:
+        data_fixture.create_form_view_field_option(
+            form, field, required=False, enabled=True
+        )
+    handler = ViewHandler()
+
+    handler.submit_form_view(
+        form=form,
+        values={
+            f"field_{text_field.id}": "Valid",
+            f"field_{deleted_field.id}": "Deleted",
+            f"field_{select_field.id}": option.id,
+        },
+    )
+    handler.submit_form_view(
+        form=form,
+        values={
+            f"field_{text_field.id}": "Invalid",
+            f"field_{select_field.id}": deleted_option.id,
+        },
+    )
+    handler.submit_form_view(form=form, values={f"field_{text_field.id}": "Last"})
+
+    deleted_field.delete()
+    deleted_option.delete()
+
+    assert handler.process_form_view_submissions(form) == 2
+
+    model = table.get_model()
+    rows = list(model.objects.all())
+    assert [getattr(row, f"field_{text_field.id}") for row in rows] == [
+        "Valid",
+        "Last",
+    ]
+    assert getattr(rows[0], f"field_{select_field.id}").id == option.id
+    assert FormViewSubmission.objects.count() == 0
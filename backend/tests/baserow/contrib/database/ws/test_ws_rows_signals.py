@@ -2,8 +2,9 @@ from typing import List, Any, Dict
 
 import pytest
 
-from unittest.mock import patch
+from unittest.mock import call, patch
 
+from django.core.cache import cache
 from rest_framework import serializers
 from rest_framework.fields import Field
 
@@ -12,6 +13,11 @@ from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
 )
+from baserow.contrib.database.ws.rows.buffer import (
+    RowsUpdatedBuffer,
+    rows_updated_buffer,
+)
+from baserow.contrib.database.ws.rows.tasks import flush_rows_updated_buffer
 from baserow.test_utils.helpers import register_instance_temporarily
 
 
@@ -179,3 +185,255 @@ def test_row_deleted(mock_broadcast_to_channel_group, data_fixture):
     assert args[0][1]["table_id"] == table.id
     assert args[0][1]["row"]["id"] == row_id
     assert args[0][1]["row"][f"field_{field.id}"] == "Value"
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_created(mock_broadcast_to_channel_group, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    row = table.get_model().objects.create()
+    rows = RowHandler().create_rows(
+        user=user,
+        table=table,
+        rows_values=[{f"field_{field.id}": "Test"}, {f"field_{field.id}": "Test2"}],
+        before=row,
+    )
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_created"
+    assert args[0][1]["table_id"] == table.id
+    assert [r["id"] for r in args[0][1]["rows"]] == [r.id for r in rows]
+    assert [r[f"field_{field.id}"] for r in args[0][1]["rows"]] == ["Test", "Test2"]
+    assert args[0][1]["before_row_id"] == row.id
+    assert args[0][1]["metadata"] == {}
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated(mock_broadcast_to_channel_group, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "Value 1"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "Value 2"})
+
+    with register_instance_temporarily(
+        row_metadata_registry, test_populates_with_row_id_metadata()
+    ):
+        RowHandler().update_rows(
+            user=user,
+            table=table,
+            rows_values=[
+                {"id": row_2.id, f"field_{field.id}": "Updated 2"},
+                {"id": row_1.id, f"field_{field.id}": "Updated 1"},
+            ],
+        )
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_updated"
+    assert args[0][1]["table_id"] == table.id
+    assert [r["id"] for r in args[0][1]["rows_before_update"]] == [row_2.id, row_1.id]
+    assert [r[f"field_{field.id}"] for r in args[0][1]["rows_before_update"]] == [
+        "Value 2",
+        "Value 1",
+    ]
+    assert [r["id"] for r in args[0][1]["rows"]] == [row_2.id, row_1.id]
+    assert [r[f"field_{field.id}"] for r in args[0][1]["rows"]] == [
+        "Updated 2",
+        "Updated 1",
+    ]
+    assert args[0][1]["metadata"] == {
+        row_1.id: {"row_id": row_1.id},
+        row_2.id: {"row_id": row_2.id},
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_deleted(mock_broadcast_to_channel_group, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "Value 1"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "Value 2"})
+    RowHandler().delete_rows(user=user, table=table, row_ids=[row_1.id, row_2.id])
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_deleted"
+    assert args[0][1]["table_id"] == table.id
+    assert args[0][1]["row_ids"] == [row_1.id, row_2.id]
+    assert [r[f"field_{field.id}"] for r in args[0][1]["rows"]] == [
+        "Value 1",
+        "Value 2",
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.ws.rows.tasks.flush_rows_updated_buffer.apply_async")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated_are_buffered(
+    mock_broadcast_to_channel_group, mock_apply_async, data_fixture
+):
+    cache.clear()
+    user = data_fixture.create_user()
+    user.web_socket_id = "web-socket-1"
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    other_field = data_fixture.create_text_field(table=other_table)
+    row_1, row_2 = RowHandler().create_rows(
+        user=user,
+        table=table,
+        rows_values=[{f"field_{field.id}": "1"}, {f"field_{field.id}": "2"}],
+    )
+    other_row = RowHandler().create_row(user=user, table=other_table)
+    mock_broadcast_to_channel_group.reset_mock()
+
+    with patch.object(rows_updated_buffer, "window", 10), register_instance_temporarily(
+        row_metadata_registry, test_populates_with_row_id_metadata()
+    ):
+        RowHandler().update_row(
+            user=user, table=table, row_id=row_1.id, values={f"field_{field.id}": "a"}
+        )
+        RowHandler().update_rows(
+            user=user,
+            table=table,
+            rows_values=[
+                {"id": row_2.id, f"field_{field.id}": "b"},
+                {"id": row_1.id, f"field_{field.id}": "c"},
+            ],
+        )
+        RowHandler().update_row(
+            user=user,
+            table=other_table,
+            row_id=other_row.id,
+            values={f"field_{other_field.id}": "d"},
+        )
+
+        # A task has been scheduled for every table, but nothing has been
+        # broadcasted.
+        assert mock_apply_async.call_args_list == [
+            call((table.id,), countdown=10),
+            call((other_table.id,), countdown=10),
+        ]
+        mock_broadcast_to_channel_group.delay.assert_not_called()
+
+        flush_rows_updated_buffer(table.id)
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_updated"
+    assert args[0][1]["table_id"] == table.id
+    assert [row["id"] for row in args[0][1]["rows"]] == [row_1.id, row_2.id]
+    assert [row[f"field_{field.id}"] for row in args[0][1]["rows"]] == ["c", "b"]
+    assert [row[f"field_{field.id}"] for row in args[0][1]["rows_before_update"]] == [
+        "1",
+        "2",
+    ]
+    assert args[0][1]["metadata"] == {
+        row_1.id: {"row_id": row_1.id},
+        row_2.id: {"row_id": row_2.id},
+    }
+    assert args[0][2] == "web-socket-1"
+
+    # The updates are only broadcasted once.
+    flush_rows_updated_buffer(table.id)
+    assert mock_broadcast_to_channel_group.delay.call_count == 1
+
+    flush_rows_updated_buffer(other_table.id)
+    assert mock_broadcast_to_channel_group.delay.call_count == 2
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{other_table.id}"
+    assert [row[f"field_{other_field.id}"] for row in args[0][1]["rows"]] == ["d"]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_row_orders_rebalanced(mock_broadcast_to_channel_group, data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    model.objects.create()
+    row = model.objects.create()
+    RowHandler().rebalance_row_orders(table, row.id)
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1] == {"type": "row_orders_rebalanced", "table_id": table.id}
+    assert args[0][2] is None
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.ws.rows.tasks.flush_rows_updated_buffer.apply_async")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_buffered_rows_updated_are_broadcasted_in_order(
+    mock_broadcast_to_channel_group, mock_apply_async, data_fixture
+):
+    cache.clear()
+    messages = []
+    mock_broadcast_to_channel_group.delay.side_effect = lambda group, payload, ignore: (
+        messages.append(
+            (
+                payload["type"],
+                ignore,
+                [row["id"] for row in payload.get("rows", [])],
+            )
+        )
+    )
+
+    user = data_fixture.create_user()
+    user.web_socket_id = "web-socket-1"
+    user_2 = data_fixture.create_user()
+    user_2.web_socket_id = "web-socket-2"
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_user_group(group=table.database.group, user=user_2)
+    field = data_fixture.create_text_field(table=table)
+    row_1, row_2 = RowHandler().create_rows(
+        user=user,
+        table=table,
+        rows_values=[{f"field_{field.id}": "1"}, {f"field_{field.id}": "2"}],
+    )
+    messages.clear()
+
+    with patch.object(rows_updated_buffer, "window", 10):
+        handler = RowHandler()
+        handler.update_row(
+            user=user, table=table, row_id=row_1.id, values={f"field_{field.id}": "a"}
+        )
+        handler.update_row(
+            user=user_2, table=table, row_id=row_1.id, values={f"field_{field.id}": "b"}
+        )
+        # The buffer is shared via the cache, so updates buffered by another process
+        # are broadcasted in order as well.
+        RowsUpdatedBuffer(10).add(
+            table.id,
+            [{"id": row_2.id}],
+            [{"id": row_2.id}],
+            "web-socket-1",
+        )
+        assert messages == []
+
+        handler.delete_row(user=user_2, table=table, row_id=row_2.id)
+
+    # The second update of the first user doesn't touch the row updated by the
+    # second user, so it's merged into the first message.
+    assert messages == [
+        ("rows_updated", "web-socket-1", [row_1.id, row_2.id]),
+        ("rows_updated", "web-socket-2", [row_1.id]),
+        ("row_deleted", "web-socket-2", []),
+    ]
+    mock_apply_async.assert_called_once_with((table.id,), countdown=10)
+
+    flush_rows_updated_buffer(table.id)
+    assert len(messages) == 3
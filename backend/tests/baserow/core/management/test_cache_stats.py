@@ -0,0 +1,27 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from baserow.core.cache import cache_stats
+
+
+def test_cache_stats():
+    cache_stats.reset()
+
+    out = StringIO()
+    call_command("cache_stats", stdout=out)
+    assert "No cache lookups have been recorded yet." in out.getvalue()
+
+    cache_stats.record("table", True, 0.002)
+    cache_stats.record("table", True, 0.001)
+    cache_stats.record("table", True, 0.002)
+    cache_stats.record("table", False, 0.003)
+
+    out = StringIO()
+    call_command("cache_stats", "--reset", stdout=out)
+    output = out.getvalue()
+    assert (
+        "table: 3 hits, 1 misses, 75.0% hit ratio, 2.000 ms average latency" in output
+    )
+    assert "The cache stats have been reset." in output
+    assert cache_stats.get_stats() == {}
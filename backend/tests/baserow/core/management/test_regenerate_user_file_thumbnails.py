@@ -0,0 +1,40 @@
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+
+from baserow.core.user_files.handler import UserFileHandler
+
+
+@pytest.mark.django_db
+def test_regenerate_user_file_thumbnails(data_fixture, tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+    user_files = []
+
+    for index in range(3):
+        user_file = data_fixture.create_user_file(
+            original_name=f"image_{index}.png",
+            is_image=True,
+            image_width=100,
+            image_height=140,
+        )
+        image = Image.new("RGB", (100, 140), color="red")
+        image_bytes = BytesIO()
+        image.save(image_bytes, format="PNG")
+        storage.save(handler.user_file_path(user_file), image_bytes)
+        user_files.append(user_file)
+    data_fixture.create_user_file(original_name="test.txt")
+
+    output = StringIO()
+    with patch("baserow.core.user_files.handler.default_storage", new=storage):
+        call_command("regenerate_user_file_thumbnails", batch_size=2, stdout=output)
+
+    assert output.getvalue() == "3 thumbnails have been regenerated.\n"
+    for user_file in user_files:
+        thumbnail = Image.open(str(tmpdir.join("thumbnails", "tiny", user_file.name)))
+        assert thumbnail.size == (21, 21)
@@ -0,0 +1,196 @@
+import pytest
+
+from django.core.cache import cache
+from django.test.utils import override_settings
+
+from baserow.core.cache import (
+    NOT_IN_GROUP,
+    CacheStats,
+    get_cache_key,
+    get_group_user_permissions,
+    get_group_user_permissions_cache_key,
+    get_or_set,
+    get_scope_version_cache_key,
+    invalidate_scope,
+    request_cache_scope,
+)
+from baserow.core.exceptions import UserNotInGroup
+from baserow.core.handler import CoreHandler
+
+
+@pytest.mark.django_db
+def test_group_has_user_is_cached_per_request(data_fixture, django_assert_num_queries):
+    group_user = data_fixture.create_user_group(permissions="ADMIN")
+    group = group_user.group
+    user = group_user.user
+    other_user = data_fixture.create_user()
+
+    with request_cache_scope():
+        with django_assert_num_queries(2):
+            assert group.has_user(user, "ADMIN")
+            group.has_user(user, ["ADMIN", "MEMBER"], raise_error=True)
+            assert not group.has_user(other_user)
+            with pytest.raises(UserNotInGroup):
+                group.has_user(other_user, raise_error=True)
+
+        # Changing the group user invalidates the cached permissions.
+        CoreHandler().update_group_user(user, group_user, permissions="MEMBER")
+        assert not group.has_user(user, "ADMIN")
+        assert group.has_user(user, "MEMBER")
+
+        group_user.delete()
+        assert not group.has_user(user)
+
+    # Outside of a request the permissions are fetched every time.
+    with django_assert_num_queries(2):
+        assert not group.has_user(user)
+        assert not group.has_user(user)
+
+
+@pytest.mark.django_db
+def test_group_has_user_trashed_group(data_fixture, django_assert_num_queries):
+    group_user = data_fixture.create_user_group()
+    group = group_user.group
+    group.trashed = True
+    group.save()
+
+    with django_assert_num_queries(0):
+        assert not group.has_user(group_user.user)
+        with pytest.raises(UserNotInGroup):
+            group.has_user(group_user.user, raise_error=True)
+
+    assert group.has_user(group_user.user, include_trash=True)
+
+
+@pytest.mark.django_db
+@override_settings(GROUP_USER_PERMISSIONS_CACHE_SECONDS=10)
+def test_group_user_permissions_shared_cache(
+    data_fixture, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    group_user = data_fixture.create_user_group(permissions="ADMIN")
+    user_id = group_user.user_id
+    group_id = group_user.group_id
+    cache_key = get_group_user_permissions_cache_key(user_id, group_id)
+
+    # The permissions are only shared after the transaction has been committed.
+    with django_capture_on_commit_callbacks(execute=True):
+        assert get_group_user_permissions(user_id, group_id) == "ADMIN"
+        assert cache.get(cache_key) is None
+    assert cache.get(cache_key) == "ADMIN"
+
+    with django_assert_num_queries(0):
+        assert get_group_user_permissions(user_id, group_id) == "ADMIN"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        group_user.permissions = "MEMBER"
+        group_user.save()
+        assert cache.get(cache_key) is None
+    assert cache.get(cache_key) is None
+
+    assert get_group_user_permissions(user_id, group_id) == "MEMBER"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        group_user.delete()
+        assert get_group_user_permissions(user_id, group_id) is None
+    assert cache.get(cache_key) == NOT_IN_GROUP
+
+    with django_assert_num_queries(0):
+        assert get_group_user_permissions(user_id, group_id) is None
+
+
+@pytest.mark.django_db
+@override_settings(GROUP_USER_PERMISSIONS_CACHE_SECONDS=0)
+def test_group_user_permissions_shared_cache_disabled(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    group_user = data_fixture.create_user_group(permissions="ADMIN")
+    cache_key = get_group_user_permissions_cache_key(
+        group_user.user_id, group_user.group_id
+    )
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        get_group_user_permissions(group_user.user_id, group_user.group_id)
+
+    assert len(callbacks) == 0
+    assert cache.get(cache_key) is None
+
+
+@pytest.mark.django_db
+def test_get_or_set_versioned_scope(django_capture_on_commit_callbacks):
+    computed = []
+
+    def compute():
+        computed.append(True)
+        return len(computed)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert get_or_set("test", 1, ["value"], compute) == 1
+    assert get_or_set("test", 1, ["value"], compute) == 1
+    assert get_or_set("test", 2, ["value"], compute) == 2
+    assert len(computed) == 2
+
+    key = get_cache_key("test", 1, "value")
+    assert key.startswith("baserow:test:1:v")
+    assert key.endswith(":value")
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        invalidate_scope("test", 1)
+    assert len(callbacks) == 1
+    assert get_cache_key("test", 1, "value") != key
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert get_or_set("test", 1, ["value"], compute) == 3
+
+    # The version is recreated with a new value if it has been evicted.
+    cache.delete(get_scope_version_cache_key("test", 1))
+    assert get_cache_key("test", 1, "value") != key
+    assert get_or_set("test", 1, ["value"], compute) == 4
+
+
+@pytest.mark.django_db
+def test_get_or_set_does_not_cache_values_of_old_version(
+    django_capture_on_commit_callbacks,
+):
+    def compute():
+        # The scope is invalidated while the value is being computed, for example
+        # because another process changes the data.
+        invalidate_scope("test", 3)
+        return "stale"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert get_or_set("test", 3, ["value"], compute) == "stale"
+
+    assert get_or_set("test", 3, ["value"], lambda: "fresh") == "fresh"
+
+
+def test_cache_stats():
+    stats = CacheStats(flush_interval=10)
+    stats.reset()
+
+    stats.record("first", True, 0.001)
+    stats.record("first", True, 0.003)
+    stats.record("first", False, 0.002)
+    stats.record("second", False, 0.001)
+    assert stats.get_stats() == {}
+
+    stats.flush()
+    stats.record("first", True, 0.001)
+    stats.flush()
+    assert stats.get_stats() == {
+        "first": {"hits": 3, "misses": 1, "latency_us": 7000},
+        "second": {"hits": 0, "misses": 1, "latency_us": 1000},
+    }
+
+    stats.reset()
+    assert stats.get_stats() == {}
+
+
+def test_cache_stats_flush_interval():
+    stats = CacheStats(flush_interval=0)
+    stats.reset()
+
+    stats.record("first", True, 0.001)
+    assert stats.get_stats() == {
+        "first": {"hits": 1, "misses": 0, "latency_us": 1000},
+    }
+    stats.reset()
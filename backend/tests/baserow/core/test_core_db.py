@@ -3,7 +3,12 @@ import pytest
 from django.db import connection
 from django.test.utils import override_settings
 
-from baserow.core.db import LockedAtomicTransaction
+from baserow.contrib.database.fields.models import Field
+from baserow.core.db import (
+    LockedAtomicTransaction,
+    get_estimated_count,
+    specific_iterator,
+)
 from baserow.core.models import Settings
 
 
@@ -24,3 +29,71 @@ def test_locked_atomic_transaction(api_client, data_fixture):
 
     with LockedAtomicTransaction(Settings):
         assert is_locked(Settings)
+
+
+@pytest.mark.django_db
+def test_get_estimated_count(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.bulk_create(
+        [model(**{f"field_{text_field.id}": str(i % 2)}) for i in range(100)]
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    assert get_estimated_count(model.objects.all()) == 100
+    filtered = model.objects.filter(**{f"field_{text_field.id}": "1"})
+    assert 0 < get_estimated_count(filtered) < 100
+
+
+@pytest.mark.django_db
+def test_specific_iterator(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    text_field_2 = data_fixture.create_text_field(table=table)
+    trashed_field = data_fixture.create_boolean_field(table=table, trashed=True)
+    link_row_field = data_fixture.create_link_row_field(table=table)
+
+    queryset = (
+        Field.objects_and_trash.filter(table=table)
+        .select_related("table")
+        .order_by("id")
+    )
+
+    # One query for the base instances and one per specific field type.
+    with django_assert_num_queries(5):
+        fields = list(specific_iterator(queryset))
+
+    assert [field.id for field in fields] == [
+        text_field.id,
+        number_field.id,
+        text_field_2.id,
+        trashed_field.id,
+        link_row_field.id,
+    ]
+    assert [type(field) for field in fields] == [
+        type(text_field),
+        type(number_field),
+        type(text_field_2),
+        type(trashed_field),
+        type(link_row_field),
+    ]
+
+    # The selected related objects are copied to the specific instances.
+    with django_assert_num_queries(0):
+        assert all(field.table.id == table.id for field in fields)
+
+    # Already specific instances don't have to be fetched again.
+    with django_assert_num_queries(0):
+        assert list(specific_iterator(fields)) == fields
+
+    base_fields = list(Field.objects.filter(table=table).prefetch_related("table"))
+    with django_assert_num_queries(2):
+        fields = list(specific_iterator(base_fields[:2]))
+
+    with django_assert_num_queries(0):
+        assert base_fields[0].specific is fields[0]
+        assert fields[1].table.id == table.id
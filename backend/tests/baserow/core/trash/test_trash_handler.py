@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 import pytest
 from django.db import connection
+from django.test.utils import override_settings
 from django.utils import timezone
 from freezegun import freeze_time
 
@@ -113,6 +116,28 @@ def test_a_trash_entry_marked_for_permanent_deletion_gets_deleted_by_task(
     assert Group.objects.count() == 0
 
 
+@pytest.mark.django_db
+@override_settings(TRASH_PERMANENT_DELETION_TIME_BUDGET_SECONDS=10)
+def test_permanently_deleting_marked_trash_stops_when_out_of_time(data_fixture):
+    user = data_fixture.create_user()
+    groups = [data_fixture.create_group(user=user) for _ in range(3)]
+    for group in groups:
+        TrashHandler.trash(user, group, None, group)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    # The first two batches start within the time budget of 10 seconds.
+    with patch("baserow.core.trash.handler.time.monotonic", side_effect=[0, 0, 5, 11]):
+        TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 1
+    assert Group.objects_and_trash.count() == 1
+
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 0
+    assert Group.objects_and_trash.count() == 0
+
+
 @pytest.mark.django_db
 def test_a_group_marked_for_perm_deletion_raises_a_404_when_asked_for_trash_contents(
     data_fixture,
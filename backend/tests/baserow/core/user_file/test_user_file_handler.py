@@ -1,6 +1,7 @@
 import pytest
 import responses
 import string
+from unittest.mock import patch
 
 from freezegun import freeze_time
 from PIL import Image
@@ -218,6 +219,96 @@ def test_upload_user_file(data_fixture, tmpdir):
     )
 
 
+@pytest.mark.django_db
+def test_upload_user_file_generates_thumbnails_in_background(
+    data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with patch("baserow.core.user_files.handler.default_storage", new=storage):
+        with django_capture_on_commit_callbacks() as callbacks:
+            user_file = handler.upload_user_file(user, "image.png", image_bytes)
+
+        assert user_file.thumbnails_status == "pending"
+        assert tmpdir.join("user_files", user_file.name).isfile()
+        assert not tmpdir.join("thumbnails", "tiny", user_file.name).isfile()
+
+        assert len(callbacks) == 1
+        callbacks[0]()
+
+    user_file.refresh_from_db()
+    assert user_file.thumbnails_status == "complete"
+    thumbnail = Image.open(str(tmpdir.join("thumbnails", "tiny", user_file.name)))
+    assert thumbnail.size == (21, 21)
+
+    # Other files don't have thumbnails to generate.
+    with django_capture_on_commit_callbacks() as callbacks:
+        user_file = handler.upload_user_file(
+            user, "test.txt", ContentFile(b"Hello"), storage=storage
+        )
+    assert user_file.thumbnails_status == "complete"
+    assert len(callbacks) == 0
+
+
+@pytest.mark.django_db
+def test_generate_user_file_thumbnails(data_fixture, tmpdir, settings):
+    settings.USER_THUMBNAILS = {"tiny": [None, 21], "card": [300, 160]}
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    for image_format, extension in [("PNG", "png"), ("JPEG", "jpg")]:
+        user_file = data_fixture.create_user_file(
+            original_name=f"large.{extension}",
+            is_image=True,
+            image_width=2000,
+            image_height=1500,
+            thumbnails_status="pending",
+        )
+        image = Image.new("RGB", (2000, 1500), color="red")
+        image_bytes = BytesIO()
+        image.save(image_bytes, format=image_format)
+        storage.save(handler.user_file_path(user_file), image_bytes)
+
+        # The image is at least 6 times larger than the thumbnails, so it is reduced
+        # to a third of its size before the thumbnails are resized from it. A JPEG
+        # image is decoded at a lower scale right away instead.
+        with patch.object(
+            Image.Image, "reduce", autospec=True, side_effect=Image.Image.reduce
+        ) as reduce:
+            handler.generate_user_file_thumbnails(user_file, storage=storage)
+
+        if image_format == "PNG":
+            assert reduce.call_args[0][1] == 3
+        else:
+            reduce.assert_not_called()
+
+        user_file.refresh_from_db()
+        assert user_file.thumbnails_status == "complete"
+        for name, size in [("tiny", (28, 21)), ("card", (300, 160))]:
+            path = tmpdir.join("thumbnails", name, user_file.name)
+            thumbnail = Image.open(str(path))
+            assert thumbnail.size == size
+            assert thumbnail.format == image_format
+
+    user_file = data_fixture.create_user_file(
+        original_name="broken.png",
+        is_image=True,
+        image_width=10,
+        image_height=10,
+        thumbnails_status="pending",
+    )
+    storage.save(handler.user_file_path(user_file), ContentFile(b"Not an image"))
+    handler.generate_user_file_thumbnails(user_file, storage=storage)
+    user_file.refresh_from_db()
+    assert user_file.thumbnails_status == "failed"
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_upload_user_file_by_url(data_fixture, tmpdir):
@@ -0,0 +1,43 @@
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from pyinstrument import Profiler
+
+from baserow.contrib.database.export.handler import ExportHandler
+from baserow.contrib.database.management.commands.fill_table import fill_table
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+
+@pytest.mark.django_db
+@pytest.mark.slow
+@patch("baserow.contrib.database.export.handler.default_storage")
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_exporting_many_rows_to_csv_is_fast(storage_mock, data_fixture):
+    table, user, _, _ = setup_interesting_test_table(data_fixture)
+    count = 10000
+    fill_table(count, table)
+
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user,
+        table,
+        None,
+        {"exporter_type": "csv", "export_charset": "utf-8"},
+    )
+
+    profiler = Profiler()
+    profiler.start()
+    handler.run_export_job(job)
+    profiler.stop()
+
+    job.refresh_from_db()
+    assert job.progress_percentage == 1.0
+    # Add -s also the the additional args to see the profiling output!
+    # The JSON and XML exporters are benchmarked in the premium tests.
+    print(profiler.output_text(unicode=True, color=True))
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+def submit_form_view_many_times(form, text_field, count):
+    handler = ViewHandler()
+    model = form.table.get_model()
+    for i in range(count):
+        handler.submit_form_view(form, {f"field_{text_field.id}": f"Value {i}"}, model)
+
+
+@pytest.mark.django_db
+@pytest.mark.slow
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_async_form_view_submissions_are_faster(data_fixture):
+    count = 2000
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    form = data_fixture.create_form_view(table=table)
+    data_fixture.create_form_view_field_option(form, text_field, enabled=True)
+
+    start = time.perf_counter()
+    submit_form_view_many_times(form, text_field, count)
+    sync_duration = time.perf_counter() - start
+
+    form.async_submissions = True
+    form.save()
+
+    start = time.perf_counter()
+    submit_form_view_many_times(form, text_field, count)
+    ViewHandler().process_form_view_submissions(form)
+    async_duration = time.perf_counter() - start
+
+    assert table.get_model().objects.count() == count * 2
+    # Add -s also the the additional args to see the output!
+    print(
+        f"Synchronous: {count / sync_duration:.0f} submissions/s, "
+        f"queued and processed in batches: {count / async_duration:.0f} "
+        f"submissions/s"
+    )
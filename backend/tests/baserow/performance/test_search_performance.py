@@ -0,0 +1,60 @@
+from time import perf_counter
+
+import pytest
+from pyinstrument import Profiler
+
+from baserow.contrib.database.db.copy import copy_rows_into_table
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.search import SEARCH_MODE_FULL_TEXT
+
+
+def search_all_fields(table, search):
+    model = table.get_model()
+    start = perf_counter()
+    ids = list(model.objects.all().search_all_fields(search).values_list("id")[:100])
+    return ids, perf_counter() - start
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.slow
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_full_text_search_of_many_rows_is_fast(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name", primary=True)
+    long_text_field = data_fixture.create_long_text_field(table=table, name="Notes")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    count = 1000000
+
+    copy_rows_into_table(
+        table.get_model(),
+        (
+            {
+                "order": i + 1,
+                f"field_{text_field.id}": f"Customer {i}",
+                f"field_{long_text_field.id}": "Lorem ipsum dolor sit amet"
+                if i != count // 2
+                else "Lorem ipsum needle sit amet",
+                f"field_{number_field.id}": i,
+            }
+            for i in range(count)
+        ),
+    )
+
+    default_ids, default_duration = search_all_fields(table, "needle")
+
+    profiler = Profiler()
+    profiler.start()
+    TableHandler().update_search_mode(table, SEARCH_MODE_FULL_TEXT)
+    profiler.stop()
+
+    table.refresh_from_db()
+    full_text_ids, full_text_duration = search_all_fields(table, "needle")
+
+    assert default_ids == full_text_ids
+    assert len(full_text_ids) == 1
+    # Add -s also the the additional args to see the profiling output!
+    print(profiler.output_text(unicode=True, color=True))
+    print(f"Default search of {count} rows took {default_duration:.3f}s")
+    print(f"Full text search of {count} rows took {full_text_duration:.3f}s")
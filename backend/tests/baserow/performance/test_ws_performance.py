@@ -0,0 +1,70 @@
+from time import perf_counter
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import sync_to_async
+from channels.testing import WebsocketCommunicator
+
+from baserow.config.asgi import application
+from baserow.ws.consumers import CoreConsumer
+from baserow.ws.tasks import broadcast_to_users
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.slow
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+async def test_broadcast_to_users_messages_handled_per_connection(data_fixture):
+    connection_count = 200
+    broadcast_count = 100
+
+    users_and_tokens = [
+        await sync_to_async(data_fixture.create_user_and_token)(
+            email=f"user{index}@localhost"
+        )
+        for index in range(connection_count)
+    ]
+
+    handled_messages = 0
+    original_broadcast_to_users = CoreConsumer.broadcast_to_users
+
+    async def counting_broadcast_to_users(self, event):
+        nonlocal handled_messages
+        handled_messages += 1
+        await original_broadcast_to_users(self, event)
+
+    communicators = []
+    with patch.object(CoreConsumer, "broadcast_to_users", counting_broadcast_to_users):
+        for user, token in users_and_tokens:
+            communicator = WebsocketCommunicator(
+                application,
+                f"ws/core/?jwt_token={token}",
+                headers=[(b"origin", b"http://localhost")],
+            )
+            await communicator.connect()
+            await communicator.receive_json_from()
+            communicators.append(communicator)
+
+        start = perf_counter()
+        for index in range(broadcast_count):
+            user, _ = users_and_tokens[index % connection_count]
+            await sync_to_async(broadcast_to_users)([user.id], {"message": index})
+        for index in range(broadcast_count):
+            await communicators[index % connection_count].receive_json_from(1)
+        duration = perf_counter() - start
+
+    for communicator in communicators:
+        await communicator.disconnect()
+
+    # Add -s also the the additional args to see the output!
+    # Before every connection joined its own user group, every connection handled
+    # every message, so the amount of messages handled per connection was equal to
+    # `broadcast_count`.
+    print(
+        f"{broadcast_count} broadcasts to single users with {connection_count} "
+        f"connections took {duration:.3f}s and "
+        f"{handled_messages / connection_count:.3f} messages were handled per "
+        f"connection."
+    )
+    assert handled_messages == broadcast_count
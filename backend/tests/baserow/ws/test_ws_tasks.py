@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from asgiref.sync import sync_to_async
@@ -6,6 +8,7 @@ from channels.testing import WebsocketCommunicator
 from channels.db import database_sync_to_async
 
 from baserow.config.asgi import application
+from baserow.ws.consumers import CoreConsumer
 from baserow.ws.tasks import (
     broadcast_to_users,
     broadcast_to_channel_group,
@@ -236,3 +239,46 @@ async def test_broadcast_to_group(data_fixture):
     await communicator_1.disconnect()
     await communicator_2.disconnect()
     await communicator_3.disconnect()
+
+
+@pytest.mark.run(order=7)
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_broadcast_to_users_is_only_handled_by_connections_of_the_users(
+    data_fixture,
+):
+    user_1, token_1 = data_fixture.create_user_and_token()
+    user_2, token_2 = data_fixture.create_user_and_token()
+
+    handled_by_user_ids = []
+    original_broadcast_to_users = CoreConsumer.broadcast_to_users
+
+    async def counting_broadcast_to_users(self, event):
+        handled_by_user_ids.append(self.scope["user"].id)
+        await original_broadcast_to_users(self, event)
+
+    communicators = []
+    with patch.object(CoreConsumer, "broadcast_to_users", counting_broadcast_to_users):
+        for token in [token_1, token_1, token_2]:
+            communicator = WebsocketCommunicator(
+                application,
+                f"ws/core/?jwt_token={token}",
+                headers=[(b"origin", b"http://localhost")],
+            )
+            await communicator.connect()
+            await communicator.receive_json_from()
+            communicators.append(communicator)
+
+        await sync_to_async(broadcast_to_users)([user_1.id], {"message": "test"})
+
+        response = await communicators[0].receive_json_from(0.1)
+        assert response["message"] == "test"
+        response = await communicators[1].receive_json_from(0.1)
+        assert response["message"] == "test"
+        await communicators[2].receive_nothing(0.1)
+
+        # Only the two connections of user 1 must have handled the message.
+        assert handled_by_user_ids == [user_1.id, user_1.id]
+
+    for communicator in communicators:
+        await communicator.disconnect()
@@ -0,0 +1,111 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, List, Optional, Tuple, Union
+
+from baserow.core.cache import get_or_set, invalidate_scope
+
+
+class LicensePayloadCache:
+    """
+    A per process least recently used cache of decoded license payloads. Decoding a
+    license requires verifying its RSA signature, which is relatively expensive and
+    would otherwise happen for every request that checks whether the user has an
+    active premium license. The entries are keyed by the id of the license and the
+    hash of the license payload, so an updated license is decoded again. Invalid
+    licenses are not cached, so that the error is raised every time.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(license_id: Optional[int], license_payload: bytes) -> Hashable:
+        from .handler import get_public_key_file_name
+
+        # The public key is part of the key because a payload that is valid for the
+        # debug key is not valid for the production key.
+        return (
+            license_id,
+            hashlib.sha256(license_payload).hexdigest(),
+            get_public_key_file_name(),
+        )
+
+    def get_payload(
+        self, license_id: Optional[int], license_payload: Union[str, bytes]
+    ) -> dict:
+        """
+        Returns the decoded payload of the license and decodes it if it isn't cached.
+
+        :param license_id: The id of the license object.
+        :param license_payload: The raw license that must be decoded.
+        :raises InvalidPremiumLicenseError: When the provided license is invalid.
+        :return: The decoded license payload.
+        """
+
+        from .handler import decode_license
+
+        if isinstance(license_payload, str):
+            license_payload = license_payload.encode()
+
+        key = self.get_key(license_id, license_payload)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        payload = decode_license(license_payload)
+
+        if self.max_size > 0:
+            with self._lock:
+                self._entries[key] = payload
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def get_user_licenses(user_id: int) -> List[Tuple[int, str]]:
+    """
+    Returns the ids and raw payloads of the licenses that the user has a seat on. The
+    result is cached in the shared cache until a license or seat changes.
+
+    :param user_id: The id of the user of which the licenses are requested.
+    :return: A list containing the id and license payload of every license.
+    """
+
+    from .models import License
+
+    return get_or_set(
+        "premium_licenses",
+        0,
+        ["user", user_id],
+        lambda: list(
+            License.objects.filter(users__user_id=user_id)
+            .distinct()
+            .order_by("id")
+            .values_list("id", "license")
+        ),
+    )
+
+
+def invalidate_user_licenses():
+    """
+    Invalidates the cached licenses of all users. This must be called when a license
+    is registered, updated or removed, or when the seats of a license change.
+    """
+
+    invalidate_scope("premium_licenses", 0)
+
+
+license_payload_cache = LicensePayloadCache(128)
@@ -28,6 +28,7 @@ from baserow.core.exceptions import IsNotAdminError
 from baserow.core.handler import CoreHandler
 from baserow.ws.signals import broadcast_to_users
 
+from .cache import get_user_licenses, invalidate_user_licenses
 from .models import License, LicenseUser
 from .exceptions import (
     NoPremiumLicenseError,
@@ -60,7 +61,12 @@ def has_active_premium_license(user: DjangoUser) -> bool:
     :return: True if the user has an active license to the version.
     """
 
-    available_licenses = License.objects.filter(users__user_id__in=[user.id]).distinct()
+    # The licenses of the user are cached and so are their decoded payloads, so this
+    # normally doesn't require a query or verifying the signature of the license.
+    available_licenses = [
+        License(id=license_id, license=license_payload)
+        for license_id, license_payload in get_user_licenses(user.id)
+    ]
 
     for available_license in available_licenses:
         try:
@@ -85,6 +91,15 @@ def check_active_premium_license(user):
         raise NoPremiumLicenseError()
 
 
+def get_public_key_file_name():
+    """
+    Returns the name of the file containing the public key that is used to verify
+    licenses. A different key file is used when Baserow is in debug mode.
+    """
+
+    return "public_key_debug.pem" if settings.DEBUG else "public_key.pem"
+
+
 def get_public_key():
     """
     Returns the public key instance that can be used to verify licenses. A different
@@ -93,7 +108,7 @@ def get_public_key():
 
     import baserow_premium
 
-    file_name = "public_key_debug.pem" if settings.DEBUG else "public_key.pem"
+    file_name = get_public_key_file_name()
     public_key_path = join(dirname(baserow_premium.__file__), file_name)
     with open(public_key_path, "rb") as key_file:
         public_key = serialization.load_pem_public_key(
@@ -281,6 +296,9 @@ def check_licenses(license_objects: List[License]) -> List[License]:
         license_object.last_check = now()
         license_object.save()
 
+    # The licenses could have been updated, removed or could have lost seats.
+    invalidate_user_licenses()
+
     return license_objects
 
 
@@ -374,6 +392,7 @@ def register_license(
             if license_object.issued_on < issued_on:
                 license_object.license = license_payload_as_string
                 license_object.save()
+                invalidate_user_licenses()
                 return license_object
             # If the `issued_on` date of the existing license is higher or equal to
             # the new license, we want to raise the exception that the most license
@@ -382,7 +401,9 @@ def register_license(
                 raise PremiumLicenseAlreadyExists("The license already exists.")
 
     # If the license doesn't exist we want to create a new one.
-    return License.objects.create(license=license_payload_as_string)
+    license_object = License.objects.create(license=license_payload_as_string)
+    invalidate_user_licenses()
+    return license_object
 
 
 def remove_license(requesting_user: User, license: License):
@@ -398,6 +419,7 @@ def remove_license(requesting_user: User, license: License):
         raise IsNotAdminError()
 
     license.delete()
+    invalidate_user_licenses()
 
 
 def add_user_to_license(
@@ -441,7 +463,9 @@ def add_user_to_license(
             )
         )
 
-    return LicenseUser.objects.create(license=license_object, user=user)
+    license_user = LicenseUser.objects.create(license=license_object, user=user)
+    invalidate_user_licenses()
+    return license_user
 
 
 def remove_user_from_license(
@@ -460,6 +484,7 @@ def remove_user_from_license(
         raise IsNotAdminError()
 
     LicenseUser.objects.filter(license=license_object, user=user).delete()
+    invalidate_user_licenses()
 
     if license_object.is_active:
         transaction.on_commit(
@@ -498,6 +523,7 @@ def fill_remaining_seats_of_license(
             LicenseUser(license=license_object, user=user) for user in users_to_add
         ]
         LicenseUser.objects.bulk_create(user_licenses)
+        invalidate_user_licenses()
 
         if license_object.is_active:
             transaction.on_commit(
@@ -529,6 +555,7 @@ def remove_all_users_from_license(requesting_user: User, license_object: License
     license_users = LicenseUser.objects.filter(license=license_object)
     license_user_ids = list(license_users.values_list("user_id", flat=True))
     license_users.delete()
+    invalidate_user_licenses()
 
     if license_object.is_active:
         transaction.on_commit(
@@ -22,12 +22,9 @@ class License(models.Model):
 
     @cached_property
     def payload(self):
-        from .handler import decode_license
+        from .cache import license_payload_cache
 
-        premium_license = self.license
-        if isinstance(premium_license, str):
-            premium_license = premium_license.encode()
-        return decode_license(premium_license)
+        return license_payload_cache.get_payload(self.id, self.license)
 
     @property
     def license_id(self):
@@ -0,0 +1,47 @@
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from django.test.utils import override_settings
+from pyinstrument import Profiler
+
+from baserow.contrib.database.export.handler import ExportHandler
+from baserow.contrib.database.management.commands.fill_table import fill_table
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+
+@pytest.mark.django_db
+@pytest.mark.slow
+@override_settings(DEBUG=True)
+@pytest.mark.parametrize("exporter_type", ["json", "xml"])
+@patch("baserow.contrib.database.export.handler.default_storage")
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_exporting_many_rows_is_fast(storage_mock, premium_data_fixture, exporter_type):
+    table, user, _, _ = setup_interesting_test_table(
+        premium_data_fixture, user_kwargs={"has_active_premium_license": True}
+    )
+    count = 10000
+    fill_table(count, table)
+
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user,
+        table,
+        None,
+        {"exporter_type": exporter_type, "export_charset": "utf-8"},
+    )
+
+    profiler = Profiler()
+    profiler.start()
+    handler.run_export_job(job)
+    profiler.stop()
+
+    job.refresh_from_db()
+    assert job.progress_percentage == 1.0
+    # Add -s also the the additional args to see the profiling output!
+    print(profiler.output_text(unicode=True, color=True))
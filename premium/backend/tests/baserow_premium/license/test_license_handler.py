@@ -27,6 +27,7 @@ from baserow_premium.license.handler import (
     fill_remaining_seats_of_license,
     remove_all_users_from_license,
 )
+from baserow_premium.license.cache import LicensePayloadCache
 from baserow_premium.license.models import License, LicenseUser
 from baserow_premium.license.exceptions import (
     NoPremiumLicenseError,
@@ -175,6 +176,73 @@ def test_has_active_premium_license(data_fixture):
     assert not has_active_premium_license(invalid_user)
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(DEBUG=True)
+@patch("baserow_premium.license.handler.broadcast_to_users")
+def test_has_active_premium_license_is_cached(
+    mock_broadcast_to_users, data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    admin = data_fixture.create_user(is_staff=True)
+    license = License.objects.create(license=VALID_TWO_SEAT_LICENSE.decode())
+
+    with freeze_time("2021-09-01 12:00"):
+        assert not has_active_premium_license(user)
+
+        add_user_to_license(admin, license, user)
+        assert has_active_premium_license(user)
+
+        # Both the licenses of the user and the decoded payloads are cached.
+        with patch("baserow_premium.license.handler.decode_license") as decode:
+            with django_assert_num_queries(0):
+                assert has_active_premium_license(user)
+            decode.assert_not_called()
+
+        remove_user_from_license(admin, license, user)
+        assert not has_active_premium_license(user)
+
+        add_user_to_license(admin, license, user)
+        assert has_active_premium_license(user)
+
+        remove_license(admin, license)
+        assert not has_active_premium_license(user)
+
+
+@override_settings(DEBUG=True)
+def test_license_payload_cache():
+    cache = LicensePayloadCache(max_size=2)
+
+    with patch(
+        "baserow_premium.license.handler.decode_license", wraps=decode_license
+    ) as decode:
+        payload = cache.get_payload(1, VALID_ONE_SEAT_LICENSE)
+        assert payload["seats"] == 1
+        assert cache.get_payload(1, VALID_ONE_SEAT_LICENSE.decode()) == payload
+        assert decode.call_count == 1
+
+        # An updated license has a different hash and must be decoded again.
+        payload = cache.get_payload(1, VALID_UPGRADED_TEN_SEAT_LICENSE)
+        assert payload["seats"] == 10
+        assert decode.call_count == 2
+
+        cache.get_payload(2, VALID_TWO_SEAT_LICENSE)
+        assert len(cache) == 2
+        cache.get_payload(1, VALID_ONE_SEAT_LICENSE)
+        assert decode.call_count == 4
+
+        # Invalid licenses are not cached.
+        for _ in range(2):
+            with pytest.raises(InvalidPremiumLicenseError):
+                cache.get_payload(3, b"invalid")
+        assert decode.call_count == 6
+        assert len(cache) == 2
+
+    # The payload is only valid for the public key it was verified with.
+    with override_settings(DEBUG=False):
+        with pytest.raises(InvalidPremiumLicenseError):
+            cache.get_payload(1, VALID_ONE_SEAT_LICENSE)
+
+
 @override_settings(DEBUG=True)
 def test_get_public_key_debug():
     public_key = get_public_key()
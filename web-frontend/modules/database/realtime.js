@@ -182,6 +182,67 @@ export const registerRealtimeEvents = (realtime) => {
     }
   })
 
+  realtime.registerEvent('rows_created', (context, data) => {
+    const { app, store } = context
+    for (const viewType of Object.values(app.$registry.getAll('view'))) {
+      for (const row of data.rows) {
+        viewType.rowCreated(
+          context,
+          data.table_id,
+          store.getters['field/getAll'],
+          store.getters['field/getPrimary'],
+          row,
+          data.metadata[row.id] || {},
+          'page/'
+        )
+      }
+    }
+  })
+
+  realtime.registerEvent('rows_updated', (context, data) => {
+    const { app, store } = context
+    for (const viewType of Object.values(app.$registry.getAll('view'))) {
+      for (let i = 0; i < data.rows.length; i++) {
+        viewType.rowUpdated(
+          context,
+          data.table_id,
+          store.getters['field/getAll'],
+          store.getters['field/getPrimary'],
+          data.rows_before_update[i],
+          data.rows[i],
+          data.metadata[data.rows[i].id] || {},
+          'page/'
+        )
+      }
+    }
+  })
+
+  realtime.registerEvent('rows_deleted', (context, data) => {
+    const { app, store } = context
+    for (const viewType of Object.values(app.$registry.getAll('view'))) {
+      for (const row of data.rows) {
+        viewType.rowDeleted(
+          context,
+          data.table_id,
+          store.getters['field/getAll'],
+          store.getters['field/getPrimary'],
+          row,
+          'page/'
+        )
+      }
+    }
+  })
+
+  realtime.registerEvent('row_orders_rebalanced', ({ store, app }, data) => {
+    // All the orders of the rows have changed, so the rows in the buffer must be
+    // fetched again to prevent conflicts with the orders of new rows.
+    if (store.getters['table/getSelectedId'] === data.table_id) {
+      app.$bus.$emit('table-refresh', {
+        tableId: data.table_id,
+      })
+    }
+  })
+
   realtime.registerEvent('view_created', ({ store }, data) => {
     if (store.getters['table/getSelectedId'] === data.view.table_id) {
       store.dispatch('view/forceCreate', { data: data.view })
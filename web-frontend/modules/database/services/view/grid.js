@@ -8,6 +8,7 @@ export default (client) => {
       includeFieldOptions = false,
       includeRowMetadata = true,
       search = false,
+      excludeHiddenFields = false,
     }) {
       const config = {
         params: {
@@ -40,6 +41,12 @@ export default (client) => {
         config.params.search = search
       }
 
+      // The backend doesn't search the hidden fields if they're excluded, so they're
+      // only excluded if the rows are not searched.
+      if (excludeHiddenFields && !search) {
+        config.params.exclude_hidden_fields = true
+      }
+
       return client.get(`/database/views/grid/${gridId}/`, config)
     },
     fetchCount({ gridId, search, cancelToken = null }) {
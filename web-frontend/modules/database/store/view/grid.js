@@ -241,6 +241,13 @@ export const mutations = {
       }
     })
   },
+  ADD_MISSING_VALUES_TO_ROW(state, { row, values }) {
+    Object.keys(values).forEach((name) => {
+      if (!Object.prototype.hasOwnProperty.call(row, name)) {
+        Vue.set(row, name, values[name])
+      }
+    })
+  },
   DECREASE_ORDERS_IN_BUFFER_LOWER_THAN(state, existingOrder) {
     const min = new BigNumber(existingOrder).integerValue(BigNumber.ROUND_FLOOR)
     const max = new BigNumber(existingOrder)
@@ -468,6 +475,7 @@ export const actions = {
           limit: requestLimit,
           cancelToken: lastSource.token,
           search: getters.getServerSearchTerm,
+          excludeHiddenFields: true,
         })
         .then(({ data }) => {
           data.results.forEach((part, index) => {
@@ -607,6 +615,7 @@ export const actions = {
       limit,
       includeFieldOptions: true,
       search: getters.getServerSearchTerm,
+      excludeHiddenFields: true,
     })
     data.results.forEach((part, index) => {
       extractMetadataAndPopulateRow(data, index)
@@ -671,6 +680,7 @@ export const actions = {
             includeFieldOptions,
             cancelToken: lastRefreshRequestSource.token,
             search: getters.getServerSearchTerm,
+            excludeHiddenFields: true,
           })
           .then(({ data }) => ({
             data,
@@ -712,7 +722,7 @@ export const actions = {
    * backend with the changed values. If the request fails the action is reverted.
    */
   async updateFieldOptionsOfField(
-    { commit, getters },
+    { commit, getters, dispatch },
     { field, values, oldValues }
   ) {
     const gridId = getters.getLastGridId
@@ -720,6 +730,9 @@ export const actions = {
       fieldId: field.id,
       values,
     })
+    if (values.hidden === false) {
+      dispatch('fetchMissingFieldValues', { fields: [field] })
+    }
     const updateValues = { field_options: {} }
     updateValues.field_options[field.id] = values
 
@@ -740,11 +753,14 @@ export const actions = {
    * Updates the field options of a given field in the store. So no API request to
    * the backend is made.
    */
-  setFieldOptionsOfField({ commit }, { field, values }) {
+  setFieldOptionsOfField({ commit, dispatch }, { field, values }) {
     commit('UPDATE_FIELD_OPTIONS_OF_FIELD', {
       fieldId: field.id,
       values,
     })
+    if (values.hidden === false) {
+      dispatch('fetchMissingFieldValues', { fields: [field] })
+    }
   },
   /**
    * Replaces all field options with new values and also makes an API request to the
@@ -771,8 +787,54 @@ export const actions = {
   /**
    * Forcefully updates all field options without making a call to the backend.
    */
-  forceUpdateAllFieldOptions({ commit }, fieldOptions) {
+  forceUpdateAllFieldOptions(
+    { commit, dispatch, getters, rootGetters },
+    fieldOptions
+  ) {
     commit('UPDATE_ALL_FIELD_OPTIONS', fieldOptions)
+    const shownFields = rootGetters['field/getAll'].filter(
+      (field) =>
+        Object.prototype.hasOwnProperty.call(fieldOptions, field.id) &&
+        !getters.getAllFieldOptions[field.id].hidden
+    )
+    dispatch('fetchMissingFieldValues', { fields: shownFields })
+  },
+  /**
+   * The values of the hidden fields are not fetched with the rows. This action
+   * fetches the values of the provided fields that are missing in the provided rows,
+   * or in all the rows in the buffer if no rows are provided. This must be done
+   * before a hidden field is shown, for example when it's made visible or when the
+   * row is expanded. Until the values have been fetched, the empty value of the
+   * field type is shown.
+   */
+  async fetchMissingFieldValues({ commit, getters }, { fields, rows = null }) {
+    const missing = (row, field) =>
+      !Object.prototype.hasOwnProperty.call(row, `field_${field.id}`)
+    rows = (rows === null ? getters.getAllRows : rows).filter(
+      (row) => !row._.loading && fields.some((field) => missing(row, field))
+    )
+    if (rows.length === 0) {
+      return
+    }
+
+    fields = fields.filter((field) => rows.some((row) => missing(row, field)))
+    const emptyValues = {}
+    fields.forEach((field) => {
+      const fieldType = this.$registry.get('field', field._.type.type)
+      emptyValues[`field_${field.id}`] = fieldType.getEmptyValue(field)
+    })
+    rows.forEach((row) => {
+      commit('ADD_MISSING_VALUES_TO_ROW', { row, values: emptyValues })
+    })
+
+    const { data } = await GridService(this.$client).filterRows({
+      gridId: getters.getLastGridId,
+      rowIds: rows.map((row) => row.id),
+      fieldIds: fields.map((field) => field.id),
+    })
+    data.forEach((values) => {
+      commit('UPDATE_ROW_IN_BUFFER', { row: values, values })
+    })
   },
   /**
    * Updates the order of all the available field options. The provided order parameter
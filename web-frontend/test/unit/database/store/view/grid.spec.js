@@ -1,4 +1,6 @@
-import gridStore from '@baserow/modules/database/store/view/grid'
+import gridStore, {
+  populateRow,
+} from '@baserow/modules/database/store/view/grid'
 import { TestApp } from '@baserow/test/helpers/testApp'
 import {
   EqualViewFilterType,
@@ -811,4 +813,42 @@ describe('Grid view store', () => {
       'test updated'
     )
   })
+
+  test('fetchMissingFieldValues', async () => {
+    const state = Object.assign(gridStore.state(), {
+      lastGridId: 1,
+      bufferStartIndex: 0,
+      bufferLimit: 3,
+      rows: [
+        populateRow({ id: 1, order: '1.00000000000000000000', field_2: 'a' }),
+        populateRow({ id: 2, order: '2.00000000000000000000' }),
+        populateRow({ id: 3, order: '3.00000000000000000000' }),
+      ],
+      count: 3,
+    })
+    gridStore.state = () => state
+    store.registerModule('grid', gridStore)
+
+    const field = { id: 2, type: 'text', _: { type: { type: 'text' } } }
+    testApp.mock
+      .onPost('/database/views/grid/1/', { row_ids: [2], field_ids: [2] })
+      .reply(200, [{ id: 2, order: '2.00000000000000000000', field_2: 'b' }])
+
+    await store.dispatch('grid/fetchMissingFieldValues', {
+      fields: [field],
+      rows: [store.getters['grid/getAllRows'][1]],
+    })
+    let rows = store.getters['grid/getAllRows']
+    expect(rows[0].field_2).toBe('a')
+    expect(rows[1].field_2).toBe('b')
+    expect(rows[2].field_2).toBe(undefined)
+
+    testApp.mock
+      .onPost('/database/views/grid/1/', { row_ids: [3], field_ids: [2] })
+      .reply(200, [{ id: 3, order: '3.00000000000000000000', field_2: 'c' }])
+
+    await store.dispatch('grid/fetchMissingFieldValues', { fields: [field] })
+    rows = store.getters['grid/getAllRows']
+    expect(rows.map((row) => row.field_2)).toEqual(['a', 'b', 'c'])
+  })
 })